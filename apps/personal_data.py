@@ -4,27 +4,30 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + '/src')
 
-from ds_command.command_runner import CommandRunner
-
-from personal_data.commands.convert import ConvertCmd
-from personal_data.commands.display import DisplayCmd
-from personal_data.commands.filter import FilterCmd
-from personal_data.commands.insert import InsertCmd
-
-
-class MainCommandRunner(CommandRunner):
-    commands = [InsertCmd, DisplayCmd, ConvertCmd, FilterCmd]
-
 
 def parse_args():
     parser = argparse.ArgumentParser('Simple data storage CLI')
-    parser.add_argument('command', type=str, help='A command to run (insert, display, filter, convert)')
+    parser.add_argument('command', type=str,
+                        help='A command to run (insert, display, filter, convert, compact, serve)')
+    parser.add_argument('--server', type=str, default=None,
+                        help='Path to a Unix socket of a server started with the `serve` command to run the command by')
 
     return parser.parse_known_args()
 
 
 def main():
     main_args, command_args = parse_args()
+
+    if main_args.server is not None:
+        # Imported here since the server module pulls in sockets, which commands run in this process do not need
+        from personal_data.server import send_command
+
+        send_command(main_args.server, main_args.command, command_args)
+        return
+
+    # Commands import the database library, which a client of a server does not need
+    from personal_data.runner import MainCommandRunner
+
     MainCommandRunner().run(main_args.command, command_args)
 
 
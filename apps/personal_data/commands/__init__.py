@@ -1,10 +1,127 @@
+import os
+
 from ds_command.command import Command
 from ds_simple_db.storage import StorageFactory
 
+from ..display import DisplayFactory
+
 
 class PersonalDataCommand(Command):
     DB_COLUMNS = ['name', 'address', 'phone_number']
     STORAGE_TYPE = 'memory_dict_storage'
 
-    def create_storage(self):
-        return StorageFactory.create(self.STORAGE_TYPE, columns=self.DB_COLUMNS)
+    STORAGE_TYPES_BY_FORMAT = dict(
+        sdb='mapped_columnar_storage'
+    )
+    """Storage types to use instead of STORAGE_TYPE for databases in specific formats (by file extension)"""
+
+    def __init__(self, storages: dict = None, cwd: str = None, served: bool = False):
+        """
+        :param storages: A dict of storages kept open between commands (e.g. by a server) by absolute database paths,
+            databases missing from it are opened and added to it. Every command opens databases anew if None
+        :param cwd: A directory relative paths of arguments are resolved against (the working directory if None)
+        :param served: Whether the command is run by a server for a client, then HTML tables are not opened
+            in a browser on the host of the server, their paths are printed instead
+        """
+        self.storages = storages
+        self.cwd = cwd
+        self.served = served
+
+    def resolve_path(self, path):
+        """
+        Resolve a path given in arguments against `cwd`
+
+        :param path: A relative or absolute path
+        :return: The path relative to the working directory of the command
+        """
+        if self.cwd is None:
+            return path
+
+        return os.path.join(self.cwd, path)
+
+    def create_display(self, display_format):
+        """
+        Create a display of a format registered in DisplayFactory
+
+        :param display_format: A display format (table/html)
+        :return: A Display instance
+        """
+        if display_format == 'html' and self.served:
+            return DisplayFactory.create(display_format, open_browser=False)
+
+        return DisplayFactory.create(display_format)
+
+    def create_storage(self, db_path=None):
+        return StorageFactory.create(self.storage_type(db_path), columns=self.DB_COLUMNS)
+
+    def open_storage(self, db_path):
+        """
+        Open a database file as a persistent storage: inserted rows are appended to a log next to the file,
+        and the file is loaded only when entries are retrieved.
+
+        Existing databases kept open between commands are loaded right away and cache results of filters
+
+        :param db_path: Path to a serialized database
+        :return: An AppendLogStorage instance
+        """
+        if self.storages is not None and os.path.abspath(db_path) in self.storages:
+            return self.storages[os.path.abspath(db_path)]
+
+        storage = StorageFactory.create(
+            'append_log_storage',
+            path=db_path if self.storages is None else os.path.abspath(db_path),
+            columns=self.DB_COLUMNS,
+            storage_type=self.storage_type(db_path)
+        )
+
+        if self.storages is not None:
+            if storage.exists():
+                storage.enable_result_cache()
+
+            self.storages[os.path.abspath(db_path)] = storage
+
+        return storage
+
+    def close_storage(self, storage):
+        """
+        Close a storage opened by `open_storage()` unless it is kept open between commands
+
+        :param storage: A storage to close
+        """
+        if self.storages is None:
+            storage.close()
+
+    def storage_type(self, db_path=None):
+        if db_path is None:
+            return self.STORAGE_TYPE
+
+        return self.STORAGE_TYPES_BY_FORMAT.get(db_path.split('.')[-1], self.STORAGE_TYPE)
+
+    @staticmethod
+    def add_page_arguments(parser):
+        parser.add_argument('--page-size', type=int, default=None,
+                            help='Number of entries per page. Default is all entries on a single page')
+        parser.add_argument('--page', type=int, default=1, help='A page to display starting from 1. Default is 1')
+
+    @staticmethod
+    def page_bounds(page_size=None, page=1):
+        """
+        Get the number of entries to retrieve and skip to display a page
+
+        :param page_size: The number of entries per page (all entries if None)
+        :param page: A page number starting from 1
+        :return: A tuple of `limit` and `offset` arguments of `Storage.iter_entries()`/`Storage.iter_filter()`
+        """
+        if page < 1:
+            raise ValueError(f'`--page` must be positive, got {page}')
+
+        if page_size is None:
+            if page != 1:
+                raise ValueError('`--page` requires `--page-size`')
+
+            return None, 0
+
+        if page_size < 1:
+            raise ValueError(f'`--page-size` must be positive, got {page_size}')
+
+        return page_size, (page - 1) * page_size
@@ -0,0 +1,30 @@
+import argparse
+
+from . import PersonalDataCommand
+
+
+class CompactCmd(PersonalDataCommand):
+    name = 'compact'
+
+    def exec(self, command_args):
+        parser = argparse.ArgumentParser(self.name)
+        parser.add_argument('--path', type=str, required=True, help='Path to a serialized database')
+        args = parser.parse_args(command_args)
+
+        self.compact(self.resolve_path(args.path))
+
+    def compact(self, db_path):
+        """
+        Merge rows inserted since the last compaction into the database file
+
+        :param db_path: Path to a serialized database
+        """
+        storage = self.open_storage(db_path)
+
+        if not storage.exists():
+            raise ValueError(f"File `{db_path}` does not exist")
+
+        storage.compact()
+        self.close_storage(storage)
+
+        print("Compaction finished")
@@ -1,4 +1,10 @@
 import argparse
+import os
+from itertools import chain
+
+from ds_simple_db.core.atomic_file import atomic_write
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.serializers import SerializerFactory
 
 from . import PersonalDataCommand
 
@@ -12,12 +18,58 @@ class ConvertCmd(PersonalDataCommand):
         parser.add_argument('--converted_path', type=str, required=True, help='Path to save a converted database')
         args = parser.parse_args(command_args)
 
-        self.convert(args.path, args.converted_path)
+        self.convert(self.resolve_path(args.path), self.resolve_path(args.converted_path))
 
     def convert(self, db_path, converted_db_path):
-        storage = self.create_storage()
-        storage.load_from_file(db_path)
+        """
+        Convert a database entry by entry without loading it into a storage, so that memory usage does not depend
+        on the database size
+
+        :param db_path: Path to a serialized database
+        :param converted_db_path: Path to save a converted database
+        """
+        storage = self.open_storage(db_path)
+
+        if not storage.exists():
+            raise ValueError(f"File `{db_path}` does not exist")
+
+        if not os.path.exists(db_path):
+            # Only the log exists, there is no file to stream
+            storage.save_to_file(converted_db_path)
+            print("Conversion finished")
+            return
+
+        serializer = SerializerFactory.create_for_file(db_path)
+        converted_serializer = SerializerFactory.create_for_file(converted_db_path)
+
+        read_mode = 'rb' if serializer.binary else 'r'
+        write_mode = 'wb' if converted_serializer.binary else 'w'
 
-        storage.save_to_file(converted_db_path)
+        with open(db_path, read_mode, newline=serializer.file_newline) as fp, \
+                atomic_write(converted_db_path, write_mode, newline=converted_serializer.file_newline) as converted_fp:
+            # Rows inserted after the last compaction are kept in the log of the database
+            logged_entries = (Entry(row) for row in storage.log_rows())
+            entries = self._normalize_entries(chain(serializer.entries_from_stream(fp), logged_entries))
+            converted_serializer.entries_to_stream(entries, converted_fp)
 
         print("Conversion finished")
+
+    def _normalize_entries(self, entries):
+        """
+        Validate entries against the database columns and fill missing fields with None values,
+        the same way the storage does on insertion
+
+        :param entries: An iterable of entries
+        :return: A generator of entries having exactly the database columns
+        """
+        for entry in entries:
+            fields = entry.fields()
+
+            if len(fields) == 0:
+                raise ValueError('Can not convert an entry because empty data provided')
+
+            for field in fields:
+                if field not in self.DB_COLUMNS:
+                    raise ValueError(f'Column `{field}` does not exist in the storage')
+
+            yield Entry({column: entry[column] if column in fields else None for column in self.DB_COLUMNS})
@@ -1,7 +1,7 @@
 import argparse
+from itertools import chain
 
 from . import PersonalDataCommand
-from ..display import DisplayFactory
 
 
 class DisplayCmd(PersonalDataCommand):
@@ -11,12 +11,27 @@ class DisplayCmd(PersonalDataCommand):
         parser = argparse.ArgumentParser(self.name)
         parser.add_argument('--path', type=str, required=True, help='Path to a serialized database')
         parser.add_argument('--format', type=str, default='table', help='Display format (table/html). Default is table')
+        self.add_page_arguments(parser)
         args = parser.parse_args(command_args)
 
-        self.display(args.path, args.format)
+        self.display(self.resolve_path(args.path), args.format, args.page_size, args.page)
 
-    def display(self, db_path, display_format):
-        storage = self.create_storage()
-        storage.load_from_file(db_path)
+    def display(self, db_path, display_format, page_size=None, page=1):
+        limit, offset = self.page_bounds(page_size, page)
+        storage = self.open_storage(db_path)
 
-        DisplayFactory.create(display_format).display(storage.all_entries())
+        try:
+            if not storage.exists():
+                raise ValueError(f"File `{db_path}` does not exist")
+
+            entries = storage.iter_entries(limit, offset)
+            first_entry = next(entries, None)
+
+            if first_entry is None and page > 1:
+                print(f"\nINFO: No entries found on page {page}")
+            elif first_entry is None:
+                print("\nINFO: No entries found")
+            else:
+                self.create_display(display_format).display(chain([first_entry], entries))
+        finally:
+            self.close_storage(storage)
@@ -1,9 +1,12 @@
 import argparse
+import re
+from itertools import chain
 
 from . import PersonalDataCommand
 
+from ds_simple_db.filters.and_filter import AndFilter
 from ds_simple_db.filters.glob_filter import GlobFilter
-from ..display import DisplayFactory
+from ds_simple_db.filters.query_parser import compile_query
 
 
 class FilterCmd(PersonalDataCommand):
@@ -12,19 +15,51 @@ class FilterCmd(PersonalDataCommand):
     def exec(self, command_args):
         parser = argparse.ArgumentParser(self.name)
         parser.add_argument('--path', type=str, required=True, help='Path to a serialized database')
-        parser.add_argument('--glob', type=str, required=True, help='A glob pattern to apply as a filter')
+        parser.add_argument('--glob', type=str, required=True, action='append',
+                            help='A filter expression, e.g. "name=A* and age >= 30" (see QueryParser). '
+                                 'Repeat to require all of the expressions')
         parser.add_argument('--display', type=str, default='table', help='Display format (table/html). Default is table')
+        parser.add_argument('--workers', type=int, default=None,
+                            help='Number of processes to filter large databases in. Default is the current process only')
+        self.add_page_arguments(parser)
         args = parser.parse_args(command_args)
 
-        self.filter(args.path, args.glob, args.display)
+        self.filter(self.resolve_path(args.path), args.glob, args.display, args.workers, args.page_size, args.page)
 
-    def filter(self, db_path, glob_pattern, display_format):
-        storage = self.create_storage()
-        storage.load_from_file(db_path)
+    def filter(self, db_path, glob_patterns, display_format, workers=None, page_size=None, page=1):
+        limit, offset = self.page_bounds(page_size, page)
 
-        filtered_entries = storage.filter(GlobFilter(glob_pattern))
+        if isinstance(glob_patterns, str):
+            glob_patterns = [glob_patterns]
 
-        if len(filtered_entries) == 0:
-            print("\nINFO: No entries satisfying the given filter found")
-        else:
-            DisplayFactory.create(display_format).display(filtered_entries)
+        filters = [self.parse_filter(glob_pattern) for glob_pattern in glob_patterns]
+        filter_obj = filters[0] if len(filters) == 1 else AndFilter(*filters)
+
+        storage = self.open_storage(db_path)
+
+        try:
+            if not storage.exists():
+                raise ValueError(f"File `{db_path}` does not exist")
+
+            filtered_entries = storage.iter_filter(filter_obj, limit, offset, workers=workers)
+            first_entry = next(filtered_entries, None)
+
+            if first_entry is None and page > 1:
+                print(f"\nINFO: No entries satisfying the given filter found on page {page}")
+            elif first_entry is None:
+                print("\nINFO: No entries satisfying the given filter found")
+            else:
+                self.create_display(display_format).display(chain([first_entry], filtered_entries))
+        finally:
+            self.close_storage(storage)
+
+    @staticmethod
+    def parse_filter(expression):
+        try:
+            return compile_query(expression)
+        except ValueError:
+            # Plain `column=pattern` filters used to accept patterns with spaces without quotes
+            if re.fullmatch(r'\w+=[^=]+', expression) is None:
+                raise
+
+            return GlobFilter(expression)
@@ -1,8 +1,6 @@
 import argparse
-import os
 
 from . import PersonalDataCommand
-from ..display import DisplayFactory
 
 
 class InsertCmd(PersonalDataCommand):
@@ -14,20 +12,18 @@ class InsertCmd(PersonalDataCommand):
         parser.add_argument('--values', type=str, required=True, help='Comma-separated values to insert')
         args = parser.parse_args(command_args)
 
-        self.insert(args.path, args.values.split(','))
+        self.insert(self.resolve_path(args.path), args.values.split(','))
 
     def insert(self, db_path, values):
         if len(values) != len(self.DB_COLUMNS):
             raise ValueError('Please specify exactly 3 columns')
 
-        storage = self.create_storage()
-
-        if os.path.exists(db_path):
-            storage.load_from_file(db_path)
+        # The row is appended to the log of the database, so the database itself is neither read nor rewritten
+        storage = self.open_storage(db_path)
 
         dict_to_insert = dict(zip(self.DB_COLUMNS, values))
-        storage.insert(**dict_to_insert)
+        entry = storage.insert(**dict_to_insert)
 
-        storage.save_to_file(db_path)
+        self.close_storage(storage)
 
-        DisplayFactory.create('table').display(storage.all_entries())
+        self.create_display('table').display([entry])
@@ -0,0 +1,53 @@
+import argparse
+import signal
+import sys
+
+from . import PersonalDataCommand
+from .compact import CompactCmd
+from .convert import ConvertCmd
+from .display import DisplayCmd
+from .filter import FilterCmd
+from .insert import InsertCmd
+from ..server import CommandServer
+
+
+class ServeCmd(PersonalDataCommand):
+    name = 'serve'
+
+    SERVED_COMMANDS = [InsertCmd, DisplayCmd, FilterCmd, ConvertCmd, CompactCmd]
+    """Commands clients can run by the server"""
+
+    def exec(self, command_args):
+        parser = argparse.ArgumentParser(self.name)
+        parser.add_argument('--socket', type=str, required=True, help='Path to a Unix socket to listen on')
+        parser.add_argument('--path', type=str, default=[], action='append',
+                            help='Path to a serialized database to load in advance. '
+                                 'Other databases are loaded on the first command. Repeat to load several databases')
+        args = parser.parse_args(command_args)
+
+        self.serve(args.socket, args.path)
+
+    def serve(self, socket_path, db_paths=()):
+        """
+        Keep databases loaded and run commands sent with `--server` until the process is interrupted or terminated
+
+        :param socket_path: Path to a Unix socket to listen on
+        :param db_paths: Paths to databases to load before serving commands
+        """
+        server = CommandServer(socket_path, self.SERVED_COMMANDS)
+        self.storages = server.storages
+
+        for db_path in db_paths:
+            if not self.open_storage(db_path).exists():
+                raise ValueError(f"File `{db_path}` does not exist")
+
+        # Terminating the server closes it the same way as an interruption does
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+        print('Server stopped')
+
@@ -1,13 +1,12 @@
 from ds_simple_db.core.factory import Factory
-from .html_display import HTMLDisplay
-from .table_display import TableDisplay
 
 
 class DisplayFactory(Factory):
     """
-    A factory to create serializers
+    A factory to create displays. The HTML display is imported only when it is used,
+    since it imports `webbrowser` and `tempfile`
     """
     classes = dict(
-        html=HTMLDisplay,
-        table=TableDisplay
+        html='personal_data.display.html_display:HTMLDisplay',
+        table='personal_data.display.table_display:TableDisplay'
     )
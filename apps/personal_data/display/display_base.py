@@ -1,8 +1,8 @@
-from typing import List
+from typing import Iterable
 
 from ds_simple_db.core.entry import Entry
 
 
 class Display:
-    def display(self, entries: List[Entry]):
+    def display(self, entries: Iterable[Entry]):
         pass
@@ -1,7 +1,7 @@
 import os
 import tempfile
 import webbrowser
-from typing import List
+from typing import Iterable
 
 from ds_simple_db.core.entry import Entry
 from ds_simple_db.serializers.html_serializer import HTMLSerializer
@@ -9,12 +9,25 @@ from personal_data.display.display_base import Display
 
 
 class HTMLDisplay(Display):
-    def display(self, entries: List[Entry]):
+    PAGE_SIZE = 10000
+    """The number of rows per HTML page, larger tables are split into linked pages"""
+
+    def __init__(self, open_browser: bool = True):
+        """
+        :param open_browser: Whether to open the table in a browser or only to print the path to it
+        """
+        self.open_browser = open_browser
+
+    def display(self, entries: Iterable[Entry]):
         path = os.path.join(tempfile.mkdtemp(), 'data_storage.html')
 
-        html = HTMLSerializer().entries_to_string(entries)
+        # Pages are written as entries are retrieved, the browser opens the first one
+        paths = HTMLSerializer().entries_to_pages(entries, path, self.PAGE_SIZE)
 
-        with open(path, 'w') as fp:
-            fp.write(html)
+        if len(paths) > 1:
+            print(f'\nINFO: The table is split into {len(paths)} pages of {self.PAGE_SIZE} rows in {os.path.dirname(path)}')
 
-        webbrowser.open('file://' + os.path.realpath(path))
+        if self.open_browser:
+            webbrowser.open('file://' + os.path.realpath(path))
+        else:
+            print(f'\nINFO: The table is written to {path}')
@@ -1,4 +1,5 @@
-from typing import List
+import sys
+from typing import Iterable
 
 from ds_simple_db.core.entry import Entry
 from ds_simple_db.serializers.table_serializer import TableSerializer
@@ -6,5 +7,10 @@ from personal_data.display.display_base import Display
 
 
 class TableDisplay(Display):
-    def display(self, entries: List[Entry]):
-        print('\n', TableSerializer().entries_to_string(entries), sep='')
+    def display(self, entries: Iterable[Entry]):
+        sys.stdout.write('\n')
+
+        # Rows are printed as soon as they are retrieved, widths of columns are fitted to the first entries
+        TableSerializer(auto_width=True).entries_to_stream(entries, sys.stdout)
+
+        sys.stdout.write('\n')
@@ -0,0 +1,13 @@
+from ds_command.command_runner import CommandRunner
+
+
+class MainCommandRunner(CommandRunner):
+    # Only the module of the command being run is imported, see `CommandRunner.commands`
+    commands = dict(
+        insert='personal_data.commands.insert:InsertCmd',
+        display='personal_data.commands.display:DisplayCmd',
+        convert='personal_data.commands.convert:ConvertCmd',
+        filter='personal_data.commands.filter:FilterCmd',
+        compact='personal_data.commands.compact:CompactCmd',
+        serve='personal_data.commands.serve:ServeCmd'
+    )
@@ -0,0 +1,149 @@
+import json
+import os
+import socket
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+
+
+class CommandServer:
+    """
+    Run commands sent by clients over a Unix socket in a long-running process.
+
+    Commands are created with a shared dict of storages (see `PersonalDataCommand.open_storage()`),
+    so a database is loaded once and kept in memory between commands instead of being parsed by every command.
+
+    A request is a single line with a JSON object with the `command` name, its `args` and the working directory
+    of the client (`cwd`), relative paths in arguments are resolved against it so that they mean the same
+    as in the client. The output of the command is sent back as text and the connection is closed.
+    Requests are served one at a time.
+
+    The socket is only accessible by the user running the server. Storages reload databases changed by other
+    processes, e.g. by commands run without the server, see `AppendLogStorage`.
+    """
+
+    def __init__(self, socket_path: str, commands: list):
+        """
+        :param socket_path: Path to the Unix socket to listen on
+        :param commands: Command classes that can be run by clients
+        """
+        self.socket_path = socket_path
+        self.commands = {command.name: command for command in commands}
+        self.storages = dict()
+
+        self._socket = None
+
+    def serve_forever(self):
+        """
+        Listen on the socket and serve requests until the process is interrupted,
+        then remove the socket and close the storages
+        """
+        self._remove_stale_socket()
+
+        server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            server_socket.bind(self.socket_path)
+            os.chmod(self.socket_path, 0o600)
+        except OSError:
+            server_socket.close()
+            raise
+
+        self._socket = server_socket
+
+        try:
+            self._socket.listen()
+
+            print(f'Serving commands {list(self.commands)} on `{self.socket_path}`')
+
+            while True:
+                connection, _ = self._socket.accept()
+
+                with connection:
+                    try:
+                        self._serve(connection)
+                    except (BrokenPipeError, ConnectionResetError):
+                        # The client has gone away, the command has been run anyway
+                        pass
+        finally:
+            self.close()
+
+    def close(self):
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+        for storage in self.storages.values():
+            storage.close()
+
+        self.storages.clear()
+
+    def _serve(self, connection):
+        with connection.makefile('r', encoding='utf-8') as reader, \
+                connection.makefile('w', encoding='utf-8') as writer:
+            try:
+                request = json.loads(reader.readline())
+            except ValueError:
+                writer.write('Invalid request\n')
+                return
+
+            if not isinstance(request, dict):
+                writer.write('Invalid request\n')
+                return
+
+            # The output of the command goes to the client, argparse errors and help included
+            with redirect_stdout(writer), redirect_stderr(writer):
+                try:
+                    self._run(request.get('command'), request.get('args', []), request.get('cwd'))
+                except SystemExit:
+                    pass
+                except Exception as e:
+                    print(e)
+
+    def _run(self, command, command_args, cwd=None):
+        if command not in self.commands:
+            print(f'Command `{command}` can not be run by the server')
+            print('Available commands: ', list(self.commands))
+            return
+
+        self.commands[command](storages=self.storages, cwd=cwd, served=True).run(command_args)
+
+    def _remove_stale_socket(self):
+        """
+        Remove a socket left by a server that has not exited cleanly, fail if a server is still listening on it
+        """
+        if not os.path.exists(self.socket_path):
+            return
+
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.connect(self.socket_path)
+        except OSError:
+            os.unlink(self.socket_path)
+        else:
+            raise ValueError(f'A server is already running on `{self.socket_path}`')
+
+
+def send_command(socket_path: str, command: str, command_args: list):
+    """
+    Run a command by a server and print its output as it arrives
+
+    :param socket_path: Path to the Unix socket the server listens on
+    :param command: A name of the command
+    :param command_args: Command line args to pass to the command
+    """
+    request = dict(command=command, args=command_args, cwd=os.getcwd())
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(socket_path)
+        except OSError as error:
+            raise ValueError(f'Can not connect to a server on `{socket_path}`: {error}') from error
+
+        client.sendall((json.dumps(request) + '\n').encode('utf-8'))
+
+        with client.makefile('r', encoding='utf-8') as reader:
+            for line in reader:
+                sys.stdout.write(line)
@@ -0,0 +1,11 @@
+"""
+Reproducible performance benchmarks for the ds_simple_db library.
+
+Run from the repository root:
+    python3 -m benchmarks --sizes 10k 1M --output bench_results.json
+    python3 -m benchmarks.compare old_results.json new_results.json
+"""
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + '/src')
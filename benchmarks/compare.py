@@ -0,0 +1,59 @@
+"""
+Compare two benchmark result files written by `python3 -m benchmarks --output`.
+
+    python3 -m benchmarks.compare baseline.json current.json --threshold 0.1
+
+Exits with code 1 if any benchmark became slower than the threshold allows.
+"""
+import argparse
+import json
+import sys
+
+
+def load_results(path: str) -> dict:
+    with open(path) as fp:
+        data = json.load(fp)
+
+    return {(r['benchmark'], r['storage'], r['rows']): r for r in data['results']}
+
+
+def compare(baseline: dict, current: dict, threshold: float):
+    """
+    Compare results present in both files
+
+    :param baseline: Baseline results keyed by (benchmark, storage, rows)
+    :param current: Current results keyed by (benchmark, storage, rows)
+    :param threshold: A relative slowdown considered to be a regression, e.g. 0.1 for 10%
+    :return: A list of rows (key, baseline seconds, current seconds, ratio, is_regression)
+    """
+    rows = []
+
+    for key in sorted(baseline.keys() & current.keys(), key=str):
+        old_seconds = baseline[key]['seconds']
+        new_seconds = current[key]['seconds']
+        ratio = new_seconds / old_seconds if old_seconds > 0 else float('inf')
+        rows.append((key, old_seconds, new_seconds, ratio, ratio > 1 + threshold))
+
+    return rows
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser('python3 -m benchmarks.compare')
+    parser.add_argument('baseline', type=str, help='Baseline results file')
+    parser.add_argument('current', type=str, help='Current results file')
+    parser.add_argument('--threshold', type=float, default=0.1, help='Relative slowdown treated as a regression')
+    args = parser.parse_args(args)
+
+    rows = compare(load_results(args.baseline), load_results(args.current), args.threshold)
+
+    print(f'{"benchmark":<22}{"storage":<24}{"rows":>10}{"baseline, s":>13}{"current, s":>12}{"ratio":>8}')
+
+    for (name, storage, num_rows), old_seconds, new_seconds, ratio, is_regression in rows:
+        mark = '  REGRESSION' if is_regression else ''
+        print(f'{name:<22}{storage or "-":<24}{num_rows:>10}{old_seconds:>13.3f}{new_seconds:>12.3f}{ratio:>8.2f}{mark}')
+
+    return 1 if any(row[-1] for row in rows) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
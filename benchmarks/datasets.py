@@ -0,0 +1,77 @@
+import random
+from typing import Iterator
+
+from ds_simple_db.core.atomic_file import atomic_write
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.serializers import SerializerFactory
+
+COLUMNS = ['name', 'address', 'phone_number']
+"""The schema of the `personal_data` app"""
+
+SIZES = {
+    '10k': 10_000,
+    '1M': 1_000_000,
+    '10M': 10_000_000,
+}
+"""Named dataset sizes"""
+
+FIRST_NAMES = [
+    'Dmitry', 'Andrew', 'Alex', 'Sergey', 'Anna', 'Maria', 'John', 'Emma', 'Olga', 'Ivan', 'Elena', 'Peter'
+]
+
+CITIES = [
+    'Moscow', 'London', 'Vancouver', 'St. Petersburg', 'Berlin', 'Paris', 'Tokyo', 'Sydney', 'Toronto', 'New York'
+]
+
+PHONE_PREFIXES = ['+7', '+1', '+44', '+49', '+33', '+81', '+61']
+
+
+def generate_rows(num_rows: int, seed: int = 0) -> Iterator[dict]:
+    """
+    Generate deterministic rows of the `personal_data` schema.
+
+    Names are mostly unique, addresses have few distinct values and phone numbers are unique,
+    which resembles a real address book.
+
+    :param num_rows: The number of rows to generate
+    :param seed: A seed of the random generator, equal seeds produce equal datasets
+    :return: An iterator over dicts with `COLUMNS` as keys
+    """
+    rng = random.Random(seed)
+
+    for idx in range(num_rows):
+        yield dict(
+            name=f'{rng.choice(FIRST_NAMES)}{idx}',
+            address=rng.choice(CITIES),
+            phone_number=f'{rng.choice(PHONE_PREFIXES)}{rng.randrange(10 ** 9, 10 ** 10)}'
+        )
+
+
+def write_dataset(path: str, num_rows: int, seed: int = 0):
+    """
+    Write a generated dataset to a file in a format inferred from its extension
+
+    :param path: A path to a file to write
+    :param num_rows: The number of rows to generate
+    :param seed: A seed of the random generator
+    """
+    serializer = SerializerFactory.create_for_file(path)
+
+    with atomic_write(path, 'wb' if serializer.binary else 'w') as fp:
+        serializer.entries_to_stream((Entry(row, copy=False) for row in generate_rows(num_rows, seed)), fp)
+
+
+def parse_size(size: str) -> int:
+    """
+    Convert a named size (`10k`, `1M`, `10M`) or a plain number to a number of rows
+
+    :param size: A size name or a number
+    :return: The number of rows
+    """
+    if size in SIZES:
+        return SIZES[size]
+
+    if not size.isdigit():
+        raise ValueError(f'Unknown dataset size `{size}`. Use one of {list(SIZES.keys())} or a number of rows')
+
+    return int(size)
@@ -0,0 +1,401 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+
+import ds_simple_db
+from ds_simple_db.filters.glob_filter import GlobFilter
+from ds_simple_db.serializers import SerializerFactory
+from ds_simple_db.storage import StorageFactory
+
+from .datasets import COLUMNS, SIZES, generate_rows, parse_size, write_dataset
+
+STORAGE_KWARGS = dict(
+    memory_dict_storage=dict(columns=COLUMNS),
+    columnar_array_storage=dict(columns=COLUMNS, column_types=dict(address='category')),
+    mapped_columnar_storage=dict(columns=COLUMNS)
+)
+"""Storage types to benchmark and their constructor arguments"""
+
+
+class BenchmarkContext:
+    """
+    Data shared by benchmarks of a single storage type and dataset size.
+    Datasets and the populated storage are created on first use and reused afterwards
+    """
+
+    def __init__(self, storage_type: str, num_rows: int, workdir: str):
+        self.storage_type = storage_type
+        self.num_rows = num_rows
+        self.workdir = workdir
+        self._storage = None
+        self._cleanups = []
+
+    def create_storage(self):
+        return StorageFactory.create(self.storage_type, **STORAGE_KWARGS[self.storage_type])
+
+    def add_cleanup(self, function):
+        """
+        Register a function to call once the current benchmark finishes, e.g. to close a storage it has created
+
+        :param function: A function without arguments
+        """
+        self._cleanups.append(function)
+
+    def run_cleanups(self):
+        while len(self._cleanups) > 0:
+            self._cleanups.pop()()
+
+    def close(self):
+        """
+        Run pending cleanups and close the shared storage
+        """
+        self.run_cleanups()
+
+        if self._storage is not None:
+            close_storage(self._storage)
+            self._storage = None
+
+    def storage(self):
+        if self._storage is None:
+            self._storage = self.create_storage()
+            self._storage.insert_many(generate_rows(self.num_rows))
+
+        return self._storage
+
+    def dataset_path(self, extension: str) -> str:
+        path = os.path.join(self.workdir, f'personal_data_{self.num_rows}.{extension}')
+
+        if not os.path.exists(path):
+            write_dataset(path, self.num_rows)
+
+        return path
+
+    def output_path(self, extension: str) -> str:
+        return os.path.join(self.workdir, f'output_{self.storage_type}_{self.num_rows}.{extension}')
+
+
+def close_storage(storage):
+    # Storages that keep worker processes, shared memory or mapped files release them on closing
+    if hasattr(storage, 'close'):
+        storage.close()
+
+
+def setup_generate(context):
+    return lambda: sum(1 for _ in generate_rows(context.num_rows))
+
+
+def setup_insert(context):
+    def run():
+        storage = context.create_storage()
+
+        for row in generate_rows(context.num_rows):
+            storage.insert(**row)
+
+        return storage
+
+    return run
+
+
+def setup_insert_many(context):
+    def run():
+        storage = context.create_storage()
+        storage.insert_many(generate_rows(context.num_rows))
+
+        return storage
+
+    return run
+
+
+def setup_scan(context):
+    storage = context.storage()
+
+    return lambda: sum(1 for _ in storage.iter_entries())
+
+
+def setup_filter_glob(context):
+    storage = context.storage()
+
+    return lambda: len(storage.filter(GlobFilter('name=*a1*')))
+
+
+def setup_filter_glob_parallel(context):
+    # A separate storage, so that its worker processes and shared memory are released after the benchmark
+    storage = context.create_storage()
+    storage.insert_many(generate_rows(context.num_rows))
+    context.add_cleanup(lambda: close_storage(storage))
+    workers = os.cpu_count()
+
+    # Start worker processes and share columns outside of the measurement
+    storage.filter(GlobFilter('name=*a1*'), workers=workers)
+
+    return lambda: len(storage.filter(GlobFilter('name=*a1*'), workers=workers))
+
+
+def setup_filter_exact(context):
+    storage = context.storage()
+
+    return lambda: len(storage.filter(GlobFilter('address=Moscow')))
+
+
+def setup_filter_indexed(context):
+    storage = context.create_storage()
+    storage.insert_many(generate_rows(context.num_rows))
+    storage.create_index('name', kind='sorted')
+    context.add_cleanup(lambda: close_storage(storage))
+
+    return lambda: len(storage.filter(GlobFilter('name=Anna1*')))
+
+
+def setup_filter_cached(context):
+    storage = context.create_storage()
+    storage.insert_many(generate_rows(context.num_rows))
+    storage.enable_result_cache()
+    storage.filter(GlobFilter('name=*a1*'))
+    context.add_cleanup(lambda: close_storage(storage))
+
+    def run():
+        # A rare insertion between queries makes the cache refresh the result with the new row only
+        storage.insert(name='Anna1', address='Moscow')
+
+        return len(storage.filter(GlobFilter('name=*a1*')))
+
+    return run
+
+
+def setup_load(extension):
+    def setup(context):
+        path = context.dataset_path(extension)
+
+        def run():
+            storage = context.create_storage()
+            storage.load_from_file(path)
+
+            return storage
+
+        return run
+
+    return setup
+
+
+def setup_save(extension):
+    def setup(context):
+        storage = context.storage()
+        path = context.output_path(extension)
+
+        return lambda: storage.save_to_file(path)
+
+    return setup
+
+
+def setup_convert(context):
+    path = context.dataset_path('csv')
+    converted_path = context.output_path('json')
+
+    def run():
+        serializer = SerializerFactory.create_for_file(path)
+        converted_serializer = SerializerFactory.create_for_file(converted_path)
+
+        with open(path, newline=serializer.file_newline) as fp, \
+                open(converted_path, 'w', newline=converted_serializer.file_newline) as converted_fp:
+            converted_serializer.entries_to_stream(serializer.entries_from_stream(fp), converted_fp)
+
+    return run
+
+
+def setup_cold_start(context):
+    """
+    Start a fresh interpreter that creates a storage, as a command line tool does on every run.
+    This measures the interpreter startup and the imports the storage needs
+    """
+    script = (
+        'from ds_simple_db.storage import StorageFactory\n'
+        f'StorageFactory.create({context.storage_type!r}, **{STORAGE_KWARGS[context.storage_type]!r})\n'
+    )
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(ds_simple_db.__file__))))
+
+    return lambda: subprocess.run([sys.executable, '-c', script], env=env, check=True)
+
+
+BENCHMARKS = dict(
+    generate=setup_generate,
+    insert=setup_insert,
+    insert_many=setup_insert_many,
+    scan=setup_scan,
+    filter_glob=setup_filter_glob,
+    filter_glob_parallel=setup_filter_glob_parallel,
+    filter_exact=setup_filter_exact,
+    filter_indexed=setup_filter_indexed,
+    filter_cached=setup_filter_cached,
+    load_csv=setup_load('csv'),
+    load_json=setup_load('json'),
+    load_jsonl=setup_load('jsonl'),
+    load_sdb=setup_load('sdb'),
+    save_csv=setup_save('csv'),
+    save_json=setup_save('json'),
+    save_jsonl=setup_save('jsonl'),
+    save_sdb=setup_save('sdb'),
+    convert_csv_to_json=setup_convert,
+    cold_start=setup_cold_start,
+)
+"""
+Benchmark names and their setup functions.
+A setup function prepares data outside of the measurement and returns a function to measure.
+`generate` measures the dataset generator alone, as insertion benchmarks include generating rows.
+`cold_start` does not depend on the dataset size, its rows per second are meaningless
+"""
+
+STORAGE_INDEPENDENT_BENCHMARKS = ['generate', 'convert_csv_to_json']
+"""Benchmarks that do not use a storage, they are run once per dataset size"""
+
+
+def measure_time(run, repeat: int) -> float:
+    """
+    Measure the best wall time of several runs
+
+    :param run: A function to measure
+    :param repeat: The number of runs
+    :return: The minimal time in seconds
+    """
+    times = []
+
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def measure_memory(run):
+    """
+    Measure memory allocated by a run with `tracemalloc` (this is a separate run since tracing slows code down)
+
+    :param run: A function to measure
+    :return: A tuple of peak memory and memory retained by the returned value, in bytes
+    """
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        result = run()
+        retained, peak = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        tracemalloc.stop()
+
+    return peak, retained
+
+
+def run_benchmark(name: str, context: BenchmarkContext, repeat: int, with_memory: bool) -> dict:
+    try:
+        run = BENCHMARKS[name](context)
+        seconds = measure_time(run, repeat)
+        result = dict(
+            benchmark=name,
+            storage=context.storage_type if name not in STORAGE_INDEPENDENT_BENCHMARKS else None,
+            rows=context.num_rows,
+            seconds=seconds,
+            rows_per_s=context.num_rows / seconds if seconds > 0 else None,
+            peak_memory_mb=None,
+            retained_memory_mb=None
+        )
+
+        if with_memory:
+            peak, retained = measure_memory(run)
+            result['peak_memory_mb'] = peak / 2 ** 20
+            result['retained_memory_mb'] = retained / 2 ** 20
+
+        return result
+    finally:
+        context.run_cleanups()
+
+
+def environment_info() -> dict:
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return dict(
+        commit=commit,
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        python=platform.python_version(),
+        implementation=platform.python_implementation(),
+        platform=platform.platform(),
+        cpu_count=os.cpu_count()
+    )
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser('python3 -m benchmarks')
+    parser.add_argument('--sizes', nargs='+', default=['10k'], help=f'Dataset sizes: {list(SIZES.keys())} or numbers')
+    parser.add_argument('--storages', nargs='+', default=list(STORAGE_KWARGS.keys()), choices=list(STORAGE_KWARGS.keys()))
+    parser.add_argument('--benchmarks', nargs='+', default=list(BENCHMARKS.keys()), choices=list(BENCHMARKS.keys()))
+    parser.add_argument('--repeat', type=int, default=3, help='Number of timed runs, the best one is reported')
+    parser.add_argument('--no-memory', action='store_true', help='Skip peak memory measurement')
+    parser.add_argument('--workdir', type=str, default=None, help='Folder for generated datasets (temporary if omitted)')
+    parser.add_argument('--output', type=str, default=None, help='Path to a JSON file to write results to')
+
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    args = parse_args(args)
+
+    if args.workdir is not None:
+        return run_benchmarks(args, args.workdir)
+
+    with tempfile.TemporaryDirectory(prefix='ds_simple_db_bench_') as workdir:
+        return run_benchmarks(args, workdir)
+
+
+def run_benchmarks(args, workdir: str):
+    """
+    Run the benchmarks selected by the command line arguments, print results and write them to the output file
+
+    :param args: Parsed command line arguments
+    :param workdir: Folder for generated datasets
+    """
+    results = []
+
+    print(f'{"benchmark":<22}{"storage":<24}{"rows":>10}{"seconds":>10}{"rows/s":>12}{"peak, MB":>10}')
+
+    for size in args.sizes:
+        num_rows = parse_size(size)
+
+        for storage_type in args.storages:
+            context = BenchmarkContext(storage_type, num_rows, workdir)
+
+            try:
+                for name in args.benchmarks:
+                    if name in STORAGE_INDEPENDENT_BENCHMARKS and storage_type != args.storages[0]:
+                        continue
+
+                    result = run_benchmark(name, context, args.repeat, not args.no_memory)
+                    results.append(result)
+
+                    peak = '' if result['peak_memory_mb'] is None else f'{result["peak_memory_mb"]:.1f}'
+                    print(
+                        f'{name:<22}{result["storage"] or "-":<24}{num_rows:>10}{result["seconds"]:>10.3f}'
+                        f'{result["rows_per_s"] or 0:>12.0f}{peak:>10}'
+                    )
+            finally:
+                context.close()
+
+    if args.output is not None:
+        with open(args.output, 'w') as fp:
+            json.dump(dict(environment=environment_info(), results=results), fp, indent=2)
+
+        print(f'Results written to {args.output}')
@@ -9,6 +9,7 @@ print('Creating a new storage and adding some data')
 print('===========================================')
 
 from ds_simple_db.storage import StorageFactory
+from ds_simple_db.serializers.csv_serializer import CSVSerializer
 
 # List available storage types
 print('Available storage types:', StorageFactory.list())
@@ -34,6 +35,10 @@ print('==================')
 all_entries = storage.all_entries()
 print('All entries:', all_entries)
 
+# Lazily iterate over entries (useful for large storages), `limit` and `offset` are optional
+for entry in storage.iter_entries(limit=1, offset=1):
+    print('Second entry:', entry)
+
 
 print()
 print('=================')
@@ -53,6 +58,58 @@ filter_glob = GlobFilter('name=*r*')
 filtered_entries_glob = storage.filter(filter_glob)
 print(f'Filtered entries `{filter_glob}`:', filtered_entries_glob)
 
+# Create secondary indexes to avoid full scans.
+# A `hash` index serves exact patterns, a `sorted` index serves exact and prefix (`Dm*`) patterns
+storage.create_index('address', kind='hash')
+storage.create_index('name', kind='sorted')
+print(f'Evaluation of `{filter_exact}`:', storage.explain(filter_exact))
+
+# Combine filters, children of AndFilter and OrFilter are reordered by their estimated cost and selectivity
+from ds_simple_db.filters.and_filter import AndFilter
+from ds_simple_db.filters.comparison_filter import ComparisonFilter
+from ds_simple_db.filters.in_set_filter import InSetFilter
+from ds_simple_db.filters.not_filter import NotFilter
+from ds_simple_db.filters.or_filter import OrFilter
+from ds_simple_db.filters.range_filter import RangeFilter
+from ds_simple_db.filters.regex_filter import RegexFilter
+
+filter_compound = AndFilter(
+    OrFilter(GlobFilter('name=Dm*'), RegexFilter('name', 'ew$')),
+    InSetFilter('address', ['Moscow', 'London']),
+    NotFilter(ComparisonFilter('phone_number', '==', '000')),
+)
+print(f'Filtered entries `{filter_compound}`:', storage.filter(filter_compound))
+
+# Indexes give candidate rows to the children that can use them, the rest of the children check only these rows
+print(f'Evaluation of `{filter_compound}`:', storage.explain(filter_compound))
+print('Names from A to D:', storage.filter(RangeFilter('name', 'A', 'D')))
+
+# Filters can also be written as expressions, compiled filters are cached by the expression text
+from ds_simple_db.filters.query_parser import compile_query
+
+filter_query = compile_query("name=Dm* and address in (Moscow, London) or name ~ 'ew$'")
+print(f'Filtered entries `{filter_query}`:', storage.filter(filter_query))
+print('Query cache:', compile_query.cache_info())
+
+# Cache results of repeated queries, inserted rows are evaluated on the next query only
+result_cache = storage.enable_result_cache(max_entries=128)
+storage.filter(filter_query)
+storage.filter(filter_query)
+print('Result cache statistics:', result_cache.stats())
+
+# Partition rows across shards, filters skip the shards that can not have matching rows
+sharded_storage = StorageFactory.create(
+    'sharded_storage',
+    columns=storage.columns(),
+    shard_key='name',
+    partitioning='range',
+    boundaries=['B', 'M'],
+    bloom_columns=['address']
+)
+sharded_storage.insert_many(entry.as_dict() for entry in storage.iter_entries())
+print('Rows per shard:', sharded_storage.shard_sizes())
+print(f'Evaluation of `{filter_exact}`:', sharded_storage.explain(filter_exact))
+
 
 print()
 print('===================')
@@ -85,6 +142,10 @@ json_str = '{"entries": [{"name": "Sergey", "address": "St. Petersburg"}, {"name
 print('JSON string to deserialize: ', json_str)
 print('Deserialized JSON entries: ', json_serializer.entries_from_string(json_str), '\n')
 
+# Deserializing JSON Lines
+jsonl_str = '{"name": "Sergey", "address": "St. Petersburg"}\n{"name": "Alex", "address": null}\n'
+print('JSON Lines entries: ', SerializerFactory.create('jsonl').entries_from_string(jsonl_str), '\n')
+
 # Deserializing CSV
 csv_str = '#name,address\nSergey,St. Petersburg\nAlex,'
 print('CSV string to deserialize:\n', csv_str, '\n', sep='')
@@ -103,3 +164,22 @@ storage.load_from_file("db/example.csv")
 storage.save_to_file("db/example.json")
 
 print("See db/example.json to view the result\n")
+
+# Load the data with a configured serializer, numeric columns are parsed as numbers
+typed_storage = StorageFactory.create('columnar_array_storage', columns=['name', 'address', 'phone_number'])
+typed_storage.load_from_file("db/example.csv", CSVSerializer(infer_types=True))
+print('Entries loaded with type inference:', typed_storage.all_entries(), '\n')
+
+# Load several files at once and report the time spent on every file (pass `workers` to parse them in processes)
+reports = storage.load_from_files(["db/example.csv", "db/example.json"])
+
+for report in reports:
+    print(f"{report['path']}: {report['rows']} rows parsed in {report['parse_seconds']:.3f}s")
+
+# Save the data in the binary columnar format and open it lazily by memory-mapping the file
+storage.save_to_file("db/example.sdb")
+
+mapped_storage = StorageFactory.create('mapped_columnar_storage')
+mapped_storage.load_from_file("db/example.sdb")
+print('Entries filtered in a memory-mapped database:', mapped_storage.filter(GlobFilter('name=Dmitry')))
+mapped_storage.close()
@@ -1,5 +1,13 @@
+from importlib import import_module
+
+
 class CommandRunner:
     commands = []
+    """
+    Command classes, or a dict of command names and command classes or their import paths
+    in the `package.module:ClassName` format. A command registered by an import path is imported
+    only when it is run, so a runner does not import the modules of all commands on every start
+    """
 
     def run(self, command, command_args):
         """
@@ -11,16 +19,34 @@ class CommandRunner:
         commands_dict = self.commands_dict()
 
         if command in commands_dict:
-            commands_dict[command]().run(command_args)
+            self.load_command(commands_dict[command])().run(command_args)
         else:
             self.command_not_found(command)
 
     def commands_dict(self):
+        if isinstance(self.commands, dict):
+            return dict(self.commands)
+
         return {command.name: command for command in self.commands}
 
     def commands_names_list(self):
-        return [command.name for command in self.commands]
+        return list(self.commands_dict())
 
     def command_not_found(self, command):
         print(f'Command `{command}` not found')
         print(f'Available commands: ', self.commands_names_list())
+
+    @staticmethod
+    def load_command(command):
+        """
+        Import a command class if it is registered by an import path
+
+        :param command: A command class or its import path in the `package.module:ClassName` format
+        :return: A command class
+        """
+        if not isinstance(command, str):
+            return command
+
+        module_name, _, class_name = command.partition(':')
+
+        return getattr(import_module(module_name), class_name)
@@ -0,0 +1,66 @@
+import os
+from contextlib import contextmanager
+
+
+@contextmanager
+def atomic_write(file_path, mode='w', newline=None):
+    """
+    Open a temporary file next to `file_path` for writing and move it to `file_path` only after the block succeeds
+    and the data is flushed to disk, so that a failure in the middle of writing does not destroy an existing file.
+
+    Missing parent folders are created, e.g. the cache folder of the registry of plugins on the first run.
+    The written file gets the permissions of the file it replaces or the default ones for a new file.
+
+    :param file_path: A path to a file to write
+    :param mode: A mode to open the file with (`w` or `wb`)
+    :param newline: How line endings are translated in the text mode, the same as for `open()`
+    :return: A context manager yielding an open file object
+    """
+    # Imported here since most processes never write files
+    import tempfile
+
+    folder = os.path.dirname(file_path)
+
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=folder or os.curdir, prefix=os.path.basename(file_path) + '.', suffix='.tmp')
+
+    try:
+        try:
+            fp = os.fdopen(fd, mode, newline=newline)
+        except BaseException:
+            os.close(fd)
+            raise
+
+        with fp:
+            os.chmod(tmp_path, _file_mode(file_path))
+
+            yield fp
+
+            fp.flush()
+            os.fsync(fp.fileno())
+
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        # The temporary file is moved by a successful `os.replace()` only, removing it must not hide the error
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+
+        raise
+
+
+def _file_mode(file_path):
+    """
+    Get the permissions of an existing file or the permissions `open()` would create a new file with
+    """
+    try:
+        return os.stat(file_path).st_mode & 0o777
+    except FileNotFoundError:
+        # The umask can only be read by setting it
+        umask = os.umask(0)
+        os.umask(umask)
+
+        return 0o666 & ~umask
@@ -0,0 +1,200 @@
+import sys
+from array import array
+from typing import NamedTuple
+
+KINDS = ['str', 'int', 'float']
+"""Kinds of encoded columns"""
+
+
+class EncodedColumnData(NamedTuple):
+    """
+    A column encoded into flat buffers:
+        * `nulls` - one byte per row, 1 for None values
+        * `values` - little-endian int64/float64 values for numeric kinds or int64 offsets into `blob` for `str`
+          (a value `i` occupies `blob[offsets[i]:offsets[i + 1]]`, so there are `num_rows + 1` offsets)
+        * `blob` - UTF-8 encoded strings for `str` kind, empty for numeric kinds
+    """
+    kind: str
+    nulls: bytes
+    values: bytes
+    blob: bytes
+
+
+def infer_kind(values, exact: bool = False) -> str:
+    """
+    Infer the narrowest kind able to keep all values of a column.
+    Integers mixed with floats are kept as floats, so they are decoded as floats (`11` as `11.0`)
+
+    :param values: An iterable of column values
+    :param exact: Whether to raise TypeError instead of converting integers mixed with floats
+    :return: One of `KINDS`
+    """
+    has_str = False
+    has_int = False
+    has_float = False
+
+    for value in values:
+        if value is None:
+            continue
+
+        if isinstance(value, str):
+            has_str = True
+
+        elif isinstance(value, float):
+            has_float = True
+
+        elif isinstance(value, int) and not isinstance(value, bool):
+            has_int = True
+
+        else:
+            raise TypeError(f'Values of type `{type(value)}` can not be encoded, only `str`, `int` and `float` are supported')
+
+    if has_str and (has_int or has_float):
+        raise TypeError('A column can not mix strings and numbers')
+
+    if exact and has_int and has_float:
+        raise TypeError('A column mixing integers and floats can not be encoded exactly')
+
+    if has_float:
+        return 'float'
+
+    if has_int:
+        return 'int'
+
+    return 'str'
+
+
+def encode_column(values: list, kind: str = None) -> EncodedColumnData:
+    """
+    Encode a list of values into flat buffers
+
+    :param values: A list of column values
+    :param kind: One of `KINDS` or None to infer it from values
+    :return: Encoded column data
+    """
+    if kind is None:
+        kind = infer_kind(values)
+
+    nulls = bytes(1 if value is None else 0 for value in values)
+
+    if kind == 'str':
+        encoded_values = [b'' if value is None else value.encode('utf-8') for value in values]
+        offsets = array('q', [0])
+        position = 0
+
+        for encoded_value in encoded_values:
+            position += len(encoded_value)
+            offsets.append(position)
+
+        return EncodedColumnData(kind, nulls, _to_little_endian(offsets), b''.join(encoded_values))
+
+    if kind in ('int', 'float'):
+        typecode = 'q' if kind == 'int' else 'd'
+        numbers = array(typecode, (0 if value is None else value for value in values))
+
+        return EncodedColumnData(kind, nulls, _to_little_endian(numbers), b'')
+
+    raise ValueError(f'Unknown column kind `{kind}`. Available kinds are {KINDS}')
+
+
+class EncodedColumn:
+    """
+    A read-only sequence of values decoded on access from buffers of an encoded column.
+
+    Buffers can be any bytes-like objects, e.g. slices of a memory-mapped file or of shared memory,
+    so only the rows that are actually accessed are read.
+    """
+
+    def __init__(self, kind: str, nulls, values, blob):
+        """
+        :param kind: One of `KINDS`
+        :param nulls: A bytes-like buffer of null flags
+        :param values: A bytes-like buffer of little-endian numbers or offsets
+        :param blob: A bytes-like buffer of UTF-8 strings
+        """
+        if kind not in KINDS:
+            raise ValueError(f'Unknown column kind `{kind}`. Available kinds are {KINDS}')
+
+        self.kind = kind
+        self._nulls = memoryview(nulls)
+        self._values = _cast_little_endian(memoryview(values), 'd' if kind == 'float' else 'q')
+        self._blob = memoryview(blob)
+
+    def __len__(self):
+        return len(self._nulls)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(len(self))
+
+            if step == 1:
+                return self._get_range(start, max(start, stop))
+
+            return [self._get(i) for i in range(start, stop, step)]
+
+        length = len(self)
+
+        if idx < 0:
+            idx += length
+
+        if idx < 0 or idx >= length:
+            raise IndexError('Column index out of range')
+
+        return self._get(idx)
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self._get(idx)
+
+    def release(self):
+        """
+        Release buffers, so that an underlying memory map or shared memory block can be closed
+        """
+        for view in (self._nulls, self._values, self._blob):
+            if isinstance(view, memoryview):
+                view.release()
+
+    def _get_range(self, start, stop):
+        """
+        Decode a contiguous range of values, copying the underlying buffers once rather than value by value
+        """
+        nulls = bytes(self._nulls[start:stop])
+
+        if self.kind != 'str':
+            return [None if is_null else value for value, is_null in zip(self._values[start:stop].tolist(), nulls)]
+
+        offsets = self._values[start:stop + 1].tolist()
+        base = offsets[0]
+        blob = bytes(self._blob[base:offsets[-1]])
+
+        return [
+            None if is_null else blob[begin - base:end - base].decode('utf-8')
+            for begin, end, is_null in zip(offsets, offsets[1:], nulls)
+        ]
+
+    def _get(self, idx):
+        if self._nulls[idx]:
+            return None
+
+        if self.kind == 'str':
+            return str(self._blob[self._values[idx]:self._values[idx + 1]], 'utf-8')
+
+        return self._values[idx]
+
+
+def _to_little_endian(numbers: array) -> bytes:
+    if sys.byteorder != 'little':
+        numbers.byteswap()
+
+    return numbers.tobytes()
+
+
+def _cast_little_endian(view: memoryview, typecode: str):
+    if sys.byteorder == 'little':
+        return view.cast('B').cast(typecode)
+
+    # Big-endian platforms can not use the buffer directly, so the numbers are copied
+    numbers = array(typecode, view.tobytes())
+    numbers.byteswap()
+
+    return numbers
@@ -0,0 +1,227 @@
+from collections import deque
+from itertools import chain, repeat
+from typing import Tuple
+
+
+class ColumnSummary:
+    """
+    A compact summary of values appended to a column: the numbers of values and None values, the types of values,
+    the minimum and the maximum values, and optionally a Bloom filter of hashes of values.
+
+    Storages keep summaries of parts of their data (e.g. shards) to skip the parts that can not contain rows
+    satisfying a filter, see `Filter.may_match()`. A summary never rules out a value that has been added,
+    while a value that has not been added passes the Bloom filter with a probability of a few percent.
+
+    Values are only added, so the Bloom filter grows by segments: when a segment is full, a new one of twice
+    the capacity is started, and a value may be present if any segment contains it. Bits are kept one per byte,
+    which allows setting them for a whole batch of values without a Python loop. Still, hashing values
+    makes updates several times slower, so Bloom filters are worth keeping only for columns looked up by equality.
+
+    Values of a hash partition (`hash_partition`) are known to have the same remainder of their hashes,
+    so equal values of other partitions are ruled out without a Bloom filter.
+
+    Minimum and maximum values are tracked for numbers, strings and bytes as long as they can be compared
+    with each other. NaN values are not ordered, so a summary with NaN values does not rule out ranges.
+    """
+
+    BITS_PER_VALUE = 8
+    """The number of Bloom filter bits per value, two bits are set for every value"""
+
+    INITIAL_CAPACITY = 1024
+    """The number of values the first segment of the Bloom filter is sized for"""
+
+    ORDERED_TYPES = frozenset({bool, int, float, str, bytes})
+    """Types of values which minimum and maximum values are tracked for"""
+
+    # The second bit of a hash is taken from a multiplicative hash of it,
+    # since hashes of small integers are the integers themselves
+    _MULTIPLIER = 0x9E3779B97F4A7C15
+    _PRIME = 2 ** 61 - 1
+
+    def __init__(self, bloom_filter: bool = True, hash_partition: Tuple[int, int] = None):
+        """
+        :param bloom_filter: Whether to keep a Bloom filter of values
+        :param hash_partition: A tuple of the number of partitions and the partition if values are hash partitioned,
+            i.e. `hash(value) % number == partition` for every value
+        """
+        self.hash_partition = hash_partition
+        self.num_values = 0
+        self.num_none = 0
+        self.has_nan = False
+        self.types = set()
+        self.min = None
+        self.max = None
+
+        self._ordered = True
+        self._hashable = bloom_filter
+        self._segments = []
+
+    def update(self, values: list):
+        """
+        Add values to the summary
+
+        :param values: A list of column values
+        """
+        present = [value for value in values if value is not None]
+
+        self.num_values += len(values)
+        self.num_none += len(values) - len(present)
+
+        if len(present) == 0:
+            return
+
+        types = set(map(type, present))
+        self.types.update(types)
+
+        if self._ordered:
+            self._update_bounds(present, types)
+
+        if self._hashable:
+            try:
+                hashes = set(map(hash, present))
+            except TypeError:
+                self._hashable = False
+                self._segments = []
+            else:
+                self._add_hashes(hashes)
+
+    def is_ordered(self) -> bool:
+        """
+        Check if minimum and maximum values are known
+
+        :return: True if `min` and `max` bound all values but None and NaN values
+        """
+        return self._ordered and self.min is not None
+
+    def may_contain(self, value) -> bool:
+        """
+        Check if a value equal to a given one may have been added.
+        None values are counted by `num_none`, they are not kept in the Bloom filter
+
+        :param value: A value to check
+        :return: False if no added value is equal to the value, True if some may be
+        """
+        if value is None:
+            return self.num_none > 0
+
+        try:
+            value_hash = hash(value)
+        except TypeError:
+            return True
+
+        if self.hash_partition is not None and value_hash % self.hash_partition[0] != self.hash_partition[1]:
+            return False
+
+        if not self._hashable:
+            return True
+
+        second = value_hash * self._MULTIPLIER % self._PRIME
+
+        return any(bits[value_hash % len(bits)] and bits[second % len(bits)] for bits, _ in self._segments)
+
+    def may_equal(self, value) -> bool:
+        """
+        Check if a value equal to a given one may have been added using both bounds and the Bloom filter
+
+        :param value: A value to check
+        :return: False if no added value is equal to the value, True if some may be
+        """
+        if value is None:
+            return self.num_none > 0
+
+        return self.may_overlap(value, value) and self.may_contain(value)
+
+    def may_overlap(self, low=None, high=None, include_low: bool = True, include_high: bool = True) -> bool:
+        """
+        Check if a value other than None within a range may have been added
+
+        :param low: The lower bound (unbounded if None)
+        :param high: The upper bound (unbounded if None)
+        :param include_low: Whether the lower bound belongs to the range
+        :param include_high: Whether the upper bound belongs to the range
+        :return: False if no added value is within the range, True if some may be
+        """
+        if self.num_values == self.num_none:
+            return False
+
+        if self.has_nan or not self.is_ordered():
+            return True
+
+        try:
+            if low is not None and (self.max < low or (self.max == low and not include_low)):
+                return False
+
+            if high is not None and (self.min > high or (self.min == high and not include_high)):
+                return False
+        except TypeError:
+            return True
+
+        return True
+
+    def may_have_prefix(self, prefix: str) -> bool:
+        """
+        Check if a string starting with a given prefix may have been added
+
+        :param prefix: A prefix to check
+        :return: False if all added values are strings and none of them starts with the prefix, True otherwise
+        """
+        if not self.types.issubset({str}) or not self.is_ordered():
+            return True
+
+        # Strings starting with the prefix follow each other in the sort order right from the prefix itself
+        return self.max >= prefix and (self.min < prefix or self.min.startswith(prefix))
+
+    def _update_bounds(self, values, types):
+        if not types.issubset(self.ORDERED_TYPES):
+            self._disable_bounds()
+            return
+
+        if float in types:
+            ordered_values = [value for value in values if value == value]
+            self.has_nan = self.has_nan or len(ordered_values) < len(values)
+            values = ordered_values
+
+            if len(values) == 0:
+                return
+
+        try:
+            low, high = min(values), max(values)
+
+            if self.min is not None:
+                low, high = min(self.min, low), max(self.max, high)
+        except TypeError:
+            self._disable_bounds()
+            return
+
+        self.min, self.max = low, high
+
+    def _disable_bounds(self):
+        self._ordered = False
+        self.min = None
+        self.max = None
+
+    def _add_hashes(self, hashes):
+        """
+        Set two bits per hash in the last segment, starting a new segment if the last one is full
+
+        :param hashes: A set of hashes of values
+        """
+        segment = self._segments[-1] if len(self._segments) > 0 else None
+
+        if segment is None or segment[1] + len(hashes) > len(segment[0]) // self.BITS_PER_VALUE:
+            capacity = self.INITIAL_CAPACITY
+
+            if segment is not None:
+                capacity = 2 * len(segment[0]) // self.BITS_PER_VALUE
+
+            segment = [bytearray(max(capacity, len(hashes)) * self.BITS_PER_VALUE), 0]
+            self._segments.append(segment)
+
+        bits, size = segment[0], len(segment[0])
+        second_hashes = map(self._PRIME.__rmod__, map(self._MULTIPLIER.__mul__, hashes))
+        positions = chain(map(size.__rmod__, hashes), map(size.__rmod__, second_hashes))
+
+        # Consume the setters at C speed
+        deque(map(bits.__setitem__, positions, repeat(1)), maxlen=0)
+
+        segment[1] += len(hashes)
@@ -0,0 +1,33 @@
+from collections.abc import Mapping
+
+
+class ColumnsChunk(Mapping):
+    """
+    A read-only mapping of column names to a range of rows `[start, end)` of storage columns.
+
+    Columns are sliced lazily on first access, so a filter evaluated against a chunk
+    only pays for the columns it actually reads.
+    """
+
+    def __init__(self, columns_data: dict, start: int, end: int):
+        """
+        :param columns_data: A dict with column names as keys and sequences supporting slicing as values
+        :param start: The first row of the chunk
+        :param end: The row following the last row of the chunk
+        """
+        self._columns_data = columns_data
+        self._start = start
+        self._end = end
+        self._sliced = dict()
+
+    def __getitem__(self, column):
+        if column not in self._sliced:
+            self._sliced[column] = self._columns_data[column][self._start:self._end]
+
+        return self._sliced[column]
+
+    def __iter__(self):
+        return iter(self._columns_data)
+
+    def __len__(self):
+        return len(self._columns_data)
@@ -12,11 +12,15 @@ class Entry:
     but clients should not rely on that as it may be subject to a change
     """
 
-    def __init__(self, data: dict = None):
+    __slots__ = ('_data',)
+
+    def __init__(self, data: dict = None, copy: bool = True):
         """
         Construct an entry from a given data dictionary
 
         :param data: Data dict to initialize
+        :param copy: Whether to copy the data. Pass False to take ownership of a dict nobody else refers to,
+            e.g. a freshly deserialized one
         """
         if data is None:
             self._data = dict()
@@ -25,7 +29,7 @@ class Entry:
             raise TypeError(f'Data must be of type `dict`, {type(data)} given')
 
         else:
-            self._data = deepcopy(data)
+            self._data = deepcopy(data) if copy else data
 
     def fields(self):
         """
@@ -52,8 +56,16 @@ class Entry:
         """
         return deepcopy(self._data)
 
+    def _as_mapping(self):
+        """
+        Get a dictionary of entry data without copying it. The result must not be modified
+
+        :return: A dictionary with fields as keys and field values as values
+        """
+        return self._data
+
     def __repr__(self):
-        return 'Entry: ' + str(self.as_dict())
+        return 'Entry: ' + str(self._as_mapping())
 
     def __getitem__(self, item):
         """
@@ -63,7 +75,7 @@ class Entry:
         :param item: A field name
         :return: A field value
         """
-        if item not in self.fields():
+        if item not in self._data:
             raise ValueError(f'Column `{item}` does not exist in the Entry')
 
         return self._data[item]
@@ -78,7 +90,10 @@ class Entry:
         return self[item]
 
     def __eq__(self, other):
-        return self.as_dict() == other.as_dict()
+        if not isinstance(other, Entry):
+            return NotImplemented
+
+        return self._as_mapping() == other._as_mapping()
 
     def __ne__(self, other):
         return not self == other
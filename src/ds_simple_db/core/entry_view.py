@@ -0,0 +1,50 @@
+from copy import deepcopy
+
+from ds_simple_db.core.entry import Entry
+
+
+class EntryView(Entry):
+    """
+    A read-only entry referring to a row of storage columns instead of holding a copy of the row data.
+
+    Storages return views to avoid building and copying a dictionary for every retrieved row.
+    A view is valid as long as the row exists in the storage, values are read on access
+    and are copied only by `as_dict()`.
+
+    Views can be used anywhere an Entry is expected (serializers, filters, comparisons).
+    """
+
+    __slots__ = ('_columns_data', '_index')
+
+    def __init__(self, columns_data: dict, index: int):
+        """
+        Construct a view of a storage row
+
+        :param columns_data: A dict with column names as keys and sequences of column values as values.
+            It is shared with the storage and is never modified by the view
+        :param index: A non-negative index of the row in the column sequences
+        """
+        self._columns_data = columns_data
+        self._index = index
+
+    def fields(self):
+        return list(self._columns_data.keys())
+
+    def values(self):
+        index = self._index
+
+        return [values[index] for values in self._columns_data.values()]
+
+    def as_dict(self):
+        return deepcopy(self._as_mapping())
+
+    def _as_mapping(self):
+        index = self._index
+
+        return {column: values[index] for column, values in self._columns_data.items()}
+
+    def __getitem__(self, item):
+        if item not in self._columns_data:
+            raise ValueError(f'Column `{item}` does not exist in the Entry')
+
+        return self._columns_data[item][self._index]
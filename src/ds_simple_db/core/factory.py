@@ -1,26 +1,43 @@
+from importlib import import_module
 from typing import List
 
+from ds_simple_db.core import plugins
+
 
 class Factory:
     """
     The base class for all factories in the project.
 
     All you need to do in a subclass is fill the `classes` dict with the classes to be instantiated.
-    """
 
-    # TODO Add environment variable with paths to modules where to search for classes
+    Classes can be registered by their import paths, so that a module is imported only when its class is created
+    for the first time. Registering every class of a package this way keeps importing the package cheap,
+    e.g. a command line tool that uses a single storage does not import the others with their dependencies.
+
+    Other packages can add classes to a factory with a `plugin_group` as plugins, see `ds_simple_db.core.plugins`.
+    Plugins are discovered on the first use of a factory and imported only when created, like the other classes
+    registered by import paths. Classes of installed packages (entry points) do not replace built-in classes
+    with the same names, while classes listed in the environment variable of the group replace any other ones.
+    """
 
     classes = dict()
     """
-    A dictionary containing key-value pairs to retrieve classes by their string representation
+    A dictionary containing key-value pairs to retrieve classes by their string representation.
+    A value is either a class or an import path of a class in the `package.module:ClassName` format
     
     Example:
         classes = dict(
             csv_serializer=CSVSerializer,
-            json_serializer=JSONSerializer
+            json_serializer='ds_simple_db.serializers.json_serializer:JSONSerializer'
         )
     """
 
+    plugin_group = None
+    """
+    The entry point group of plugins, e.g. `ds_simple_db.storage`, which also names the environment variable
+    listing plugins, e.g. `DS_SIMPLE_DB_STORAGE_PLUGINS`. Plugins are not discovered if None
+    """
+
     @classmethod
     def list(cls) -> List[str]:
         """
@@ -28,8 +45,36 @@ class Factory:
 
         :return: A list of registered class names
         """
+        cls._discover_plugins()
+
         return list(cls.classes.keys())
 
+    @classmethod
+    def get_class(cls, class_name) -> type:
+        """
+        Get a class by its name, importing it if it is registered by an import path
+
+        :param class_name: A class string name (must be one of the keys registered in `classes` dict)
+        :return: A registered class
+        """
+        cls._discover_plugins()
+
+        if class_name not in cls.classes:
+            raise ValueError(f'Class `{class_name}` is not registered in a factory. Available names are {list(cls.classes.keys())}')
+
+        Class = cls.classes[class_name]
+
+        if isinstance(Class, str):
+            Class = import_class(Class)
+
+            # Keep the imported class in the subclass dict, not in the dict of a base factory
+            if 'classes' not in vars(cls):
+                cls.classes = dict(cls.classes)
+
+            cls.classes[class_name] = Class
+
+        return Class
+
     @classmethod
     def create(cls, class_name, *args, **kwargs):
         """
@@ -40,9 +85,43 @@ class Factory:
         :param kwargs: Keyword arguments to pass to an instance constructor
         :return: An created instance of a given class with given arguments
         """
+        Class = cls.get_class(class_name)
+        return Class(*args, **kwargs)
 
-        if class_name not in cls.classes:
-            raise ValueError(f'Class `{class_name}` is not registered in a factory. Available names are {list(cls.classes.keys())}')
+    @classmethod
+    def _discover_plugins(cls):
+        """
+        Add plugins of `plugin_group` to the classes of the factory once
+        """
+        if cls.plugin_group is None or vars(cls).get('_plugins_discovered', False):
+            return
 
-        Class = cls.classes[class_name]
-        return Class(*args, **kwargs)
+        classes = dict(cls.classes)
+
+        for class_name, import_path in plugins.installed_plugins(cls.plugin_group).items():
+            classes.setdefault(class_name, import_path)
+
+        classes.update(plugins.env_plugins(cls.plugin_group))
+
+        cls.classes = classes
+        cls._plugins_discovered = True
+
+
+def import_class(import_path: str) -> type:
+    """
+    Import a class by its import path
+
+    :param import_path: A path in the `package.module:ClassName` format
+    :return: The imported class
+    """
+    module_name, separator, class_name = import_path.partition(':')
+
+    if not separator or not module_name or not class_name:
+        raise ValueError(f'Invalid import path `{import_path}`, expected `package.module:ClassName`')
+
+    module = import_module(module_name)
+
+    try:
+        return getattr(module, class_name)
+    except AttributeError:
+        raise ImportError(f'Module `{module_name}` has no class `{class_name}`') from None
@@ -1,4 +1,7 @@
+from typing import Hashable, Iterable, List, Optional
+
 from ds_simple_db.core.entry import Entry
+from ds_simple_db.core.entry_view import EntryView
 
 
 class Filter:
@@ -7,6 +10,24 @@ class Filter:
 
     To implement a new filter you need to implement the following methods:
         * satisfies
+
+    Optionally a filter may implement a column-oriented evaluation that storages prefer over `satisfies`
+    as it does not require constructing an Entry for every row:
+        * mask
+
+    and an evaluation using secondary indexes of a storage that avoids scanning rows at all:
+        * lookup (exact results) or candidates (rows that are checked with `select` afterwards)
+        * explain
+
+    Composite filters (see AndFilter and OrFilter) evaluate a child filter only on rows left by previous children
+    with `select`, and order children by `cost` and `selectivity` estimates.
+
+    Filters should also report the columns they read (`columns`), so that storages evaluating filters
+    in parallel processes share only these columns with the processes, and may provide a canonical form
+    (`cache_key`) to let storages cache their results.
+
+    Storages partitioned into parts with summaries of their columns (see ColumnSummary) skip the parts
+    a filter rules out with `may_match`.
     """
 
     def satisfies(self, entry: Entry) -> bool:
@@ -17,3 +38,108 @@ class Filter:
         :return: True if entry satisfies the filter, False otherwise
         """
         pass
+
+    def mask(self, columns_data: dict) -> Optional[List[bool]]:
+        """
+        Evaluate the filter against whole columns at once.
+
+        `columns_data` maps column names to sequences of values of equal length (e.g. the internal column lists
+        of a storage). The filter must not modify them.
+
+        Return None if column-oriented evaluation is not supported by the filter,
+        in this case storages fall back to `satisfies`.
+
+        :param columns_data: A dict with column names as keys and sequences of column values as values
+        :return: A list of booleans (True for rows satisfying the filter) or None
+        """
+        return None
+
+    def select(self, columns_data: dict, rows: Iterable[int]) -> List[int]:
+        """
+        Keep the rows satisfying the filter out of given rows.
+
+        The default implementation checks `satisfies` for views of the rows
+
+        :param columns_data: A dict with column names as keys and sequences of column values as values
+        :param rows: Ascending indexes of rows in the sequences
+        :return: A list of indexes of rows satisfying the filter in the same order
+        """
+        return [row for row in rows if self.satisfies(EntryView(columns_data, row))]
+
+    def cost(self) -> float:
+        """
+        Estimate the cost of evaluating the filter for a single row relative to an equality check
+
+        :return: A positive number
+        """
+        return 1.0
+
+    def selectivity(self) -> float:
+        """
+        Estimate the fraction of rows satisfying the filter
+
+        :return: A number between 0 and 1
+        """
+        return 0.5
+
+    def columns(self) -> Optional[List[str]]:
+        """
+        Get the columns the filter reads
+
+        :return: A list of column names or None if the filter may read any column
+        """
+        return None
+
+    def cache_key(self) -> Optional[Hashable]:
+        """
+        Get a canonical form of the filter: filters with equal keys must select the same rows.
+        Storages with a result cache reuse results of filters by their keys
+
+        :return: A hashable key or None if results of the filter must not be cached
+        """
+        return None
+
+    def may_match(self, summaries: dict) -> bool:
+        """
+        Check whether any row of a part of a storage may satisfy the filter given summaries of its columns.
+        The answer must be True unless the summaries prove that no row satisfies the filter.
+
+        The default implementation never rules a part out
+
+        :param summaries: A dict with column names as keys and ColumnSummary instances as values
+        :return: False if no row of the part satisfies the filter, True if some may
+        """
+        return True
+
+    def lookup(self, indexes: dict) -> Optional[List[int]]:
+        """
+        Find rows satisfying the filter using secondary indexes of a storage.
+
+        Return None if none of the given indexes can be used, in this case storages fall back to a scan.
+
+        :param indexes: A dict with column names as keys and Index instances as values
+        :return: A sorted list of indexes of rows satisfying the filter or None
+        """
+        return None
+
+    def candidates(self, indexes: dict) -> Optional[List[int]]:
+        """
+        Find rows that may satisfy the filter using secondary indexes of a storage,
+        storages check them with `select()`. This allows filters to use indexes that can not
+        give exact results, e.g. because they compare string representations of values.
+
+        The default implementation returns the exact results of `lookup()`
+
+        :param indexes: A dict with column names as keys and Index instances as values
+        :return: A sorted list of indexes of rows including all rows satisfying the filter or None
+        """
+        return self.lookup(indexes)
+
+    def explain(self, indexes: dict) -> Optional[str]:
+        """
+        Describe how `lookup()` or `candidates()` would use the given indexes
+
+        :param indexes: A dict with column names as keys and Index instances as values
+        :return: A human-readable description or None if no index can be used
+        """
+        return None
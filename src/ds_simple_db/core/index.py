@@ -0,0 +1,91 @@
+from typing import List
+
+
+class Index:
+    """
+    The base class for all secondary indexes on storage columns.
+
+    An index maps string representations of column values (the same representation filters match against)
+    to the indexes of rows holding these values. Indexes are kept up to date by storages on insertion.
+
+    To implement a new index you need to implement the following methods:
+        * add
+        * lookup
+        * lookup_prefix (optional, set `supports_prefix_lookup` to True if implemented)
+        * lookup_range (optional, set `supports_range_lookup` to True if implemented)
+    """
+
+    kind = None
+    """The string name of an index kind, e.g. `hash`. Must be defined in a subclass"""
+
+    supports_prefix_lookup = False
+    """Whether `lookup_prefix()` is implemented"""
+
+    supports_range_lookup = False
+    """Whether `lookup_range()` is implemented"""
+
+    def build(self, values):
+        """
+        Index all values of a column at once.
+        Subclasses may override it with a more efficient bulk implementation
+
+        :param values: A sequence of column values, the position of a value is its row index
+        """
+        for row, value in enumerate(values):
+            self.add(value, row)
+
+    def add(self, value, row: int):
+        """
+        Add a value of a new row to the index.
+        Rows must be added in ascending order
+
+        :param value: A column value
+        :param row: The index of the row holding the value
+        """
+        pass
+
+    def add_many(self, values, start_row: int):
+        """
+        Add values of a batch of new rows to the index.
+        Subclasses may override it with a more efficient bulk implementation
+
+        :param values: A sequence of column values of consecutive rows
+        :param start_row: The index of the row holding the first value, greater than the rows added before
+        """
+        for row, value in enumerate(values, start_row):
+            self.add(value, row)
+
+    def lookup(self, key: str) -> List[int]:
+        """
+        Find rows whose values are equal to a key
+
+        :param key: A string representation of a value to look up
+        :return: A sorted list of row indexes
+        """
+        pass
+
+    def lookup_prefix(self, prefix: str) -> List[int]:
+        """
+        Find rows whose values start with a prefix
+
+        :param prefix: A prefix of a string representation of a value to look up
+        :return: A sorted list of row indexes
+        """
+        raise NotImplementedError(f'Prefix lookups are not supported by `{self.kind}` index')
+
+    def lookup_range(self, low: str = None, high: str = None, include_low: bool = True,
+                     include_high: bool = True) -> List[int]:
+        """
+        Find rows whose values are within a range. Keys are compared as strings
+
+        :param low: The lower bound of a string representation of a value (unbounded if None)
+        :param high: The upper bound of a string representation of a value (unbounded if None)
+        :param include_low: Whether values equal to the lower bound are in the range
+        :param include_high: Whether values equal to the upper bound are in the range
+        :return: A sorted list of row indexes
+        """
+        raise NotImplementedError(f'Range lookups are not supported by `{self.kind}` index')
+
+    @staticmethod
+    def _key(value) -> str:
+        return str(value)
@@ -0,0 +1,195 @@
+import sys
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from itertools import compress, repeat
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterator
+
+from ds_simple_db.core.column_codec import infer_kind
+from ds_simple_db.core.columns_chunk import ColumnsChunk
+from ds_simple_db.core.entry_view import EntryView
+from ds_simple_db.core.filter import Filter
+from ds_simple_db.serializers.binary_columnar_serializer import BinaryColumnarSerializer
+
+
+class ParallelScanner:
+    """
+    Evaluates filters over row ranges in a pool of worker processes.
+
+    Columns are encoded once into a shared memory block in the binary columnar format
+    (see BinaryColumnarSerializer), workers map the block and decode only the rows of their chunks,
+    so neither columns nor entries are pickled. Workers return indexes of matching rows,
+    which are yielded in the original order.
+
+    Storages are append-only, so a shared block stays valid for the rows it was created for
+    and is re-created only when a scan needs more rows.
+    """
+
+    def __init__(self, workers: int):
+        """
+        :param workers: The number of worker processes
+        """
+        if workers < 1:
+            raise ValueError(f'`workers` must be positive, got {workers}')
+
+        self.workers = workers
+
+        self._executor = None
+        self._lock = threading.Lock()
+        self._block = None
+        self._block_key = None
+        self._scans_by_block = dict()
+        self._stale_blocks = []
+
+    def share(self, columns_data: dict, num_rows: int) -> SharedMemory:
+        """
+        Get a shared memory block with the first `num_rows` rows of given columns, encoding them if needed
+
+        TypeError is raised if values of a column can not be encoded exactly (see `column_codec.infer_kind()`),
+        e.g. integers mixed with floats would be decoded as floats and match filters differently.
+        OverflowError or UnicodeEncodeError is raised for integers out of the 64-bit range
+        and strings that are not valid UTF-8
+
+        :param columns_data: A dict with column names as keys and sequences of column values as values
+        :param num_rows: The number of rows to share
+        :return: A shared memory block
+        """
+        key = (num_rows, tuple((column, id(values)) for column, values in columns_data.items()))
+
+        with self._lock:
+            if self._block_key == key:
+                return self._block
+
+            columns_data = {column: values[:num_rows] for column, values in columns_data.items()}
+
+            for values in columns_data.values():
+                infer_kind(values, exact=True)
+
+            fp = BytesIO()
+            BinaryColumnarSerializer().columns_to_stream(columns_data, fp)
+            data = fp.getbuffer()
+
+            block = SharedMemory(create=True, size=len(data))
+            block.buf[:len(data)] = data
+            data.release()
+
+            if self._block is not None:
+                self._stale_blocks.append(self._block)
+                self._release_stale_blocks()
+
+            self._block = block
+            self._block_key = key
+
+            return block
+
+    def scan(self, block: SharedMemory, filter_obj: Filter, num_rows: int, chunk_size: int) -> Iterator[int]:
+        """
+        Lazily find rows satisfying a filter. Chunks are evaluated in parallel,
+        unfinished chunks are cancelled if the iterator is closed
+
+        :param block: A shared memory block returned by `share()`
+        :param filter_obj: A filter to evaluate (it must be picklable)
+        :param num_rows: The number of rows to scan
+        :param chunk_size: The number of rows evaluated by a single task
+        :return: An iterator over indexes of matching rows in ascending order
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+            executor = self._executor
+            self._scans_by_block[block.name] = self._scans_by_block.get(block.name, 0) + 1
+
+        starts = range(0, num_rows, chunk_size)
+        ends = [min(start + chunk_size, num_rows) for start in starts]
+
+        try:
+            for rows in executor.map(_scan_chunk, repeat(block.name), repeat(filter_obj), starts, ends):
+                yield from rows
+        finally:
+            with self._lock:
+                num_scans = self._scans_by_block.pop(block.name, 0)
+
+                if num_scans > 1:
+                    self._scans_by_block[block.name] = num_scans - 1
+
+                self._release_stale_blocks()
+
+    def close(self):
+        """
+        Stop worker processes and free shared memory
+        """
+        with self._lock:
+            if self._executor is not None:
+                if sys.version_info >= (3, 9):
+                    self._executor.shutdown(cancel_futures=True)
+                else:
+                    self._executor.shutdown()
+                self._executor = None
+
+            if self._block is not None:
+                self._stale_blocks.append(self._block)
+                self._block = None
+                self._block_key = None
+
+            self._scans_by_block.clear()
+            self._release_stale_blocks()
+
+    def _release_stale_blocks(self):
+        """
+        Free blocks that have been replaced and are not used by running scans
+        """
+        for block in list(self._stale_blocks):
+            if block.name not in self._scans_by_block:
+                self._stale_blocks.remove(block)
+                block.close()
+                block.unlink()
+
+
+_attached_blocks = dict()
+"""Blocks attached by a worker process, only the last one is kept"""
+
+
+def _attach(name: str) -> dict:
+    """
+    Attach a shared memory block in a worker process and open its columns
+
+    :param name: A name of a shared memory block
+    :return: A dict with column names as keys and EncodedColumn instances as values
+    """
+    if name not in _attached_blocks:
+        for block, columns in _attached_blocks.values():
+            for values in columns.values():
+                values.release()
+
+            block.close()
+
+        _attached_blocks.clear()
+
+        # Pool workers share the resource tracker of the parent process, so attaching does not make
+        # the block owned by the worker, it is still unlinked by the parent only
+        block = SharedMemory(name=name)
+        _attached_blocks[name] = (block, BinaryColumnarSerializer().open_columns(block.buf))
+
+    return _attached_blocks[name][1]
+
+
+def _scan_chunk(name: str, filter_obj: Filter, start: int, end: int) -> array:
+    """
+    Find rows satisfying a filter in a range of rows of a shared memory block (runs in a worker process)
+
+    :param name: A name of a shared memory block
+    :param filter_obj: A filter to evaluate
+    :param start: The first row of the chunk
+    :param end: The row following the last row of the chunk
+    :return: An array of indexes of matching rows
+    """
+    columns = _attach(name)
+    mask = filter_obj.mask(ColumnsChunk(columns, start, end))
+
+    if mask is None:
+        return array('q', (idx for idx in range(start, end) if filter_obj.satisfies(EntryView(columns, idx))))
+
+    return array('q', compress(range(start, end), mask))
@@ -0,0 +1,156 @@
+import json
+import os
+import sys
+from typing import Dict
+
+from ds_simple_db.core.atomic_file import atomic_write
+
+GROUP_PREFIX = 'ds_simple_db.'
+"""Entry point groups that are kept in the registry, e.g. `ds_simple_db.storage`"""
+
+CACHE_DIR_ENV_VAR = 'DS_SIMPLE_DB_CACHE_DIR'
+"""An environment variable with a folder to keep the registry in, `~/.cache/ds_simple_db` by default"""
+
+_CACHE_VERSION = 1
+
+# The registry of installed plugins by entry point groups, read once per process
+_registry = None
+
+
+def env_var_name(group: str) -> str:
+    """
+    Get the name of the environment variable that registers plugins of a group,
+    e.g. `DS_SIMPLE_DB_STORAGE_PLUGINS` for the `ds_simple_db.storage` group
+
+    :param group: An entry point group
+    :return: The name of the environment variable
+    """
+    return group.upper().replace('.', '_') + '_PLUGINS'
+
+
+def env_plugins(group: str) -> Dict[str, str]:
+    """
+    Get plugins registered in the environment variable of a group as comma-separated `name=package.module:ClassName`
+    pairs, e.g. `DS_SIMPLE_DB_STORAGE_PLUGINS=fast=fast_db.storage:FastStorage`
+
+    :param group: An entry point group
+    :return: A dict of names and import paths of classes
+    """
+    plugins = dict()
+
+    for item in os.environ.get(env_var_name(group), '').split(','):
+        if not item.strip():
+            continue
+
+        name, separator, import_path = item.partition('=')
+
+        if not separator or not name.strip() or not import_path.strip():
+            raise ValueError(f'Invalid plugin `{item}` in `{env_var_name(group)}`, expected `name=package.module:ClassName`')
+
+        plugins[name.strip()] = import_path.strip()
+
+    return plugins
+
+
+def installed_plugins(group: str) -> Dict[str, str]:
+    """
+    Get plugins registered by installed packages in an entry point group, e.g. in `setup.py`:
+
+        entry_points={'ds_simple_db.storage': ['fast = fast_db.storage:FastStorage']}
+
+    Scanning the metadata of installed packages takes a while, so entry points of all `ds_simple_db.*` groups
+    are kept in a file and scanned again only when the folders of `sys.path` change (as installing
+    or removing a package does). Plugin classes are not imported until they are used
+
+    :param group: An entry point group
+    :return: A dict of names and import paths of classes
+    """
+    global _registry
+
+    if _registry is None:
+        _registry = _load_registry()
+
+    return dict(_registry.get(group, dict()))
+
+
+def cache_path() -> str:
+    """
+    Get the path to the file the registry of installed plugins is kept in
+
+    :return: A path to a JSON file
+    """
+    folder = os.environ.get(CACHE_DIR_ENV_VAR)
+
+    if not folder:
+        folder = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'ds_simple_db')
+
+    return os.path.join(folder, 'plugins.json')
+
+
+def _load_registry():
+    """
+    Read the registry from the cache if it has been built for the current `sys.path`, scan entry points otherwise.
+    A cache that can not be read or written is the same as a missing one
+    """
+    path = cache_path()
+    fingerprint = _sys_path_fingerprint()
+
+    try:
+        with open(path, encoding='utf-8') as fp:
+            cache = json.load(fp)
+
+        if cache.get('version') == _CACHE_VERSION and cache.get('fingerprint') == fingerprint:
+            return cache['groups']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    registry = _scan_entry_points()
+
+    try:
+        with atomic_write(path) as fp:
+            json.dump(dict(version=_CACHE_VERSION, fingerprint=fingerprint, groups=registry), fp)
+    except OSError:
+        pass
+
+    return registry
+
+
+def _scan_entry_points():
+    """
+    Collect entry points of `ds_simple_db.*` groups from the metadata of installed packages.
+    There are no entry points before Python 3.8, which has no `importlib.metadata`
+    """
+    # Imported here since it is only needed when the cache is outdated
+    try:
+        from importlib.metadata import distributions
+    except ImportError:
+        return dict()
+
+    registry = dict()
+
+    for distribution in distributions():
+        for entry_point in distribution.entry_points:
+            if entry_point.group.startswith(GROUP_PREFIX):
+                # Packages found earlier in `sys.path` shadow the same packages found later
+                registry.setdefault(entry_point.group, dict()).setdefault(entry_point.name, entry_point.value)
+
+    return registry
+
+
+def _sys_path_fingerprint():
+    """
+    Get paths of `sys.path` with modification times of their folders, which change when packages are installed
+    """
+    fingerprint = []
+
+    for path in sys.path:
+        # The working directory changes whenever files are written to it, packages are not installed there
+        if not path:
+            continue
+
+        try:
+            fingerprint.append([path, os.stat(path).st_mtime_ns])
+        except OSError:
+            fingerprint.append([path, None])
+
+    return fingerprint
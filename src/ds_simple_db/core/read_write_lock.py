@@ -0,0 +1,78 @@
+import threading
+from contextlib import contextmanager, nullcontext
+
+
+class ReadWriteLock:
+    """
+    A readers-writer lock: any number of readers can hold the lock at once, a writer holds it exclusively.
+
+    Writers are preferred: once a writer is waiting, new readers wait until it is done,
+    so a steady stream of readers can not starve writers. The lock is not reentrant.
+
+    Usage:
+        with lock.read():
+            ...
+        with lock.write():
+            ...
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._num_readers = 0
+        self._num_waiting_writers = 0
+        self._is_writing = False
+
+    @contextmanager
+    def read(self):
+        """
+        Hold the lock shared with other readers
+        """
+        with self._condition:
+            while self._is_writing or self._num_waiting_writers > 0:
+                self._condition.wait()
+
+            self._num_readers += 1
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._num_readers -= 1
+
+                if self._num_readers == 0:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self):
+        """
+        Hold the lock exclusively
+        """
+        with self._condition:
+            self._num_waiting_writers += 1
+
+            try:
+                while self._is_writing or self._num_readers > 0:
+                    self._condition.wait()
+            finally:
+                self._num_waiting_writers -= 1
+
+            self._is_writing = True
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._is_writing = False
+                self._condition.notify_all()
+
+
+class NoopReadWriteLock:
+    """
+    A lock with the interface of ReadWriteLock that does nothing, for storages used by a single thread
+    """
+
+    def read(self):
+        return nullcontext()
+
+    def write(self):
+        return nullcontext()
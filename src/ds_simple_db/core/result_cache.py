@@ -0,0 +1,108 @@
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Callable, List
+
+
+class ResultCache:
+    """
+    A least-recently-used cache of filter results of an append-only storage.
+
+    Results are lists of matching row indexes keyed by `Filter.cache_key()`. Every result remembers the number
+    of storage rows it was computed for, which serves as the storage version: when rows are appended,
+    a cached result is not discarded but refreshed by evaluating the filter only against the new rows.
+
+    The cache is bounded by the number of results and by the total number of cached rows,
+    results larger than `max_rows` are not cached at all.
+    """
+
+    def __init__(self, max_entries: int = 128, max_rows: int = 1000000):
+        """
+        :param max_entries: The maximum number of cached results
+        :param max_rows: The maximum total number of row indexes in cached results
+        """
+        if max_entries < 1:
+            raise ValueError(f'`max_entries` must be positive, got {max_entries}')
+
+        if max_rows < 1:
+            raise ValueError(f'`max_rows` must be positive, got {max_rows}')
+
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+
+        self._lock = threading.Lock()
+        self._results = OrderedDict()
+        self._num_cached_rows = 0
+        self._stats = dict(hits=0, refreshes=0, misses=0, evictions=0)
+
+    def rows(self, key, num_rows: int, evaluate: Callable[[int], List[int]]) -> List[int]:
+        """
+        Get matching rows among the first `num_rows` rows of a storage, evaluating the filter only if needed
+
+        :param key: A cache key of a filter
+        :param num_rows: The number of rows in the storage
+        :param evaluate: A function evaluating the filter against the rows from a given row up to `num_rows`
+        :return: A sorted list of indexes of matching rows, it must not be modified
+        """
+        with self._lock:
+            cached = self._results.get(key)
+
+            if cached is None:
+                self._stats['misses'] += 1
+            else:
+                self._results.move_to_end(key)
+                self._stats['hits' if cached[0] >= num_rows else 'refreshes'] += 1
+
+        if cached is None:
+            rows = evaluate(0)
+        elif cached[0] == num_rows:
+            return cached[1]
+        elif cached[0] > num_rows:
+            # A reader of an older snapshot of a storage shared by threads
+            return cached[1][:bisect_left(cached[1], num_rows)]
+        else:
+            rows = cached[1] + evaluate(cached[0])
+
+        self._put(key, num_rows, rows)
+
+        return rows
+
+    def clear(self):
+        """
+        Remove all cached results
+        """
+        with self._lock:
+            self._results.clear()
+            self._num_cached_rows = 0
+
+    def stats(self) -> dict:
+        """
+        Get cache statistics
+
+        :return: A dict with the numbers of `hits`, `refreshes` (results updated with appended rows), `misses`,
+            `evictions`, cached results (`entries`) and cached row indexes (`rows`)
+        """
+        with self._lock:
+            return dict(self._stats, entries=len(self._results), rows=self._num_cached_rows)
+
+    def _put(self, key, num_rows, rows):
+        with self._lock:
+            previous = self._results.pop(key, None)
+
+            if previous is not None:
+                self._num_cached_rows -= len(previous[1])
+
+                # Another thread may have cached a result for more rows meanwhile
+                if previous[0] > num_rows:
+                    num_rows, rows = previous
+
+            if len(rows) > self.max_rows:
+                return
+
+            self._results[key] = (num_rows, rows)
+            self._num_cached_rows += len(rows)
+
+            while len(self._results) > self.max_entries or self._num_cached_rows > self.max_rows:
+                _, (_, evicted_rows) = self._results.popitem(last=False)
+                self._num_cached_rows -= len(evicted_rows)
+                self._stats['evictions'] += 1
@@ -1,4 +1,5 @@
-from typing import List
+from itertools import chain, islice
+from typing import IO, Iterable, Iterator, List
 
 from ds_simple_db.core.entry import Entry
 
@@ -10,8 +11,24 @@ class Serializer:
     To implement a new serializer you need to implement the following methods:
         * entries_to_string (serialize a list of entries to a string)
         * entries_from_string (deserialize a list of entries from a string)
+
+    Serializers that can produce output incrementally should also override `entries_to_chunks`,
+    serializers that can parse input incrementally should also override `entries_from_stream`.
+    Both are used by storages and apps to process files with bounded memory.
+
+    Binary serializers set `binary` to True, so that files are opened in binary mode
+    and streams passed to them are binary rather than text ones.
     """
 
+    binary = False
+    """Whether the serializer reads and writes bytes rather than text"""
+
+    file_newline = None
+    """The `newline` argument text files are opened with, None translates line endings on reading and writing"""
+
+    COLUMNS_BATCH_SIZE = 4096
+    """The default number of rows `columns_from_stream()` yields at once"""
+
     def entries_to_string(self, entries: List[Entry]) -> str:
         """
         Dump a list of entries to a string.
@@ -31,3 +48,79 @@ class Serializer:
         :return: A list of entries deserialized from a string
         """
         pass
+
+    def entries_to_chunks(self, entries: Iterable[Entry]) -> Iterator[str]:
+        """
+        Lazily serialize entries to a sequence of string chunks whose concatenation equals `entries_to_string()`.
+        This allows consumers to print or write the output before all entries are retrieved.
+
+        The default implementation builds the whole string at once
+
+        :param entries: An iterable of entries to serialize
+        :return: An iterator over serialized string chunks
+        """
+        yield self.entries_to_string(list(entries))
+
+    def entries_to_stream(self, entries: Iterable[Entry], fp: IO[str]):
+        """
+        Serialize entries to a writable text stream (e.g. a file) chunk by chunk
+
+        :param entries: An iterable of entries to serialize
+        :param fp: A writable text stream
+        """
+        fp.writelines(self.entries_to_chunks(entries))
+
+    def entries_from_stream(self, fp: IO[str]) -> Iterator[Entry]:
+        """
+        Lazily deserialize entries from a readable text stream (e.g. a file).
+
+        The default implementation reads the whole stream at once
+
+        :param fp: A readable text stream
+        :return: An iterator over deserialized entries
+        """
+        return iter(self.entries_from_string(fp.read()))
+
+    def rows_from_stream(self, fp: IO[str]) -> Iterator[dict]:
+        """
+        Lazily deserialize rows from a readable text stream as plain dicts.
+        This is used for loading data into storages, where constructing entries is unnecessary.
+
+        The default implementation converts entries from `entries_from_stream()`
+
+        :param fp: A readable text stream
+        :return: An iterator over dicts with fields as keys
+        """
+        for entry in self.entries_from_stream(fp):
+            yield dict(zip(entry.fields(), entry.values()))
+
+    def columns_from_stream(self, fp: IO[str], batch_size: int = None) -> Iterator[dict]:
+        """
+        Lazily deserialize rows from a readable text stream in batches of columns.
+        This is used for loading data into storages, which append whole columns at once (see `Storage.insert_columns()`).
+
+        The default implementation converts batches of rows from `rows_from_stream()`,
+        a column missing in some rows gets None values in them
+
+        :param fp: A readable text stream
+        :param batch_size: The maximum number of rows in a batch (COLUMNS_BATCH_SIZE if None)
+        :return: An iterator over dicts with columns as keys and lists of values of equal lengths as values
+        """
+        if batch_size is None:
+            batch_size = self.COLUMNS_BATCH_SIZE
+
+        rows = self.rows_from_stream(fp)
+
+        while True:
+            batch = list(islice(rows, batch_size))
+
+            if len(batch) == 0:
+                return
+
+            for row in batch:
+                if not isinstance(row, dict):
+                    raise TypeError(f'Row must be of type `dict`, got {type(row)}')
+
+            columns = dict.fromkeys(chain.from_iterable(batch))
+
+            yield {column: [row.get(column) for row in batch] for column in columns}
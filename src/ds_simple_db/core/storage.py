@@ -1,8 +1,13 @@
 import os
-from typing import List
+import time
+from collections import deque
+from itertools import islice
+from typing import Iterable, Iterator, List
 
+from ds_simple_db.core.atomic_file import atomic_write
 from ds_simple_db.core.entry import Entry
 from ds_simple_db.core.filter import Filter
+from ds_simple_db.core.serializer import Serializer
 from ds_simple_db.serializers import SerializerFactory
 
 
@@ -26,6 +31,40 @@ class Storage:
         """
         pass
 
+    def insert_many(self, rows: Iterable[dict]) -> int:
+        """
+        Insert multiple rows to the storage.
+
+        The default implementation inserts rows one by one,
+        subclasses should override it to validate and append rows in batches.
+
+        :param rows: An iterable of dicts with columns as keys
+        :return: The number of inserted rows
+        """
+        num_inserted = 0
+
+        for row in rows:
+            self.insert(**row)
+            num_inserted += 1
+
+        return num_inserted
+
+    def insert_columns(self, columns_data: dict) -> int:
+        """
+        Insert multiple rows to the storage given as whole columns.
+
+        The default implementation converts columns to rows and calls `insert_many()`.
+
+        :param columns_data: A dict with columns as keys and lists of values of equal lengths as values
+        :return: The number of inserted rows
+        """
+        if len(set(len(values) for values in columns_data.values())) > 1:
+            raise ValueError('Lengths of data columns do not match')
+
+        columns = list(columns_data.keys())
+
+        return self.insert_many(dict(zip(columns, values)) for values in zip(*columns_data.values()))
+
     def columns(self) -> list:
         """
         Get all columns present in the storage
@@ -42,61 +81,230 @@ class Storage:
         """
         pass
 
-    def filter(self, filter_obj: Filter) -> List[Entry]:
+    def filter(self, filter_obj: Filter, workers: int = None) -> List[Entry]:
         """
         Retrieve the data from the storage using a given filter.
         An empty filter must return an empty list
 
         :param filter_obj: A filter to apply to the storage entries
+        :param workers: The number of processes to evaluate the filter in (storages may ignore it)
         :return: A list of filtered entries
         """
         pass
 
-    def load_from_file(self, db_path):
+    def iter_entries(self, limit: int = None, offset: int = 0) -> Iterator[Entry]:
+        """
+        Lazily iterate over entries in the storage.
+
+        The default implementation slices `all_entries()`,
+        subclasses should override it to avoid building the whole list of entries.
+
+        :param limit: The maximum number of entries to yield (no limit if None)
+        :param offset: The number of entries to skip from the beginning
+        :return: An iterator over entries in the storage
+        """
+        return self._slice(self.all_entries(), limit, offset)
+
+    def iter_filter(self, filter_obj: Filter, limit: int = None, offset: int = 0,
+                    workers: int = None) -> Iterator[Entry]:
+        """
+        Lazily iterate over entries satisfying a given filter.
+        An empty filter must yield no entries
+
+        The default implementation slices `filter()`,
+        subclasses should override it to avoid building the whole list of entries.
+
+        :param filter_obj: A filter to apply to the storage entries
+        :param limit: The maximum number of entries to yield (no limit if None)
+        :param offset: The number of matching entries to skip from the beginning
+        :param workers: The number of processes to evaluate the filter in (storages may ignore it)
+        :return: An iterator over filtered entries
+        """
+        return self._slice(self.filter(filter_obj, workers=workers), limit, offset)
+
+    def create_index(self, column: str, kind: str = 'hash'):
+        """
+        Create a secondary index on a column to speed up filters that can use it
+        (see `Filter.lookup()` and `Filter.candidates()`).
+        The index is kept up to date on insertion. Creating an index on an indexed column replaces the old index
+
+        :param column: A column to index
+        :param kind: A kind of the index registered in IndexFactory (`hash` or `sorted`)
+        """
+        raise NotImplementedError(f'Indexes are not supported by `{type(self).__name__}`')
+
+    def enable_result_cache(self, max_entries: int = 128, max_rows: int = 1000000):
+        """
+        Cache results of filters providing a cache key (see `Filter.cache_key()`) and keep them up to date on insertion
+
+        :param max_entries: The maximum number of cached results
+        :param max_rows: The maximum total number of rows in cached results
+        :return: The cache, see `ResultCache.stats()` for hit and miss statistics
+        """
+        raise NotImplementedError(f'Result caching is not supported by `{type(self).__name__}`')
+
+    def explain(self, filter_obj: Filter) -> str:
+        """
+        Describe how the storage would evaluate a given filter
+
+        :param filter_obj: A filter to explain
+        :return: A human-readable description of the evaluation path
+        """
+        raise NotImplementedError(f'Explaining filters is not supported by `{type(self).__name__}`')
+
+    def load_from_file(self, db_path, serializer: Serializer = None):
         """
         Load (deserialize) a storage from a file
 
         The type of serializer is inferred from the file extension using SerializerFactory
 
-        Note that this does not clear the storage, so you can load multiple files into the storage
+        Note that this does not clear the storage, so you can load multiple files into the storage.
+        Rows are read and appended in batches of columns (see `Serializer.columns_from_stream()`)
 
         :param db_path: Path to a file to deserialize data from
+        :param serializer: A serializer to read the file with, e.g. configured with options (inferred if None)
         :return:
         """
         if not os.path.exists(db_path):
             raise ValueError(f"File `{db_path}` does not exist")
 
-        with open(db_path, 'r') as fp:
-            raw_data_str = fp.read()
+        if serializer is None:
+            serializer = SerializerFactory.create_for_file(db_path)
 
-        serializer = self._get_serializer_from_file_name(db_path)
-        deserialized_data = serializer.entries_from_string(raw_data_str)
+        with open(db_path, 'rb' if serializer.binary else 'r', newline=serializer.file_newline) as fp:
+            for columns_data in serializer.columns_from_stream(fp):
+                self.insert_columns(columns_data)
 
-        for entry in deserialized_data:
-            self.insert(**entry.as_dict())
+    def load_from_files(self, db_paths: Iterable[str], workers: int = None,
+                        serializer: Serializer = None) -> List[dict]:
+        """
+        Load (deserialize) multiple files into the storage.
+
+        With `workers` greater than 1 files are parsed in a pool of processes into batches of columns
+        (see `Serializer.columns_from_stream()`), which are sent back and appended in the current process.
+        Rows are appended in the order of `db_paths` whatever order files are parsed in,
+        and at most two files per worker are parsed ahead of insertion to bound memory usage.
+
+        The type of serializer is inferred from the extension of every file using SerializerFactory
+
+        :param db_paths: Paths to files to deserialize data from
+        :param workers: The number of processes to parse files in (the current process only if None)
+        :param serializer: A serializer to read all files with (inferred per file if None), it must be picklable
+        :return: A list of dicts per file with the `path`, the number of `rows`, and the seconds spent
+            on parsing the file (`parse_seconds`) and on inserting its rows (`insert_seconds`)
+        """
+        db_paths = list(db_paths)
+
+        for db_path in db_paths:
+            if not os.path.exists(db_path):
+                raise ValueError(f"File `{db_path}` does not exist")
+
+        if workers is None or workers <= 1 or len(db_paths) <= 1:
+            return [self._load_file_timed(db_path, serializer) for db_path in db_paths]
+
+        # Imported here since it pulls in multiprocessing, which serial loading does not need
+        from concurrent.futures import ProcessPoolExecutor
+
+        reports = []
+        pending = deque()
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for db_path in db_paths:
+                pending.append((db_path, executor.submit(_read_columns, db_path, serializer)))
+
+                if len(pending) >= 2 * workers:
+                    reports.append(self._insert_parsed(*pending.popleft()))
+
+            while len(pending) > 0:
+                reports.append(self._insert_parsed(*pending.popleft()))
+
+        return reports
 
     def save_to_file(self, db_path):
         """
         Save (serialize) the storage to a file
 
-        The type of serializer is inferred from the file extension using SerializerFactory
+        The type of serializer is inferred from the file extension using SerializerFactory.
+        Entries are written incrementally, the file is replaced only after serialization succeeds
 
         :param db_path: Path to a file to serialize data to
         :return:
         """
-        serializer = self._get_serializer_from_file_name(db_path)
-        serialized_data = serializer.entries_to_string(self.all_entries())
+        serializer = SerializerFactory.create_for_file(db_path)
+
+        with atomic_write(db_path, 'wb' if serializer.binary else 'w', newline=serializer.file_newline) as fp:
+            serializer.entries_to_stream(self.iter_entries(), fp)
+
+    def _load_file_timed(self, db_path, serializer):
+        """
+        Parse a file and append its rows batch by batch, timing parsing and insertion separately
+
+        :return: A dict with the `path`, the number of `rows`, `parse_seconds` and `insert_seconds`
+        """
+        start = time.perf_counter()
+        num_rows = 0
+        insert_seconds = 0.0
 
-        db_folder = os.path.dirname(db_path)
+        if serializer is None:
+            serializer = SerializerFactory.create_for_file(db_path)
 
-        if not os.path.exists(db_folder):
-            os.makedirs(db_folder)
+        with open(db_path, 'rb' if serializer.binary else 'r', newline=serializer.file_newline) as fp:
+            for columns_data in serializer.columns_from_stream(fp):
+                insert_start = time.perf_counter()
+                num_rows += self.insert_columns(columns_data)
+                insert_seconds += time.perf_counter() - insert_start
+
+        return dict(path=db_path, rows=num_rows, parse_seconds=time.perf_counter() - start - insert_seconds,
+                    insert_seconds=insert_seconds)
+
+    def _insert_parsed(self, db_path, future):
+        """
+        Append batches of columns parsed from a file by a worker process
+
+        :return: A dict with the `path`, the number of `rows`, `parse_seconds` and `insert_seconds`
+        """
+        batches, parse_seconds = future.result()
+        start = time.perf_counter()
+        num_rows = sum(self.insert_columns(columns_data) for columns_data in batches)
+
+        return dict(path=db_path, rows=num_rows, parse_seconds=parse_seconds,
+                    insert_seconds=time.perf_counter() - start)
+
+    @staticmethod
+    def _slice(iterable, limit: int = None, offset: int = 0):
+        """
+        Apply `limit` and `offset` to an iterable validating their values
+
+        :param iterable: An iterable to slice
+        :param limit: The maximum number of items to yield (no limit if None)
+        :param offset: The number of items to skip from the beginning
+        :return: An iterator over the slice
+        """
+        if offset < 0:
+            raise ValueError(f'`offset` must be non-negative, got {offset}')
+
+        if limit is not None and limit < 0:
+            raise ValueError(f'`limit` must be non-negative or None, got {limit}')
+
+        stop = None if limit is None else offset + limit
+
+        return islice(iterable, offset, stop)
+
+
+def _read_columns(db_path, serializer=None):
+    """
+    Parse a file into batches of columns, this runs in worker processes of `Storage.load_from_files()`
+
+    :param db_path: Path to a file to deserialize data from
+    :param serializer: A serializer to read the file with (inferred from the extension if None)
+    :return: A tuple of a list of dicts with columns as keys and lists of values as values, and the parsing time
+    """
+    start = time.perf_counter()
 
-        with open(db_path, 'w') as fp:
-            fp.write(serialized_data)
+    if serializer is None:
+        serializer = SerializerFactory.create_for_file(db_path)
 
-    def _get_serializer_from_file_name(self, db_path):
-        db_format = db_path.split('.')[-1]
-        serializer = SerializerFactory.create(db_format)
+    with open(db_path, 'rb' if serializer.binary else 'r', newline=serializer.file_newline) as fp:
+        batches = list(serializer.columns_from_stream(fp))
 
-        return serializer
+    return batches, time.perf_counter() - start
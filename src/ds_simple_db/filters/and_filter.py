@@ -0,0 +1,112 @@
+from itertools import compress
+from typing import Iterable, List, Optional
+
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.filters.composite_filter import CompositeFilter
+
+
+class AndFilter(CompositeFilter):
+    """
+    Filter entries satisfying all of given filters.
+
+    Children are evaluated in the order that discards the most rows per unit of cost first,
+    and every next child checks only the rows left by the previous ones. Rows are found using indexes
+    if any child can use them: candidate rows of all such children are intersected and checked by the rest.
+    """
+
+    def _plan(self, filters):
+        return sorted(filters, key=lambda filter_obj: (filter_obj.selectivity() - 1) / filter_obj.cost())
+
+    def satisfies(self, entry: Entry) -> bool:
+        return all(filter_obj.satisfies(entry) for filter_obj in self._ordered)
+
+    def mask(self, columns_data: dict) -> Optional[List[bool]]:
+        mask, rest = self._first_mask(columns_data)
+
+        if mask is None:
+            return None
+
+        result = [False] * len(mask)
+
+        for row in self._select(rest, columns_data, compress(range(len(mask)), mask)):
+            result[row] = True
+
+        return result
+
+    def select(self, columns_data: dict, rows: Iterable[int]) -> List[int]:
+        return self._select(self._ordered, columns_data, rows)
+
+    def cost(self) -> float:
+        cost, fraction = 0.0, 1.0
+
+        for filter_obj in self._ordered:
+            cost += fraction * filter_obj.cost()
+            fraction *= filter_obj.selectivity()
+
+        return cost
+
+    def selectivity(self) -> float:
+        selectivity = 1.0
+
+        for filter_obj in self._ordered:
+            selectivity *= filter_obj.selectivity()
+
+        return selectivity
+
+    def may_match(self, summaries: dict) -> bool:
+        return all(filter_obj.may_match(summaries) for filter_obj in self._ordered)
+
+    def lookup(self, indexes: dict) -> Optional[List[int]]:
+        found = [filter_obj.lookup(indexes) for filter_obj in self._ordered]
+
+        if any(rows is None for rows in found):
+            return None
+
+        return self._intersect(found)
+
+    def candidates(self, indexes: dict) -> Optional[List[int]]:
+        found = [filter_obj.candidates(indexes) for filter_obj in self._ordered]
+        found = [rows for rows in found if rows is not None]
+
+        if len(found) == 0:
+            return None
+
+        return self._intersect(found)
+
+    def explain(self, indexes: dict) -> Optional[str]:
+        plans = [filter_obj.explain(indexes) for filter_obj in self._ordered]
+
+        if all(plan is None for plan in plans):
+            return None
+
+        description = ' and '.join(plan for plan in plans if plan is not None)
+        unindexed = [filter_obj for filter_obj, plan in zip(self._ordered, plans) if plan is None]
+
+        if len(unindexed) > 0:
+            description += ', then check ' + ', '.join(f'`{filter_obj!r}`' for filter_obj in unindexed)
+
+        return description
+
+    @staticmethod
+    def _select(filters, columns_data, rows):
+        rows = list(rows)
+
+        for filter_obj in filters:
+            if len(rows) == 0:
+                break
+
+            rows = filter_obj.select(columns_data, rows)
+
+        return rows
+
+    @staticmethod
+    def _intersect(found):
+        rows = set(min(found, key=len))
+
+        for other_rows in found:
+            rows.intersection_update(other_rows)
+
+        return sorted(rows)
+
+    def __repr__(self):
+        return self._join_repr('AND')
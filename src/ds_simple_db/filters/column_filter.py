@@ -0,0 +1,73 @@
+from typing import Hashable, Iterable, List, Optional
+
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.core.filter import Filter
+
+
+class ColumnFilter(Filter):
+    """
+    The base class for filters checking a value of a single column.
+
+    To implement a new column filter you need to implement the following methods:
+        * matches (check a single value)
+        * __repr__ (a readable form of the filter)
+        * _parameters (the parameters the filter compares values with, they are a part of the cache key)
+
+    Row, column mask and row selection evaluations are derived from `matches`.
+    """
+
+    def __init__(self, column: str):
+        """
+        :param column: A column to check values of
+        """
+        if not isinstance(column, str):
+            raise TypeError(f'column must be of type `str`, `{type(column)}` given')
+
+        if len(column) == 0:
+            raise ValueError('column must not be empty')
+
+        self.column = column
+
+    def matches(self, value) -> bool:
+        """
+        Check if a column value satisfies the filter
+
+        :param value: A column value
+        :return: True if the value satisfies the filter, False otherwise
+        """
+        pass
+
+    def satisfies(self, entry: Entry) -> bool:
+        return self.matches(entry[self.column])
+
+    def mask(self, columns_data: dict) -> List[bool]:
+        matches = self.matches
+
+        return [matches(value) for value in self._column_values(columns_data)]
+
+    def select(self, columns_data: dict, rows: Iterable[int]) -> List[int]:
+        values = self._column_values(columns_data)
+        matches = self.matches
+
+        return [row for row in rows if matches(values[row])]
+
+    def columns(self) -> List[str]:
+        return [self.column]
+
+    def cache_key(self) -> Optional[Hashable]:
+        return type(self).__name__, self.column, self._parameters()
+
+    def _parameters(self) -> tuple:
+        """
+        Get the parameters of the filter besides the column, values are given by their `repr`
+        so that e.g. `1` and `True` (which are equal) give different keys
+
+        :return: A tuple of hashable parameters
+        """
+        return repr(self),
+
+    def _column_values(self, columns_data: dict):
+        if self.column not in columns_data:
+            raise ValueError(f'Column `{self.column}` does not exist in the data')
+
+        return columns_data[self.column]
@@ -0,0 +1,123 @@
+import operator
+from typing import List, Optional
+
+from ds_simple_db.filters.column_filter import ColumnFilter
+
+
+class ComparisonFilter(ColumnFilter):
+    """
+    Filter entries by comparing a column value with a given value: `column <op> value`.
+
+    Supported operators are `==`, `!=`, `<`, `<=`, `>` and `>=`. Values are compared as they are stored,
+    e.g. `ComparisonFilter('age', '>=', 30)` matches integer ages. None values and values that can not be compared
+    with the given value (e.g. a string with an integer) never satisfy the filter.
+
+    Indexes keep string representations of values, so they give candidate rows only
+    for string values, and ranges require an index supporting range lookups.
+    """
+
+    OPERATORS = {
+        '==': operator.eq,
+        '!=': operator.ne,
+        '<': operator.lt,
+        '<=': operator.le,
+        '>': operator.gt,
+        '>=': operator.ge,
+    }
+
+    SELECTIVITY = {
+        '==': 0.1,
+        '!=': 0.9,
+    }
+    """Estimated selectivities of operators, range operators select 0.3 of rows"""
+
+    def __init__(self, column: str, op: str, value):
+        """
+        :param column: A column to compare values of
+        :param op: A comparison operator, one of `OPERATORS`
+        :param value: A value to compare column values with
+        """
+        super().__init__(column)
+
+        if op not in self.OPERATORS:
+            raise ValueError(f'Unknown comparison operator `{op}`, expected one of {list(self.OPERATORS)}')
+
+        self.op = op
+        self.value = value
+
+        self._compare = self.OPERATORS[op]
+
+    def matches(self, value) -> bool:
+        if value is None:
+            return False
+
+        try:
+            return bool(self._compare(value, self.value))
+        except TypeError:
+            return False
+
+    def selectivity(self) -> float:
+        return self.SELECTIVITY.get(self.op, 0.3)
+
+    def may_match(self, summaries: dict) -> bool:
+        summary = summaries.get(self.column)
+
+        if summary is None or self.op == '!=':
+            return True
+
+        if self.op == '==':
+            return summary.may_equal(self.value)
+
+        return summary.may_overlap(**self._bounds())
+
+    def candidates(self, indexes: dict) -> Optional[List[int]]:
+        index = self._usable_index(indexes)
+
+        if index is None:
+            return None
+
+        if self.op == '==':
+            return index.lookup(self.value)
+
+        return index.lookup_range(**self._bounds())
+
+    def explain(self, indexes: dict) -> Optional[str]:
+        index = self._usable_index(indexes)
+
+        if index is None:
+            return None
+
+        if self.op == '==':
+            return f'{index.kind} index lookup on `{self.column}`'
+
+        return f'{index.kind} index range scan on `{self.column}`'
+
+    def _bounds(self):
+        """
+        Express a range operator as bounds of a range
+
+        :return: A dict with `low`, `high`, `include_low` and `include_high` keys
+        """
+        return dict(
+            low=self.value if self.op in ('>', '>=') else None,
+            high=self.value if self.op in ('<', '<=') else None,
+            include_low=self.op == '>=',
+            include_high=self.op == '<=',
+        )
+
+    def _usable_index(self, indexes: dict):
+        index = indexes.get(self.column)
+
+        if index is None or not isinstance(self.value, str) or self.op == '!=':
+            return None
+
+        if self.op != '==' and not index.supports_range_lookup:
+            return None
+
+        return index
+
+    def _parameters(self) -> tuple:
+        return self.op, repr(self.value)
+
+    def __repr__(self):
+        return f'{self.column} {self.op} {self.value!r}'
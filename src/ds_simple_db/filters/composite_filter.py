@@ -0,0 +1,74 @@
+from typing import Hashable, List, Optional
+
+from ds_simple_db.core.filter import Filter
+
+
+class CompositeFilter(Filter):
+    """
+    The base class for filters combining other filters.
+
+    Child filters are ordered once on construction by `_plan()`, the original order is kept in `filters`.
+    """
+
+    def __init__(self, *filters: Filter):
+        """
+        :param filters: Filters to combine
+        """
+        if len(filters) == 0:
+            raise ValueError('At least one filter must be provided')
+
+        for filter_obj in filters:
+            if not isinstance(filter_obj, Filter):
+                raise TypeError(f'filter must be of type `Filter`, got {type(filter_obj)}')
+
+        self.filters = list(filters)
+
+        self._ordered = self._plan(self.filters)
+
+    def _plan(self, filters: List[Filter]) -> List[Filter]:
+        """
+        Order child filters for evaluation
+
+        :param filters: Child filters in the original order
+        :return: Child filters in the order of evaluation
+        """
+        return list(filters)
+
+    def columns(self) -> Optional[List[str]]:
+        columns = []
+
+        for filter_obj in self.filters:
+            filter_columns = filter_obj.columns()
+
+            if filter_columns is None:
+                return None
+
+            columns.extend(column for column in filter_columns if column not in columns)
+
+        return columns
+
+    def cache_key(self) -> Optional[Hashable]:
+        keys = tuple(filter_obj.cache_key() for filter_obj in self.filters)
+
+        if any(key is None for key in keys):
+            return None
+
+        return type(self).__name__, keys
+
+    def _first_mask(self, columns_data: dict):
+        """
+        Evaluate the first child supporting column masks in the order of evaluation
+
+        :param columns_data: A dict with column names as keys and sequences of column values as values
+        :return: A tuple of the mask (or None if no child supports masks) and the other children in order
+        """
+        for position, filter_obj in enumerate(self._ordered):
+            mask = filter_obj.mask(columns_data)
+
+            if mask is not None:
+                return mask, self._ordered[:position] + self._ordered[position + 1:]
+
+        return None, self._ordered
+
+    def _join_repr(self, operator_name: str) -> str:
+        return '(' + f' {operator_name} '.join(repr(filter_obj) for filter_obj in self.filters) + ')'
@@ -1,20 +1,128 @@
-from fnmatch import fnmatch
+import re
+from fnmatch import translate
+from typing import List, Optional
 
-from ds_simple_db.core.entry import Entry
-from ds_simple_db.core.filter import Filter
+from ds_simple_db.filters.column_filter import ColumnFilter
 
 
-class GlobFilter(Filter):
+class GlobFilter(ColumnFilter):
+    """
+    Filter entries by matching a string representation of a column value against a glob pattern: `column=pattern`.
+
+    The pattern is compiled to a regular expression once on construction. Matching is case-sensitive.
+
+    Patterns without wildcards can be looked up in any index on the column,
+    patterns with a single trailing `*` (prefix patterns) can be looked up in a sorted index.
+    """
+
+    WILDCARDS = '*?['
 
     def __init__(self, filter_str: str):
         if not isinstance(filter_str, str):
             raise TypeError(f'filter_str must be of type `str`, `{type(filter_str)}` given')
 
-        self._field, self._pattern = self._get_field_and_pattern(filter_str)
+        column, self._pattern = self._get_field_and_pattern(filter_str)
+        super().__init__(column)
+
+        self._regex = re.compile(translate(self._pattern))
         self._filter_str = filter_str
 
-    def satisfies(self, entry: Entry) -> bool:
-        return fnmatch(str(entry[self._field]), self._pattern)
+    def matches(self, value) -> bool:
+        return self._regex.match(str(value)) is not None
+
+    def mask(self, columns_data: dict) -> List[bool]:
+        """
+        Match the pattern against the target column only
+
+        :param columns_data: A dict with column names as keys and sequences of column values as values
+        :return: A list of booleans (True for rows satisfying the filter)
+        """
+        match = self._regex.match
+
+        return [match(str(value)) is not None for value in self._column_values(columns_data)]
+
+    def cost(self) -> float:
+        return 3.0
+
+    def selectivity(self) -> float:
+        if not self._has_wildcards(self._pattern):
+            return 0.1
+
+        return 0.5
+
+    def may_match(self, summaries: dict) -> bool:
+        """
+        Rule a part out if its values are strings that can not match the pattern:
+        a pattern without wildcards is looked up in the Bloom filter, a prefix pattern is checked against
+        the minimum and maximum values. None values match as the string `None`
+
+        :param summaries: A dict with column names as keys and ColumnSummary instances as values
+        :return: False if no row of the part satisfies the filter, True if some may
+        """
+        summary = summaries.get(self.column)
+
+        if summary is None or not summary.types.issubset({str}):
+            return True
+
+        if summary.num_none > 0 and self.matches(None):
+            return True
+
+        if not self._has_wildcards(self._pattern):
+            return summary.may_equal(self._pattern)
+
+        prefix = self._pattern[:-1]
+
+        if self._pattern.endswith('*') and not self._has_wildcards(prefix):
+            return summary.may_have_prefix(prefix)
+
+        return summary.num_values > summary.num_none
+
+    def lookup(self, indexes: dict) -> Optional[List[int]]:
+        index, prefix = self._usable_index(indexes)
+
+        if index is None:
+            return None
+
+        if prefix is None:
+            return index.lookup(self._pattern)
+
+        return index.lookup_prefix(prefix)
+
+    def explain(self, indexes: dict) -> Optional[str]:
+        index, prefix = self._usable_index(indexes)
+
+        if index is None:
+            return None
+
+        if prefix is None:
+            return f'{index.kind} index lookup on `{self.column}`'
+
+        return f'{index.kind} index prefix scan on `{self.column}`'
+
+    def _usable_index(self, indexes: dict):
+        """
+        Choose an index that can evaluate the pattern
+
+        :param indexes: A dict with column names as keys and Index instances as values
+        :return: A tuple of an index (or None) and a prefix to look up (or None for an exact lookup)
+        """
+        index = indexes.get(self.column)
+
+        if index is None:
+            return None, None
+
+        if not self._has_wildcards(self._pattern):
+            return index, None
+
+        prefix = self._pattern[:-1]
+
+        if self._pattern.endswith('*') and not self._has_wildcards(prefix) and index.supports_prefix_lookup:
+            return index, prefix
+
+        return None, None
+
+    def _has_wildcards(self, pattern):
+        return any(char in pattern for char in self.WILDCARDS)
 
     @staticmethod
     def _get_field_and_pattern(filter_str):
@@ -25,5 +133,8 @@ class GlobFilter(Filter):
 
         return tokens
 
+    def _parameters(self) -> tuple:
+        return self._pattern,
+
     def __repr__(self):
         return self._filter_str
@@ -0,0 +1,75 @@
+from typing import Iterable, List, Optional
+
+from ds_simple_db.filters.column_filter import ColumnFilter
+
+
+class InSetFilter(ColumnFilter):
+    """
+    Filter entries with column values equal to one of given values: `column in (value, ...)`.
+
+    Values must be hashable. Any index on the column gives candidate rows if all values are strings.
+    """
+
+    def __init__(self, column: str, values: Iterable):
+        """
+        :param column: A column to check values of
+        :param values: Values to look for
+        """
+        super().__init__(column)
+
+        self.values = tuple(dict.fromkeys(values))
+
+        if len(self.values) == 0:
+            raise ValueError('`values` must not be empty')
+
+        self._values_set = frozenset(self.values)
+
+    def matches(self, value) -> bool:
+        try:
+            return value in self._values_set
+        except TypeError:
+            return False
+
+    def selectivity(self) -> float:
+        return min(0.1 * len(self.values), 0.9)
+
+    def may_match(self, summaries: dict) -> bool:
+        summary = summaries.get(self.column)
+
+        if summary is None:
+            return True
+
+        return any(summary.may_equal(value) for value in self.values)
+
+    def candidates(self, indexes: dict) -> Optional[List[int]]:
+        index = self._usable_index(indexes)
+
+        if index is None:
+            return None
+
+        rows = set()
+
+        for value in self.values:
+            rows.update(index.lookup(value))
+
+        return sorted(rows)
+
+    def explain(self, indexes: dict) -> Optional[str]:
+        index = self._usable_index(indexes)
+
+        if index is None:
+            return None
+
+        return f'{index.kind} index lookup of {len(self.values)} values on `{self.column}`'
+
+    def _usable_index(self, indexes: dict):
+        if not all(isinstance(value, str) for value in self.values):
+            return None
+
+        return indexes.get(self.column)
+
+    def _parameters(self) -> tuple:
+        return tuple(repr(value) for value in self.values)
+
+    def __repr__(self):
+        return f'{self.column} in ({", ".join(repr(value) for value in self.values)})'
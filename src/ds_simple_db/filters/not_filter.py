@@ -0,0 +1,58 @@
+from typing import Hashable, Iterable, List, Optional
+
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.core.filter import Filter
+
+
+class NotFilter(Filter):
+    """
+    Filter entries not satisfying a given filter.
+
+    Indexes are never used, since they can not enumerate rows missing from them.
+    """
+
+    def __init__(self, filter_obj: Filter):
+        """
+        :param filter_obj: A filter to negate
+        """
+        if not isinstance(filter_obj, Filter):
+            raise TypeError(f'filter must be of type `Filter`, got {type(filter_obj)}')
+
+        self.filter = filter_obj
+
+    def satisfies(self, entry: Entry) -> bool:
+        return not self.filter.satisfies(entry)
+
+    def mask(self, columns_data: dict) -> Optional[List[bool]]:
+        mask = self.filter.mask(columns_data)
+
+        if mask is None:
+            return None
+
+        return [not matched for matched in mask]
+
+    def select(self, columns_data: dict, rows: Iterable[int]) -> List[int]:
+        rows = list(rows)
+        matched = set(self.filter.select(columns_data, rows))
+
+        return [row for row in rows if row not in matched]
+
+    def cost(self) -> float:
+        return self.filter.cost()
+
+    def selectivity(self) -> float:
+        return 1 - self.filter.selectivity()
+
+    def columns(self) -> Optional[List[str]]:
+        return self.filter.columns()
+
+    def cache_key(self) -> Optional[Hashable]:
+        key = self.filter.cache_key()
+
+        if key is None:
+            return None
+
+        return type(self).__name__, key
+
+    def __repr__(self):
+        return f'NOT {self.filter!r}'
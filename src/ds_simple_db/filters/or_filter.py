@@ -0,0 +1,107 @@
+from itertools import compress
+from typing import Iterable, List, Optional
+
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.filters.composite_filter import CompositeFilter
+
+
+class OrFilter(CompositeFilter):
+    """
+    Filter entries satisfying any of given filters.
+
+    Children are evaluated in the order that accepts the most rows per unit of cost first,
+    and every next child checks only the rows not accepted by the previous ones.
+    Indexes are used only if all children can use them, then their rows are united.
+    """
+
+    def _plan(self, filters):
+        return sorted(filters, key=lambda filter_obj: -filter_obj.selectivity() / filter_obj.cost())
+
+    def satisfies(self, entry: Entry) -> bool:
+        return any(filter_obj.satisfies(entry) for filter_obj in self._ordered)
+
+    def mask(self, columns_data: dict) -> Optional[List[bool]]:
+        mask, rest = self._first_mask(columns_data)
+
+        if mask is None:
+            return None
+
+        result = list(mask)
+        remaining = [row for row, matched in enumerate(mask) if not matched]
+
+        for filter_obj in rest:
+            if len(remaining) == 0:
+                break
+
+            matched = filter_obj.select(columns_data, remaining)
+
+            for row in matched:
+                result[row] = True
+
+            matched = set(matched)
+            remaining = [row for row in remaining if row not in matched]
+
+        return result
+
+    def select(self, columns_data: dict, rows: Iterable[int]) -> List[int]:
+        rows = list(rows)
+        remaining = rows
+        matched = set()
+
+        for filter_obj in self._ordered:
+            if len(remaining) == 0:
+                break
+
+            matched.update(filter_obj.select(columns_data, remaining))
+            remaining = [row for row in remaining if row not in matched]
+
+        return [row for row in rows if row in matched]
+
+    def cost(self) -> float:
+        cost, fraction = 0.0, 1.0
+
+        for filter_obj in self._ordered:
+            cost += fraction * filter_obj.cost()
+            fraction *= 1 - filter_obj.selectivity()
+
+        return cost
+
+    def selectivity(self) -> float:
+        rejected = 1.0
+
+        for filter_obj in self._ordered:
+            rejected *= 1 - filter_obj.selectivity()
+
+        return 1 - rejected
+
+    def may_match(self, summaries: dict) -> bool:
+        return any(filter_obj.may_match(summaries) for filter_obj in self._ordered)
+
+    def lookup(self, indexes: dict) -> Optional[List[int]]:
+        return self._unite([filter_obj.lookup(indexes) for filter_obj in self._ordered])
+
+    def candidates(self, indexes: dict) -> Optional[List[int]]:
+        return self._unite([filter_obj.candidates(indexes) for filter_obj in self._ordered])
+
+    def explain(self, indexes: dict) -> Optional[str]:
+        plans = [filter_obj.explain(indexes) for filter_obj in self._ordered]
+
+        if any(plan is None for plan in plans):
+            return None
+
+        return ' or '.join(plans)
+
+    @staticmethod
+    def _unite(found):
+        if any(rows is None for rows in found):
+            return None
+
+        rows = set()
+
+        for other_rows in found:
+            rows.update(other_rows)
+
+        return sorted(rows)
+
+    def __repr__(self):
+        return self._join_repr('OR')
@@ -0,0 +1,249 @@
+import re
+from functools import lru_cache
+
+from ds_simple_db.core.filter import Filter
+from ds_simple_db.filters.and_filter import AndFilter
+from ds_simple_db.filters.comparison_filter import ComparisonFilter
+from ds_simple_db.filters.glob_filter import GlobFilter
+from ds_simple_db.filters.in_set_filter import InSetFilter
+from ds_simple_db.filters.not_filter import NotFilter
+from ds_simple_db.filters.or_filter import OrFilter
+from ds_simple_db.filters.range_filter import RangeFilter
+from ds_simple_db.filters.regex_filter import RegexFilter
+
+
+class QueryParser:
+    """
+    Parses filter expressions into filters.
+
+    Grammar (keywords are case-insensitive):
+        expression := term (OR term)*
+        term       := factor (AND factor)*
+        factor     := NOT factor | '(' expression ')' | condition
+        condition  := column '=' pattern                          (GlobFilter)
+                    | column ('=='|'!='|'<'|'<='|'>'|'>=') value  (ComparisonFilter)
+                    | column '~' regex                           (RegexFilter)
+                    | column IN '(' value (',' value)* ')'       (InSetFilter)
+                    | column BETWEEN value AND value             (RangeFilter)
+
+    Values are either quoted with `'` or `"` (a backslash escapes quotes and backslashes) or bare words.
+    Quoted values are strings, bare words are numbers if they look like numbers and strings otherwise.
+    Patterns and regular expressions are always strings.
+
+    Example:
+        name=A* and (address in (Moscow, London) or not age >= 30)
+    """
+
+    KEYWORDS = ('and', 'or', 'not', 'in', 'between')
+
+    _token_regex = re.compile(r'''
+        \s*(?:
+            (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+            |(?P<operator>==|!=|<=|>=|<|>|=|~)
+            |(?P<punctuation>[(),])
+            |(?P<word>(?:[^\s()'",=!<>~]|!(?!=))+)
+        )
+    ''', re.VERBOSE)
+
+    _column_regex = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+    def __init__(self, text: str):
+        """
+        :param text: A filter expression
+        """
+        if not isinstance(text, str):
+            raise TypeError(f'text must be of type `str`, `{type(text)}` given')
+
+        self.text = text
+
+        self._tokens = self._tokenize(text)
+        self._position = 0
+
+    def parse(self) -> Filter:
+        """
+        Parse the whole expression
+
+        :return: A filter
+        """
+        if len(self._tokens) == 0:
+            raise ValueError('Filter expression must not be empty')
+
+        filter_obj = self._expression()
+
+        if self._peek() is not None:
+            self._fail('end of expression')
+
+        return filter_obj
+
+    def _expression(self):
+        filters = [self._term()]
+
+        while self._accept_keyword('or'):
+            filters.append(self._term())
+
+        return filters[0] if len(filters) == 1 else OrFilter(*filters)
+
+    def _term(self):
+        filters = [self._factor()]
+
+        while self._accept_keyword('and'):
+            filters.append(self._factor())
+
+        return filters[0] if len(filters) == 1 else AndFilter(*filters)
+
+    def _factor(self):
+        if self._accept_keyword('not'):
+            return NotFilter(self._factor())
+
+        if self._accept('punctuation', '('):
+            filter_obj = self._expression()
+            self._expect('punctuation', ')')
+
+            return filter_obj
+
+        return self._condition()
+
+    def _condition(self):
+        kind, column, _ = self._next('column')
+
+        if kind != 'word' or self._column_regex.fullmatch(column) is None or column.lower() in self.KEYWORDS:
+            self._fail('column', step_back=True)
+
+        if self._accept_keyword('in'):
+            self._expect('punctuation', '(')
+            values = [self._value()]
+
+            while self._accept('punctuation', ','):
+                values.append(self._value())
+
+            self._expect('punctuation', ')')
+
+            return InSetFilter(column, values)
+
+        if self._accept_keyword('between'):
+            low = self._value()
+
+            if not self._accept_keyword('and'):
+                self._fail('`and`')
+
+            return RangeFilter(column, low, self._value())
+
+        kind, op, _ = self._next('operator')
+
+        if kind != 'operator':
+            self._fail('operator', step_back=True)
+
+        if op == '=':
+            return GlobFilter(f'{column}={self._value(raw=True)}')
+
+        if op == '~':
+            return RegexFilter(column, self._value(raw=True))
+
+        return ComparisonFilter(column, op, self._value())
+
+    def _value(self, raw: bool = False):
+        kind, text, _ = self._next('value')
+
+        if kind == 'string':
+            return re.sub(r'\\([\\\'"])', r'\1', text[1:-1])
+
+        if kind != 'word':
+            self._fail('value', step_back=True)
+
+        if raw:
+            return text
+
+        for value_type in (int, float):
+            try:
+                return value_type(text)
+            except ValueError:
+                pass
+
+        return text
+
+    def _peek(self):
+        return self._tokens[self._position] if self._position < len(self._tokens) else None
+
+    def _next(self, expected):
+        token = self._peek()
+
+        if token is None:
+            self._fail(expected)
+
+        self._position += 1
+
+        return token
+
+    def _accept(self, kind, text):
+        token = self._peek()
+
+        if token is not None and token[0] == kind and token[1] == text:
+            self._position += 1
+            return True
+
+        return False
+
+    def _accept_keyword(self, keyword):
+        token = self._peek()
+
+        if token is not None and token[0] == 'word' and token[1].lower() == keyword:
+            self._position += 1
+            return True
+
+        return False
+
+    def _expect(self, kind, text):
+        if not self._accept(kind, text):
+            self._fail(f'`{text}`')
+
+    def _fail(self, expected, step_back=False):
+        if step_back:
+            self._position -= 1
+
+        token = self._peek()
+
+        if token is None:
+            raise ValueError(f'Expected {expected} at the end of filter expression `{self.text}`')
+
+        raise ValueError(
+            f'Expected {expected}, got `{token[1]}` at position {token[2]} of filter expression `{self.text}`'
+        )
+
+    @classmethod
+    def _tokenize(cls, text):
+        """
+        Split an expression into tokens
+
+        :param text: A filter expression
+        :return: A list of tuples of a token kind, a token text and its position in the expression
+        """
+        tokens = []
+        position = 0
+
+        while text[position:].strip():
+            match = cls._token_regex.match(text, position)
+
+            if match is None:
+                start = len(text) - len(text[position:].lstrip())
+                raise ValueError(f'Unexpected `{text[start]}` at position {start} of filter expression `{text}`')
+
+            kind = match.lastgroup
+            tokens.append((kind, match.group(kind), match.start(kind)))
+            position = match.end()
+
+        return tokens
+
+
+@lru_cache(maxsize=256)
+def compile_query(text: str) -> Filter:
+    """
+    Parse a filter expression (see QueryParser) once and reuse the filter for the same expression text,
+    so repeated queries skip parsing and regular expression compilation.
+
+    Filters do not keep state between evaluations, so a cached filter can be shared by any number of queries.
+    Cache statistics are available with `compile_query.cache_info()`
+
+    :param text: A filter expression
+    :return: A filter
+    """
+    return QueryParser(text).parse()
@@ -0,0 +1,104 @@
+from typing import List, Optional
+
+from ds_simple_db.filters.column_filter import ColumnFilter
+
+
+class RangeFilter(ColumnFilter):
+    """
+    Filter entries with column values within a range: `low <= column <= high`.
+
+    Either bound may be omitted, bounds are inclusive unless `include_low`/`include_high` are False.
+    Like ComparisonFilter, None values and values that can not be compared with the bounds never satisfy the filter,
+    and indexes supporting range lookups give candidate rows only for string bounds.
+    """
+
+    def __init__(self, column: str, low=None, high=None, include_low: bool = True, include_high: bool = True):
+        """
+        :param column: A column to check values of
+        :param low: The lower bound (unbounded if None)
+        :param high: The upper bound (unbounded if None)
+        :param include_low: Whether values equal to the lower bound satisfy the filter
+        :param include_high: Whether values equal to the upper bound satisfy the filter
+        """
+        super().__init__(column)
+
+        if low is None and high is None:
+            raise ValueError('At least one of `low` and `high` must be provided')
+
+        self.low = low
+        self.high = high
+        self.include_low = include_low
+        self.include_high = include_high
+
+    def matches(self, value) -> bool:
+        if value is None:
+            return False
+
+        try:
+            if self.low is not None and (value < self.low if self.include_low else value <= self.low):
+                return False
+
+            if self.high is not None and (value > self.high if self.include_high else value >= self.high):
+                return False
+        except TypeError:
+            return False
+
+        return True
+
+    def cost(self) -> float:
+        return 1.5
+
+    def selectivity(self) -> float:
+        return 0.25
+
+    def may_match(self, summaries: dict) -> bool:
+        summary = summaries.get(self.column)
+
+        if summary is None:
+            return True
+
+        return summary.may_overlap(self.low, self.high, self.include_low, self.include_high)
+
+    def candidates(self, indexes: dict) -> Optional[List[int]]:
+        index = self._usable_index(indexes)
+
+        if index is None:
+            return None
+
+        return index.lookup_range(self.low, self.high, self.include_low, self.include_high)
+
+    def explain(self, indexes: dict) -> Optional[str]:
+        index = self._usable_index(indexes)
+
+        if index is None:
+            return None
+
+        return f'{index.kind} index range scan on `{self.column}`'
+
+    def _usable_index(self, indexes: dict):
+        index = indexes.get(self.column)
+
+        if index is None or not index.supports_range_lookup:
+            return None
+
+        if any(bound is not None and not isinstance(bound, str) for bound in (self.low, self.high)):
+            return None
+
+        return index
+
+    def _parameters(self) -> tuple:
+        return repr(self.low), repr(self.high), self.include_low, self.include_high
+
+    def __repr__(self):
+        if self.low is not None and self.high is not None and self.include_low and self.include_high:
+            return f'{self.column} between {self.low!r} and {self.high!r}'
+
+        conditions = []
+
+        if self.low is not None:
+            conditions.append(f'{self.column} {">=" if self.include_low else ">"} {self.low!r}')
+
+        if self.high is not None:
+            conditions.append(f'{self.column} {"<=" if self.include_high else "<"} {self.high!r}')
+
+        return ' and '.join(conditions)
@@ -0,0 +1,38 @@
+import re
+
+from ds_simple_db.filters.column_filter import ColumnFilter
+
+
+class RegexFilter(ColumnFilter):
+    """
+    Filter entries by searching a regular expression in a string representation of a column value.
+
+    The expression may match anywhere in the value, use `^` and `$` to anchor it.
+    Indexes are never used.
+    """
+
+    def __init__(self, column: str, pattern: str):
+        """
+        :param column: A column to check values of
+        :param pattern: A regular expression, see the `re` module
+        """
+        super().__init__(column)
+
+        if not isinstance(pattern, str):
+            raise TypeError(f'pattern must be of type `str`, `{type(pattern)}` given')
+
+        self.pattern = pattern
+
+        self._regex = re.compile(pattern)
+
+    def matches(self, value) -> bool:
+        return self._regex.search(str(value)) is not None
+
+    def cost(self) -> float:
+        return 4.0
+
+    def _parameters(self) -> tuple:
+        return self.pattern,
+
+    def __repr__(self):
+        return f'{self.column} ~ {self.pattern!r}'
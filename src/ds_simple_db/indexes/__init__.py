@@ -0,0 +1,13 @@
+from ds_simple_db.core.factory import Factory
+
+
+class IndexFactory(Factory):
+    """
+    A factory to create indexes. Index modules are imported when an index of their type is created
+    """
+    plugin_group = 'ds_simple_db.indexes'
+
+    classes = dict(
+        hash='ds_simple_db.indexes.hash_index:HashIndex',
+        sorted='ds_simple_db.indexes.sorted_index:SortedIndex'
+    )
@@ -0,0 +1,23 @@
+from collections import defaultdict
+from typing import List
+
+from ds_simple_db.core.index import Index
+
+
+class HashIndex(Index):
+    """
+    An index based on a dictionary of row lists.
+
+    Provides O(1) exact-match lookups, prefix lookups are not supported.
+    """
+
+    kind = 'hash'
+
+    def __init__(self):
+        self._rows = defaultdict(list)
+
+    def add(self, value, row: int):
+        self._rows[self._key(value)].append(row)
+
+    def lookup(self, key: str) -> List[int]:
+        return list(self._rows.get(key, []))
@@ -0,0 +1,122 @@
+import sys
+import threading
+from bisect import bisect_left, bisect_right
+from typing import List
+
+from ds_simple_db.core.index import Index
+
+
+class SortedIndex(Index):
+    """
+    An index based on a sorted list of keys and a parallel list of rows.
+
+    Provides O(log n) exact-match, prefix and range lookups. Added rows are kept in a pending list
+    and merged into the sorted lists by the next lookup: a few rows are inserted one by one (O(n) each),
+    while many rows are sorted and merged in a single pass, so bulk inserts do not cost O(n) per row.
+    """
+
+    kind = 'sorted'
+    supports_prefix_lookup = True
+    supports_range_lookup = True
+
+    MERGE_RATIO = 32
+    """Pending rows are merged in a single pass if there are more than 1/MERGE_RATIO of the indexed rows"""
+
+    def __init__(self):
+        self._keys = []
+        self._rows = []
+        self._pending = []
+
+        # Lookups run concurrently under a read lock of a storage, only one of them merges pending rows
+        self._merge_lock = threading.Lock()
+
+    def build(self, values):
+        pairs = sorted((self._key(value), row) for row, value in enumerate(values))
+
+        self._keys = [key for key, _ in pairs]
+        self._rows = [row for _, row in pairs]
+        self._pending = []
+
+    def add(self, value, row: int):
+        self._pending.append((self._key(value), row))
+
+    def add_many(self, values, start_row: int):
+        key = self._key
+        self._pending.extend([(key(value), row) for row, value in enumerate(values, start_row)])
+
+    def _merge_pending(self):
+        if not self._pending:
+            return
+
+        with self._merge_lock:
+            pending = self._pending
+
+            if not pending:
+                return
+
+            if len(pending) * self.MERGE_RATIO < len(self._keys):
+                keys, rows = self._keys, self._rows
+
+                # Rows are added in ascending order, so inserting after equal keys keeps rows of a key sorted
+                for key, row in pending:
+                    position = bisect_right(keys, key)
+                    keys.insert(position, key)
+                    rows.insert(position, row)
+            else:
+                pairs = list(zip(self._keys, self._rows))
+                pairs.extend(sorted(pending))
+
+                # Both parts are sorted runs, which the sort merges in linear time
+                pairs.sort()
+
+                self._keys = [key for key, _ in pairs]
+                self._rows = [row for _, row in pairs]
+
+            self._pending = []
+
+    def lookup(self, key: str) -> List[int]:
+        self._merge_pending()
+        start = bisect_left(self._keys, key)
+        end = bisect_right(self._keys, key, lo=start)
+
+        return self._rows[start:end]
+
+    def lookup_prefix(self, prefix: str) -> List[int]:
+        self._merge_pending()
+        start = bisect_left(self._keys, prefix)
+        upper_bound = self._prefix_upper_bound(prefix)
+        end = len(self._keys) if upper_bound is None else bisect_left(self._keys, upper_bound, lo=start)
+
+        return sorted(self._rows[start:end])
+
+    def lookup_range(self, low: str = None, high: str = None, include_low: bool = True,
+                     include_high: bool = True) -> List[int]:
+        self._merge_pending()
+
+        if low is None:
+            start = 0
+        else:
+            start = (bisect_left if include_low else bisect_right)(self._keys, low)
+
+        if high is None:
+            end = len(self._keys)
+        else:
+            end = (bisect_right if include_high else bisect_left)(self._keys, high, lo=start)
+
+        return sorted(self._rows[start:end])
+
+    @staticmethod
+    def _prefix_upper_bound(prefix: str):
+        """
+        Get the smallest string that is greater than all strings starting with a prefix
+
+        :param prefix: A prefix
+        :return: An upper bound string or None if there is no upper bound (all strings greater than prefix match)
+        """
+        while prefix and prefix[-1] == chr(sys.maxunicode):
+            prefix = prefix[:-1]
+
+        if not prefix:
+            return None
+
+        return prefix[:-1] + chr(ord(prefix[-1]) + 1)
@@ -1,16 +1,30 @@
 from ds_simple_db.core.factory import Factory
 
-from .csv_serializer import CSVSerializer
-from .json_serializer import JSONSerializer
-
 
 class SerializerFactory(Factory):
     """
     A factory to create serializers.
 
-    HTMLSerializer and TableSerializer are not included because they do not implement deserialization at the moment
+    HTMLSerializer and TableSerializer are not included because they do not implement deserialization at the moment.
+    Serializer modules are imported when a serializer of their type is created
     """
+    plugin_group = 'ds_simple_db.serializers'
+
     classes = dict(
-        csv=CSVSerializer,
-        json=JSONSerializer
+        csv='ds_simple_db.serializers.csv_serializer:CSVSerializer',
+        json='ds_simple_db.serializers.json_serializer:JSONSerializer',
+        jsonl='ds_simple_db.serializers.json_lines_serializer:JSONLinesSerializer',
+        sdb='ds_simple_db.serializers.binary_columnar_serializer:BinaryColumnarSerializer'
     )
+
+    @classmethod
+    def create_for_file(cls, file_path, *args, **kwargs):
+        """
+        Instantiate a serializer registered under the extension of a given file
+
+        :param file_path: A path to a file, e.g. `db/example.csv`
+        :param args: Positional arguments to pass to a serializer constructor
+        :param kwargs: Keyword arguments to pass to a serializer constructor
+        :return: A serializer instance
+        """
+        return cls.create(file_path.split('.')[-1], *args, **kwargs)
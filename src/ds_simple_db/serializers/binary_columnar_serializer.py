@@ -0,0 +1,223 @@
+import mmap
+import struct
+from contextlib import contextmanager
+from typing import IO, Iterable, Iterator, List
+
+from ds_simple_db.core.column_codec import KINDS, EncodedColumn, encode_column
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.core.serializer import Serializer
+
+
+class BinaryColumnarSerializer(Serializer):
+    """
+    Serializer to a binary columnar format laid out to be memory-mapped.
+
+    Layout (all numbers are little-endian):
+        header:    magic `SDBCOL1\\0`, uint32 format version, uint32 number of columns, uint64 number of rows
+        directory: for every column - uint32 name length, UTF-8 name, uint8 kind (index in KINDS) and
+                   uint64 offset/length pairs of `nulls`, `values` and `blob` buffers (see EncodedColumnData)
+        data:      column buffers, every buffer starts at an offset aligned to 8 bytes
+
+    Reading a column does not require reading any other column, and the directory is enough to open a file,
+    see `open_columns()`. Writing keeps all values of the columns in memory since the layout
+    depends on the total number of rows.
+
+    The format supports columns of `str`, `int` and `float` values (with None), kinds are inferred on writing.
+    """
+
+    binary = True
+
+    MAGIC = b'SDBCOL1\0'
+    VERSION = 1
+
+    _HEADER = struct.Struct('<8sIIQ')
+    _NAME_LENGTH = struct.Struct('<I')
+    _COLUMN_LAYOUT = struct.Struct('<BQQQQQQ')
+    _ALIGNMENT = 8
+
+    def entries_to_string(self, entries: Iterable[Entry]) -> str:
+        raise NotImplementedError('Binary columnar format can not be serialized to a string, use `entries_to_stream`')
+
+    def entries_from_string(self, input_str: str) -> List[Entry]:
+        raise NotImplementedError('Binary columnar format can not be deserialized from a string, use `entries_from_stream`')
+
+    def entries_to_stream(self, entries: Iterable[Entry], fp: IO[bytes]):
+        """
+        Serialize entries to a writable binary stream
+
+        :param entries: An iterable of entries to serialize (all entries must have the same fields)
+        :param fp: A writable binary stream
+        """
+        fields = None
+        columns_values = []
+
+        for entry in entries:
+            if fields is None:
+                fields = entry.fields()
+                columns_values = [[] for _ in fields]
+
+            elif entry.fields() != fields:
+                raise ValueError('Entries have different sets of fields')
+
+            for column_values, value in zip(columns_values, entry.values()):
+                column_values.append(value)
+
+        self.columns_to_stream(dict(zip(fields or [], columns_values)), fp)
+
+    def columns_to_stream(self, columns_data: dict, fp: IO[bytes]):
+        """
+        Serialize whole columns to a writable binary stream
+
+        :param columns_data: A dict with column names as keys and lists of values of equal lengths as values
+        :param fp: A writable binary stream
+        """
+        encoded_columns = {column: encode_column(values) for column, values in columns_data.items()}
+        num_rows = len(next(iter(columns_data.values()), []))
+
+        directory_size = sum(
+            self._NAME_LENGTH.size + len(column.encode('utf-8')) + self._COLUMN_LAYOUT.size
+            for column in encoded_columns
+        )
+        position = self._align(self._HEADER.size + directory_size)
+
+        # Compute buffer offsets first, as the directory precedes the data
+        layouts = []
+        buffers = []
+
+        for column, encoded in encoded_columns.items():
+            layout = [KINDS.index(encoded.kind)]
+
+            for buffer in (encoded.nulls, encoded.values, encoded.blob):
+                layout += [position, len(buffer)]
+                buffers.append((position, buffer))
+                position = self._align(position + len(buffer))
+
+            layouts.append((column, layout))
+
+        fp.write(self._HEADER.pack(self.MAGIC, self.VERSION, len(encoded_columns), num_rows))
+
+        for column, layout in layouts:
+            name = column.encode('utf-8')
+            fp.write(self._NAME_LENGTH.pack(len(name)) + name + self._COLUMN_LAYOUT.pack(*layout))
+
+        written = self._HEADER.size + directory_size
+
+        for offset, buffer in buffers:
+            fp.write(b'\0' * (offset - written))
+            fp.write(buffer)
+            written = offset + len(buffer)
+
+    def entries_from_stream(self, fp: IO[bytes]) -> Iterator[Entry]:
+        for row in self.rows_from_stream(fp):
+            # Rows are new dicts of immutable values, so they are not copied
+            yield Entry(data=row, copy=False)
+
+    def rows_from_stream(self, fp: IO[bytes]) -> Iterator[dict]:
+        """
+        Lazily deserialize rows from a readable binary stream.
+        Files are memory-mapped, other streams are read at once
+
+        :param fp: A readable binary stream
+        :return: An iterator over dicts with column names as keys
+        """
+        with self._opened_columns(fp) as columns:
+            num_rows = len(next(iter(columns.values()), []))
+
+            for idx in range(num_rows):
+                yield {column: values[idx] for column, values in columns.items()}
+
+    def columns_from_stream(self, fp: IO[bytes], batch_size: int = None) -> Iterator[dict]:
+        """
+        Lazily deserialize batches of columns from a readable binary stream,
+        a column of a batch is decoded at once from a slice of its buffers without building rows
+
+        :param fp: A readable binary stream
+        :param batch_size: The maximum number of rows in a batch (COLUMNS_BATCH_SIZE if None)
+        :return: An iterator over dicts with columns as keys and lists of values of equal lengths as values
+        """
+        if batch_size is None:
+            batch_size = self.COLUMNS_BATCH_SIZE
+
+        with self._opened_columns(fp) as columns:
+            num_rows = len(next(iter(columns.values()), []))
+
+            for start in range(0, num_rows, batch_size):
+                yield {column: values[start:start + batch_size] for column, values in columns.items()}
+
+    @contextmanager
+    def _opened_columns(self, fp):
+        """
+        Memory-map a file (other streams are read at once) and open its columns,
+        the columns are released and the file is unmapped on exit
+
+        :param fp: A readable binary stream
+        :return: A context manager yielding a dict of column names and EncodedColumn instances
+        """
+        try:
+            buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            buffer = fp.read()
+
+        try:
+            columns = self.open_columns(buffer)
+
+            try:
+                yield columns
+            finally:
+                for values in columns.values():
+                    values.release()
+        finally:
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+
+    def open_columns(self, buffer) -> dict:
+        """
+        Parse the header and the directory of a serialized buffer without reading column data
+
+        :param buffer: A bytes-like object (e.g. a memory-mapped file) with serialized data
+        :return: A dict with column names as keys and EncodedColumn instances reading the buffer as values
+        """
+        view = memoryview(buffer)
+
+        try:
+            if len(view) < self._HEADER.size:
+                raise ValueError('Input is too short to be in a binary columnar format')
+
+            magic, version, num_columns, num_rows = self._HEADER.unpack_from(view, 0)
+
+            if magic != self.MAGIC:
+                raise ValueError('Input is not in a binary columnar format')
+
+            if version != self.VERSION:
+                raise ValueError(f'Unsupported binary columnar format version {version}')
+
+            position = self._HEADER.size
+            columns = dict()
+
+            for _ in range(num_columns):
+                name_length, = self._NAME_LENGTH.unpack_from(view, position)
+                position += self._NAME_LENGTH.size
+                column = bytes(view[position:position + name_length]).decode('utf-8')
+                position += name_length
+
+                kind, *layout = self._COLUMN_LAYOUT.unpack_from(view, position)
+                position += self._COLUMN_LAYOUT.size
+
+                offsets_and_lengths = list(zip(layout[::2], layout[1::2]))
+
+                if any(offset + length > len(view) for offset, length in offsets_and_lengths):
+                    raise ValueError(f'Column `{column}` is truncated')
+
+                if kind >= len(KINDS) or offsets_and_lengths[0][1] != num_rows:
+                    raise ValueError(f'Column `{column}` is corrupted')
+
+                nulls, values, blob = [view[offset:offset + length] for offset, length in offsets_and_lengths]
+
+                columns[column] = EncodedColumn(KINDS[kind], nulls, values, blob)
+
+            return columns
+        finally:
+            view.release()
+
+    def _align(self, position):
+        return -(-position // self._ALIGNMENT) * self._ALIGNMENT
@@ -1,24 +1,107 @@
-from typing import List
+import csv
+import io
+import re
+from itertools import chain, islice
+from typing import IO, Iterable, Iterator, List
 
 from ds_simple_db.core.entry import Entry
 from ds_simple_db.core.serializer import Serializer
 
 
+class _LineWriter:
+    """
+    A file-like object for `csv.writer` that hands written lines back instead of storing them,
+    `writerow()` returns the result of `write()`, so it returns the formatted line
+    """
+
+    @staticmethod
+    def write(line):
+        return line
+
+
 class CSVSerializer(Serializer):
     """
-    Serializer to a CSV format with a given `delimiter` and `newline`.
+    Serializer to a CSV format with a given dialect (`delimiter`, `quotechar`, `escapechar`, `quoting` and `newline`).
+
+    Lines are split and joined by the standard `csv` module, so fields containing delimiters, quotes
+    or newlines are quoted on writing and parsed back correctly.
+
+    The first line is a header that starts with `#`, other lines are data even if they start with `#`
+    (a field written as `"#..."` can not be told apart from `#...` once parsed). Blank lines are skipped.
+
+    All values are strings by default. With `infer_types=True` columns whose non-empty values are all
+    decimal integers are parsed as `int` columns, columns of decimal numbers as `float` columns, and empty values
+    of numeric columns become None. A value is only parsed if it is written back the same way, so identifiers
+    like zip codes (`02134`) and numbers like `1.50` or `1e3` keep columns as strings.
+    Types are inferred from the first `sample_size` rows, a later value that does not fit the type of its column
+    raises ValueError, so the input is still read batch by batch.
 
     Sample output:
         #name,address\n
         Dmitry,Moscow\n
-        Andrew,London\n
+        Andrew,"London, UK"\n
     """
 
-    def __init__(self):
-        self._delimiter = ','
-        self._newline = '\n'
+    QUOTING = dict(
+        minimal=csv.QUOTE_MINIMAL,
+        all=csv.QUOTE_ALL,
+        none=csv.QUOTE_NONE
+    )
+    """Names of supported quoting modes, see the `csv` module"""
+
+    file_newline = ''
+    """The `csv` module handles line endings itself, so that newlines inside quoted fields are kept as they are"""
+
+    _regexes = {
+        int: re.compile(r'-?(?:0|[1-9][0-9]*)'),
+        float: re.compile(r'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?')
+    }
+    """Numeric types columns are inferred as, in the order they are tried, with patterns of their values"""
 
-    def entries_to_string(self, entries: List[Entry]) -> str:
+    def __init__(self, delimiter: str = ',', quotechar: str = '"', escapechar: str = None, quoting: str = 'minimal',
+                 newline: str = '\n', strip: bool = True, infer_types: bool = False, sample_size: int = 10000):
+        """
+        :param delimiter: A one-character string separating fields
+        :param quotechar: A one-character string quoting fields that contain special characters
+        :param escapechar: A one-character string escaping special characters (required with `quoting='none'`)
+        :param quoting: When fields are quoted on writing: `minimal` (only if needed), `all` or `none`
+        :param newline: A string terminating lines on writing, any newline is accepted on reading
+        :param strip: Whether to remove whitespace around values on reading
+        :param infer_types: Whether to parse numeric columns as `int` or `float` columns
+        :param sample_size: The number of first rows the types of columns are inferred from with `infer_types`
+        """
+        if quoting not in self.QUOTING:
+            raise ValueError(f'Unknown quoting `{quoting}`, available values are {list(self.QUOTING.keys())}')
+
+        self.delimiter = delimiter
+        self.newline = newline
+        self.strip = strip
+        self.infer_types = infer_types
+        self.sample_size = sample_size
+
+        self._dialect = dict(
+            delimiter=delimiter,
+            quotechar=quotechar,
+            escapechar=escapechar,
+            quoting=self.QUOTING[quoting],
+            doublequote=escapechar is None,
+            skipinitialspace=strip,
+            lineterminator=newline
+        )
+
+        # Fail early on an invalid dialect rather than on the first line
+        try:
+            csv.writer(_LineWriter, **self._dialect)
+        except (TypeError, csv.Error) as error:
+            raise ValueError(f'Invalid CSV dialect: {error}') from error
+
+        self._writable_types = {str, type(None), int, float} if infer_types else {str, type(None)}
+
+        # The reader splits lines on both `\r` and `\n`, while the writer only quotes line breaks of `newline`
+        other_line_breaks = ''.join(char for char in '\r\n' if char not in newline)
+        self._line_break_regex = re.compile(f'[{other_line_breaks}]') if other_line_breaks else None
+
+    def entries_to_string(self, entries: Iterable[Entry]) -> str:
         """
         Serialise CSV to a string in a following CSV format:
 
@@ -29,31 +112,103 @@ class CSVSerializer(Serializer):
         Commas here can be replaced by any delimiter given in a CSVSerializer constructor
         Newline delimiter can also be set in a CSVSerializer constructor
 
-        Note that no typing is provided at the moment so all values will be considered as strings.
-        Thus we explicitly prohibit serializing non-string values to avoid any deserialization incoherence.
+        Values are strings unless `infer_types` is set, then `int` and `float` values are accepted as well.
+        Other values are prohibited to avoid any deserialization incoherence.
 
-        :param entries: A list of entries to serialize
+        :param entries: An iterable of entries to serialize
         :return: A serialized string
         """
-        if len(entries) == 0:
-            return ''
+        return ''.join(self.entries_to_chunks(entries))
+
+    def entries_to_chunks(self, entries: Iterable[Entry]) -> Iterator[str]:
+        """
+        Lazily serialize entries yielding a header line first and then a single line per chunk
+
+        :param entries: An iterable of entries to serialize
+        :return: An iterator over serialized lines
+        """
+        try:
+            yield from map(self._row_writer(_LineWriter), self._rows_to_write(entries))
+        except csv.Error as error:
+            raise ValueError(f'Can not write values as CSV: {error}') from error
+
+    def entries_to_stream(self, entries: Iterable[Entry], fp: IO[str]):
+        """
+        Serialize entries to a writable text stream, the `csv` writer writes lines to the stream itself
+
+        :param entries: An iterable of entries to serialize
+        :param fp: A writable text stream
+        """
+        try:
+            writerow = self._row_writer(fp)
 
-        # Write header
-        first_entry_fields = entries[0].fields()
-        entries_data = '#' + self._make_line(first_entry_fields)
+            for values in self._rows_to_write(entries):
+                writerow(values)
+        except csv.Error as error:
+            raise ValueError(f'Can not write values as CSV: {error}') from error
 
-        # Write values
-        for entry in entries:
+    def _row_writer(self, fp):
+        """
+        Get a function writing a list of values as a line with the `csv` writer.
+        Lines with values containing line breaks the writer does not quote itself are written
+        with all values quoted, so that they are read back as a single line
+
+        :param fp: A file-like object to write lines to
+        :return: A function taking a list of values and returning the result of `fp.write()`
+        """
+        line_break_regex = self._line_break_regex
+
+        if line_break_regex is None or self._dialect['quoting'] == csv.QUOTE_ALL:
+            return csv.writer(fp, **self._dialect).writerow
+
+        writer = csv.writer(_LineWriter, **self._dialect)
+        quoting_writer = csv.writer(_LineWriter, **dict(self._dialect, quoting=csv.QUOTE_ALL))
+        quoting = self._dialect['quoting'] != csv.QUOTE_NONE
+
+        def writerow(values):
+            line = writer.writerow(values)
+
+            if line_break_regex.search(line) is not None:
+                if not quoting:
+                    raise ValueError('Can not write a value containing a line break without quoting')
+
+                line = quoting_writer.writerow(values)
+
+            return fp.write(line)
+
+        return writerow
+
+    def _rows_to_write(self, entries):
+        """
+        Check entries and convert them to lists of values to write, starting with the header
+
+        :param entries: An iterable of entries to serialize
+        :return: An iterator over lists of values
+        """
+        entries = iter(entries)
+        first_entry = next(entries, None)
+
+        if first_entry is None:
+            return
+
+        # The header marker is a part of the first field, so that it is quoted together with it
+        first_entry_fields = first_entry.fields()
+        yield ['#' + first_entry_fields[0]] + first_entry_fields[1:]
+
+        writable_types = self._writable_types
+
+        for entry in chain([first_entry], entries):
             self._check_entry_fields_match(first_entry_fields, entry.fields())
-            entries_data += self._make_line(entry.values())
+            values = entry.values()
 
-        return entries_data
+            if not writable_types.issuperset(map(type, values)):
+                self._raise_type_error(values)
+
+            yield values
 
     def entries_from_string(self, input_str: str) -> List[Entry]:
         """
-        Deserialize CSV from a string using a standard Python standard `json.loads()` function.
-
-        Note that no typing is provided at the moment so all values will be considered as strings.
+        Deserialize CSV from a string.
 
         The format of the input must be as follows:
         #header_col1,header_col2\n
@@ -63,73 +218,211 @@ class CSVSerializer(Serializer):
         :param input_str: A CSV string to serialize
         :return: A list of entries deserialized from a string
         """
-        lines = input_str.splitlines()
-        header = self._get_header(lines)
-        entries = self._get_entries(header, lines)
+        return list(self.entries_from_stream(io.StringIO(input_str, newline='')))
 
-        return entries
+    def entries_from_stream(self, fp: IO[str]) -> Iterator[Entry]:
+        """
+        Lazily deserialize CSV from a readable text stream line by line,
+        so that only a single line is kept in memory at once (the first `sample_size` lines with `infer_types`).
 
-    def _get_header(self, lines):
-        if len(lines) == 0:
-            raise ValueError('Header not found in the input')
+        The format of the input is the same as in `entries_from_string()`
+
+        :param fp: A readable text stream
+        :return: An iterator over deserialized entries
+        """
+        for row in self.rows_from_stream(fp):
+            yield Entry(data=row, copy=False)
+
+    def rows_from_stream(self, fp: IO[str]) -> Iterator[dict]:
+        if self.infer_types:
+            for columns_data in self.columns_from_stream(fp):
+                header = list(columns_data.keys())
+
+                for values in zip(*columns_data.values()):
+                    yield dict(zip(header, values))
+
+            return
+
+        reader = csv.reader(fp, **self._dialect)
+        header = self._read_header(reader)
+        num_columns = len(header)
+        strip = self.strip
+
+        try:
+            for row in reader:
+                if len(row) == 0:
+                    continue
+
+                if len(row) != num_columns:
+                    raise ValueError(f'Number of tokens in line {reader.line_num} does not match the header')
+
+                yield dict(zip(header, map(str.strip, row) if strip else row))
+        except csv.Error as error:
+            raise ValueError(f'Invalid CSV in line {reader.line_num}: {error}') from error
+
+    def columns_from_stream(self, fp: IO[str], batch_size: int = None) -> Iterator[dict]:
+        """
+        Lazily deserialize CSV into batches of columns, which storages append without building a dict per row.
+        Lines are split by the `csv` module and transposed into columns at once.
+
+        With `infer_types` the batches of the first `sample_size` rows are kept until the types of columns
+        are inferred from them, then all batches are converted to typed columns
+
+        :param fp: A readable text stream
+        :param batch_size: The maximum number of rows in a batch (COLUMNS_BATCH_SIZE if None)
+        :return: An iterator over dicts with columns as keys and lists of values of equal lengths as values
+        """
+        if batch_size is None:
+            batch_size = self.COLUMNS_BATCH_SIZE
+
+        reader = csv.reader(fp, **self._dialect)
+        header = self._read_header(reader)
+        batches = self._read_columns(reader, len(header), batch_size)
+
+        if self.infer_types:
+            batches = self._infer_batches(header, batches)
+
+        for columns in batches:
+            yield dict(zip(header, columns))
+
+    def _read_header(self, reader):
+        try:
+            header = next(reader, None)
+        except csv.Error as error:
+            raise ValueError(f'Invalid CSV header: {error}') from error
 
-        header_line = lines[0]
+        if header is None or len(header) == 0:
+            raise ValueError('Header not found in the input')
 
-        if not header_line.startswith('#'):
+        if not header[0].startswith('#'):
             raise ValueError('Header must start with #')
 
-        header_line_without_hash = header_line[1:]
-        header = self._split_line(header_line_without_hash)
+        header[0] = header[0][1:]
+
+        return [column.strip() for column in header]
+
+    def _read_columns(self, reader, num_columns, batch_size):
+        """
+        Read lines batch by batch, skipping blank lines
+
+        :param reader: A csv reader positioned after the header
+        :param num_columns: The number of columns in the header
+        :param batch_size: The number of lines to read at once
+        :return: An iterator over lists of columns, each column is a list of strings
+        """
+        while True:
+            columns = self._read_batch(reader, num_columns, batch_size)
+
+            if columns is None:
+                return
+
+            if len(columns) > 0:
+                yield columns
+
+    def _read_batch(self, reader, num_columns, batch_size):
+        """
+        Read a batch of lines and transpose it into columns
+
+        :return: A list of columns, an empty list if all lines are skipped, or None at the end of the input
+        """
+        try:
+            lines = list(islice(reader, batch_size))
+
+            if len(lines) == 0:
+                return None
+
+            rows = [row for row in lines if len(row) > 0]
+
+            if any(len(row) != num_columns for row in rows):
+                raise ValueError(
+                    f'Number of tokens in a line does not match the header in lines '
+                    f'{reader.line_num - len(lines) + 1}-{reader.line_num}'
+                )
 
-        return header
+            columns = zip(*rows)
 
-    def _get_entries(self, header, lines):
-        entries = []
+            return [list(map(str.strip, values)) for values in columns] if self.strip else list(map(list, columns))
+        except csv.Error as error:
+            raise ValueError(f'Invalid CSV in line {reader.line_num}: {error}') from error
 
-        for line in lines:
-            if line.startswith('#'):
-                continue
+    def _infer_batches(self, header, batches):
+        """
+        Infer the types of columns from the batches of the first `sample_size` rows and convert all batches
 
-            values = self._split_line(line)
+        :param header: A list of column names
+        :param batches: An iterator over lists of columns of strings
+        :return: An iterator over lists of columns of strings, `int` and `float` values
+        """
+        sample = []
+        num_rows = 0
 
-            if len(values) != len(header):
-                raise ValueError('Number of tokens in a line does not match the header')
+        for columns in batches:
+            sample.append(columns)
+            num_rows += len(columns[0]) if len(columns) > 0 else 0
 
-            entry_data = dict(zip(header, values))
-            entry = Entry(data=entry_data)
-            entries.append(entry)
+            if num_rows >= self.sample_size:
+                break
 
-        return entries
+        column_types = [
+            self._infer_column_type([columns[idx] for columns in sample]) for idx in range(len(header))
+        ]
 
-    def _split_line(self, line):
-        return [x.strip() for x in line.split(',')]
+        for columns in chain(sample, batches):
+            yield [
+                self._convert_column(column, column_type, values) if column_type is not None else values
+                for column, column_type, values in zip(header, column_types, columns)
+            ]
 
-    def _make_line(self, tokens: List[str]) -> str:
+    def _infer_column_type(self, sample):
         """
-        Make a single line of a csv file given a list of string tokens.
+        Find the numeric type all non-empty values of a column are written in
 
-        Tokens are joined using a `delimiter` and the whole line appended with a `newline`.
+        :param sample: Lists of strings of the column from the sampled batches
+        :return: `int`, `float`, or None if the column is kept as strings
+        """
+        present = [value for values in sample for value in values if value]
 
-        Can be used to create both header and data lines.
+        if len(present) == 0:
+            return None
 
-        None values are converted to empty strings
+        for value_type in self._regexes:
+            if all(self._is_exact(value, value_type) for value in present):
+                return value_type
 
-        :param tokens: A list of string tokens to join using a given delimiter
-        :return: A resulting CSV line
+        return None
+
+    def _convert_column(self, column, column_type, values):
         """
-        values = [self._handle_type(x) for x in tokens]
-        return self._delimiter.join(values) + self._newline
+        Convert a column of strings to a column of numbers, empty strings become None
 
-    def _handle_type(self, token):
+        :param column: The name of the column
+        :param column_type: The type inferred from the sampled rows, `int` or `float`
+        :param values: A list of strings
+        :return: A list of `int` or `float` values and None
         """
-        Do type conversion
+        for value in values:
+            if value and not self._is_exact(value, column_type):
+                raise ValueError(
+                    f'Value `{value}` of column `{column}` is not of the `{column_type.__name__}` type '
+                    f'inferred from the first {self.sample_size} rows'
+                )
 
-        TODO: this potentially should be much more elaborated than the current implementation
+        return [column_type(value) if value else None for value in values]
 
-        :param token: Input token with source type
-        :return: Converted token with type consideration
+    def _is_exact(self, value, value_type):
+        """
+        Check whether a string is a number of a type that is written back as the same string,
+        so that inferring types never changes the text of values (`-0`, `1.50` and `1e3` are kept as strings)
         """
-        return token if token is not None else ''
+        return self._regexes[value_type].fullmatch(value) is not None and str(value_type(value)) == value
+
+    def _raise_type_error(self, values):
+        for value in values:
+            if type(value) not in self._writable_types:
+                raise TypeError(
+                    f'Can not serialize a value of type `{type(value)}` to CSV, '
+                    f'allowed types are {sorted(value_type.__name__ for value_type in self._writable_types)}'
+                )
 
     @staticmethod
     def _check_entry_fields_match(first_entry_fields: List[str], entry_fields: List[str]):
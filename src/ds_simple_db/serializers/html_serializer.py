@@ -1,33 +1,95 @@
-from typing import List
+import os
+from html import escape
+from itertools import chain, islice
+from typing import Iterable, Iterator, List
+from urllib.parse import quote
 
 from ds_simple_db.core.entry import Entry
 from ds_simple_db.core.serializer import Serializer
 
 
 class HTMLSerializer(Serializer):
+    """
+    Serialize entries into a simple HTML table, values are converted to strings and escaped.
+
+    Large tables can be split into multiple pages linked with each other, see `entries_to_pages()`.
+
+    This is currently implemented only for serialisation/viewing purposes.
+    No deserialization is supported.
+    """
+
+    _CELL_SEPARATOR = '\x1f'
+
     def __init__(self, border=1):
         self._border = border
 
-    def entries_to_string(self, entries: List[Entry]) -> str:
+    def entries_to_string(self, entries: Iterable[Entry]) -> str:
         """
         Serialize entry list into a simple HTML table
 
-        :param entries:
-        :return:
+        :param entries: An iterable of entries to serialize
+        :return: A serialized string
         """
-        if len(entries) == 0:
-            return ''
+        return ''.join(self.entries_to_chunks(entries))
+
+    def entries_to_chunks(self, entries: Iterable[Entry]) -> Iterator[str]:
+        """
+        Lazily serialize entries into a simple HTML table yielding a single row per chunk
+
+        :param entries: An iterable of entries to serialize
+        :return: An iterator over serialized string chunks
+        """
+        entries = iter(entries)
+        first_entry = next(entries, None)
 
-        out_str = f'<table border="{self._border}">'
+        if first_entry is None:
+            return
+
+        yield f'<table border="{self._border}">'
+        yield self._get_header(first_entry.fields())
+
+        for entry in chain([first_entry], entries):
+            yield self._get_row(entry.values())
+
+        yield '</table>'
+
+    def entries_to_pages(self, entries: Iterable[Entry], path: str, page_size: int) -> List[str]:
+        """
+        Serialize entries into HTML files of `page_size` rows each, every page links to the previous and the next one.
+        The first page is written to `path`, the next ones next to it with a page number added to the name,
+        e.g. `table.html`, `table_2.html`, `table_3.html`.
+
+        Pages are written one by one as entries are retrieved, so only a single row is kept in memory at once
+
+        :param entries: An iterable of entries to serialize
+        :param path: Path to the first page
+        :param page_size: The maximum number of rows per page
+        :return: A list of paths of written pages (a single page with no table if there are no entries)
+        """
+        if page_size < 1:
+            raise ValueError(f'`page_size` must be positive, got {page_size}')
 
-        out_str += self._get_header(entries[0].fields())
+        entries = iter(entries)
+        next_entry = next(entries, None)
+        paths = [path]
 
-        for entry in entries:
-            out_str += self._get_row(entry.values())
+        while True:
+            page_entries = [] if next_entry is None else chain([next_entry], islice(entries, page_size - 1))
 
-        out_str += '</table>'
+            with open(paths[-1], 'w', encoding='utf-8') as fp:
+                fp.write('<!DOCTYPE html>\n<html><head><meta charset="utf-8"></head><body>\n')
+                fp.writelines(self.entries_to_chunks(page_entries))
 
-        return out_str
+                next_entry = next(entries, None)
+                next_path = None if next_entry is None else self._page_path(path, len(paths) + 1)
+
+                fp.write(self._get_page_links(paths, next_path))
+                fp.write('</body></html>\n')
+
+            if next_path is None:
+                return paths
+
+            paths.append(next_path)
 
     def entries_from_string(self, input_str: str) -> List[Entry]:
         raise NotImplementedError("Deserialization of HTML not implemented")
@@ -36,34 +98,61 @@ class HTMLSerializer(Serializer):
         """
         Generate a header
 
-        :param fields:
-        :return:
+        :param fields: A list of column names
+        :return: A table row of header cells
+        """
+        return '<tr><th>' + '</th><th>'.join([escape(field, quote=False) for field in fields]) + '</th></tr>'
+
+    def _get_row(self, values):
         """
-        out_str = '<tr>'
+        Generate a row. Values are joined with a control character and escaped at once,
+        which is several times faster than escaping them one by one
 
-        for value in fields:
-            out_str += '<th>'
-            out_str += value
-            out_str += '</th>'
+        :param values: A list of values
+        :return: A table row of data cells
+        """
+        text = self._CELL_SEPARATOR.join(['' if value is None else str(value) for value in values])
 
-        out_str += '</tr>'
+        if text.count(self._CELL_SEPARATOR) != len(values) - 1:
+            return '<tr><td>' + '</td><td>'.join([
+                '' if value is None else escape(str(value), quote=False) for value in values
+            ]) + '</td></tr>'
 
-        return out_str
+        return '<tr><td>' + escape(text, quote=False).replace(self._CELL_SEPARATOR, '</td><td>') + '</td></tr>'
 
-    def _get_row(self, values):
+    @staticmethod
+    def _get_page_links(paths, next_path):
         """
-        Generate a row
+        Generate links to the previous and the next pages
 
-        :param values:
-        :return:
+        :param paths: Paths of pages written so far, the last one is the current page
+        :param next_path: Path to the next page, or None if the current page is the last one
+        :return: A paragraph with links, or an empty string if there is a single page
         """
-        out_str = '<tr>'
+        if len(paths) == 1 and next_path is None:
+            return ''
+
+        links = []
+
+        if len(paths) > 1:
+            links.append(f'<a href="{HTMLSerializer._page_url(paths[-2])}">Previous</a>')
+
+        links.append(f'Page {len(paths)}')
 
-        for value in values:
-            out_str += '<td>'
-            out_str += value
-            out_str += '</td>'
+        if next_path is not None:
+            links.append(f'<a href="{HTMLSerializer._page_url(next_path)}">Next</a>')
+
+        return '\n<p>' + ' | '.join(links) + '</p>\n'
+
+    @staticmethod
+    def _page_url(path):
+        """
+        Get a relative URL of a page, characters like `#`, `?`, `%` and spaces in its name are percent-encoded
+        """
+        return escape(quote(os.path.basename(path)))
 
-        out_str += '</tr>'
+    @staticmethod
+    def _page_path(path, page):
+        root, extension = os.path.splitext(path)
 
-        return out_str
+        return f'{root}_{page}{extension}'
@@ -0,0 +1,64 @@
+import json
+from importlib.util import find_spec
+
+
+class JSONBackend:
+    """
+    Encodes and decodes single JSON values with the standard `json` module or with `orjson`.
+
+    `orjson` is an optional dependency that encodes and decodes several times faster.
+    Its output is compact (no spaces after separators) and it supports only `str` keys and 64-bit integers.
+
+    Backends:
+        * `json` - the standard `json` module
+        * `orjson` - the `orjson` package, ValueError is raised if it is not installed
+        * `auto` - `orjson` if it is installed, `json` otherwise
+    """
+
+    BACKENDS = ('json', 'orjson', 'auto')
+
+    def __init__(self, name: str = 'json'):
+        """
+        :param name: A name of the backend, one of `BACKENDS`
+        """
+        if name not in self.BACKENDS:
+            raise ValueError(f'Unknown JSON backend `{name}`, expected one of {list(self.BACKENDS)}')
+
+        if name == 'auto':
+            name = 'orjson' if find_spec('orjson') is not None else 'json'
+
+        if name == 'orjson':
+            try:
+                import orjson
+            except ImportError:
+                raise ValueError('JSON backend `orjson` requires the `orjson` package: pip install orjson') from None
+
+            self._orjson = orjson
+        else:
+            self._orjson = None
+
+        self.name = name
+
+    def dumps(self, value) -> str:
+        """
+        Encode a value to a JSON string without line breaks
+
+        :param value: A value to encode
+        :return: A JSON string
+        """
+        if self._orjson is None:
+            return json.dumps(value)
+
+        return self._orjson.dumps(value).decode('utf-8')
+
+    def loads(self, input_str: str):
+        """
+        Decode a JSON string, ValueError is raised if the string is not valid JSON
+
+        :param input_str: A JSON string
+        :return: A decoded value
+        """
+        if self._orjson is None:
+            return json.loads(input_str)
+
+        return self._orjson.loads(input_str)
@@ -0,0 +1,55 @@
+import io
+from typing import IO, Iterable, Iterator, List
+
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.core.serializer import Serializer
+from ds_simple_db.serializers.json_backend import JSONBackend
+
+
+class JSONLinesSerializer(Serializer):
+    """
+    Serializer to the JSON Lines format (https://jsonlines.org): one JSON object per line.
+
+    Every line is encoded and decoded independently, so the format is processed incrementally in both directions
+    and can be handled by a faster backend (see JSONBackend). By default `orjson` is used if it is installed.
+    Blank lines are skipped on decoding.
+    """
+
+    def __init__(self, backend: str = 'auto'):
+        """
+        :param backend: A JSON backend to encode and decode lines with, see JSONBackend
+        """
+        self._backend = JSONBackend(backend)
+
+    def entries_to_string(self, entries: Iterable[Entry]) -> str:
+        return ''.join(self.entries_to_chunks(entries))
+
+    def entries_to_chunks(self, entries: Iterable[Entry]) -> Iterator[str]:
+        dumps = self._backend.dumps
+
+        for entry in entries:
+            yield dumps(dict(zip(entry.fields(), entry.values()))) + '\n'
+
+    def entries_from_string(self, input_str: str) -> List[Entry]:
+        return list(self.entries_from_stream(io.StringIO(input_str)))
+
+    def entries_from_stream(self, fp: IO[str]) -> Iterator[Entry]:
+        for row in self.rows_from_stream(fp):
+            yield Entry(data=row, copy=False)
+
+    def rows_from_stream(self, fp: IO[str]) -> Iterator[dict]:
+        loads = self._backend.loads
+
+        for line_number, line in enumerate(fp, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                row = loads(line)
+            except ValueError as error:
+                raise ValueError(f'Invalid JSON on line {line_number}: {error}') from error
+
+            if not isinstance(row, dict):
+                raise TypeError(f'Data must be of type `dict`, {type(row)} given on line {line_number}')
+
+            yield row
@@ -1,35 +1,87 @@
 import json
-from typing import List
+import re
+from typing import IO, Any, Callable, Iterable, Iterator, List
 
 from ds_simple_db.core.entry import Entry
 from ds_simple_db.core.serializer import Serializer
+from ds_simple_db.serializers.json_backend import JSONBackend
 
 
 class JSONSerializer(Serializer):
     """
     Serializer to a JSON format with a given `indent`.
     The behaviour is similar to Python standard `json.dumps()`.
+
+    Both directions are incremental: entries are encoded one at a time, and streams are decoded
+    `READ_SIZE` characters at a time, so neither the whole document nor all its rows are kept in memory at once.
+
+    Entries without indentation are encoded and decoded by a faster backend if requested (see JSONBackend).
     """
-    def __init__(self, indent: int = None):
+
+    READ_SIZE = 1 << 16
+    """The number of characters read from a stream at once when decoding"""
+
+    FORMAT_ERROR = 'Input string must be of format: {"entries": [{"field1": "value1", "field2": "value2"}]}'
+
+    def __init__(self, indent: int = None, backend: str = 'json'):
+        """
+        :param indent: An indent of nested values (no line breaks if None), see `json.dumps()`
+        :param backend: A JSON backend to encode entries and decode strings with, see JSONBackend
+        """
         self._indent = indent
+        self._backend = JSONBackend(backend)
 
-    def entries_to_string(self, entries: List[Entry]) -> str:
+    def entries_to_string(self, entries: Iterable[Entry]) -> str:
         """
-        Serialise JSON to a string using a standard Python standard `json.dumps()` function.
+        Serialise JSON to a string. With the `json` backend the output is identical to the one
+        of a standard Python `json.dumps()` function applied to `{"entries": [...]}`.
 
-        :param entries: A list of entries to serialize
+        :param entries: An iterable of entries to serialize
         :return: A serialized JSON string
         """
-        entries_data = []
+        return ''.join(self.entries_to_chunks(entries))
+
+    def entries_to_chunks(self, entries: Iterable[Entry]) -> Iterator[str]:
+        """
+        Lazily serialize entries encoding a single entry per chunk,
+        so that the whole list of entries is never kept in memory
+
+        :param entries: An iterable of entries to serialize
+        :return: An iterator over serialized JSON chunks
+        """
+        if self._indent is None:
+            dumps = self._backend.dumps
+
+            yield '{"entries": ['
+            separator = ''
+
+            for entry in entries:
+                yield separator + dumps(dict(zip(entry.fields(), entry.values())))
+                separator = ', '
+
+            yield ']}'
+
+            return
+
+        # Reproduce the layout of `json.dumps(..., indent=indent)` with entries nested two levels deep
+        indent = ' ' * self._indent if isinstance(self._indent, int) else self._indent
+        entry_indent = '\n' + indent * 2
+
+        yield '{\n' + indent + '"entries": ['
+        separator = entry_indent
+        has_entries = False
 
         for entry in entries:
-            entries_data.append(entry.as_dict())
+            entry_str = json.dumps(dict(zip(entry.fields(), entry.values())), indent=self._indent)
+            yield separator + entry_str.replace('\n', entry_indent)
+            separator = ',' + entry_indent
+            has_entries = True
 
-        return json.dumps(dict(entries=entries_data), indent=self._indent)
+        yield ('\n' + indent if has_entries else '') + ']\n}'
 
     def entries_from_string(self, input_str: str) -> List[Entry]:
         """
-        Deserialize JSON from a string using a standard Python standard `json.loads()` function.
+        Deserialize JSON from a string at once using the backend.
 
         The format of the input must be as follows:
         {"entries": [{"field1": "value1", "field2": "value2"}]}
@@ -37,15 +89,232 @@ class JSONSerializer(Serializer):
         :param input_str: A JSON string to serialize
         :return: A list of entries deserialized from a string
         """
-        entries = []
+        return [Entry(data=row, copy=False) for row in self._rows_from_string(input_str)]
+
+    def entries_from_stream(self, fp: IO[str]) -> Iterator[Entry]:
+        for row in self.rows_from_stream(fp):
+            yield Entry(data=row, copy=False)
+
+    def rows_from_stream(self, fp: IO[str]) -> Iterator[dict]:
+        """
+        Lazily deserialize rows from a readable text stream decoding elements of `entries`
+        in the part of the stream that has been read
+
+        :param fp: A readable text stream
+        :return: An iterator over dicts with fields as keys
+        """
+        reader = _JSONStreamReader(fp, self.READ_SIZE, self._backend.loads)
+        has_entries = False
+
+        reader.expect('{')
+
+        if not reader.accept('}'):
+            while True:
+                key = reader.value()
+
+                if not isinstance(key, str):
+                    raise ValueError(f'Invalid JSON: object keys must be strings, got `{key}`')
+
+                reader.expect(':')
+
+                if key == 'entries':
+                    has_entries = True
+                    yield from self._rows_from_array(reader)
+                else:
+                    reader.value()
+
+                if reader.accept('}'):
+                    break
+
+                reader.expect(',')
+
+        reader.expect_end()
+
+        if not has_entries:
+            raise ValueError(self.FORMAT_ERROR)
+
+    def _rows_from_string(self, input_str: str) -> List[dict]:
+        data_dict = self._backend.loads(input_str)
+
+        if not isinstance(data_dict, dict) or 'entries' not in data_dict:
+            raise ValueError(self.FORMAT_ERROR)
+
+        for row in data_dict['entries']:
+            self._check_row(row)
+
+        return data_dict['entries']
+
+    def _rows_from_array(self, reader):
+        for row in reader.array_values():
+            yield self._check_row(row)
+
+    @staticmethod
+    def _check_row(row):
+        if not isinstance(row, dict):
+            raise TypeError(f'Data must be of type `dict`, {type(row)} given')
+
+        return row
+
+
+class _JSONStreamReader:
+    """
+    Reads JSON tokens and values from a text stream keeping only a window of it in memory
+    """
+
+    _whitespace_regex = re.compile(r'[ \t\n\r]*')
+    _separator_regex = re.compile(r'[ \t\n\r]*([,\]])')
+
+    def __init__(self, fp: IO[str], read_size: int, loads: Callable[[str], Any] = json.loads):
+        """
+        :param fp: A readable text stream
+        :param read_size: The number of characters to read at once
+        :param loads: A function decoding a JSON string
+        """
+        self._fp = fp
+        self._read_size = read_size
+        self._loads = loads
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._position = 0
+        self._offset = 0
+        self._is_eof = False
+
+    def accept(self, char: str) -> bool:
+        """
+        Skip a structural character if it is next in the stream
+
+        :param char: A character, e.g. `{`
+        :return: True if the character has been skipped
+        """
+        if self._peek() == char:
+            self._position += 1
+            return True
+
+        return False
+
+    def expect(self, char: str):
+        if not self.accept(char):
+            self._fail(f'`{char}`')
+
+    def expect_end(self):
+        if self._peek() != '':
+            self._fail('the end of input')
+
+    def value(self):
+        """
+        Decode the next value, reading more of the stream until the value is complete
+
+        :return: A decoded value
+        """
+        self._peek()
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if self._read():
+                    continue
+
+                raise
+
+            # A number at the end of the buffer may continue in the unread part of the stream
+            if end == len(self._buffer) and self._read():
+                continue
+
+            self._position = end
+
+            return value
+
+    def array_values(self) -> Iterator:
+        """
+        Lazily decode elements of the next array.
+
+        Complete objects in the buffer are decoded in one call: the buffer is cut after its last `},`
+        and the part before the cut is decoded as an array. The cut falls inside an element only if `},`
+        is a part of a string or of a nested value, then the part is not a valid array, and elements
+        up to the cut are decoded one by one
+
+        :return: An iterator over decoded elements
+        """
+        self.expect('[')
+
+        if self.accept(']'):
+            return
+
+        loads = self._loads
+        match_separator = self._separator_regex.match
+        invalid_cut = -1
+
+        while True:
+            cut = self._buffer.rfind('},', self._position)
+
+            if cut != -1 and self._offset + cut > invalid_cut:
+                try:
+                    values = loads('[' + self._buffer[self._position:cut + 1] + ']')
+                except ValueError:
+                    invalid_cut = self._offset + cut
+                else:
+                    self._position = cut + 2
+                    yield from values
+                    self._peek()
+                    continue
+
+            value = self.value()
+            separator = match_separator(self._buffer, self._position)
+
+            if separator is None:
+                # The separator may have not been read yet
+                self._peek()
+                separator = match_separator(self._buffer, self._position)
+
+                if separator is None:
+                    self._fail('`,` or `]`')
+
+            self._position = separator.end()
+
+            yield value
+
+            if separator.group(1) == ']':
+                return
+
+    def _peek(self) -> str:
+        """
+        Skip whitespace and get the next character without consuming it
+
+        :return: The next character or an empty string at the end of the stream
+        """
+        while True:
+            self._position = self._whitespace_regex.match(self._buffer, self._position).end()
+
+            if self._position < len(self._buffer) or not self._read():
+                return self._buffer[self._position:self._position + 1]
+
+    def _read(self) -> bool:
+        """
+        Append the next part of the stream to the unconsumed part of the buffer.
+        Parts grow with the buffer, so that a long value is decoded a logarithmic number of times
+
+        :return: False at the end of the stream
+        """
+        if self._is_eof:
+            return False
+
+        chunk = self._fp.read(max(self._read_size, len(self._buffer) - self._position))
+
+        if not chunk:
+            self._is_eof = True
+            return False
+
+        self._buffer = self._buffer[self._position:] + chunk
+        self._offset += self._position
+        self._position = 0
 
-        data_dict = json.loads(input_str)
+        return True
 
-        if 'entries' not in data_dict:
-            raise ValueError('Input string must be of format: {"entries": [{"field1": "value1", "field2": "value2"}]}')
+    def _fail(self, expected):
+        got = self._buffer[self._position:self._position + 20]
 
-        for entry_data in data_dict['entries']:
-            entry = Entry(data=entry_data)
-            entries.append(entry)
+        if got == '':
+            raise ValueError(f'Invalid JSON: expected {expected}, got the end of input')
 
-        return entries
+        raise ValueError(f'Invalid JSON: expected {expected}, got `{got}`')
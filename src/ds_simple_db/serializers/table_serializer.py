@@ -1,4 +1,5 @@
-from typing import List
+from itertools import chain, islice
+from typing import Iterable, Iterator, List
 
 from ds_simple_db.core.entry import Entry
 from ds_simple_db.core.serializer import Serializer
@@ -14,65 +15,93 @@ class TableSerializer(Serializer):
     |  col1_value |  col2_value |
     +-------------+-------------+
 
+    Columns are `row_width` characters wide. With `auto_width=True` the width of every column fits its name
+    and the values of the first `sample_size` entries (but not more than `max_width`), so that the table
+    can still be printed as soon as the sample is retrieved. Longer values are truncated.
+
     This is currently implemented only for serialisation/viewing purposes.
     No deserialization is supported.
     """
 
-    def __init__(self, row_width: int = 20):
+    def __init__(self, row_width: int = 20, auto_width: bool = False, sample_size: int = 1000, max_width: int = 40):
+        """
+        :param row_width: The width of every column
+        :param auto_width: Whether to compute widths of columns from a sample of entries instead of using `row_width`
+        :param sample_size: The maximum number of entries to compute widths of columns from
+        :param max_width: The maximum width of a column computed from a sample
+        """
+        if sample_size < 1:
+            raise ValueError(f'`sample_size` must be positive, got {sample_size}')
+
         self._row_width = row_width
+        self._auto_width = auto_width
+        self._sample_size = sample_size
+        self._max_width = max_width
 
-    def entries_to_string(self, entries: List[Entry]) -> str:
-        if len(entries) == 0:
-            return ''
+    def entries_to_string(self, entries: Iterable[Entry]) -> str:
+        return ''.join(self.entries_to_chunks(entries))
 
-        cols = entries[0].fields()
+    def entries_to_chunks(self, entries: Iterable[Entry]) -> Iterator[str]:
+        """
+        Lazily serialize entries yielding a header first and then a single row per chunk.
+        The row separator and the row format are built once per table
 
-        out_str = self._get_header(cols)
+        :param entries: An iterable of entries to serialize
+        :return: An iterator over serialized string chunks
+        """
+        entries = iter(entries)
+        sample = list(islice(entries, self._sample_size)) if self._auto_width else []
+        entries = chain(sample, entries)
+        first_entry = next(entries, None)
 
-        for entry in entries:
-            out_str += self._get_row(entry.values())
+        if first_entry is None:
+            return
 
-        return out_str
+        fields = first_entry.fields()
+        widths = self._get_column_widths(fields, sample) if self._auto_width else [self._row_width] * len(fields)
 
-    def entries_from_string(self, input_str: str) -> List[Entry]:
-        raise NotImplementedError("Deserialization of tables not implemented")
+        row_separator = self._get_separator(widths)
+        row_format = self._get_row_format(widths)
 
-    def _get_row_separator(self, num_cols):
-        col_str = '-' * self._row_width + '+'
-        out_str = '+' + col_str * num_cols
+        yield row_separator + row_format.format(*fields) + row_separator
 
-        return out_str + '\n'
+        row_format = row_format.format
 
-    def _get_row_content(self, values: List[str]):
-        col_str = '|'
+        for entry in chain([first_entry], entries):
+            yield row_format(*['' if value is None else str(value) for value in entry.values()]) + row_separator
 
-        for value in values:
-            max_value_length = self._row_width
-
-            if len(value) > max_value_length:
-                value = value[:max_value_length]
+    def entries_from_string(self, input_str: str) -> List[Entry]:
+        raise NotImplementedError("Deserialization of tables not implemented")
 
-            num_spaces = self._row_width - len(value)
-            num_spaces_front = num_spaces // 2
-            num_spaces_back = num_spaces - num_spaces_front
+    def _get_column_widths(self, fields, sample):
+        """
+        Fit widths of columns to their names and values of sample entries, leaving a space at both sides
 
-            formatted_value = ' ' * num_spaces_front + value + ' ' * num_spaces_back
+        :param fields: A list of column names
+        :param sample: A list of entries
+        :return: A list of widths of columns
+        """
+        widths = [len(field) for field in fields]
 
-            col_str += formatted_value + '|'
+        for entry in sample:
+            widths = list(map(max, widths, map(len, map(self._to_str, entry.values()))))
 
-        return col_str + '\n'
+        return [min(width + 2, self._max_width) for width in widths]
 
-    def _get_header(self, cols):
-        row_separator = self._get_row_separator(num_cols=len(cols))
-        out_str = row_separator
-        out_str += self._get_row_content(cols)
-        out_str += row_separator
+    @staticmethod
+    def _get_separator(widths):
+        return '+' + ''.join('-' * width + '+' for width in widths) + '\n'
 
-        return out_str
+    @staticmethod
+    def _get_row_format(widths):
+        """
+        Make a format string that centers values in columns and truncates values longer than columns
 
-    def _get_row(self, cols):
-        row_separator = self._get_row_separator(num_cols=len(cols))
-        out_str = self._get_row_content(cols)
-        out_str += row_separator
+        :param widths: A list of widths of columns
+        :return: A format string with a positional field per column
+        """
+        return '|' + ''.join(f'{{:^{width}.{width}}}|' for width in widths) + '\n'
 
-        return out_str
+    @staticmethod
+    def _to_str(value):
+        return '' if value is None else str(value)
@@ -1,12 +1,16 @@
 from ds_simple_db.core.factory import Factory
 
-from .memory_dict_storage import MemoryDictStorage
-
 
 class StorageFactory(Factory):
     """
-    A factory to create storage
+    A factory to create storage. Storage modules are imported when a storage of their type is created
     """
+    plugin_group = 'ds_simple_db.storage'
+
     classes = dict(
-        memory_dict_storage=MemoryDictStorage
+        memory_dict_storage='ds_simple_db.storage.memory_dict_storage:MemoryDictStorage',
+        columnar_array_storage='ds_simple_db.storage.columnar_array_storage:ColumnarArrayStorage',
+        mapped_columnar_storage='ds_simple_db.storage.mapped_columnar_storage:MappedColumnarStorage',
+        append_log_storage='ds_simple_db.storage.append_log_storage:AppendLogStorage',
+        sharded_storage='ds_simple_db.storage.sharded_storage:ShardedStorage'
     )
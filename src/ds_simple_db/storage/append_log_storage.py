@@ -0,0 +1,508 @@
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from itertools import islice
+from typing import Iterable, Iterator, List
+
+try:
+    import fcntl
+except ImportError:
+    # Files are not locked where `fcntl` is not available (Windows)
+    fcntl = None
+
+from ds_simple_db.core.atomic_file import atomic_write
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.core.filter import Filter
+from ds_simple_db.core.storage import Storage
+
+
+class AppendLogStorage(Storage):
+    """
+    A persistent storage that keeps data in a base file and appends inserted rows to a write-ahead log
+    (the `<path>.wal` file, one JSON object per line) instead of rewriting the base file.
+
+    Insertion does not read the base file, so its cost does not depend on the database size.
+    The base file and the log are loaded into an in-memory storage of `storage_type`
+    only when entries are retrieved for the first time.
+
+    The log is flushed after every insertion and synced to disk (fsync) every `sync_every` rows, so at most
+    `sync_every - 1` rows can be lost on a power failure. When the log reaches `compact_threshold` rows,
+    it is compacted: the base file is rewritten atomically with all rows and the log is started anew.
+
+    The first line of the log identifies the base file it applies to by a SHA-256 hash of its content,
+    so copying, moving or touching the base file together with the log keeps logged rows (the hash is
+    only computed when the inode, the size or the modification time of the base file have changed).
+    Compaction appends a marker to the log before rewriting the base file, a log ending with the marker
+    that does not match the base file is left over after a crash in the middle of compaction and is discarded,
+    so rows are never applied twice. A log that does not match the base file otherwise (e.g. the base file
+    has been restored from an older backup) raises ValueError and is never overwritten.
+    A partially written last row is discarded.
+
+    Processes sharing the storage lock the `<path>.lock` file while appending, compacting and loading,
+    and a loaded storage is reloaded when another process has changed the base file or the log.
+    """
+
+    LOG_SUFFIX = '.wal'
+    """The suffix added to the base file path to get the log path"""
+
+    LOCK_SUFFIX = '.lock'
+    """The suffix added to the base file path to get the path of the lock file"""
+
+    COMPACT_THRESHOLD = 10000
+    """The default number of logged rows that triggers compaction"""
+
+    _COMPACTING_MARKER = 'compacting'
+
+    def __init__(self, path: str, columns: list, storage_type: str = 'memory_dict_storage', sync_every: int = 1,
+                 compact_threshold: int = COMPACT_THRESHOLD):
+        """
+        :param path: Path to the base file, its format is inferred from the extension using SerializerFactory
+        :param columns: A list of columns of the storage
+        :param storage_type: A type of the in-memory storage registered in StorageFactory to load data into
+        :param sync_every: The number of logged rows after which the log is synced to disk
+        :param compact_threshold: The number of logged rows that triggers compaction (never compact if None)
+        """
+        if sync_every < 1:
+            raise ValueError(f'`sync_every` must be positive, got {sync_every}')
+
+        if compact_threshold is not None and compact_threshold < 1:
+            raise ValueError(f'`compact_threshold` must be positive or None, got {compact_threshold}')
+
+        self.path = path
+        self.log_path = path + self.LOG_SUFFIX
+        self.storage_type = storage_type
+        self.sync_every = sync_every
+        self.compact_threshold = compact_threshold
+
+        self._columns = list(columns)
+        self._storage = None
+        self._log_fp = None
+        self._num_logged = 0
+        self._num_unsynced = 0
+        self._loaded_state = None
+        self._indexes = []
+        self._result_cache_args = None
+        self._lock_depth = 0
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.path!r})'
+
+    def exists(self) -> bool:
+        """
+        Check if the base file or the log exists
+
+        :return: True if the storage has persisted data
+        """
+        return os.path.exists(self.path) or os.path.exists(self.log_path)
+
+    def columns(self) -> list:
+        return list(self._columns)
+
+    def insert(self, **kwargs) -> Entry:
+        """
+        Validate a row and append it to the log without loading the base file
+
+        :return: Inserted Entry
+        """
+        with self._locked():
+            entry = (self._fresh_storage() or self._create_storage()).insert(**kwargs)
+            self._append_to_log([kwargs])
+
+        return entry
+
+    def insert_many(self, rows: Iterable[dict], batch_size: int = None) -> int:
+        """
+        Validate rows and append them to the log without loading the base file.
+        Rows are validated and logged batch by batch, the log is synced once per batch at most
+
+        :param rows: An iterable of dicts with columns as keys
+        :param batch_size: The number of rows to log at once (INSERT_BATCH_SIZE of the in-memory storage if None)
+        :return: The number of inserted rows
+        """
+        if batch_size is None:
+            batch_size = self._create_storage().INSERT_BATCH_SIZE
+
+        rows = iter(rows)
+        num_inserted = 0
+
+        while True:
+            batch = list(islice(rows, batch_size))
+
+            if len(batch) == 0:
+                return num_inserted
+
+            # A loaded storage may appear in the middle if the log gets compacted
+            with self._locked():
+                (self._fresh_storage() or self._create_storage()).insert_many(batch)
+                self._append_to_log(batch)
+
+            num_inserted += len(batch)
+
+    def all_entries(self) -> List[Entry]:
+        return self._loaded_storage().all_entries()
+
+    def filter(self, filter_obj: Filter, workers: int = None) -> List[Entry]:
+        return self._loaded_storage().filter(filter_obj, workers=workers)
+
+    def iter_entries(self, limit: int = None, offset: int = 0) -> Iterator[Entry]:
+        return self._loaded_storage().iter_entries(limit, offset)
+
+    def iter_filter(self, filter_obj: Filter, limit: int = None, offset: int = 0,
+                    workers: int = None) -> Iterator[Entry]:
+        return self._loaded_storage().iter_filter(filter_obj, limit, offset, workers=workers)
+
+    def create_index(self, column: str, kind: str = 'hash'):
+        self._loaded_storage().create_index(column, kind)
+
+        # Indexes and the result cache are created again when the storage is reloaded
+        self._indexes.append((column, kind))
+
+    def enable_result_cache(self, max_entries: int = 128, max_rows: int = 1000000):
+        self._result_cache_args = (max_entries, max_rows)
+
+        return self._loaded_storage().enable_result_cache(max_entries, max_rows)
+
+    def explain(self, filter_obj: Filter) -> str:
+        return self._loaded_storage().explain(filter_obj)
+
+    def save_to_file(self, db_path):
+        """
+        Save all rows to a file. Saving to the base file compacts the log
+
+        :param db_path: Path to a file to serialize data to
+        """
+        if os.path.abspath(db_path) == os.path.abspath(self.path):
+            self.compact()
+        else:
+            self._loaded_storage().save_to_file(db_path)
+
+    def log_rows(self) -> Iterator[dict]:
+        """
+        Lazily read rows of the log that have not been compacted into the base file yet
+
+        :return: An iterator over dicts with columns as keys
+        """
+        if not os.path.exists(self.log_path):
+            return
+
+        with open(self.log_path, 'rb') as fp:
+            if not self._check_log(fp):
+                return
+
+            for line in fp:
+                # A line without a newline is a row that was being written during a crash
+                if not line.endswith(b'\n'):
+                    return
+
+                row = json.loads(line)
+
+                # Rows are objects, other values are markers
+                if isinstance(row, dict):
+                    yield row
+
+    def compact(self):
+        """
+        Rewrite the base file with all rows and start a new empty log
+        """
+        with self._locked():
+            storage = self._loaded_storage()
+
+            self._close_replaced_log()
+
+            if self._log_fp is None and os.path.exists(self.log_path):
+                self._open_log()
+
+            # Once the base file is rewritten the old log no longer matches it, the marker tells
+            # that its rows are in the base file even if the process crashes before the log is started anew
+            if self._log_fp is not None:
+                self._log_fp.write(json.dumps(self._COMPACTING_MARKER) + '\n')
+                self._num_unsynced += 1
+                self._close_log()
+
+            storage.save_to_file(self.path)
+            self._start_log()
+
+            self._loaded_state = self._disk_state()
+
+    def flush(self):
+        """
+        Sync logged rows to disk
+        """
+        if self._log_fp is not None and self._num_unsynced > 0:
+            self._log_fp.flush()
+            os.fsync(self._log_fp.fileno())
+            self._num_unsynced = 0
+
+    def close(self):
+        """
+        Sync logged rows to disk and close the log. The storage must not be used after it has been closed
+        """
+        self._close_log()
+        self._drop_storage()
+
+    def _create_storage(self):
+        # Imported here since the storage package registers this module in StorageFactory
+        from ds_simple_db.storage import StorageFactory
+
+        return StorageFactory.create(self.storage_type, columns=self._columns)
+
+    def _loaded_storage(self):
+        """
+        Load the base file and replay the log on first access,
+        and again if another process has changed them since then
+
+        :return: An in-memory storage with all rows
+        """
+        if self._fresh_storage() is None:
+            with self._locked(shared=True):
+                storage = self._create_storage()
+
+                if os.path.exists(self.path):
+                    storage.load_from_file(self.path)
+
+                storage.insert_many(self.log_rows())
+
+                for column, kind in self._indexes:
+                    storage.create_index(column, kind)
+
+                if self._result_cache_args is not None:
+                    storage.enable_result_cache(*self._result_cache_args)
+
+                self._storage = storage
+                self._loaded_state = self._disk_state()
+
+        return self._storage
+
+    def _fresh_storage(self):
+        """
+        Get the loaded storage if the base file and the log have not been changed by another process since
+        they were loaded, a stale storage is dropped
+
+        :return: An in-memory storage with all rows, or None
+        """
+        if self._storage is not None and self._disk_state() != self._loaded_state:
+            self._drop_storage()
+
+        return self._storage
+
+    def _drop_storage(self):
+        if self._storage is not None and hasattr(self._storage, 'close'):
+            self._storage.close()
+
+        self._storage = None
+
+    def _disk_state(self):
+        """
+        Get what changes whenever the base file or the log is changed
+
+        :return: A tuple of the inode, size and modification time of the base file, and the inode and size of the log
+        """
+        return self._file_stat(self.path), self._file_stat(self.log_path)
+
+    @staticmethod
+    def _file_stat(path):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+
+        return [stat.st_ino, stat.st_size, stat.st_mtime_ns]
+
+    @contextmanager
+    def _locked(self, shared: bool = False):
+        """
+        Hold a lock of the `<path>.lock` file, an exclusive one for changes and a shared one for loading.
+        Nested blocks keep the lock taken by the outermost one
+        """
+        if fcntl is None or self._lock_depth > 0 or (shared and not self.exists()):
+            self._lock_depth += 1
+
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+
+            return
+
+        folder = os.path.dirname(self.path)
+
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        with open(self.path + self.LOCK_SUFFIX, 'a') as lock_fp:
+            fcntl.flock(lock_fp, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            self._lock_depth += 1
+
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                # Closing the file releases the lock
+
+    def _append_to_log(self, rows):
+        """
+        Append rows to the log, the caller holds the lock and has inserted them into the loaded storage if any
+        """
+        self._close_replaced_log()
+
+        if self._log_fp is None:
+            self._open_log()
+
+        self._log_fp.write(''.join(json.dumps(row) + '\n' for row in rows))
+        self._log_fp.flush()
+
+        if self._storage is not None:
+            self._loaded_state = self._disk_state()
+
+        self._num_logged += len(rows)
+        self._num_unsynced += len(rows)
+
+        if self._num_unsynced >= self.sync_every:
+            self.flush()
+
+        if self.compact_threshold is not None and self._num_logged >= self.compact_threshold:
+            self.compact()
+
+    def _open_log(self):
+        """
+        Open the log for appending. A log whose rows have been compacted into the base file is replaced
+        with a new one, a partially written last row is truncated
+        """
+        if not os.path.exists(self.log_path):
+            self._start_log()
+            return
+
+        with open(self.log_path, 'rb') as fp:
+            compacted = not self._check_log(fp)
+
+            if not compacted:
+                header_size = fp.tell()
+                num_logged = 0
+                valid_size = header_size
+
+                for line in fp:
+                    if not line.endswith(b'\n'):
+                        break
+
+                    num_logged += 1
+                    valid_size += len(line)
+
+                fp.seek(0)
+                base = json.loads(fp.readline())['base']
+
+        if compacted:
+            self._start_log()
+            return
+
+        if base is not None and base['stat'] != self._file_stat(self.path):
+            # The base file has been copied or touched, the new header saves hashing it on every open
+            self._rewrite_header(header_size, valid_size)
+        else:
+            with open(self.log_path, 'r+b') as fp:
+                fp.truncate(valid_size)
+
+        self._log_fp = open(self.log_path, 'a', encoding='utf-8')
+        self._num_logged = num_logged
+
+    def _start_log(self):
+        with atomic_write(self.log_path) as fp:
+            fp.write(json.dumps(self._log_header()) + '\n')
+
+        self._log_fp = open(self.log_path, 'a', encoding='utf-8')
+        self._num_logged = 0
+        self._num_unsynced = 0
+
+    def _rewrite_header(self, header_size, valid_size):
+        """
+        Replace the header of the log with the one of the current base file keeping fully written rows
+        """
+        with open(self.log_path, 'rb') as fp, atomic_write(self.log_path, 'wb') as new_fp:
+            fp.seek(header_size)
+            new_fp.write((json.dumps(self._log_header()) + '\n').encode('utf-8'))
+            new_fp.write(fp.read(valid_size - header_size))
+
+    def _close_replaced_log(self):
+        """
+        Close the log if another process has replaced it by compacting it
+        """
+        if self._log_fp is not None:
+            log_stat = self._file_stat(self.log_path)
+
+            if log_stat is None or log_stat[0] != os.fstat(self._log_fp.fileno()).st_ino:
+                self._close_log()
+
+    def _close_log(self):
+        if self._log_fp is not None:
+            self.flush()
+            self._log_fp.close()
+            self._log_fp = None
+
+    def _check_log(self, fp) -> bool:
+        """
+        Check whether the log applies to the current base file, leaving the file positioned after the header
+
+        :param fp: The log opened in binary mode
+        :return: True if the log applies to the base file, False if its rows have already been compacted into it
+        """
+        header = fp.readline()
+
+        if header.endswith(b'\n') and self._header_matches(json.loads(header)):
+            return True
+
+        # Nothing is appended after the marker, compaction rewrites the base file right after writing it
+        marker = (json.dumps(self._COMPACTING_MARKER) + '\n').encode('utf-8')
+        end = fp.seek(0, os.SEEK_END)
+
+        if end >= len(header) + len(marker):
+            fp.seek(end - len(marker))
+
+            if fp.read() == marker:
+                return False
+
+        raise ValueError(
+            f'The log `{self.log_path}` does not apply to the base file `{self.path}`, which has been replaced '
+            f'since the rows were logged. Restore the base file or move the log away to use the storage'
+        )
+
+    def _header_matches(self, header):
+        """
+        Check whether a log header identifies the current base file, by the hash of its content
+        if the size or the modification time of the file have changed
+        """
+        if not isinstance(header, dict) or 'base' not in header:
+            return False
+
+        base = header['base']
+        stat = self._file_stat(self.path)
+
+        if base is None or stat is None:
+            return base is None and stat is None
+
+        if base['stat'] == stat:
+            return True
+
+        return base['sha256'] == self._base_hash()
+
+    def _log_header(self):
+        """
+        Identify the current version of the base file
+
+        :return: A dict with the SHA-256 hash of the base file and its inode, size and modification time,
+            or with None if the base file does not exist
+        """
+        stat = self._file_stat(self.path)
+
+        if stat is None:
+            return dict(base=None)
+
+        return dict(base=dict(sha256=self._base_hash(), stat=stat))
+
+    def _base_hash(self):
+        digest = hashlib.sha256()
+
+        with open(self.path, 'rb') as fp:
+            for chunk in iter(lambda: fp.read(1 << 20), b''):
+                digest.update(chunk)
+
+        return digest.hexdigest()
@@ -0,0 +1,161 @@
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from itertools import islice
+from typing import AsyncIterator, Iterable, List
+
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.core.filter import Filter
+from ds_simple_db.core.storage import Storage
+
+
+class AsyncStorage:
+    """
+    An asyncio wrapper around any Storage.
+
+    Blocking calls (file I/O, scans, insertion) run in an executor, so they do not block the event loop.
+    Lazy iteration pulls entries from the wrapped storage in batches of `BATCH_SIZE`, one executor call per batch,
+    so long scans give control back to the event loop between batches and stop early if the consumer does.
+
+    At most `max_concurrency` calls run in the executor at once, other calls wait for a free slot.
+    If insertion may run concurrently with other calls, wrap a storage created with `thread_safe=True`.
+
+    Usage:
+        storage = AsyncStorage(StorageFactory.create('memory_dict_storage', columns=['name'], thread_safe=True))
+        await storage.load('db/example.csv')
+
+        async for entry in storage.aiter_filter(GlobFilter('name=A*')):
+            ...
+    """
+
+    BATCH_SIZE = 1024
+    """The number of entries retrieved by a single executor call during iteration"""
+
+    def __init__(self, storage: Storage, max_concurrency: int = 4, executor: Executor = None):
+        """
+        :param storage: A storage to wrap
+        :param max_concurrency: The maximum number of calls running in the executor at once
+        :param executor: An executor to run blocking calls in (the default executor of the event loop if None)
+        """
+        if not isinstance(storage, Storage):
+            raise TypeError(f'storage must be of type `Storage`, got {type(storage)}')
+
+        if max_concurrency < 1:
+            raise ValueError(f'`max_concurrency` must be positive, got {max_concurrency}')
+
+        self.storage = storage
+
+        self.max_concurrency = max_concurrency
+
+        self._executor = executor
+
+        # Before Python 3.10 a semaphore is bound to the event loop current at its creation,
+        # so it is created in the running loop on the first call (and anew if the storage is used in another loop)
+        self._semaphore = None
+        self._semaphore_loop = None
+
+    async def load(self, db_path):
+        """
+        Load a storage from a file, see `Storage.load_from_file()`
+
+        :param db_path: Path to a file to deserialize data from
+        """
+        await self._run(self.storage.load_from_file, db_path)
+
+    async def save(self, db_path):
+        """
+        Save a storage to a file, see `Storage.save_to_file()`
+
+        :param db_path: Path to a file to serialize data to
+        """
+        await self._run(self.storage.save_to_file, db_path)
+
+    async def insert(self, **kwargs) -> Entry:
+        return await self._run(partial(self.storage.insert, **kwargs))
+
+    async def insert_many(self, rows: Iterable[dict]) -> int:
+        return await self._run(self.storage.insert_many, rows)
+
+    async def all_entries(self) -> List[Entry]:
+        return await self._run(self.storage.all_entries)
+
+    async def filter(self, filter_obj: Filter, workers: int = None) -> List[Entry]:
+        return await self._run(partial(self.storage.filter, filter_obj, workers=workers))
+
+    def aiter_entries(self, limit: int = None, offset: int = 0) -> AsyncIterator[Entry]:
+        """
+        Lazily iterate over entries in the storage, see `Storage.iter_entries()`
+
+        :param limit: The maximum number of entries to yield (no limit if None)
+        :param offset: The number of entries to skip from the beginning
+        :return: An asynchronous iterator over entries
+        """
+        return self._aiter(partial(self.storage.iter_entries, limit, offset))
+
+    def aiter_filter(self, filter_obj: Filter, limit: int = None, offset: int = 0,
+                     workers: int = None) -> AsyncIterator[Entry]:
+        """
+        Lazily iterate over entries satisfying a given filter, see `Storage.iter_filter()`
+
+        :param filter_obj: A filter to apply to the storage entries
+        :param limit: The maximum number of entries to yield (no limit if None)
+        :param offset: The number of matching entries to skip from the beginning
+        :param workers: The number of processes to evaluate the filter in (storages may ignore it)
+        :return: An asynchronous iterator over filtered entries
+        """
+        return self._aiter(partial(self.storage.iter_filter, filter_obj, limit, offset, workers=workers))
+
+    async def close(self):
+        """
+        Close the wrapped storage if it supports closing
+        """
+        if hasattr(self.storage, 'close'):
+            await self._run(self.storage.close)
+
+    async def _aiter(self, create_iterator):
+        """
+        Create an iterator and pull entries from it batch by batch in the executor
+
+        :param create_iterator: A function creating an iterator over entries
+        :return: An asynchronous generator of entries
+        """
+        iterator = await self._run(create_iterator)
+
+        try:
+            while True:
+                batch = await self._run(_next_batch, iterator, self.BATCH_SIZE)
+
+                for entry in batch:
+                    yield entry
+
+                if len(batch) < self.BATCH_SIZE:
+                    return
+        finally:
+            # Stop generators of storages early, e.g. to cancel parallel scans.
+            # Closing runs the cleanup of a generator, which may block, so it runs in the executor as well
+            if hasattr(iterator, 'close'):
+                await self._run(_close_iterator, iterator)
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+
+        async with self._semaphore:
+            return await loop.run_in_executor(self._executor, func, *args)
+
+
+def _next_batch(iterator, batch_size: int) -> list:
+    return list(islice(iterator, batch_size))
+
+
+def _close_iterator(iterator):
+    try:
+        iterator.close()
+    except ValueError:
+        # If the consumer has been cancelled while a batch is pulled, the generator is still running
+        # in another thread of the executor and can not be closed, then it is left to the garbage collector
+        if not getattr(iterator, 'gi_running', False):
+            raise
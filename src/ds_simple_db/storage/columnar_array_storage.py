@@ -0,0 +1,324 @@
+from array import array
+
+from ds_simple_db.storage.memory_dict_storage import MemoryDictStorage
+
+
+class _Column:
+    """
+    The base class for typed column buffers used by ColumnarArrayStorage.
+
+    A column behaves like a read-only sequence (supports `len()`, indexing and iteration),
+    values are appended with `append()` after they have been checked with `validate()`.
+    """
+    kind = None
+
+    def validate(self, value):
+        """
+        Raise TypeError if a value can not be stored in the column, or ValueError if its type fits
+        but the value does not (e.g. an integer out of the 64-bit range). Columns of a row are extended
+        one after another, so every value must be checked before any column is changed
+
+        :param value: A value to check
+        """
+        pass
+
+    def append(self, value):
+        pass
+
+    def extend(self, values):
+        for value in values:
+            self.append(value)
+
+    def __len__(self):
+        pass
+
+    def __getitem__(self, idx):
+        """
+        Get a value by its index or a list of values by a slice
+
+        :param idx: An integer index or a slice
+        :return: A value or a list of values
+        """
+        if isinstance(idx, slice):
+            return [self._get(i) for i in range(*idx.indices(len(self)))]
+
+        length = len(self)
+
+        if idx < 0:
+            idx += length
+
+        if idx < 0 or idx >= length:
+            raise IndexError('Column index out of range')
+
+        return self._get(idx)
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self._get(idx)
+
+    def _get(self, idx):
+        """
+        Get a value by a non-negative index without bounds checking
+
+        :param idx: A non-negative index
+        :return: A value
+        """
+        pass
+
+
+class _NumericColumn(_Column):
+    """
+    A column of numbers kept in a contiguous `array` buffer with a separate null mask
+    """
+    typecode = None
+    accepted_types = ()
+
+    def __init__(self):
+        self._values = array(self.typecode)
+        self._nulls = bytearray()
+
+    def validate(self, value):
+        if value is None:
+            return
+
+        if isinstance(value, bool) or not isinstance(value, self.accepted_types):
+            raise TypeError(f'Column of kind `{self.kind}` can not store a value of type `{type(value)}`')
+
+        self._validate_range(value)
+
+    def _validate_range(self, value):
+        pass
+
+    def append(self, value):
+        if value is None:
+            self._values.append(0)
+            self._nulls.append(1)
+        else:
+            self._values.append(value)
+            self._nulls.append(0)
+
+    def extend(self, values):
+        self._values.extend(0 if value is None else value for value in values)
+        self._nulls.extend(1 if value is None else 0 for value in values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def _get(self, idx):
+        return None if self._nulls[idx] else self._values[idx]
+
+    def __iter__(self):
+        for value, is_null in zip(self._values, self._nulls):
+            yield None if is_null else value
+
+
+class _IntColumn(_NumericColumn):
+    kind = 'int'
+    typecode = 'q'
+    accepted_types = (int,)
+
+    MIN_VALUE = -2 ** 63
+    MAX_VALUE = 2 ** 63 - 1
+
+    def _validate_range(self, value):
+        if not self.MIN_VALUE <= value <= self.MAX_VALUE:
+            raise ValueError(f'Column of kind `{self.kind}` can not store {value}, it is out of the 64-bit range')
+
+
+class _FloatColumn(_NumericColumn):
+    kind = 'float'
+    typecode = 'd'
+    accepted_types = (int, float)
+
+    def _validate_range(self, value):
+        if isinstance(value, int):
+            try:
+                float(value)
+            except OverflowError:
+                raise ValueError(f'Column of kind `{self.kind}` can not store {value}, it is too large') from None
+
+
+class _StrColumn(_Column):
+    """
+    A column of strings kept as one UTF-8 buffer and an array of offsets into it.
+
+    A value `i` occupies `blob[offsets[i]:offsets[i + 1]]`. This layout is compact for columns
+    with mostly unique values (e.g. names or phone numbers).
+    """
+    kind = 'str'
+
+    def __init__(self):
+        self._blob = bytearray()
+        self._offsets = array('q', [0])
+        self._nulls = bytearray()
+
+    def validate(self, value):
+        if value is not None and not isinstance(value, str):
+            raise TypeError(f'Column of kind `{self.kind}` can not store a value of type `{type(value)}`')
+
+        # Strings with lone surrogates can not be encoded, ASCII strings always can
+        if value is not None and not value.isascii():
+            try:
+                value.encode('utf-8')
+            except UnicodeEncodeError:
+                raise ValueError(f'Column of kind `{self.kind}` can not store {value!r}, it is not valid UTF-8') from None
+
+    def append(self, value):
+        if value is not None:
+            self._blob += value.encode('utf-8')
+
+        self._offsets.append(len(self._blob))
+        self._nulls.append(1 if value is None else 0)
+
+    def __len__(self):
+        return len(self._nulls)
+
+    def _get(self, idx):
+        if self._nulls[idx]:
+            return None
+
+        return self._blob[self._offsets[idx]:self._offsets[idx + 1]].decode('utf-8')
+
+
+class _CategoryColumn(_Column):
+    """
+    A dictionary-encoded column of strings: every distinct value is kept once,
+    rows keep integer codes into the dictionary (code -1 stands for None).
+
+    This layout is compact for columns with a few distinct values (e.g. cities).
+    """
+    kind = 'category'
+
+    def __init__(self):
+        self._codes = array('i')
+        self._dictionary = []
+        self._code_by_value = dict()
+
+    def validate(self, value):
+        if value is not None and not isinstance(value, str):
+            raise TypeError(f'Column of kind `{self.kind}` can not store a value of type `{type(value)}`')
+
+    def append(self, value):
+        if value is None:
+            self._codes.append(-1)
+            return
+
+        code = self._code_by_value.get(value)
+
+        if code is None:
+            code = len(self._dictionary)
+            self._dictionary.append(value)
+            self._code_by_value[value] = code
+
+        self._codes.append(code)
+
+    def __len__(self):
+        return len(self._codes)
+
+    def _get(self, idx):
+        code = self._codes[idx]
+
+        return None if code < 0 else self._dictionary[code]
+
+    def __iter__(self):
+        dictionary = self._dictionary
+
+        for code in self._codes:
+            yield None if code < 0 else dictionary[code]
+
+
+class ColumnarArrayStorage(MemoryDictStorage):
+    """
+    An in-memory storage that keeps every column in a typed contiguous buffer (standard `array` module)
+    instead of a list of boxed Python objects, which reduces memory usage severalfold on large datasets.
+
+    Supported column kinds:
+        * `str` - UTF-8 buffer with an array of offsets (default)
+        * `category` - dictionary-encoded strings, for columns with few distinct values
+        * `int` - 64-bit signed integers
+        * `float` - double precision floats
+
+    All kinds support None values.
+
+    Retrieval and filtering are inherited from MemoryDictStorage since typed columns behave like read-only lists.
+    """
+
+    column_kinds = dict(
+        str=_StrColumn,
+        category=_CategoryColumn,
+        int=_IntColumn,
+        float=_FloatColumn
+    )
+
+    def __init__(self, initial_data: dict = None, columns: list = None, column_types: dict = None,
+                 thread_safe: bool = False):
+        """
+        :param initial_data: A dict of column lists to initialize the storage with
+        :param columns: A list of columns of an empty storage
+        :param column_types: A dict of column kinds (see `column_kinds`). Columns not listed here are `str`
+        :param thread_safe: Whether the storage is going to be used by multiple threads concurrently
+        """
+        if initial_data is not None and columns is not None:
+            raise ValueError('Either `initial_data` or `columns` can be provided, but not both')
+
+        if column_types is None:
+            column_types = dict()
+
+        if initial_data is not None:
+            self._validate_data(initial_data)
+            columns = list(initial_data.keys())
+
+        elif columns is None:
+            columns = []
+
+        for column in column_types:
+            if column not in columns:
+                raise ValueError(f'Column `{column}` from `column_types` does not exist in the storage')
+
+        super().__init__(columns=columns, thread_safe=thread_safe)
+
+        for column in columns:
+            self._data[column] = self._create_column(column_types.get(column, 'str'))
+
+        if initial_data:
+            self.insert_columns(initial_data)
+
+    def __repr__(self):
+        return str({column: list(values) for column, values in self._data.items()})
+
+    def column_types(self) -> dict:
+        """
+        Get kinds of all columns present in the storage
+
+        :return: A dict with column names as keys and column kinds as values
+        """
+        return {column: values.kind for column, values in self._data.items()}
+
+    def _validate_values(self, column, values):
+        validate = self._data[column].validate
+
+        for value in values:
+            validate(value)
+
+    def _create_column(self, kind):
+        if kind not in self.column_kinds:
+            raise ValueError(f'Unknown column kind `{kind}`. Available kinds are {list(self.column_kinds.keys())}')
+
+        return self.column_kinds[kind]()
+
+    @staticmethod
+    def _validate_data(data):
+        if not isinstance(data, dict):
+            raise TypeError(f'ColumnarArrayStorage `initial_data` must be of type `dict`, got {type(data)}')
+
+        list_length = None
+
+        for _, val in data.items():
+            if not isinstance(val, list):
+                raise TypeError(f'ColumnarArrayStorage `initial_data` values must be of type `list`, got {type(val)}')
+
+            if list_length is None:
+                list_length = len(val)
+
+            elif list_length != len(val):
+                raise ValueError('Lengths of data columns do not match')
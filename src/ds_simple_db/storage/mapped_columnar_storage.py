@@ -0,0 +1,199 @@
+import mmap
+import os
+from itertools import chain, repeat
+
+from ds_simple_db.core.serializer import Serializer
+from ds_simple_db.serializers import SerializerFactory
+from ds_simple_db.serializers.binary_columnar_serializer import BinaryColumnarSerializer
+from ds_simple_db.storage.memory_dict_storage import MemoryDictStorage
+
+
+class _MappedColumn:
+    """
+    A column whose first rows are decoded on access from an encoded column of a mapped file,
+    rows appended after the file has been opened are kept in a list.
+
+    A column behaves like a read-only sequence (supports `len()`, indexing and iteration),
+    values are appended with `append()`/`extend()` after they have been checked with `validate()`.
+    """
+
+    accepted_types = dict(
+        str=(str,),
+        int=(int,),
+        float=(int, float)
+    )
+
+    def __init__(self, mapped, num_rows: int):
+        """
+        :param mapped: An EncodedColumn, or None for a column that is missing in the file (all values are None)
+        :param num_rows: The number of rows in the file
+        """
+        self.kind = None if mapped is None else mapped.kind
+        self._mapped = mapped
+        self._num_mapped = num_rows
+        self._appended = []
+
+    def validate(self, value):
+        """
+        Raise TypeError if a value can not be stored in the column, so that the storage can be saved back
+
+        :param value: A value to check
+        """
+        if value is None or self.kind is None:
+            return
+
+        if isinstance(value, bool) or not isinstance(value, self.accepted_types[self.kind]):
+            raise TypeError(f'Column of kind `{self.kind}` can not store a value of type `{type(value)}`')
+
+    def append(self, value):
+        self._appended.append(value)
+
+    def extend(self, values):
+        self._appended.extend(values)
+
+    def release(self):
+        """
+        Release buffers of the mapped file
+        """
+        if self._mapped is not None:
+            self._mapped.release()
+
+    def __len__(self):
+        return self._num_mapped + len(self._appended)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(len(self))
+
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+
+            mapped_stop = min(stop, self._num_mapped)
+            values = self._get_mapped(start, mapped_stop) if start < mapped_stop else []
+
+            return values + self._appended[max(start - self._num_mapped, 0):max(stop - self._num_mapped, 0)]
+
+        length = len(self)
+
+        if idx < 0:
+            idx += length
+
+        if idx < 0 or idx >= length:
+            raise IndexError('Column index out of range')
+
+        if idx >= self._num_mapped:
+            return self._appended[idx - self._num_mapped]
+
+        return None if self._mapped is None else self._mapped[idx]
+
+    def __iter__(self):
+        mapped = repeat(None, self._num_mapped) if self._mapped is None else iter(self._mapped)
+
+        return chain(mapped, self._appended)
+
+    def _get_mapped(self, start, stop):
+        if self._mapped is None:
+            return [None] * (stop - start)
+
+        return self._mapped[start:stop]
+
+
+class MappedColumnarStorage(MemoryDictStorage):
+    """
+    A storage that opens files in the binary columnar format (`.sdb`, see BinaryColumnarSerializer)
+    by memory-mapping them instead of parsing.
+
+    Opening a file reads only its header and column directory, so it takes the same time for any file size.
+    Values are decoded when a query touches them, and the operating system loads only the pages of the columns
+    and row ranges that are actually read.
+
+    Rows inserted after opening a file are kept in memory and persisted by `save_to_file()`.
+    Files in other formats, or files loaded into a non-empty storage, are loaded by copying rows
+    the same way as MemoryDictStorage does.
+
+    Call `close()` to unmap files when the storage is no longer needed.
+    """
+
+    def __init__(self, initial_data: dict = None, columns: list = None, thread_safe: bool = False):
+        super().__init__(initial_data=initial_data, columns=columns, thread_safe=thread_safe)
+
+        self._mapped_files = []
+
+    def load_from_file(self, db_path, serializer: Serializer = None):
+        """
+        Open a file in the binary columnar format by memory-mapping it, or load a file in any other format
+
+        If the storage has no columns, it takes the columns of the file. Otherwise columns missing in the file
+        are filled with None values, and columns of the file missing in the storage raise ValueError
+
+        :param db_path: Path to a file to deserialize data from
+        :param serializer: A serializer to read the file with (inferred if None)
+        """
+        if not os.path.exists(db_path):
+            raise ValueError(f"File `{db_path}` does not exist")
+
+        if serializer is None:
+            serializer = SerializerFactory.create_for_file(db_path)
+
+        if not isinstance(serializer, BinaryColumnarSerializer) or self._num_entries() > 0:
+            return super().load_from_file(db_path, serializer)
+
+        with open(db_path, 'rb') as fp:
+            try:
+                buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files can not be mapped, they are rejected by the serializer below
+                buffer = fp.read()
+
+        try:
+            mapped_columns = serializer.open_columns(buffer)
+        except BaseException:
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+            raise
+
+        columns = self.columns() if len(self._data) > 0 else list(mapped_columns.keys())
+
+        for column in mapped_columns:
+            if column not in columns:
+                for mapped in mapped_columns.values():
+                    mapped.release()
+
+                if isinstance(buffer, mmap.mmap):
+                    buffer.close()
+
+                raise ValueError(f'Column `{column}` does not exist in the storage')
+
+        num_rows = len(next(iter(mapped_columns.values()), []))
+
+        with self._lock.write():
+            self._data = {column: _MappedColumn(mapped_columns.get(column), num_rows) for column in columns}
+            self._mapped_files.append(buffer)
+
+            for column, index in self._indexes.items():
+                index.build(self._data[column])
+
+            self._num_rows = num_rows
+
+    def close(self):
+        """
+        Unmap opened files. The storage must not be used after it has been closed
+        """
+        super().close()
+
+        for values in self._data.values():
+            if isinstance(values, _MappedColumn):
+                values.release()
+
+        for buffer in self._mapped_files:
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+
+        self._mapped_files = []
+
+    def _validate_values(self, column, values):
+        column_values = self._data[column]
+
+        if isinstance(column_values, _MappedColumn):
+            for value in values:
+                column_values.validate(value)
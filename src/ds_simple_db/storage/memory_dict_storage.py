@@ -1,9 +1,17 @@
 from copy import deepcopy
-from typing import List
+from bisect import bisect_left
+from itertools import compress, islice
+from typing import Iterable, Iterator, List
+from weakref import finalize
 
+from ds_simple_db.core.columns_chunk import ColumnsChunk
 from ds_simple_db.core.entry import Entry
+from ds_simple_db.core.entry_view import EntryView
 from ds_simple_db.core.filter import Filter
+from ds_simple_db.core.read_write_lock import NoopReadWriteLock, ReadWriteLock
+from ds_simple_db.core.result_cache import ResultCache
 from ds_simple_db.core.storage import Storage
+from ds_simple_db.indexes import IndexFactory
 
 
 class MemoryDictStorage(Storage):
@@ -11,9 +19,28 @@ class MemoryDictStorage(Storage):
     This is an in-memory storage using standard Python dictionary that has no persistent representation.
 
     Note that internally it keeps columns as keys and values as lists for efficiency.
+
+    With `thread_safe=True` the storage can be shared by threads. Since rows are only appended,
+    readers work with snapshots: a read takes the number of committed rows when it starts and never looks
+    past it, so it neither sees torn rows (some columns extended, others not) nor waits for writers while scanning.
+    Writers are serialized with a readers-writer lock, which readers hold only for short index lookups.
     """
 
-    def __init__(self, initial_data: dict = None, columns: list = None):
+    SCAN_CHUNK_SIZE = 4096
+    """The number of rows a filter is evaluated against at once"""
+
+    INSERT_BATCH_SIZE = 4096
+    """The default number of rows `insert_many()` appends at once"""
+
+    PARALLEL_TASKS_PER_WORKER = 4
+    """The number of chunks a parallel scan is split into per worker process, more chunks balance load better"""
+
+    def __init__(self, initial_data: dict = None, columns: list = None, thread_safe: bool = False):
+        """
+        :param initial_data: A dict of column lists to initialize the storage with
+        :param columns: A list of columns of an empty storage
+        :param thread_safe: Whether the storage is going to be used by multiple threads concurrently
+        """
         if initial_data is None and columns is None:
             self._data = dict()
 
@@ -29,6 +56,14 @@ class MemoryDictStorage(Storage):
         else:
             raise ValueError('Either `initial_data` or `columns` can be provided, but not both')
 
+        self._indexes = dict()
+        self._lock = ReadWriteLock() if thread_safe else NoopReadWriteLock()
+        self._scanner = None
+        self._result_cache = None
+
+        # The number of rows visible to readers, it is updated after all columns have been extended
+        self._num_rows = len(next(iter(self._data.values()), []))
+
     def __repr__(self):
         return str(self._data)
 
@@ -45,68 +80,359 @@ class MemoryDictStorage(Storage):
         Insert an entry to the storage by appending values to the columns lists.
         Validate before insertion and raise exception in advance, thus preserving invariants (lengths of column lists).
 
-        TODO: Wrapping this function into a mutex should be considered for thread-safety
-
         :return: Inserted Entry
         """
+        start = self._append_columns({column: [value] for column, value in kwargs.items()})
+
+        return self._entry_by_index(start)
+
+    def insert_many(self, rows: Iterable[dict], batch_size: int = None) -> int:
+        """
+        Insert rows batch by batch. Every batch is converted to columns and appended with `insert_columns()`,
+        so the schema is checked once per distinct set of row keys and columns are extended in one go.
+
+        If a row is invalid, its whole batch is rejected, while previous batches remain inserted.
+
+        :param rows: An iterable of dicts with columns as keys
+        :param batch_size: The number of rows to insert at once (INSERT_BATCH_SIZE if None)
+        :return: The number of inserted rows
+        """
+        if batch_size is None:
+            batch_size = self.INSERT_BATCH_SIZE
 
-        # Validate columns before insertion
-        for column in kwargs.keys():
+        rows = iter(rows)
+        num_inserted = 0
+
+        while True:
+            batch = list(islice(rows, batch_size))
+
+            if len(batch) == 0:
+                return num_inserted
+
+            self._check_rows_keys(batch)
+            self.insert_columns({column: [row.get(column) for row in batch] for column in self._data})
+
+            num_inserted += len(batch)
+
+    def insert_columns(self, columns_data: dict) -> int:
+        """
+        Insert rows given as whole columns by extending the columns lists.
+        Columns that are not provided are filled with None values.
+        Validate before insertion and raise exception in advance, thus preserving invariants (lengths of column lists).
+
+        :param columns_data: A dict with columns as keys and lists of values of equal lengths as values
+        :return: The number of inserted rows
+        """
+        self._append_columns(columns_data)
+
+        return len(next(iter(columns_data.values())))
+
+    def _append_columns(self, columns_data: dict) -> int:
+        """
+        Validate and append rows given as whole columns, then make them visible to readers
+
+        :param columns_data: A dict with columns as keys and lists of values of equal lengths as values
+        :return: The index of the first appended row
+        """
+        if len(columns_data) == 0:
+            raise ValueError('Can not perform insertion because empty data provided')
+
+        num_rows = None
+
+        for column, values in columns_data.items():
             if column not in self._data:
                 raise ValueError(f'Column `{column}` does not exist in the storage')
 
-        # Track the columns that are being inserted to figure out which were not present in data
-        non_inserted_columns = self.columns()
+            if num_rows is None:
+                num_rows = len(values)
 
-        for column, value in kwargs.items():
-            self._data[column].append(value)
-            non_inserted_columns.remove(column)
+            elif num_rows != len(values):
+                raise ValueError('Lengths of data columns do not match')
 
-        if len(non_inserted_columns) == len(self.columns()):
-            raise ValueError('Can not perform insertion because empty data provided')
+            self._validate_values(column, values)
 
-        # Fill remaining columns with None values
-        for column in non_inserted_columns:
-            self._data[column].append(None)
+        with self._lock.write():
+            start = self._num_rows
 
-        return self._entry_by_index(-1)
+            for column, column_values in self._data.items():
+                column_values.extend(columns_data[column] if column in columns_data else [None] * num_rows)
 
-    def all_entries(self) -> List[Entry]:
-        if len(self.columns()) == 0:
-            return []
+            for column, index in self._indexes.items():
+                index.add_many(self._data[column][start:start + num_rows], start)
 
-        num_entries = len(self._data[self.columns()[0]])
+            self._num_rows = start + num_rows
 
-        all_entries = list()
+        return start
 
-        for idx in range(num_entries):
-            entry = self._entry_by_index(idx)
-            all_entries.append(entry)
+    def create_index(self, column: str, kind: str = 'hash'):
+        if column not in self._data:
+            raise ValueError(f'Column `{column}` does not exist in the storage')
 
-        return all_entries
+        index = IndexFactory.create(kind)
 
-    def filter(self, filter_obj: Filter = None) -> List[Entry]:
-        if filter_obj is None:
-            return []
+        with self._lock.write():
+            index.build(self._data[column])
+            self._indexes[column] = index
 
+    def explain(self, filter_obj: Filter) -> str:
         if not isinstance(filter_obj, Filter):
             raise TypeError(f'filter must be of type `Filter`, got {type(filter_obj)}')
 
-        return [entry for entry in self.all_entries() if filter_obj.satisfies(entry)]
+        with self._lock.read():
+            index_plan = filter_obj.explain(self._indexes)
+
+        if index_plan is not None:
+            return index_plan
+
+        return 'full scan'
+
+    def all_entries(self) -> List[Entry]:
+        return list(self.iter_entries())
+
+    def filter(self, filter_obj: Filter = None, workers: int = None) -> List[Entry]:
+        return list(self.iter_filter(filter_obj, workers=workers))
+
+    def iter_entries(self, limit: int = None, offset: int = 0) -> Iterator[Entry]:
+        indices = self._slice(range(self._num_entries()), limit, offset)
+
+        return (self._entry_by_index(idx) for idx in indices)
+
+    def iter_filter(self, filter_obj: Filter = None, limit: int = None, offset: int = 0,
+                    workers: int = None) -> Iterator[Entry]:
+        """
+        Lazily iterate over entries satisfying a given filter.
+
+        Filters that can use an index are looked up, candidate rows found by indexes are checked
+        by the filter (see `Filter.candidates()`). Otherwise the storage is scanned chunk by chunk,
+        and with `workers` greater than 1 chunks are evaluated in a pool of processes (see ParallelScanner).
+        Columns the filter reads are then copied to shared memory once, until more rows are inserted.
+        Parallel evaluation falls back to a scan in the current process if the storage is small
+        or if values can not be shared (only `str`, `int` and `float` values are supported),
+        as well as before Python 3.8, which has no shared memory
+
+        If the result cache is enabled (see `enable_result_cache()`), results of cacheable filters
+        are computed in full and reused, new rows are evaluated only once they are inserted.
+
+        :param filter_obj: A filter to apply to the storage entries
+        :param limit: The maximum number of entries to yield (no limit if None)
+        :param offset: The number of matching entries to skip from the beginning
+        :param workers: The number of processes to evaluate the filter in (the current process only if None)
+        :return: An iterator over filtered entries
+        """
+        if filter_obj is not None and not isinstance(filter_obj, Filter):
+            raise TypeError(f'filter must be of type `Filter`, got {type(filter_obj)}')
+
+        if filter_obj is None:
+            return self._slice(iter([]), limit, offset)
+
+        num_entries = self._num_entries()
+        key = filter_obj.cache_key() if self._result_cache is not None else None
+
+        if key is not None:
+            rows = self._result_cache.rows(
+                key,
+                num_entries,
+                lambda start: list(self._iter_matching_rows(filter_obj, start, num_entries, workers))
+            )
+        else:
+            rows = self._iter_matching_rows(filter_obj, 0, num_entries, workers)
+
+        return (self._entry_by_index(idx) for idx in self._slice(rows, limit, offset))
+
+    def enable_result_cache(self, max_entries: int = 128, max_rows: int = 1000000) -> ResultCache:
+        """
+        Cache results of filters providing a cache key (see `Filter.cache_key()`).
+        Rows are only appended, so inserting rows does not invalidate cached results,
+        they are refreshed by evaluating filters against the inserted rows on the next query
+
+        :param max_entries: The maximum number of cached results
+        :param max_rows: The maximum total number of rows in cached results
+        :return: The cache, see `ResultCache.stats()` for hit and miss statistics
+        """
+        self._result_cache = ResultCache(max_entries, max_rows)
+
+        return self._result_cache
+
+    def close(self):
+        """
+        Stop worker processes of parallel scans and free shared memory
+        """
+        if self._scanner is not None:
+            self._scanner.close()
+            self._scanner = None
+
+    def _iter_matching_rows(self, filter_obj, start, end, workers=None):
+        """
+        Find rows satisfying a filter in a range of rows using indexes, a parallel scan or a scan
+
+        :param filter_obj: A filter to apply to the storage entries
+        :param start: The first row to evaluate
+        :param end: The row following the last row to evaluate
+        :param workers: The number of processes to evaluate the filter in (the current process only if None)
+        :return: An iterator over indexes of matching rows in ascending order
+        """
+        with self._lock.read():
+            rows = filter_obj.lookup(self._indexes)
+            candidates = filter_obj.candidates(self._indexes) if rows is None else None
+
+        if candidates is not None:
+            return self._iter_selected_rows(filter_obj, self._rows_between(candidates, start, end))
+
+        if rows is not None:
+            return iter(self._rows_between(rows, start, end))
+
+        if workers is not None and workers > 1 and start == 0:
+            rows = self._scan_in_parallel(filter_obj, workers, end)
+
+            if rows is not None:
+                return rows
+
+        return self._iter_scanned_rows(filter_obj, start, end)
+
+    def _iter_scanned_rows(self, filter_obj, start, end):
+        """
+        Evaluate a filter chunk by chunk so that the first matching rows are found
+        before the whole storage is scanned
+
+        :param filter_obj: A filter to apply to the storage entries
+        :param start: The first row to evaluate
+        :param end: The row following the last row to evaluate
+        :return: A generator of indexes of matching rows
+        """
+        for chunk_start in range(start, end, self.SCAN_CHUNK_SIZE):
+            chunk_end = min(chunk_start + self.SCAN_CHUNK_SIZE, end)
+            mask = filter_obj.mask(ColumnsChunk(self._data, chunk_start, chunk_end))
+
+            # Fall back to row-by-row evaluation if the filter does not support column masks
+            if mask is None:
+                for idx in range(chunk_start, chunk_end):
+                    if filter_obj.satisfies(self._entry_by_index(idx)):
+                        yield idx
+            else:
+                yield from compress(range(chunk_start, chunk_end), mask)
+
+    def _iter_selected_rows(self, filter_obj, candidates):
+        """
+        Check candidate rows found by indexes chunk by chunk
+
+        :param filter_obj: A filter to apply to the storage entries
+        :param candidates: A sorted list of indexes of rows that may satisfy the filter
+        :return: A generator of indexes of matching rows
+        """
+        for start in range(0, len(candidates), self.SCAN_CHUNK_SIZE):
+            yield from filter_obj.select(self._data, candidates[start:start + self.SCAN_CHUNK_SIZE])
+
+    def _scan_in_parallel(self, filter_obj, workers, num_entries):
+        """
+        Start evaluating a filter in a pool of processes
+
+        :param filter_obj: A filter to apply to the storage entries
+        :param workers: The number of processes
+        :param num_entries: The number of rows to evaluate
+        :return: An iterator over indexes of matching rows or None if the filter can not be evaluated in parallel
+        """
+        columns = filter_obj.columns()
+
+        if columns is None:
+            columns = self.columns()
+
+        # Missing columns are reported by a regular scan
+        if num_entries <= self.SCAN_CHUNK_SIZE or any(column not in self._data for column in columns):
+            return None
+
+        if self._scanner is None or self._scanner.workers != workers:
+            # Imported here since it pulls in multiprocessing and shared memory, which serial scans do not need
+            try:
+                from ds_simple_db.core.parallel_scan import ParallelScanner
+            except ImportError:
+                # `multiprocessing.shared_memory` appeared in Python 3.8
+                return None
+
+            self.close()
+            self._scanner = ParallelScanner(workers)
+
+            # Worker processes and shared memory must not outlive the storage
+            finalize(self, self._scanner.close)
+
+        try:
+            block = self._scanner.share({column: self._data[column] for column in columns}, num_entries)
+        except (TypeError, OverflowError, UnicodeEncodeError):
+            # Columns that can not be encoded exactly are scanned serially
+            return None
+
+        chunk_size = max(self.SCAN_CHUNK_SIZE, -(-num_entries // (workers * self.PARALLEL_TASKS_PER_WORKER)))
+
+        return self._scanner.scan(block, filter_obj, num_entries, chunk_size)
+
+    @staticmethod
+    def _rows_between(rows, start, end):
+        """
+        Get rows within a range out of a sorted list of rows
+
+        :param rows: A sorted list of row indexes
+        :param start: The first row of the range
+        :param end: The row following the last row of the range
+        :return: A list of row indexes
+        """
+        if start == 0 and (len(rows) == 0 or rows[-1] < end):
+            return rows
+
+        return rows[bisect_left(rows, start):bisect_left(rows, end)]
+
+    def _num_entries(self):
+        """
+        Get the number of rows visible to readers, rows being inserted concurrently are not counted
+        """
+        return self._num_rows
+
+    def _validate_values(self, column, values):
+        """
+        Check if values can be inserted into a column and raise an exception if not.
+        Any value can be stored in a list, so this is a hook for subclasses with typed columns
+
+        :param column: A column name
+        :param values: A list of values to insert
+        """
+        pass
+
+    def _check_rows_keys(self, rows):
+        """
+        Check that rows are non-empty dicts with existing columns as keys.
+        Rows usually share the same keys, so every distinct tuple of keys is checked only once
+
+        :param rows: A list of rows to check
+        """
+        checked_keys = set()
+
+        for row in rows:
+            if not isinstance(row, dict):
+                raise TypeError(f'Row must be of type `dict`, got {type(row)}')
+
+            keys = tuple(row)
+
+            if keys in checked_keys:
+                continue
+
+            if len(keys) == 0:
+                raise ValueError('Can not perform insertion because empty data provided')
+
+            for column in keys:
+                if column not in self._data:
+                    raise ValueError(f'Column `{column}` does not exist in the storage')
+
+            checked_keys.add(keys)
 
     def _entry_by_index(self, idx):
         """
         Get an entry by its index
 
-        :param idx: The entry index
-        :return: Entry
+        :param idx: The entry index (negative values count from the end)
+        :return: A read-only view of the entry
         """
-        entry_data = dict()
-
-        for column in self.columns():
-            entry_data[column] = self._data[column][idx]
+        if idx < 0:
+            idx += self._num_entries()
 
-        return Entry(entry_data)
+        return EntryView(self._data, idx)
 
     @staticmethod
     def _validate_data(data):
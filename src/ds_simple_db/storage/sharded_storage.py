@@ -0,0 +1,405 @@
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import chain, compress, islice
+from typing import Iterable, Iterator, List
+
+from ds_simple_db.core.column_summary import ColumnSummary
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.core.filter import Filter
+from ds_simple_db.core.read_write_lock import NoopReadWriteLock, ReadWriteLock
+from ds_simple_db.core.storage import Storage
+
+
+class ShardedStorage(Storage):
+    """
+    A storage that partitions rows across several child storages (shards) by the value of a shard key column.
+
+    With `partitioning='hash'` a row goes to the shard `hash(key) % num_shards`, which spreads rows evenly.
+    With `partitioning='range'` sorted `boundaries` split keys into ranges and a row goes to the shard of the range
+    its key falls into (keys equal to a boundary go to the next shard, None keys go to the first one),
+    which keeps close keys together. Note that hashes of strings differ between processes,
+    so hash partitioning is only stable within a process.
+
+    Shards are storages of any `storage_type` registered in StorageFactory, created with the same keyword arguments.
+    Entries are returned shard by shard, in the order of insertion within every shard.
+
+    Every shard has a summary of every column (see ColumnSummary) updated on insertion. A filter skips the shards
+    their summaries rule out (see `Filter.may_match()`), e.g. shards whose range of values does not overlap
+    a range filter or, with hash partitioning, shards other than the one a key looked up is assigned to.
+    Values of `bloom_columns` are also kept in Bloom filters, so that values looked up are ruled out
+    in the shards that do not have them, at the cost of slower insertion. The remaining shards are queried
+    in a pool of threads, one per shard. A scan in the current process holds the interpreter lock,
+    so threads speed up scans only with `workers`, which are split between the queried shards.
+    """
+
+    PARTITIONINGS = ('hash', 'range')
+    """Supported ways to assign rows to shards"""
+
+    def __init__(self, columns: list, num_shards: int = None, shard_key: str = None, partitioning: str = 'hash',
+                 boundaries: list = None, bloom_columns: list = None, storage_type: str = 'memory_dict_storage',
+                 thread_safe: bool = False, **storage_kwargs):
+        """
+        :param columns: A list of columns of the storage
+        :param num_shards: The number of shards (the number of boundaries plus one for range partitioning)
+        :param shard_key: A column which values assign rows to shards (the first column if None)
+        :param partitioning: How keys are assigned to shards, one of `PARTITIONINGS`
+        :param boundaries: Sorted keys separating shards for range partitioning
+        :param bloom_columns: Columns to keep Bloom filters of values for in shard summaries
+        :param storage_type: A type of shards registered in StorageFactory
+        :param thread_safe: Whether the storage is going to be used by multiple threads concurrently
+        :param storage_kwargs: Other keyword arguments to create shards with, e.g. `column_types`
+        """
+        # Imported here since the storage package registers this module in StorageFactory
+        from ds_simple_db.storage import StorageFactory
+
+        if partitioning not in self.PARTITIONINGS:
+            raise ValueError(f'Unknown partitioning `{partitioning}`, expected one of {list(self.PARTITIONINGS)}')
+
+        columns = list(columns)
+
+        if len(columns) == 0:
+            raise ValueError('At least one column must be provided')
+
+        if shard_key is None:
+            shard_key = columns[0]
+
+        if shard_key not in columns:
+            raise ValueError(f'Column `{shard_key}` does not exist in the storage')
+
+        bloom_columns = [] if bloom_columns is None else list(bloom_columns)
+
+        for column in bloom_columns:
+            if column not in columns:
+                raise ValueError(f'Column `{column}` does not exist in the storage')
+
+        if partitioning == 'range':
+            num_shards = self._check_boundaries(boundaries, num_shards)
+
+        elif boundaries is not None:
+            raise ValueError('`boundaries` can be provided only for range partitioning')
+
+        if num_shards is None or num_shards < 1:
+            raise ValueError(f'`num_shards` must be positive, got {num_shards}')
+
+        self.shard_key = shard_key
+        self.partitioning = partitioning
+        self.boundaries = None if boundaries is None else list(boundaries)
+
+        if thread_safe:
+            storage_kwargs['thread_safe'] = True
+
+        self.shards = [
+            StorageFactory.create(storage_type, columns=columns, **storage_kwargs) for _ in range(num_shards)
+        ]
+
+        self._columns = columns
+        self._summaries = [
+            {
+                column: ColumnSummary(
+                    bloom_filter=column in bloom_columns,
+                    hash_partition=(num_shards, shard) if partitioning == 'hash' and column == shard_key else None
+                )
+                for column in columns
+            }
+            for shard in range(num_shards)
+        ]
+        self._sizes = [0] * num_shards
+        self._lock = ReadWriteLock() if thread_safe else NoopReadWriteLock()
+        self._executor = None
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.partitioning}, `{self.shard_key}`, {len(self.shards)} shards)'
+
+    def columns(self) -> list:
+        return list(self._columns)
+
+    def insert(self, **kwargs) -> Entry:
+        """
+        Insert an entry to the shard its key is assigned to
+
+        :return: Inserted Entry
+        """
+        self._check_columns(kwargs)
+
+        shard = self._shard_numbers([kwargs.get(self.shard_key)])[0]
+
+        with self._lock.write():
+            entry = self.shards[shard].insert(**kwargs)
+            self._update_summaries(shard, {column: [value] for column, value in kwargs.items()}, 1)
+            self._sizes[shard] += 1
+
+        return entry
+
+    def insert_many(self, rows: Iterable[dict], batch_size: int = None) -> int:
+        """
+        Insert rows batch by batch, every batch is converted to columns and inserted with `insert_columns()`
+
+        :param rows: An iterable of dicts with columns as keys
+        :param batch_size: The number of rows to insert at once (INSERT_BATCH_SIZE of the first shard if None)
+        :return: The number of inserted rows
+        """
+        if batch_size is None:
+            batch_size = getattr(self.shards[0], 'INSERT_BATCH_SIZE', 4096)
+
+        rows = iter(rows)
+        num_inserted = 0
+
+        while True:
+            batch = list(islice(rows, batch_size))
+
+            if len(batch) == 0:
+                return num_inserted
+
+            for row in batch:
+                if not isinstance(row, dict):
+                    raise TypeError(f'Row must be of type `dict`, got {type(row)}')
+
+                self._check_columns(row)
+
+            self.insert_columns({column: [row.get(column) for row in batch] for column in self._columns})
+
+            num_inserted += len(batch)
+
+    def insert_columns(self, columns_data: dict) -> int:
+        """
+        Split rows given as whole columns between shards and insert every part with `insert_columns()` of its shard.
+
+        Columns are checked before insertion, values are validated by shards, so if a shard rejects its part,
+        parts inserted into other shards remain
+
+        :param columns_data: A dict with columns as keys and lists of values of equal lengths as values
+        :return: The number of inserted rows
+        """
+        self._check_columns(columns_data)
+
+        if len(set(map(len, columns_data.values()))) > 1:
+            raise ValueError('Lengths of data columns do not match')
+
+        num_rows = len(next(iter(columns_data.values())))
+
+        if num_rows == 0:
+            return 0
+
+        key_values = columns_data.get(self.shard_key, [None] * num_rows)
+        shard_numbers = self._shard_numbers(key_values)
+
+        with self._lock.write():
+            for shard in range(len(self.shards)):
+                positions = list(compress(range(num_rows), map(shard.__eq__, shard_numbers)))
+
+                if len(positions) == 0:
+                    continue
+
+                if len(positions) == num_rows:
+                    part = columns_data
+                else:
+                    part = {
+                        column: list(map(values.__getitem__, positions)) for column, values in columns_data.items()
+                    }
+
+                self.shards[shard].insert_columns(part)
+                self._update_summaries(shard, part, len(positions))
+                self._sizes[shard] += len(positions)
+
+        return num_rows
+
+    def all_entries(self) -> List[Entry]:
+        return list(self.iter_entries())
+
+    def filter(self, filter_obj: Filter = None, workers: int = None) -> List[Entry]:
+        return list(self.iter_filter(filter_obj, workers=workers))
+
+    def iter_entries(self, limit: int = None, offset: int = 0) -> Iterator[Entry]:
+        """
+        Lazily iterate over entries shard by shard, shards before `offset` are skipped without retrieving entries
+
+        :param limit: The maximum number of entries to yield (no limit if None)
+        :param offset: The number of entries to skip from the beginning
+        :return: An iterator over entries in the storage
+        """
+        # Validate `limit` and `offset` right away rather than on iteration
+        self._slice([], limit, offset)
+
+        with self._lock.read():
+            sizes = list(self._sizes)
+
+        return self._iter_shard_entries(sizes, limit, offset)
+
+    def iter_filter(self, filter_obj: Filter = None, limit: int = None, offset: int = 0,
+                    workers: int = None) -> Iterator[Entry]:
+        """
+        Iterate over entries satisfying a given filter in the shards the filter does not rule out.
+
+        Without `limit` the shards are queried concurrently and their results are concatenated.
+        With `limit` the shards are queried lazily one by one, so that only the first matching entries are retrieved
+
+        :param filter_obj: A filter to apply to the storage entries
+        :param limit: The maximum number of entries to yield (no limit if None)
+        :param offset: The number of matching entries to skip from the beginning
+        :param workers: The number of processes to evaluate the filter in, split between the queried shards
+        :return: An iterator over filtered entries
+        """
+        if filter_obj is not None and not isinstance(filter_obj, Filter):
+            raise TypeError(f'filter must be of type `Filter`, got {type(filter_obj)}')
+
+        if filter_obj is None:
+            return self._slice(iter([]), limit, offset)
+
+        shards = [self.shards[shard] for shard in self._shards_to_query(filter_obj)]
+
+        if limit is not None or len(shards) <= 1:
+            results = (shard.iter_filter(filter_obj, workers=workers) for shard in shards)
+
+            return self._slice(chain.from_iterable(results), limit, offset)
+
+        if workers is not None:
+            workers = -(-workers // len(shards))
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(len(self.shards), thread_name_prefix='shard')
+
+        futures = [self._executor.submit(shard.filter, filter_obj, workers=workers) for shard in shards]
+
+        return self._slice(chain.from_iterable(future.result() for future in futures), limit, offset)
+
+    def create_index(self, column: str, kind: str = 'hash'):
+        for shard in self.shards:
+            shard.create_index(column, kind)
+
+    def enable_result_cache(self, max_entries: int = 128, max_rows: int = 1000000) -> list:
+        """
+        Cache results of filters in every shard, see `Storage.enable_result_cache()`
+
+        :param max_entries: The maximum number of cached results per shard
+        :param max_rows: The maximum total number of rows in cached results per shard
+        :return: A list of caches of shards
+        """
+        return [shard.enable_result_cache(max_entries, max_rows) for shard in self.shards]
+
+    def explain(self, filter_obj: Filter) -> str:
+        if not isinstance(filter_obj, Filter):
+            raise TypeError(f'filter must be of type `Filter`, got {type(filter_obj)}')
+
+        queried = self._shards_to_query(filter_obj)
+        skipped = [str(shard) for shard in range(len(self.shards)) if shard not in queried]
+        plans = [f'shard {shard}: {self.shards[shard].explain(filter_obj)}' for shard in queried]
+
+        if len(skipped) > 0:
+            plans.insert(0, f'skip shards {", ".join(skipped)} by column summaries')
+
+        return '; '.join(plans)
+
+    def shard_sizes(self) -> List[int]:
+        """
+        Get the numbers of rows inserted into shards
+
+        :return: A list with the number of rows per shard
+        """
+        with self._lock.read():
+            return list(self._sizes)
+
+    def close(self):
+        """
+        Stop the threads querying shards and close the shards
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+        for shard in self.shards:
+            if hasattr(shard, 'close'):
+                shard.close()
+
+    def _iter_shard_entries(self, sizes, limit, offset):
+        for shard, size in zip(self.shards, sizes):
+            if limit is not None and limit <= 0:
+                return
+
+            if offset >= size:
+                offset -= size
+                continue
+
+            num_entries = size - offset if limit is None else min(limit, size - offset)
+
+            yield from shard.iter_entries(num_entries, offset)
+
+            offset = 0
+
+            if limit is not None:
+                limit -= num_entries
+
+    def _shards_to_query(self, filter_obj):
+        """
+        Find the shards whose column summaries do not rule a filter out
+
+        :param filter_obj: A filter to apply to the storage entries
+        :return: A list of numbers of shards
+        """
+        with self._lock.read():
+            return [shard for shard, summaries in enumerate(self._summaries) if filter_obj.may_match(summaries)]
+
+    def _shard_numbers(self, keys):
+        """
+        Assign keys to shards
+
+        :param keys: A list of values of the shard key column
+        :return: A list of numbers of shards
+        """
+        num_shards = len(self.shards)
+
+        if self.partitioning == 'hash':
+            try:
+                return list(map(num_shards.__rmod__, map(hash, keys)))
+            except TypeError as error:
+                raise TypeError(f'Values of the shard key column `{self.shard_key}` must be hashable') from error
+
+        locate = partial(bisect_right, self.boundaries)
+
+        try:
+            if None not in keys:
+                return list(map(locate, keys))
+
+            return [0 if key is None else locate(key) for key in keys]
+        except TypeError as error:
+            raise TypeError(
+                f'Values of the shard key column `{self.shard_key}` can not be compared with the boundaries'
+            ) from error
+
+    def _update_summaries(self, shard, columns_data, num_rows):
+        summaries = self._summaries[shard]
+
+        for column, summary in summaries.items():
+            summary.update(columns_data[column] if column in columns_data else [None] * num_rows)
+
+    def _check_columns(self, data):
+        if len(data) == 0:
+            raise ValueError('Can not perform insertion because empty data provided')
+
+        for column in data:
+            if column not in self._summaries[0]:
+                raise ValueError(f'Column `{column}` does not exist in the storage')
+
+    @staticmethod
+    def _check_boundaries(boundaries, num_shards):
+        """
+        Check boundaries of range partitioning
+
+        :return: The number of shards
+        """
+        if boundaries is None or len(boundaries) == 0:
+            raise ValueError('`boundaries` must be provided for range partitioning')
+
+        try:
+            is_sorted = all(low < high for low, high in zip(boundaries, boundaries[1:]))
+        except TypeError as error:
+            raise TypeError('`boundaries` must be comparable with each other') from error
+
+        if not is_sorted or None in boundaries:
+            raise ValueError('`boundaries` must be sorted in ascending order without duplicates and None values')
+
+        if num_shards is not None and num_shards != len(boundaries) + 1:
+            raise ValueError(f'{len(boundaries)} boundaries split keys into {len(boundaries) + 1} shards, '
+                             f'`num_shards` is {num_shards}')
+
+        return len(boundaries) + 1
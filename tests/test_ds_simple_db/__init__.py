@@ -0,0 +1,12 @@
+import atexit
+import os
+import shutil
+import tempfile
+
+from ds_simple_db.core.plugins import CACHE_DIR_ENV_VAR
+
+# Factories cache the registry of plugins on their first use, tests keep it in a temporary folder
+# instead of the cache folder of the user. The package is imported before its tests by both unittest and pytest
+_cache_folder = tempfile.mkdtemp()
+os.environ[CACHE_DIR_ENV_VAR] = _cache_folder
+atexit.register(shutil.rmtree, _cache_folder, ignore_errors=True)
@@ -0,0 +1,69 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from ds_simple_db.core.atomic_file import atomic_write
+
+
+class TestAtomicWrite(TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, 'nested', 'file.txt')
+
+    def test_creates_folders_and_writes_file(self):
+        with atomic_write(self.path) as fp:
+            fp.write('data')
+
+        with open(self.path) as fp:
+            self.assertEqual('data', fp.read())
+
+        self.assertListEqual(['file.txt'], os.listdir(os.path.dirname(self.path)))
+
+    def test_keeps_existing_file_on_failure(self):
+        with atomic_write(self.path) as fp:
+            fp.write('old data')
+
+        with self.assertRaises(RuntimeError):
+            with atomic_write(self.path) as fp:
+                fp.write('new data')
+                raise RuntimeError('Serialization failed')
+
+        with open(self.path) as fp:
+            self.assertEqual('old data', fp.read())
+
+        self.assertListEqual(['file.txt'], os.listdir(os.path.dirname(self.path)))
+
+    def test_keeps_permissions_of_replaced_file(self):
+        with atomic_write(self.path) as fp:
+            fp.write('old data')
+
+        os.chmod(self.path, 0o640)
+
+        with atomic_write(self.path) as fp:
+            fp.write('new data')
+
+        self.assertEqual(0o640, os.stat(self.path).st_mode & 0o777)
+
+    def test_keeps_line_endings_with_newline_argument(self):
+        with atomic_write(self.path, newline='') as fp:
+            fp.write('a\r\nb\rc\n')
+
+        with open(self.path, 'rb') as fp:
+            self.assertEqual(b'a\r\nb\rc\n', fp.read())
+
+    def test_raises_error_of_failed_open(self):
+        with self.assertRaises(ValueError):
+            with atomic_write(self.path, 'invalid mode'):
+                pass
+
+        self.assertListEqual([], os.listdir(os.path.dirname(self.path)))
+
+    def test_concurrent_writes_use_separate_temporary_files(self):
+        with atomic_write(self.path) as first_fp, atomic_write(self.path) as second_fp:
+            first_fp.write('first')
+            second_fp.write('second')
+
+        with open(self.path) as fp:
+            self.assertEqual('first', fp.read())
+
+        self.assertListEqual(['file.txt'], os.listdir(os.path.dirname(self.path)))
@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from ds_simple_db.core.column_codec import EncodedColumn, encode_column, infer_kind
+
+
+class TestColumnCodec(TestCase):
+
+    #
+    # infer_kind()
+    #
+
+    def test_infer_kind_picks_narrowest_kind(self):
+        self.assertEqual('str', infer_kind(['a', None]))
+        self.assertEqual('str', infer_kind([None, None]))
+        self.assertEqual('int', infer_kind([1, None, 2]))
+        self.assertEqual('float', infer_kind([1, None, 2.5]))
+
+    def test_infer_kind_raises_type_error_for_unsupported_values(self):
+        with self.assertRaises(TypeError):
+            infer_kind(['a', 1])
+
+        with self.assertRaises(TypeError):
+            infer_kind([True])
+
+        with self.assertRaises(TypeError):
+            infer_kind([b'bytes'])
+
+    def test_infer_kind_exact_raises_type_error_for_integers_mixed_with_floats(self):
+        self.assertEqual('float', infer_kind([1.5, None, 2.5], exact=True))
+
+        with self.assertRaises(TypeError):
+            infer_kind([1, None, 2.5], exact=True)
+
+    #
+    # encode_column() / EncodedColumn
+    #
+
+    def test_encoded_column_decodes_values_of_all_kinds(self):
+        for values in [['Дмитрий', None, '', 'Andrew'], [1, None, -2 ** 63], [1.5, None, 2.0]]:
+            column = EncodedColumn(*encode_column(values))
+
+            self.assertEqual(len(values), len(column))
+            self.assertListEqual(values, list(column))
+            self.assertListEqual(values[1:3], column[1:3])
+            self.assertEqual(values[-1], column[-1])
+
+    def test_encoded_column_raises_index_error_if_index_is_out_of_range(self):
+        column = EncodedColumn(*encode_column(['a']))
+
+        with self.assertRaises(IndexError):
+            column[1]
+
+    def test_encode_column_raises_value_error_if_kind_is_unknown(self):
+        with self.assertRaises(ValueError):
+            encode_column(['a'], kind='category')
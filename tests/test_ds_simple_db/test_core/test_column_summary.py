@@ -0,0 +1,99 @@
+from unittest import TestCase
+
+from ds_simple_db.core.column_summary import ColumnSummary
+
+
+class TestColumnSummary(TestCase):
+
+    def test_update_counts_values_and_tracks_bounds(self):
+        summary = ColumnSummary()
+        summary.update([3, None, 1])
+        summary.update([7])
+
+        self.assertEqual(4, summary.num_values)
+        self.assertEqual(1, summary.num_none)
+        self.assertEqual({int}, summary.types)
+        self.assertEqual((1, 7), (summary.min, summary.max))
+
+    def test_may_contain_never_rules_out_added_values(self):
+        values = [f'value{i}' for i in range(5000)] + list(range(5000)) + [1.5, (1, 2)]
+        summary = ColumnSummary()
+
+        # Small batches make the Bloom filter grow by segments
+        for start in range(0, len(values), 700):
+            summary.update(values[start:start + 700])
+
+        self.assertTrue(all(summary.may_contain(value) for value in values))
+
+    def test_may_contain_rules_out_most_missing_values(self):
+        summary = ColumnSummary()
+        summary.update([f'value{i}' for i in range(5000)])
+
+        false_positives = sum(summary.may_contain(f'missing{i}') for i in range(1000))
+
+        self.assertLess(false_positives, 150)
+
+    def test_may_contain_considers_only_hash_partition_without_bloom_filter(self):
+        summary = ColumnSummary(bloom_filter=False, hash_partition=(4, 1))
+        summary.update([1, 5, 9])
+
+        self.assertTrue(summary.may_contain(13))
+        self.assertFalse(summary.may_contain(2))
+
+    def test_may_contain_none_only_if_none_was_added(self):
+        summary = ColumnSummary()
+        summary.update(['a'])
+
+        self.assertFalse(summary.may_contain(None))
+
+        summary.update([None])
+
+        self.assertTrue(summary.may_contain(None))
+
+    def test_may_contain_unhashable_values(self):
+        summary = ColumnSummary()
+        summary.update([[1], [2]])
+
+        self.assertTrue(summary.may_contain('anything'))
+        self.assertTrue(summary.may_contain([3]))
+
+    def test_may_overlap(self):
+        summary = ColumnSummary()
+        summary.update([10, 20, None])
+
+        self.assertTrue(summary.may_overlap(15, 30))
+        self.assertTrue(summary.may_overlap(high=10))
+        self.assertFalse(summary.may_overlap(high=10, include_high=False))
+        self.assertFalse(summary.may_overlap(21))
+        self.assertTrue(summary.may_overlap('a'))
+
+    def test_may_overlap_is_false_for_none_values_only(self):
+        summary = ColumnSummary()
+        summary.update([None, None])
+
+        self.assertFalse(summary.may_overlap(0))
+
+    def test_bounds_are_dropped_for_incomparable_values(self):
+        summary = ColumnSummary()
+        summary.update([1, 2])
+        summary.update(['a'])
+
+        self.assertFalse(summary.is_ordered())
+        self.assertTrue(summary.may_overlap(100))
+
+    def test_nan_values_do_not_rule_out_ranges(self):
+        summary = ColumnSummary()
+        summary.update([1.0, float('nan')])
+
+        self.assertEqual((1.0, 1.0), (summary.min, summary.max))
+        self.assertTrue(summary.may_overlap(5.0))
+
+    def test_may_have_prefix(self):
+        summary = ColumnSummary()
+        summary.update(['Andrew', 'Dmitry'])
+
+        self.assertTrue(summary.may_have_prefix('A'))
+        self.assertTrue(summary.may_have_prefix('B'))
+        self.assertTrue(summary.may_have_prefix('Dm'))
+        self.assertFalse(summary.may_have_prefix('Ab'))
+        self.assertFalse(summary.may_have_prefix('E'))
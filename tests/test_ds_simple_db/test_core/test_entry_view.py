@@ -0,0 +1,76 @@
+from unittest import TestCase
+
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.core.entry_view import EntryView
+from ds_simple_db.filters.glob_filter import GlobFilter
+
+
+class TestEntryView(TestCase):
+    def setUp(self):
+        self.columns_data = dict(
+            col1=[1, 2],
+            col2=['str1', ['nested']]
+        )
+
+    def test_fields_and_values(self):
+        view = EntryView(self.columns_data, 1)
+
+        self.assertListEqual(['col1', 'col2'], view.fields())
+        self.assertListEqual([2, ['nested']], view.values())
+
+    def test_getattr_returns_correct_values(self):
+        view = EntryView(self.columns_data, 0)
+
+        self.assertEqual(1, view.col1)
+        self.assertEqual('str1', view['col2'])
+
+    def test_getattr_raises_value_error_if_non_existing_column_given(self):
+        view = EntryView(self.columns_data, 0)
+
+        with self.assertRaises(ValueError):
+            view.non_existing_column
+
+        with self.assertRaises(ValueError):
+            view['non_existing_column']
+
+    def test_as_dict_returns_a_copy(self):
+        view = EntryView(self.columns_data, 1)
+
+        data = view.as_dict()
+        data['col2'].append('modified')
+
+        self.assertDictEqual(dict(col1=2, col2=['nested']), view.as_dict())
+        self.assertListEqual(['nested'], self.columns_data['col2'][1])
+
+    def test_equal_to_entry(self):
+        view = EntryView(self.columns_data, 0)
+
+        self.assertEqual(Entry(data=dict(col1=1, col2='str1')), view)
+        self.assertEqual(view, Entry(data=dict(col1=1, col2='str1')))
+        self.assertNotEqual(Entry(data=dict(col1=2, col2='str1')), view)
+
+    def test_repr_matches_entry(self):
+        self.assertEqual(
+            repr(Entry(data=dict(col1=1, col2='str1'))),
+            repr(EntryView(self.columns_data, 0))
+        )
+
+    def test_view_reflects_columns_appended_after_creation(self):
+        view = EntryView(self.columns_data, 1)
+
+        self.columns_data['col1'].append(3)
+        self.columns_data['col2'].append('str3')
+
+        self.assertEqual(Entry(data=dict(col1=2, col2=['nested'])), view)
+
+    def test_satisfies_filter(self):
+        view = EntryView(self.columns_data, 0)
+
+        self.assertTrue(GlobFilter('col2=str*').satisfies(view))
+        self.assertFalse(GlobFilter('col1=2').satisfies(view))
+
+    def test_does_not_allow_new_attributes(self):
+        view = EntryView(self.columns_data, 0)
+
+        with self.assertRaises(AttributeError):
+            view.col3 = 'value'
@@ -0,0 +1,107 @@
+import json
+import os
+import subprocess
+import sys
+from collections import OrderedDict
+from unittest import TestCase
+
+import ds_simple_db
+from ds_simple_db.core.factory import Factory, import_class
+
+
+class LazyFactory(Factory):
+    classes = dict(
+        ordered_dict='collections:OrderedDict',
+        missing_class='collections:MissingClass',
+        missing_module='ds_simple_db.missing_module:MissingClass',
+        invalid_path='collections.OrderedDict'
+    )
+
+
+class TestFactory(TestCase):
+    def test_create_imports_class_by_path(self):
+        instance = LazyFactory.create('ordered_dict', [('a', 1)])
+
+        self.assertIsInstance(instance, OrderedDict)
+        self.assertIs(OrderedDict, LazyFactory.classes['ordered_dict'])
+
+    def test_registered_classes_are_listed_without_import(self):
+        self.assertListEqual(['ordered_dict', 'missing_class', 'missing_module', 'invalid_path'], LazyFactory.list())
+
+    def test_class_imported_by_subclass_is_kept_in_subclass(self):
+        class BaseFactory(Factory):
+            classes = dict(ordered_dict='collections:OrderedDict')
+
+        class SubFactory(BaseFactory):
+            pass
+
+        self.assertIs(OrderedDict, SubFactory.get_class('ordered_dict'))
+        self.assertIs(OrderedDict, SubFactory.classes['ordered_dict'])
+        self.assertEqual('collections:OrderedDict', BaseFactory.classes['ordered_dict'])
+
+    def test_unknown_name(self):
+        with self.assertRaises(ValueError):
+            LazyFactory.create('unknown')
+
+    def test_invalid_import_paths(self):
+        with self.assertRaises(ImportError):
+            LazyFactory.get_class('missing_class')
+
+        with self.assertRaises(ImportError):
+            LazyFactory.get_class('missing_module')
+
+        with self.assertRaises(ValueError):
+            LazyFactory.get_class('invalid_path')
+
+        self.assertIs(OrderedDict, import_class('collections:OrderedDict'))
+
+
+class TestLazyImports(TestCase):
+    """
+    Importing factories and using a single storage must not import the other storages, serializers
+    and the modules only parallel scans and loads need. Modules are listed in a fresh interpreter
+    once the registry of plugins has been cached by a previous one
+    """
+
+    SCRIPT = '''
+import json
+import sys
+
+from ds_simple_db.serializers import SerializerFactory
+from ds_simple_db.storage import StorageFactory
+
+storage = StorageFactory.create('memory_dict_storage', columns=['name', 'address'])
+storage.insert(name='John', address='Street')
+SerializerFactory.create('csv').entries_to_string(storage.all_entries())
+
+print(json.dumps(sorted(sys.modules)))
+'''
+
+    UNUSED_MODULES = [
+        'concurrent.futures.process',
+        'importlib.metadata',
+        'multiprocessing',
+        'tempfile',
+        'webbrowser',
+        'ds_simple_db.core.parallel_scan',
+        'ds_simple_db.serializers.binary_columnar_serializer',
+        'ds_simple_db.serializers.json_serializer',
+        'ds_simple_db.storage.append_log_storage',
+        'ds_simple_db.storage.mapped_columnar_storage',
+        'ds_simple_db.storage.sharded_storage',
+    ]
+
+    def test_unused_modules_are_not_imported(self):
+        # The cache folder of the registry is inherited from the tests package, the first run fills the cache
+        env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(ds_simple_db.__file__)))
+
+        for _ in range(2):
+            output = subprocess.run([sys.executable, '-c', self.SCRIPT], env=env, capture_output=True, text=True, check=True)
+
+        modules = set(json.loads(output.stdout))
+
+        self.assertIn('ds_simple_db.storage.memory_dict_storage', modules)
+        self.assertIn('ds_simple_db.serializers.csv_serializer', modules)
+
+        for module in self.UNUSED_MODULES:
+            self.assertNotIn(module, modules)
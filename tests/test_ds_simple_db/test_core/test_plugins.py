@@ -0,0 +1,119 @@
+import json
+import os
+import sys
+import tempfile
+from collections import OrderedDict
+from unittest import TestCase, mock
+
+from ds_simple_db.core import plugins
+from ds_simple_db.core.factory import Factory
+
+
+class PluginFactory(Factory):
+    plugin_group = 'ds_simple_db.test'
+
+    classes = dict(
+        builtin='collections:deque'
+    )
+
+
+class TestPlugins(TestCase):
+    def setUp(self):
+        self.packages_folder = self._temporary_folder()
+        self.cache_folder = self._temporary_folder()
+
+        self._add_package('fast_plugin', {'ds_simple_db.test': ['fast = collections:OrderedDict',
+                                                                'builtin = collections:OrderedDict']})
+
+        patches = [
+            mock.patch.object(sys, 'path', [self.packages_folder] + sys.path),
+            mock.patch.object(plugins, '_registry', None),
+            mock.patch.dict(os.environ, {plugins.CACHE_DIR_ENV_VAR: self.cache_folder}),
+            mock.patch.object(PluginFactory, 'classes', dict(PluginFactory.classes))
+        ]
+
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.addCleanup(self._forget_plugins)
+
+    def _temporary_folder(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+
+        return folder.name
+
+    @staticmethod
+    def _forget_plugins():
+        if '_plugins_discovered' in vars(PluginFactory):
+            del PluginFactory._plugins_discovered
+
+    def _add_package(self, name, entry_points):
+        folder = os.path.join(self.packages_folder, f'{name}-1.0.dist-info')
+        os.makedirs(folder)
+
+        with open(os.path.join(folder, 'METADATA'), 'w') as fp:
+            fp.write(f'Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n')
+
+        with open(os.path.join(folder, 'entry_points.txt'), 'w') as fp:
+            for group, items in entry_points.items():
+                fp.write(f'[{group}]\n' + '\n'.join(items) + '\n')
+
+    def test_installed_plugins(self):
+        self.assertDictEqual(
+            dict(fast='collections:OrderedDict', builtin='collections:OrderedDict'),
+            plugins.installed_plugins('ds_simple_db.test')
+        )
+        self.assertDictEqual(dict(), plugins.installed_plugins('ds_simple_db.missing'))
+
+    def test_registry_is_cached(self):
+        plugins.installed_plugins('ds_simple_db.test')
+
+        with open(plugins.cache_path()) as fp:
+            self.assertIn('ds_simple_db.test', json.load(fp)['groups'])
+
+        with mock.patch.object(plugins, '_registry', None), \
+                mock.patch.object(plugins, '_scan_entry_points', side_effect=AssertionError('Scanned again')):
+            self.assertIn('fast', plugins.installed_plugins('ds_simple_db.test'))
+
+    def test_cache_is_rebuilt_when_packages_change(self):
+        plugins.installed_plugins('ds_simple_db.test')
+
+        self._add_package('other_plugin', {'ds_simple_db.test': ['other = collections:Counter']})
+
+        # Make sure the modification time changes on file systems with a coarse resolution
+        stat = os.stat(self.packages_folder)
+        os.utime(self.packages_folder, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+        with mock.patch.object(plugins, '_registry', None):
+            self.assertIn('other', plugins.installed_plugins('ds_simple_db.test'))
+
+    def test_broken_cache_is_ignored(self):
+        os.makedirs(os.path.dirname(plugins.cache_path()), exist_ok=True)
+
+        with open(plugins.cache_path(), 'w') as fp:
+            fp.write('{broken')
+
+        self.assertIn('fast', plugins.installed_plugins('ds_simple_db.test'))
+
+    def test_env_plugins(self):
+        with mock.patch.dict(os.environ, DS_SIMPLE_DB_TEST_PLUGINS=' custom = collections:Counter ,'):
+            self.assertDictEqual(dict(custom='collections:Counter'), plugins.env_plugins('ds_simple_db.test'))
+
+        with mock.patch.dict(os.environ, DS_SIMPLE_DB_TEST_PLUGINS='collections:Counter'):
+            with self.assertRaises(ValueError):
+                plugins.env_plugins('ds_simple_db.test')
+
+    def test_factory_discovers_plugins(self):
+        with mock.patch.dict(os.environ, DS_SIMPLE_DB_TEST_PLUGINS='custom=collections:Counter'):
+            self.assertListEqual(['builtin', 'fast', 'custom'], PluginFactory.list())
+
+        self.assertIsInstance(PluginFactory.create('fast'), OrderedDict)
+
+        # Installed plugins do not replace built-in classes
+        self.assertNotIsInstance(PluginFactory.create('builtin'), OrderedDict)
+
+    def test_env_plugins_replace_builtin_classes(self):
+        with mock.patch.dict(os.environ, DS_SIMPLE_DB_TEST_PLUGINS='builtin=collections:OrderedDict'):
+            self.assertIsInstance(PluginFactory.create('builtin'), OrderedDict)
@@ -0,0 +1,54 @@
+import threading
+import time
+from unittest import TestCase
+
+from ds_simple_db.core.read_write_lock import ReadWriteLock
+
+
+class TestReadWriteLock(TestCase):
+    def test_readers_hold_lock_together(self):
+        lock = ReadWriteLock()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def read():
+            with lock.read():
+                # Every reader waits for the others while holding the lock, so this fails if readers exclude each other
+                barrier.wait()
+
+        threads = [threading.Thread(target=read) for _ in range(3)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertFalse(barrier.broken)
+
+    def test_writer_excludes_readers_and_writers(self):
+        lock = ReadWriteLock()
+        events = []
+
+        def write(name):
+            with lock.write():
+                events.append(f'{name} start')
+                time.sleep(0.01)
+                events.append(f'{name} end')
+
+        def read(name):
+            with lock.read():
+                events.append(f'{name} start')
+                events.append(f'{name} end')
+
+        threads = [threading.Thread(target=write, args=('writer1',)), threading.Thread(target=read, args=('reader',)),
+                   threading.Thread(target=write, args=('writer2',))]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        # Every critical section starts and ends without interleaving with a writer
+        for idx in range(0, len(events), 2):
+            self.assertEqual(events[idx].split()[0], events[idx + 1].split()[0])
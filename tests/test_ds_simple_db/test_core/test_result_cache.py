@@ -0,0 +1,80 @@
+from unittest import TestCase
+
+from ds_simple_db.core.result_cache import ResultCache
+
+
+class TestResultCache(TestCase):
+    def setUp(self):
+        self.evaluated = []
+
+    def evaluate(self, rows):
+        def evaluate(start):
+            self.evaluated.append(start)
+            return [row for row in rows if row >= start]
+
+        return evaluate
+
+    def test_rows_are_evaluated_once(self):
+        cache = ResultCache()
+
+        self.assertListEqual([1, 3], cache.rows('a', 4, self.evaluate([1, 3])))
+        self.assertListEqual([1, 3], cache.rows('a', 4, self.evaluate([1, 3])))
+        self.assertListEqual([0], self.evaluated)
+        self.assertEqual(1, cache.stats()['hits'])
+        self.assertEqual(1, cache.stats()['misses'])
+
+    def test_appended_rows_are_evaluated_incrementally(self):
+        cache = ResultCache()
+        cache.rows('a', 4, self.evaluate([1, 3]))
+
+        self.assertListEqual([1, 3, 5], cache.rows('a', 6, self.evaluate([1, 3, 5])))
+        self.assertListEqual([0, 4], self.evaluated)
+        self.assertEqual(1, cache.stats()['refreshes'])
+
+    def test_older_snapshots_get_truncated_results(self):
+        cache = ResultCache()
+        cache.rows('a', 6, self.evaluate([1, 3, 5]))
+
+        self.assertListEqual([1, 3], cache.rows('a', 4, self.evaluate([1, 3, 5])))
+        self.assertListEqual([1, 3, 5], cache.rows('a', 6, self.evaluate([1, 3, 5])))
+        self.assertListEqual([0], self.evaluated)
+
+    def test_least_recently_used_results_are_evicted(self):
+        cache = ResultCache(max_entries=2)
+        cache.rows('a', 4, self.evaluate([1]))
+        cache.rows('b', 4, self.evaluate([2]))
+        cache.rows('a', 4, self.evaluate([1]))
+        cache.rows('c', 4, self.evaluate([3]))
+
+        self.assertEqual(1, cache.stats()['evictions'])
+
+        cache.rows('a', 4, self.evaluate([1]))
+        cache.rows('b', 4, self.evaluate([2]))
+
+        self.assertEqual(2, cache.stats()['hits'])
+        self.assertEqual(4, cache.stats()['misses'])
+
+    def test_size_is_bounded_by_number_of_rows(self):
+        cache = ResultCache(max_rows=3)
+        cache.rows('a', 10, self.evaluate([1, 2]))
+        cache.rows('b', 10, self.evaluate([3, 4]))
+
+        self.assertEqual(dict(entries=1, rows=2), {key: cache.stats()[key] for key in ('entries', 'rows')})
+
+        cache.rows('c', 10, self.evaluate([1, 2, 3, 4]))
+
+        self.assertEqual(1, cache.stats()['entries'])
+
+    def test_clear(self):
+        cache = ResultCache()
+        cache.rows('a', 4, self.evaluate([1]))
+        cache.clear()
+
+        self.assertEqual(0, cache.stats()['entries'])
+
+    def test_raises_value_error_if_bounds_are_not_positive(self):
+        with self.assertRaises(ValueError):
+            ResultCache(max_entries=0)
+
+        with self.assertRaises(ValueError):
+            ResultCache(max_rows=0)
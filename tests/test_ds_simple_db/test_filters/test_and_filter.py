@@ -0,0 +1,101 @@
+from unittest import TestCase
+
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.core.filter import Filter
+from ds_simple_db.filters.and_filter import AndFilter
+from ds_simple_db.filters.comparison_filter import ComparisonFilter
+from ds_simple_db.filters.glob_filter import GlobFilter
+from ds_simple_db.filters.regex_filter import RegexFilter
+from ds_simple_db.indexes.hash_index import HashIndex
+from ds_simple_db.indexes.sorted_index import SortedIndex
+
+
+class CountingFilter(Filter):
+    """
+    A filter without column masks that counts evaluated rows
+    """
+
+    def __init__(self, column, value):
+        self.column = column
+        self.value = value
+        self.num_checked = 0
+
+    def satisfies(self, entry):
+        self.num_checked += 1
+        return entry[self.column] == self.value
+
+
+class TestAndFilter(TestCase):
+    def setUp(self):
+        self.columns_data = dict(
+            name=['Dmitry', 'Andrew', 'Alex', 'Anna'],
+            address=['Moscow', 'London', 'Moscow', 'Moscow']
+        )
+
+    def test_raises_value_error_if_no_filters_provided(self):
+        with self.assertRaises(ValueError):
+            AndFilter()
+
+    def test_raises_type_error_if_argument_is_not_a_filter(self):
+        with self.assertRaises(TypeError):
+            AndFilter(GlobFilter('name=A*'), 'address=Moscow')
+
+    def test_satisfies(self):
+        entry = Entry(data=dict(name='Alex', address='Moscow'))
+
+        self.assertTrue(AndFilter(GlobFilter('name=A*'), GlobFilter('address=Moscow')).satisfies(entry))
+        self.assertFalse(AndFilter(GlobFilter('name=A*'), GlobFilter('address=London')).satisfies(entry))
+
+    def test_mask_is_consistent_with_satisfies(self):
+        and_filter = AndFilter(GlobFilter('name=A*'), RegexFilter('address', 'cow$'))
+        entries = [Entry(data=dict(zip(self.columns_data, row))) for row in zip(*self.columns_data.values())]
+
+        self.assertListEqual([False, False, True, True], and_filter.mask(self.columns_data))
+        self.assertListEqual([and_filter.satisfies(entry) for entry in entries], and_filter.mask(self.columns_data))
+
+    def test_mask_evaluates_other_filters_only_on_remaining_rows(self):
+        counting_filter = CountingFilter('address', 'Moscow')
+        and_filter = AndFilter(counting_filter, GlobFilter('name=A*'))
+
+        self.assertListEqual([False, False, True, True], and_filter.mask(self.columns_data))
+        self.assertEqual(3, counting_filter.num_checked)
+
+    def test_mask_returns_none_if_no_filter_supports_masks(self):
+        self.assertIsNone(AndFilter(CountingFilter('name', 'Alex')).mask(self.columns_data))
+
+    def test_planner_evaluates_selective_and_cheap_filters_first(self):
+        regex_filter = RegexFilter('name', 'e')
+        wildcard_filter = GlobFilter('name=*e*')
+        exact_filter = ComparisonFilter('address', '==', 'Moscow')
+        and_filter = AndFilter(regex_filter, wildcard_filter, exact_filter)
+
+        self.assertListEqual([exact_filter, wildcard_filter, regex_filter], and_filter._ordered)
+        self.assertListEqual([regex_filter, wildcard_filter, exact_filter], and_filter.filters)
+        self.assertAlmostEqual(0.1 * 0.5 * 0.5, and_filter.selectivity())
+
+    def test_candidates_intersect_indexed_filters(self):
+        name_index = SortedIndex()
+        name_index.build(self.columns_data['name'])
+        address_index = HashIndex()
+        address_index.build(self.columns_data['address'])
+        indexes = dict(name=name_index, address=address_index)
+
+        and_filter = AndFilter(GlobFilter('name=A*'), GlobFilter('address=Moscow'), RegexFilter('name', 'x'))
+
+        self.assertListEqual([2, 3], and_filter.candidates(indexes))
+        self.assertIsNone(and_filter.lookup(indexes))
+        self.assertListEqual([2, 3], AndFilter(GlobFilter('name=A*'), GlobFilter('address=Moscow')).lookup(indexes))
+        self.assertListEqual([2], and_filter.select(self.columns_data, and_filter.candidates(indexes)))
+        self.assertIsNone(AndFilter(RegexFilter('name', 'x')).candidates(indexes))
+
+    def test_columns(self):
+        and_filter = AndFilter(GlobFilter('name=A*'), GlobFilter('address=Moscow'), RegexFilter('name', 'x'))
+
+        self.assertListEqual(['name', 'address'], and_filter.columns())
+        self.assertIsNone(AndFilter(GlobFilter('name=A*'), CountingFilter('name', 'Alex')).columns())
+
+    def test_repr(self):
+        self.assertEqual(
+            "(name=A* AND address ~ 'cow$')",
+            repr(AndFilter(GlobFilter('name=A*'), RegexFilter('address', 'cow$')))
+        )
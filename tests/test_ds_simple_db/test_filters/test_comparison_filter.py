@@ -0,0 +1,89 @@
+from unittest import TestCase
+
+from ds_simple_db.core.column_summary import ColumnSummary
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.filters.comparison_filter import ComparisonFilter
+from ds_simple_db.indexes.hash_index import HashIndex
+from ds_simple_db.indexes.sorted_index import SortedIndex
+
+
+class TestComparisonFilter(TestCase):
+    def setUp(self):
+        self.columns_data = dict(
+            name=['Dmitry', 'Andrew', 'Alex', None],
+            age=[30, 25, 41, None]
+        )
+
+    def test_raises_value_error_if_operator_is_unknown(self):
+        with self.assertRaises(ValueError):
+            ComparisonFilter('age', '=>', 30)
+
+    def test_raises_type_error_if_column_is_not_str(self):
+        with self.assertRaises(TypeError):
+            ComparisonFilter(1, '==', 30)
+
+    def test_satisfies(self):
+        entry = Entry(data=dict(name='Dmitry', age=30))
+
+        self.assertTrue(ComparisonFilter('age', '==', 30).satisfies(entry))
+        self.assertTrue(ComparisonFilter('age', '>=', 30).satisfies(entry))
+        self.assertFalse(ComparisonFilter('age', '>', 30).satisfies(entry))
+        self.assertTrue(ComparisonFilter('name', '<', 'E').satisfies(entry))
+
+    def test_mask(self):
+        self.assertListEqual([True, False, True, False], ComparisonFilter('age', '>=', 30).mask(self.columns_data))
+        self.assertListEqual([False, True, False, False], ComparisonFilter('age', '<', 30).mask(self.columns_data))
+        self.assertListEqual([True, True, True, False], ComparisonFilter('age', '!=', 0).mask(self.columns_data))
+
+    def test_values_of_other_types_do_not_match(self):
+        self.assertListEqual([False, False, False, False], ComparisonFilter('age', '>', '3').mask(self.columns_data))
+
+    def test_select(self):
+        self.assertListEqual([2], ComparisonFilter('age', '>', 30).select(self.columns_data, [1, 2, 3]))
+
+    def test_mask_raises_value_error_if_column_does_not_exist(self):
+        with self.assertRaises(ValueError):
+            ComparisonFilter('phone_number', '==', '000').mask(self.columns_data)
+
+    def test_candidates_use_index_for_string_values(self):
+        index = SortedIndex()
+        index.build(self.columns_data['name'])
+        indexes = dict(name=index)
+
+        self.assertListEqual([0], ComparisonFilter('name', '==', 'Dmitry').candidates(indexes))
+        self.assertListEqual([0, 3], ComparisonFilter('name', '>', 'Andrew').candidates(indexes))
+        self.assertListEqual([1, 2], ComparisonFilter('name', '<=', 'Andrew').candidates(indexes))
+        self.assertEqual('sorted index range scan on `name`', ComparisonFilter('name', '>', 'B').explain(indexes))
+        self.assertIsNone(ComparisonFilter('name', '>', 'B').lookup(indexes))
+
+    def test_candidates_return_none_if_index_can_not_be_used(self):
+        hash_index = HashIndex()
+        hash_index.build(self.columns_data['name'])
+
+        self.assertIsNone(ComparisonFilter('name', '>', 'B').candidates(dict(name=hash_index)))
+        self.assertIsNone(ComparisonFilter('name', '!=', 'Alex').candidates(dict(name=hash_index)))
+        self.assertIsNone(ComparisonFilter('age', '==', 30).candidates(dict(age=hash_index)))
+        self.assertIsNone(ComparisonFilter('name', '==', 'Alex').explain(dict()))
+
+    def test_may_match_uses_summaries(self):
+        summary = ColumnSummary()
+        summary.update([25, 30, 41])
+        summaries = dict(age=summary)
+
+        self.assertTrue(ComparisonFilter('age', '==', 30).may_match(summaries))
+        self.assertFalse(ComparisonFilter('age', '==', 50).may_match(summaries))
+        self.assertFalse(ComparisonFilter('age', '==', 26).may_match(summaries))
+        self.assertTrue(ComparisonFilter('age', '<=', 25).may_match(summaries))
+        self.assertFalse(ComparisonFilter('age', '<', 25).may_match(summaries))
+        self.assertFalse(ComparisonFilter('age', '>', 41).may_match(summaries))
+        self.assertTrue(ComparisonFilter('age', '!=', 30).may_match(summaries))
+        self.assertTrue(ComparisonFilter('name', '==', 'Alex').may_match(summaries))
+
+    def test_repr(self):
+        self.assertEqual('age >= 30', repr(ComparisonFilter('age', '>=', 30)))
+        self.assertEqual("name == 'Dmitry'", repr(ComparisonFilter('name', '==', 'Dmitry')))
+
+    def test_cache_key(self):
+        self.assertEqual(ComparisonFilter('age', '>=', 30).cache_key(), ComparisonFilter('age', '>=', 30).cache_key())
+        self.assertNotEqual(ComparisonFilter('age', '>=', 30).cache_key(), ComparisonFilter('age', '>', 30).cache_key())
+        self.assertNotEqual(ComparisonFilter('age', '==', 1).cache_key(), ComparisonFilter('age', '==', '1').cache_key())
@@ -1,7 +1,10 @@
 from unittest import TestCase
 
+from ds_simple_db.core.column_summary import ColumnSummary
 from ds_simple_db.core.entry import Entry
 from ds_simple_db.filters.glob_filter import GlobFilter
+from ds_simple_db.indexes.hash_index import HashIndex
+from ds_simple_db.indexes.sorted_index import SortedIndex
 
 
 class TestGlobFilter(TestCase):
@@ -22,3 +25,77 @@ class TestGlobFilter(TestCase):
 
         with self.assertRaises(ValueError):
             self.assertTrue(GlobFilter('phone_number=000').satisfies(entry))
+
+    def test_mask(self):
+        columns_data = dict(
+            name=['Dmitry', 'Andrew', 'Alex', None],
+            address=['Moscow', 'London', 'Vancouver', 'Moscow']
+        )
+
+        self.assertListEqual([True, True, True, True], GlobFilter('name=*').mask(columns_data))
+        self.assertListEqual([False, True, True, False], GlobFilter('name=A*').mask(columns_data))
+        self.assertListEqual([False, False, False, True], GlobFilter('name=None').mask(columns_data))
+        self.assertListEqual([True, False, False, True], GlobFilter('address=Moscow').mask(columns_data))
+
+    def test_mask_is_consistent_with_satisfies(self):
+        entries = [
+            Entry(data=dict(name='Dmitry')),
+            Entry(data=dict(name='dmitry')),
+            Entry(data=dict(name='[Dm]itry')),
+        ]
+        columns_data = dict(name=[entry.name for entry in entries])
+
+        for pattern in ['name=Dm*', 'name=?mitry', 'name=[Dd]*', 'name=[[]Dm]*']:
+            glob_filter = GlobFilter(pattern)
+
+            self.assertListEqual(
+                [glob_filter.satisfies(entry) for entry in entries],
+                glob_filter.mask(columns_data)
+            )
+
+    def test_mask_raises_value_error_if_column_does_not_exist(self):
+        with self.assertRaises(ValueError):
+            GlobFilter('phone_number=000').mask(dict(name=['Dmitry']))
+
+    def test_lookup_uses_index_for_exact_pattern(self):
+        index = HashIndex()
+        index.build(['Dmitry', 'Andrew', 'Dmitry'])
+
+        self.assertListEqual([0, 2], GlobFilter('name=Dmitry').lookup(dict(name=index)))
+        self.assertEqual('hash index lookup on `name`', GlobFilter('name=Dmitry').explain(dict(name=index)))
+
+    def test_lookup_uses_sorted_index_for_prefix_pattern(self):
+        index = SortedIndex()
+        index.build(['Dmitry', 'Andrew', 'Alex'])
+
+        self.assertListEqual([1, 2], GlobFilter('name=A*').lookup(dict(name=index)))
+        self.assertEqual('sorted index prefix scan on `name`', GlobFilter('name=A*').explain(dict(name=index)))
+
+    def test_lookup_returns_none_if_index_can_not_be_used(self):
+        hash_index = HashIndex()
+        sorted_index = SortedIndex()
+
+        self.assertIsNone(GlobFilter('name=A*').lookup(dict(name=hash_index)))
+        self.assertIsNone(GlobFilter('name=*x').lookup(dict(name=sorted_index)))
+        self.assertIsNone(GlobFilter('name=A?*').lookup(dict(name=sorted_index)))
+        self.assertIsNone(GlobFilter('name=Alex').lookup(dict(address=sorted_index)))
+        self.assertIsNone(GlobFilter('name=Alex').explain(dict()))
+
+    def test_may_match_uses_summaries_of_string_columns(self):
+        summary = ColumnSummary()
+        summary.update(['Andrew', 'Dmitry'])
+        summaries = dict(name=summary)
+
+        self.assertTrue(GlobFilter('name=Andrew').may_match(summaries))
+        self.assertFalse(GlobFilter('name=Alex').may_match(summaries))
+        self.assertTrue(GlobFilter('name=Dm*').may_match(summaries))
+        self.assertFalse(GlobFilter('name=E*').may_match(summaries))
+        self.assertTrue(GlobFilter('name=*x').may_match(summaries))
+
+    def test_may_match_does_not_rule_out_string_representations(self):
+        numbers, names = ColumnSummary(), ColumnSummary()
+        numbers.update([1, 2])
+        names.update(['Andrew', None])
+
+        self.assertTrue(GlobFilter('age=1').may_match(dict(age=numbers)))
+        self.assertTrue(GlobFilter('name=None').may_match(dict(name=names)))
@@ -0,0 +1,38 @@
+from unittest import TestCase
+
+from ds_simple_db.filters.in_set_filter import InSetFilter
+from ds_simple_db.indexes.hash_index import HashIndex
+
+
+class TestInSetFilter(TestCase):
+    def setUp(self):
+        self.columns_data = dict(
+            address=['Moscow', 'London', 'Vancouver', None],
+            age=[30, 25, 41, None]
+        )
+
+    def test_raises_value_error_if_values_are_empty(self):
+        with self.assertRaises(ValueError):
+            InSetFilter('address', [])
+
+    def test_mask(self):
+        self.assertListEqual(
+            [True, True, False, False],
+            InSetFilter('address', ['Moscow', 'London']).mask(self.columns_data)
+        )
+        self.assertListEqual([False, True, True, False], InSetFilter('age', [25, 41]).mask(self.columns_data))
+        self.assertListEqual([False, False, False, True], InSetFilter('age', [None]).mask(self.columns_data))
+
+    def test_candidates_unite_index_lookups(self):
+        index = HashIndex()
+        index.build(self.columns_data['address'] + ['Moscow'])
+
+        self.assertListEqual([0, 1, 4], InSetFilter('address', ['London', 'Moscow']).candidates(dict(address=index)))
+        self.assertEqual(
+            'hash index lookup of 2 values on `address`',
+            InSetFilter('address', ['London', 'Moscow']).explain(dict(address=index))
+        )
+        self.assertIsNone(InSetFilter('age', [25]).candidates(dict(age=index)))
+
+    def test_repr(self):
+        self.assertEqual("address in ('Moscow', 'London')", repr(InSetFilter('address', ['Moscow', 'London'])))
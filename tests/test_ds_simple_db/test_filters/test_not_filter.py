@@ -0,0 +1,46 @@
+from unittest import TestCase
+
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.filters.glob_filter import GlobFilter
+from ds_simple_db.filters.not_filter import NotFilter
+from ds_simple_db.indexes.hash_index import HashIndex
+
+
+class TestNotFilter(TestCase):
+    def setUp(self):
+        self.columns_data = dict(name=['Dmitry', 'Andrew', 'Alex', 'Anna'])
+
+    def test_raises_type_error_if_argument_is_not_a_filter(self):
+        with self.assertRaises(TypeError):
+            NotFilter('name=A*')
+
+    def test_satisfies(self):
+        entry = Entry(data=dict(name='Alex'))
+
+        self.assertFalse(NotFilter(GlobFilter('name=A*')).satisfies(entry))
+        self.assertTrue(NotFilter(GlobFilter('name=D*')).satisfies(entry))
+
+    def test_mask_and_select(self):
+        not_filter = NotFilter(GlobFilter('name=A*'))
+
+        self.assertListEqual([True, False, False, False], not_filter.mask(self.columns_data))
+        self.assertListEqual([0], not_filter.select(self.columns_data, [0, 2, 3]))
+        self.assertAlmostEqual(0.5, not_filter.selectivity())
+        self.assertListEqual(['name'], not_filter.columns())
+
+    def test_indexes_are_not_used(self):
+        index = HashIndex()
+        index.build(self.columns_data['name'])
+
+        self.assertIsNone(NotFilter(GlobFilter('name=Alex')).candidates(dict(name=index)))
+
+    def test_repr(self):
+        self.assertEqual('NOT name=A*', repr(NotFilter(GlobFilter('name=A*'))))
+
+    def test_cache_key_differs_from_filters_with_same_repr(self):
+        not_filter = NotFilter(GlobFilter('x=1'))
+        glob_filter = GlobFilter('NOT x=1')
+
+        self.assertEqual(repr(glob_filter), repr(not_filter))
+        self.assertNotEqual(glob_filter.cache_key(), not_filter.cache_key())
+        self.assertEqual(NotFilter(GlobFilter('x=1')).cache_key(), not_filter.cache_key())
@@ -0,0 +1,64 @@
+from unittest import TestCase
+
+from ds_simple_db.core.column_summary import ColumnSummary
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.filters.comparison_filter import ComparisonFilter
+from ds_simple_db.filters.glob_filter import GlobFilter
+from ds_simple_db.filters.or_filter import OrFilter
+from ds_simple_db.filters.regex_filter import RegexFilter
+from ds_simple_db.indexes.hash_index import HashIndex
+
+
+class TestOrFilter(TestCase):
+    def setUp(self):
+        self.columns_data = dict(
+            name=['Dmitry', 'Andrew', 'Alex', 'Anna'],
+            address=['Moscow', 'London', 'Moscow', 'Paris']
+        )
+
+    def test_satisfies(self):
+        entry = Entry(data=dict(name='Alex', address='Moscow'))
+
+        self.assertTrue(OrFilter(GlobFilter('name=D*'), GlobFilter('address=Moscow')).satisfies(entry))
+        self.assertFalse(OrFilter(GlobFilter('name=D*'), GlobFilter('address=London')).satisfies(entry))
+
+    def test_mask_and_select(self):
+        or_filter = OrFilter(GlobFilter('name=D*'), RegexFilter('address', 'on'), GlobFilter('name=Anna'))
+        entries = [Entry(data=dict(zip(self.columns_data, row))) for row in zip(*self.columns_data.values())]
+
+        self.assertListEqual([True, True, False, True], or_filter.mask(self.columns_data))
+        self.assertListEqual([or_filter.satisfies(entry) for entry in entries], or_filter.mask(self.columns_data))
+        self.assertListEqual([1, 3], or_filter.select(self.columns_data, [1, 2, 3]))
+
+    def test_planner_evaluates_broad_and_cheap_filters_first(self):
+        exact_filter = ComparisonFilter('name', '==', 'Alex')
+        negated_filter = ComparisonFilter('name', '!=', 'Alex')
+        or_filter = OrFilter(exact_filter, negated_filter)
+
+        self.assertListEqual([negated_filter, exact_filter], or_filter._ordered)
+        self.assertAlmostEqual(1 - 0.9 * 0.1, or_filter.selectivity())
+
+    def test_candidates_unite_indexed_filters(self):
+        index = HashIndex()
+        index.build(self.columns_data['address'])
+        indexes = dict(address=index)
+
+        self.assertListEqual(
+            [0, 1, 2],
+            OrFilter(GlobFilter('address=London'), GlobFilter('address=Moscow')).lookup(indexes)
+        )
+        self.assertEqual(
+            'hash index lookup on `address` or hash index lookup on `address`',
+            OrFilter(GlobFilter('address=London'), GlobFilter('address=Moscow')).explain(indexes)
+        )
+        self.assertIsNone(OrFilter(GlobFilter('address=London'), GlobFilter('name=Alex')).candidates(indexes))
+
+    def test_may_match_if_any_child_may_match(self):
+        summary = ColumnSummary()
+        summary.update(['Andrew', 'Dmitry'])
+
+        self.assertTrue(OrFilter(GlobFilter('name=Alex'), GlobFilter('name=D*')).may_match(dict(name=summary)))
+        self.assertFalse(OrFilter(GlobFilter('name=Alex'), GlobFilter('name=E*')).may_match(dict(name=summary)))
+
+    def test_repr(self):
+        self.assertEqual("(name=D* OR name=Anna)", repr(OrFilter(GlobFilter('name=D*'), GlobFilter('name=Anna'))))
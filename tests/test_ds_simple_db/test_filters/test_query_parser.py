@@ -0,0 +1,64 @@
+from unittest import TestCase
+
+from ds_simple_db.filters.and_filter import AndFilter
+from ds_simple_db.filters.comparison_filter import ComparisonFilter
+from ds_simple_db.filters.glob_filter import GlobFilter
+from ds_simple_db.filters.in_set_filter import InSetFilter
+from ds_simple_db.filters.not_filter import NotFilter
+from ds_simple_db.filters.or_filter import OrFilter
+from ds_simple_db.filters.query_parser import QueryParser, compile_query
+from ds_simple_db.filters.range_filter import RangeFilter
+from ds_simple_db.filters.regex_filter import RegexFilter
+
+
+class TestQueryParser(TestCase):
+    def test_parses_conditions(self):
+        self.assertIsInstance(QueryParser('name=A*').parse(), GlobFilter)
+        self.assertIsInstance(QueryParser('name ~ "^A"').parse(), RegexFilter)
+        self.assertIsInstance(QueryParser('name in (Alex, Anna)').parse(), InSetFilter)
+        self.assertIsInstance(QueryParser('age between 20 and 30').parse(), RangeFilter)
+
+        comparison_filter = QueryParser('age >= 30').parse()
+
+        self.assertIsInstance(comparison_filter, ComparisonFilter)
+        self.assertEqual(('age', '>=', 30), (comparison_filter.column, comparison_filter.op, comparison_filter.value))
+
+    def test_bare_numbers_are_converted_and_quoted_values_are_strings(self):
+        self.assertEqual(30.5, QueryParser('age == 30.5').parse().value)
+        self.assertEqual('30', QueryParser("age == '30'").parse().value)
+        self.assertEqual('Dmitry', QueryParser('name == Dmitry').parse().value)
+        self.assertEqual("O'Neil", QueryParser(r"name == 'O\'Neil'").parse().value)
+        self.assertEqual(r'^\d+$', QueryParser(r'phone_number ~ "^\d+$"').parse().pattern)
+
+    def test_operator_precedence(self):
+        filter_obj = QueryParser('not name=A* and address=Moscow or age < 30').parse()
+
+        self.assertEqual('((NOT name=A* AND address=Moscow) OR age < 30)', repr(filter_obj))
+        self.assertIsInstance(filter_obj, OrFilter)
+        self.assertIsInstance(filter_obj.filters[0], AndFilter)
+        self.assertIsInstance(filter_obj.filters[0].filters[0], NotFilter)
+
+    def test_parentheses_and_case_insensitive_keywords(self):
+        self.assertEqual(
+            "(name=A* AND (address=Moscow OR address in ('London', 'New York')))",
+            repr(QueryParser("name=A* AND (address=Moscow Or address IN (London, 'New York'))").parse())
+        )
+
+    def test_raises_value_error_on_syntax_errors(self):
+        for text in ['', 'name', 'name >=', '(name=A*', 'name=A* x', 'and=1', 'name in Moscow', 'name=A* or',
+                     'name between 1 2', "name='unterminated", "'name'=A*"]:
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                QueryParser(text).parse()
+
+    def test_raises_type_error_if_text_is_not_str(self):
+        with self.assertRaises(TypeError):
+            QueryParser(1)
+
+    def test_compile_query_caches_filters(self):
+        compile_query.cache_clear()
+
+        filter_obj = compile_query('name=A* and age >= 30')
+
+        self.assertIs(filter_obj, compile_query('name=A* and age >= 30'))
+        self.assertEqual(1, compile_query.cache_info().hits)
+        self.assertEqual(1, compile_query.cache_info().misses)
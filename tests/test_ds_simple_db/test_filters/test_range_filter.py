@@ -0,0 +1,52 @@
+from unittest import TestCase
+
+from ds_simple_db.core.column_summary import ColumnSummary
+from ds_simple_db.filters.range_filter import RangeFilter
+from ds_simple_db.indexes.hash_index import HashIndex
+from ds_simple_db.indexes.sorted_index import SortedIndex
+
+
+class TestRangeFilter(TestCase):
+    def setUp(self):
+        self.columns_data = dict(
+            name=['Dmitry', 'Andrew', 'Alex', None],
+            age=[30, 25, 41, None]
+        )
+
+    def test_raises_value_error_if_no_bounds_provided(self):
+        with self.assertRaises(ValueError):
+            RangeFilter('age')
+
+    def test_mask(self):
+        self.assertListEqual([True, True, False, False], RangeFilter('age', 25, 30).mask(self.columns_data))
+        self.assertListEqual(
+            [False, False, False, False],
+            RangeFilter('age', 25, 30, include_low=False, include_high=False).mask(self.columns_data)
+        )
+        self.assertListEqual([True, False, True, False], RangeFilter('age', low=30).mask(self.columns_data))
+        self.assertListEqual([False, True, True, False], RangeFilter('name', high='B').mask(self.columns_data))
+
+    def test_values_of_other_types_do_not_match(self):
+        self.assertListEqual([False, False, False, False], RangeFilter('name', 1, 2).mask(self.columns_data))
+
+    def test_candidates_use_sorted_index_for_string_bounds(self):
+        index = SortedIndex()
+        index.build(self.columns_data['name'])
+
+        self.assertListEqual([1, 2], RangeFilter('name', 'A', 'B').candidates(dict(name=index)))
+        self.assertEqual('sorted index range scan on `name`', RangeFilter('name', 'A', 'B').explain(dict(name=index)))
+        self.assertIsNone(RangeFilter('age', 25, 30).candidates(dict(age=index)))
+        self.assertIsNone(RangeFilter('name', 'A', 'B').candidates(dict(name=HashIndex())))
+
+    def test_may_match_uses_summaries(self):
+        summary = ColumnSummary()
+        summary.update([25, 30, 41])
+
+        self.assertTrue(RangeFilter('age', 40, 50).may_match(dict(age=summary)))
+        self.assertFalse(RangeFilter('age', 20, 25, include_high=False).may_match(dict(age=summary)))
+        self.assertFalse(RangeFilter('age', low=42).may_match(dict(age=summary)))
+
+    def test_repr(self):
+        self.assertEqual('age between 25 and 30', repr(RangeFilter('age', 25, 30)))
+        self.assertEqual('age > 25 and age <= 30', repr(RangeFilter('age', 25, 30, include_low=False)))
+        self.assertEqual("name < 'B'", repr(RangeFilter('name', high='B', include_high=False)))
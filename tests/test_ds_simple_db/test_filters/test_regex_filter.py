@@ -0,0 +1,30 @@
+from unittest import TestCase
+
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.filters.regex_filter import RegexFilter
+from ds_simple_db.indexes.hash_index import HashIndex
+
+
+class TestRegexFilter(TestCase):
+    def test_raises_type_error_if_pattern_is_not_str(self):
+        with self.assertRaises(TypeError):
+            RegexFilter('name', 1)
+
+    def test_satisfies_searches_anywhere_in_value(self):
+        entry = Entry(data=dict(name='Dmitry', age=30))
+
+        self.assertTrue(RegexFilter('name', 'mit').satisfies(entry))
+        self.assertTrue(RegexFilter('age', '^3').satisfies(entry))
+        self.assertFalse(RegexFilter('name', '^mit').satisfies(entry))
+
+    def test_mask(self):
+        columns_data = dict(name=['Dmitry', 'Andrew', 'Alex', None])
+
+        self.assertListEqual([False, True, True, False], RegexFilter('name', '^A').mask(columns_data))
+        self.assertListEqual([False, False, False, True], RegexFilter('name', 'None').mask(columns_data))
+
+    def test_indexes_are_not_used(self):
+        self.assertIsNone(RegexFilter('name', 'Dmitry').candidates(dict(name=HashIndex())))
+
+    def test_repr(self):
+        self.assertEqual("name ~ '^A'", repr(RegexFilter('name', '^A')))
@@ -0,0 +1,36 @@
+from unittest import TestCase
+
+from ds_simple_db.indexes.hash_index import HashIndex
+
+
+class TestHashIndex(TestCase):
+    def test_lookup_returns_rows_in_ascending_order(self):
+        index = HashIndex()
+        index.build(['Moscow', 'London', 'Moscow', None])
+
+        self.assertListEqual([0, 2], index.lookup('Moscow'))
+        self.assertListEqual([1], index.lookup('London'))
+        self.assertListEqual([3], index.lookup('None'))
+        self.assertListEqual([], index.lookup('Paris'))
+
+    def test_add_updates_index(self):
+        index = HashIndex()
+        index.add('Moscow', 0)
+        index.add('Moscow', 1)
+
+        self.assertListEqual([0, 1], index.lookup('Moscow'))
+
+    def test_lookup_result_does_not_affect_index(self):
+        index = HashIndex()
+        index.add('Moscow', 0)
+        index.lookup('Moscow').append(1)
+
+        self.assertListEqual([0], index.lookup('Moscow'))
+
+    def test_prefix_lookup_is_not_supported(self):
+        index = HashIndex()
+
+        self.assertFalse(index.supports_prefix_lookup)
+
+        with self.assertRaises(NotImplementedError):
+            index.lookup_prefix('Mo')
@@ -0,0 +1,75 @@
+from unittest import TestCase
+
+from ds_simple_db.indexes.sorted_index import SortedIndex
+
+
+class TestSortedIndex(TestCase):
+    def setUp(self):
+        self.values = ['Moscow', 'London', 'Moscow', 'Montreal', 'Mo', 'Mp', None]
+
+    def test_build_and_add_give_same_results(self):
+        built_index = SortedIndex()
+        built_index.build(self.values)
+
+        added_index = SortedIndex()
+
+        for row, value in enumerate(self.values):
+            added_index.add(value, row)
+
+        for key in ['Moscow', 'London', 'Mo', 'Paris']:
+            self.assertListEqual(built_index.lookup(key), added_index.lookup(key))
+
+        for prefix in ['', 'M', 'Mo', 'Mos', 'X']:
+            self.assertListEqual(built_index.lookup_prefix(prefix), added_index.lookup_prefix(prefix))
+
+    def test_build_and_add_many_give_same_results(self):
+        values = self.values * 40
+
+        built_index = SortedIndex()
+        built_index.build(values)
+
+        # A lookup after every batch merges it: a batch of 1 row is inserted by bisection, larger ones are merged
+        batched_index = SortedIndex()
+
+        for start, size in [(0, 100), (100, 1), (101, 50), (151, 129)]:
+            batched_index.add_many(values[start:start + size], start)
+            batched_index.lookup('Moscow')
+
+        for key in ['Moscow', 'London', 'Mo', 'None', 'Paris']:
+            self.assertListEqual(built_index.lookup(key), batched_index.lookup(key))
+
+        for prefix in ['', 'M', 'Mo', 'Mos', 'X']:
+            self.assertListEqual(built_index.lookup_prefix(prefix), batched_index.lookup_prefix(prefix))
+
+    def test_lookup(self):
+        index = SortedIndex()
+        index.build(self.values)
+
+        self.assertListEqual([0, 2], index.lookup('Moscow'))
+        self.assertListEqual([6], index.lookup('None'))
+        self.assertListEqual([], index.lookup('Paris'))
+
+    def test_lookup_prefix(self):
+        index = SortedIndex()
+        index.build(self.values)
+
+        self.assertListEqual([0, 2, 3, 4], index.lookup_prefix('Mo'))
+        self.assertListEqual([0, 2], index.lookup_prefix('Mos'))
+        self.assertListEqual([0, 1, 2, 3, 4, 5, 6], index.lookup_prefix(''))
+        self.assertListEqual([], index.lookup_prefix('X'))
+
+    def test_lookup_prefix_with_max_unicode_character(self):
+        index = SortedIndex()
+        index.build(['a\U0010ffff', 'a\U0010ffffb', 'b'])
+
+        self.assertListEqual([0, 1], index.lookup_prefix('a\U0010ffff'))
+
+    def test_lookup_range(self):
+        index = SortedIndex()
+        index.build(self.values)
+
+        self.assertListEqual([0, 2, 3, 4, 5], index.lookup_range('Mo', 'Mp'))
+        self.assertListEqual([0, 2, 3], index.lookup_range('Mo', 'Mp', include_low=False, include_high=False))
+        self.assertListEqual([1], index.lookup_range(high='Mo', include_high=False))
+        self.assertListEqual([0, 2, 5, 6], index.lookup_range(low='Montreal', include_low=False))
+        self.assertListEqual([], index.lookup_range('X', 'Y'))
@@ -0,0 +1,112 @@
+import io
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.serializers.binary_columnar_serializer import BinaryColumnarSerializer
+
+
+class TestBinaryColumnarSerializer(TestCase):
+    def test_entries_to_stream_and_back_round_trip(self):
+        entries = [
+            Entry(data=dict(name='Dmitry', age=30, height=1.8)),
+            Entry(data=dict(name=None, age=None, height=2)),
+        ]
+        fp = io.BytesIO()
+
+        BinaryColumnarSerializer().entries_to_stream(entries, fp)
+        fp.seek(0)
+
+        self.assertListEqual(
+            [
+                Entry(data=dict(name='Dmitry', age=30, height=1.8)),
+                Entry(data=dict(name=None, age=None, height=2.0)),
+            ],
+            list(BinaryColumnarSerializer().entries_from_stream(fp))
+        )
+
+    def test_rows_from_stream_reads_memory_mapped_file(self):
+        path = os.path.join(tempfile.mkdtemp(), 'db.sdb')
+
+        with open(path, 'wb') as fp:
+            BinaryColumnarSerializer().columns_to_stream(dict(name=['Dmitry', 'Andrew'], address=['Moscow', None]), fp)
+
+        with open(path, 'rb') as fp:
+            rows = list(BinaryColumnarSerializer().rows_from_stream(fp))
+
+        self.assertListEqual(
+            [dict(name='Dmitry', address='Moscow'), dict(name='Andrew', address=None)],
+            rows
+        )
+
+    def test_memory_mapped_file_is_closed(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        path = os.path.join(folder.name, 'db.sdb')
+
+        with open(path, 'wb') as fp:
+            BinaryColumnarSerializer().columns_to_stream(dict(name=['Dmitry', 'Andrew']), fp)
+
+        for read in (lambda serializer, fp: list(serializer.rows_from_stream(fp)),
+                     lambda serializer, fp: next(serializer.rows_from_stream(fp)),
+                     lambda serializer, fp: list(serializer.columns_from_stream(fp))):
+            serializer = BinaryColumnarSerializer()
+
+            with open(path, 'rb') as fp, \
+                    mock.patch.object(serializer, 'open_columns', wraps=serializer.open_columns) as open_columns:
+                read(serializer, fp)
+
+            # An abandoned generator is closed once it is collected
+            self.assertTrue(open_columns.call_args[0][0].closed)
+
+    def test_columns_from_stream_decodes_batches(self):
+        fp = io.BytesIO()
+        BinaryColumnarSerializer().columns_to_stream(
+            dict(name=['Dmitry', None, 'Anna'], age=[30, 40, None], height=[1.8, None, 1.6]), fp
+        )
+        fp.seek(0)
+
+        self.assertListEqual(
+            [
+                dict(name=['Dmitry', None], age=[30, 40], height=[1.8, None]),
+                dict(name=['Anna'], age=[None], height=[1.6]),
+            ],
+            list(BinaryColumnarSerializer().columns_from_stream(fp, batch_size=2))
+        )
+
+    def test_empty_entries_round_trip(self):
+        fp = io.BytesIO()
+
+        BinaryColumnarSerializer().entries_to_stream([], fp)
+        fp.seek(0)
+
+        self.assertListEqual([], list(BinaryColumnarSerializer().entries_from_stream(fp)))
+
+    def test_open_columns_reads_only_directory(self):
+        fp = io.BytesIO()
+        BinaryColumnarSerializer().columns_to_stream(dict(name=['Dmitry'], age=[30]), fp)
+
+        columns = BinaryColumnarSerializer().open_columns(fp.getvalue())
+
+        self.assertListEqual(['name', 'age'], list(columns.keys()))
+        self.assertEqual('int', columns['age'].kind)
+        self.assertEqual(30, columns['age'][0])
+
+    def test_open_columns_raises_value_error_for_invalid_input(self):
+        fp = io.BytesIO()
+        BinaryColumnarSerializer().columns_to_stream(dict(name=['Dmitry', 'Andrew']), fp)
+        data = fp.getvalue()
+
+        for invalid_data in [b'', b'{"entries": []}' * 4, data[:-4]]:
+            with self.assertRaises(ValueError):
+                BinaryColumnarSerializer().open_columns(invalid_data)
+
+    def test_entries_to_stream_raises_value_error_if_fields_differ(self):
+        entries = [
+            Entry(data=dict(col1='1')),
+            Entry(data=dict(col2='2')),
+        ]
+
+        with self.assertRaises(ValueError):
+            BinaryColumnarSerializer().entries_to_stream(entries, io.BytesIO())
@@ -1,3 +1,4 @@
+import io
 from unittest import TestCase
 
 from ds_simple_db.core.entry import Entry
@@ -83,3 +84,159 @@ class TestCsvSerializer(TestCase):
             CSVSerializer().entries_from_string(
                 '#col1,col2\nval1,str1\nval2\n'
             )
+
+    def test_entries_from_stream_yields_entries_lazily(self):
+        stream = io.StringIO('#col1,col2\n1,str1\n2,str2\n')
+        entries = CSVSerializer().entries_from_stream(stream)
+
+        self.assertEqual(Entry(data=dict(col1='1', col2='str1')), next(entries))
+        self.assertEqual('2,str2\n', stream.readline())
+
+    def test_entries_from_stream_raises_value_error_if_empty_stream(self):
+        with self.assertRaises(ValueError):
+            list(CSVSerializer().entries_from_stream(io.StringIO('')))
+
+    def test_entries_from_string_handles_windows_newlines(self):
+        self.assertEqual(
+            [Entry(data=dict(col1='1', col2='str1'))],
+            CSVSerializer().entries_from_string('#col1,col2\r\n1,str1\r\n')
+        )
+
+    def test_entries_to_stream_writes_same_output_as_entries_to_string(self):
+        entries = [
+            Entry(data=dict(col1='1', col2='str1')),
+            Entry(data=dict(col1='2', col2='str2')),
+        ]
+        stream = io.StringIO()
+
+        CSVSerializer().entries_to_stream(iter(entries), stream)
+
+        self.assertEqual(CSVSerializer().entries_to_string(entries), stream.getvalue())
+
+    def test_fields_with_special_characters_are_quoted_and_parsed_back(self):
+        entries = [
+            Entry(data=dict(col1='#1, the first', col2='say "hi"')),
+            Entry(data=dict(col1='multi\nline', col2='')),
+        ]
+        output = CSVSerializer().entries_to_string(entries)
+
+        self.assertEqual('#col1,col2\n"#1, the first","say ""hi"""\n"multi\nline",\n', output)
+        self.assertListEqual(entries, CSVSerializer().entries_from_string(output))
+
+    def test_dialect_is_configurable(self):
+        entries = [Entry(data=dict(col1='a\tb', col2='c'))]
+        serializer = CSVSerializer(delimiter='\t', quoting='none', escapechar='\\', newline='\r\n')
+        output = serializer.entries_to_string(entries)
+
+        self.assertEqual('#col1\tcol2\r\na\\\tb\tc\r\n', output)
+        self.assertListEqual(entries, serializer.entries_from_string(output))
+        self.assertEqual('"#col1","col2"\n"a\tb","c"\n', CSVSerializer(quoting='all').entries_to_string(entries))
+
+    def test_constructor_raises_value_error_if_dialect_is_invalid(self):
+        with self.assertRaises(ValueError):
+            CSVSerializer(quoting='nonnumeric')
+
+        with self.assertRaises(ValueError):
+            CSVSerializer(delimiter=';;')
+
+    def test_entries_to_string_raises_value_error_if_value_can_not_be_written_without_quoting(self):
+        with self.assertRaises(ValueError):
+            CSVSerializer(quoting='none').entries_to_string([Entry(data=dict(col1='a,b'))])
+
+    def test_entries_from_string_strips_values_unless_disabled(self):
+        self.assertEqual(
+            [Entry(data=dict(col1='1', col2='a, b'))],
+            CSVSerializer().entries_from_string('#col1, col2\n 1 , "a, b" \n')
+        )
+        self.assertEqual(
+            [Entry(data=dict(col1=' 1 ', col2='a '))],
+            CSVSerializer(strip=False).entries_from_string('#col1,col2\n 1 ,a \n')
+        )
+
+    def test_entries_from_string_skips_blank_lines_but_not_lines_starting_with_hash(self):
+        self.assertEqual(
+            [Entry(data=dict(col1='#1', col2='a')), Entry(data=dict(col1='2', col2='b'))],
+            CSVSerializer().entries_from_string('#col1,col2\n#1,a\n\n2,b\n')
+        )
+
+    def test_columns_from_stream_yields_batches_of_columns(self):
+        stream = io.StringIO('#col1,col2\n1,a\n2,b\n\n3,c\n')
+
+        self.assertListEqual(
+            [dict(col1=['1', '2'], col2=['a', 'b']), dict(col1=['3'], col2=['c'])],
+            list(CSVSerializer().columns_from_stream(stream, batch_size=3))
+        )
+
+    def test_columns_from_stream_raises_value_error_if_line_does_not_match_header(self):
+        with self.assertRaisesRegex(ValueError, 'lines 2-3'):
+            list(CSVSerializer().columns_from_stream(io.StringIO('#col1,col2\n1,a\n2\n')))
+
+    def test_infer_types_parses_numeric_columns(self):
+        input_str = '#id,price,zip,name\n1,1.5,02134,Dmitry\n-2,,10001,nan\n3,2.25,,\n'
+        expected_columns = dict(
+            id=[1, -2, 3],
+            price=[1.5, None, 2.25],
+            zip=['02134', '10001', ''],
+            name=['Dmitry', 'nan', '']
+        )
+        serializer = CSVSerializer(infer_types=True)
+
+        self.assertListEqual([expected_columns], list(serializer.columns_from_stream(io.StringIO(input_str))))
+        self.assertListEqual(
+            [dict(zip(expected_columns, values)) for values in zip(*expected_columns.values())],
+            list(serializer.rows_from_stream(io.StringIO(input_str)))
+        )
+
+    def test_infer_types_keeps_numbers_written_differently_as_strings(self):
+        input_str = '#zero,price,big,mixed\n-0,1.50,1e3,1\n0,2.5,2e3,2.5\n'
+
+        self.assertListEqual(
+            [dict(zero=['-0', '0'], price=['1.50', '2.5'], big=['1e3', '2e3'], mixed=['1', '2.5'])],
+            list(CSVSerializer(infer_types=True).columns_from_stream(io.StringIO(input_str)))
+        )
+
+    def test_infer_types_infers_types_from_sample_and_keeps_batches(self):
+        input_str = '#id,name\n1,a\n2,b\n\n3,c\n4,d\n5,e\n'
+        serializer = CSVSerializer(infer_types=True, sample_size=2)
+
+        self.assertListEqual(
+            [dict(id=[1, 2], name=['a', 'b']), dict(id=[3], name=['c']), dict(id=[4, 5], name=['d', 'e'])],
+            list(serializer.columns_from_stream(io.StringIO(input_str), batch_size=2))
+        )
+
+    def test_infer_types_raises_value_error_if_value_does_not_match_sampled_type(self):
+        serializer = CSVSerializer(infer_types=True, sample_size=2)
+        batches = serializer.columns_from_stream(io.StringIO('#id\n1\n2\nthree\n'), batch_size=2)
+
+        self.assertDictEqual(dict(id=[1, 2]), next(batches))
+
+        with self.assertRaisesRegex(ValueError, 'three'):
+            next(batches)
+
+    def test_entries_round_trip_keeps_line_breaks_and_quotes(self):
+        entries = [
+            Entry(data=dict(col1='line1\rline2', col2='line1\nline2')),
+            Entry(data=dict(col1='line1\r\nline2', col2='"Quoted", with a comma')),
+        ]
+        serializer = CSVSerializer()
+
+        self.assertListEqual(entries, serializer.entries_from_string(serializer.entries_to_string(entries)))
+
+        stream = io.StringIO(newline='')
+        serializer.entries_to_stream(entries, stream)
+        stream.seek(0)
+
+        self.assertListEqual(entries, list(serializer.entries_from_stream(stream)))
+
+        with self.assertRaises(ValueError):
+            CSVSerializer(quoting='none', escapechar='\\').entries_to_string(entries)
+
+    def test_infer_types_allows_writing_numbers(self):
+        entries = [Entry(data=dict(col1=1, col2=2.5, col3='str1'))]
+        serializer = CSVSerializer(infer_types=True)
+
+        self.assertEqual('#col1,col2,col3\n1,2.5,str1\n', serializer.entries_to_string(entries))
+        self.assertListEqual(entries, serializer.entries_from_string(serializer.entries_to_string(entries)))
+
+        with self.assertRaises(TypeError):
+            serializer.entries_to_string([Entry(data=dict(col1=True))])
@@ -1,4 +1,7 @@
+import os
+import tempfile
 from unittest import TestCase
+from urllib.parse import unquote
 
 from ds_simple_db.core.entry import Entry
 from ds_simple_db.serializers.html_serializer import HTMLSerializer
@@ -41,3 +44,88 @@ class TestHTMLSerializer(TestCase):
             '</table>',
             HTMLSerializer(border=1).entries_to_string(entries)
         )
+
+    def test_entries_to_chunks_accepts_iterator(self):
+        entries = iter([
+            Entry(data=dict(col='val1')),
+            Entry(data=dict(col='val2')),
+        ])
+
+        self.assertListEqual(
+            [
+                '<table border="1">',
+                '<tr><th>col</th></tr>',
+                '<tr><td>val1</td></tr>',
+                '<tr><td>val2</td></tr>',
+                '</table>',
+            ],
+            list(HTMLSerializer(border=1).entries_to_chunks(entries))
+        )
+
+    def test_values_are_escaped(self):
+        entries = [
+            Entry(data={'<col>': '<b>"Tom" & Jerry</b>', 'num': 1, 'none': None}),
+        ]
+
+        self.assertEqual(
+            '<table border="1">'
+            '<tr><th>&lt;col&gt;</th><th>num</th><th>none</th></tr>'
+            '<tr><td>&lt;b&gt;"Tom" &amp; Jerry&lt;/b&gt;</td><td>1</td><td></td></tr>'
+            '</table>',
+            HTMLSerializer().entries_to_string(entries)
+        )
+
+    def test_entries_to_pages_splits_table_into_linked_pages(self):
+        folder = tempfile.mkdtemp()
+        entries = iter([Entry(data=dict(col=f'val{idx}')) for idx in range(5)])
+
+        paths = HTMLSerializer().entries_to_pages(entries, os.path.join(folder, 'table.html'), page_size=2)
+
+        self.assertListEqual([os.path.join(folder, name) for name in ['table.html', 'table_2.html', 'table_3.html']], paths)
+
+        with open(paths[1]) as fp:
+            page = fp.read()
+
+        self.assertIn('<tr><th>col</th></tr><tr><td>val2</td></tr><tr><td>val3</td></tr></table>', page)
+        self.assertIn('<a href="table.html">Previous</a> | Page 2 | <a href="table_3.html">Next</a>', page)
+
+        with open(paths[2]) as fp:
+            page = fp.read()
+
+        self.assertIn('<tr><td>val4</td></tr></table>', page)
+        self.assertNotIn('Next', page)
+
+    def test_page_links_are_percent_encoded(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        entries = [Entry(data=dict(col=f'val{idx}')) for idx in range(3)]
+
+        paths = HTMLSerializer().entries_to_pages(entries, os.path.join(folder.name, 'my #1?100% table.html'), page_size=2)
+
+        with open(paths[0]) as fp:
+            self.assertIn('<a href="my%20%231%3F100%25%20table_2.html">Next</a>', fp.read())
+
+        with open(paths[1]) as fp:
+            self.assertIn('<a href="my%20%231%3F100%25%20table.html">Previous</a>', fp.read())
+
+        # A browser resolves the link to the page written next to the first one
+        self.assertEqual(os.path.join(folder.name, unquote('my%20%231%3F100%25%20table_2.html')), paths[1])
+
+    def test_entries_to_pages_writes_single_page_without_links(self):
+        folder = tempfile.mkdtemp()
+
+        for num_entries in [0, 2]:
+            path = os.path.join(folder, f'table{num_entries}.html')
+            entries = [Entry(data=dict(col=f'val{idx}')) for idx in range(num_entries)]
+
+            self.assertListEqual([path], HTMLSerializer().entries_to_pages(entries, path, page_size=2))
+
+            with open(path) as fp:
+                page = fp.read()
+
+            self.assertNotIn('<a ', page)
+            self.assertEqual(num_entries > 0, '<table' in page)
+
+    def test_entries_to_pages_raises_value_error_if_page_size_is_not_positive(self):
+        with self.assertRaises(ValueError):
+            HTMLSerializer().entries_to_pages([], os.path.join(tempfile.mkdtemp(), 'table.html'), page_size=0)
@@ -0,0 +1,36 @@
+from importlib.util import find_spec
+from unittest import TestCase, skipUnless
+
+from ds_simple_db.serializers.json_backend import JSONBackend
+
+
+class TestJSONBackend(TestCase):
+    def test_json_backend(self):
+        backend = JSONBackend('json')
+
+        self.assertEqual('json', backend.name)
+        self.assertEqual('{"a": [1, null]}', backend.dumps(dict(a=[1, None])))
+        self.assertEqual(dict(a=[1, None]), backend.loads('{"a": [1, null]}'))
+
+        with self.assertRaises(ValueError):
+            backend.loads('{"a": ')
+
+    def test_auto_backend_chooses_installed_backend(self):
+        self.assertEqual('orjson' if find_spec('orjson') else 'json', JSONBackend('auto').name)
+
+    @skipUnless(find_spec('orjson'), 'orjson is not installed')
+    def test_orjson_backend(self):
+        backend = JSONBackend('orjson')
+
+        self.assertEqual('{"a":[1,null]}', backend.dumps(dict(a=[1, None])))
+        self.assertEqual(dict(a=[1, None]), backend.loads('{"a": [1, null]}'))
+
+        with self.assertRaises(ValueError):
+            backend.loads('{"a": ')
+
+        with self.assertRaises(TypeError):
+            backend.dumps({1: 'non-str key'})
+
+    def test_raises_value_error_if_backend_is_unknown(self):
+        with self.assertRaises(ValueError):
+            JSONBackend('simdjson')
@@ -0,0 +1,44 @@
+import io
+from unittest import TestCase
+
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.serializers import SerializerFactory
+from ds_simple_db.serializers.json_lines_serializer import JSONLinesSerializer
+
+
+class TestJSONLinesSerializer(TestCase):
+    def test_entries_to_string(self):
+        entries = [
+            Entry(data=dict(col1=1, col2='str1')),
+            Entry(data=dict(col1=2, col2='multi\nline')),
+        ]
+
+        self.assertEqual(
+            '{"col1": 1, "col2": "str1"}\n{"col1": 2, "col2": "multi\\nline"}\n',
+            JSONLinesSerializer(backend='json').entries_to_string(entries)
+        )
+        self.assertEqual('', JSONLinesSerializer().entries_to_string([]))
+
+    def test_round_trip(self):
+        entries = [
+            Entry(data=dict(col1=1, col2='str1', col3=None)),
+            Entry(data=dict(col1=2.5, col2='multi\nline', col3=[1, 2])),
+        ]
+        serializer = JSONLinesSerializer()
+
+        self.assertListEqual(entries, serializer.entries_from_string(serializer.entries_to_string(entries)))
+
+    def test_rows_from_stream_skips_blank_lines(self):
+        stream = io.StringIO('{"col1": 1}\n\n  \n{"col1": 2}')
+
+        self.assertListEqual([dict(col1=1), dict(col1=2)], list(JSONLinesSerializer().rows_from_stream(stream)))
+
+    def test_rows_from_stream_reports_invalid_line(self):
+        with self.assertRaisesRegex(ValueError, 'line 2'):
+            list(JSONLinesSerializer().rows_from_stream(io.StringIO('{"col1": 1}\n{"col1": \n')))
+
+        with self.assertRaises(TypeError):
+            list(JSONLinesSerializer().rows_from_stream(io.StringIO('{"col1": 1}\n[1]\n')))
+
+    def test_is_registered_for_jsonl_files(self):
+        self.assertIsInstance(SerializerFactory.create_for_file('db/example.jsonl'), JSONLinesSerializer)
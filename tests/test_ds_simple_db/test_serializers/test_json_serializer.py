@@ -1,4 +1,7 @@
-from unittest import TestCase
+import io
+import json
+from importlib.util import find_spec
+from unittest import TestCase, skipUnless
 
 from ds_simple_db.core.entry import Entry
 from ds_simple_db.serializers.json_serializer import JSONSerializer
@@ -48,3 +51,72 @@ class TestJsonSerializer(TestCase):
             JSONSerializer().entries_from_string(
                 '{"some_broken_json":'
             )
+
+    def test_entries_to_string_matches_json_dumps_with_indent(self):
+        entries = [
+            Entry(data=dict(col1=1, col2=dict(nested=['str1', 'str2']))),
+            Entry(data=dict(col1=None, col2='multi\nline')),
+        ]
+
+        for indent in [0, 2, '\t']:
+            for entries_to_serialize in [entries, entries[:1], []]:
+                self.assertEqual(
+                    json.dumps(dict(entries=[entry.as_dict() for entry in entries_to_serialize]), indent=indent),
+                    JSONSerializer(indent=indent).entries_to_string(entries_to_serialize)
+                )
+
+    def test_entries_to_stream_writes_entries_from_iterator(self):
+        stream = io.StringIO()
+
+        JSONSerializer().entries_to_stream(iter([Entry(data=dict(col1=1))]), stream)
+
+        self.assertEqual('{"entries": [{"col1": 1}]}', stream.getvalue())
+
+    def test_rows_from_stream_decodes_incrementally(self):
+        rows = [
+            dict(col1=idx, col2='}, {"col1": 0}' * (idx % 3), col3=dict(nested=[idx, None])) for idx in range(100)
+        ]
+        serializer = JSONSerializer()
+
+        for indent in [None, 2]:
+            input_str = json.dumps(dict(version=1, entries=rows, footer=dict(num_rows=12345)), indent=indent)
+
+            for read_size in [1, 7, 100, 10000]:
+                serializer.READ_SIZE = read_size
+
+                with self.subTest(indent=indent, read_size=read_size):
+                    self.assertListEqual(rows, list(serializer.rows_from_stream(io.StringIO(input_str))))
+
+    def test_entries_from_stream_round_trip(self):
+        entries = [Entry(data=dict(col1=1, col2='str1')), Entry(data=dict(col1=2.5, col2=None))]
+        stream = io.StringIO()
+
+        JSONSerializer(indent=2).entries_to_stream(entries, stream)
+        stream.seek(0)
+
+        self.assertListEqual(entries, list(JSONSerializer().entries_from_stream(stream)))
+
+    def test_rows_from_stream_raises_on_invalid_input(self):
+        for input_str in ['', '[]', '{"entries": [{"col1": 1}', '{"entries": [{"col1": 1} {}]}',
+                          '{"entries": [{"col1": 1},]}', '{"entries": []} {}', '{"other": []}']:
+            with self.subTest(input_str=input_str), self.assertRaises(ValueError):
+                list(JSONSerializer().rows_from_stream(io.StringIO(input_str)))
+
+        with self.assertRaises(TypeError):
+            list(JSONSerializer().rows_from_stream(io.StringIO('{"entries": [{"col1": 1}, 1]}')))
+
+    def test_raises_value_error_if_backend_is_unknown(self):
+        with self.assertRaises(ValueError):
+            JSONSerializer(backend='simdjson')
+
+    @skipUnless(find_spec('orjson'), 'orjson is not installed')
+    def test_orjson_backend(self):
+        entries = [Entry(data=dict(col1=1, col2='str1'))]
+        serializer = JSONSerializer(backend='orjson')
+
+        self.assertEqual('{"entries": [{"col1":1,"col2":"str1"}]}', serializer.entries_to_string(entries))
+        self.assertListEqual(entries, serializer.entries_from_string(serializer.entries_to_string(entries)))
+        self.assertListEqual(
+            [dict(col1=1, col2='str1')],
+            list(serializer.rows_from_stream(io.StringIO(serializer.entries_to_string(entries))))
+        )
@@ -13,52 +13,90 @@ class TestTableSerializer(TestCase):
             TableSerializer().entries_to_string(entries)
         )
 
-    def test_row_separator(self):
+    def test_header_and_row_separators_fit_row_width(self):
+        entries = [Entry(data=dict(col1='a', col2='b'))]
+
         self.assertEqual(
-            '+-----+-----+\n',
-            TableSerializer(row_width=5)._get_row_separator(num_cols=2)
+            '+-----+-----+\n|col1 |col2 |\n+-----+-----+\n|  a  |  b  |\n+-----+-----+\n',
+            TableSerializer(row_width=5).entries_to_string(entries)
         )
 
         self.assertEqual(
-            '+---+\n',
-            TableSerializer(row_width=3)._get_row_separator(num_cols=1)
+            '+---+\n|col|\n+---+\n| a |\n+---+\n',
+            TableSerializer(row_width=3).entries_to_string([Entry(data=dict(col='a'))])
         )
 
-    def test_get_row_content(self):
-        values = ['col', 'value', 'col3']
+    def test_values_longer_than_row_width_are_truncated(self):
+        entries = [Entry(data=dict(col='col', value='value', col3='col3'))]
 
         self.assertEqual(
-            '| col |value|col3 |\n',
-            TableSerializer(row_width=5)._get_row_content(values)
+            '+---+---+---+\n|col|val|col|\n+---+---+---+\n|col|val|col|\n+---+---+---+\n',
+            TableSerializer(row_width=3).entries_to_string(entries)
         )
 
+    def test_entries_to_string(self):
+        entries = [
+            Entry(data=dict(col='val', value='field', col3='val3')),
+        ]
+
         self.assertEqual(
-            '|col|val|col|\n',
-            TableSerializer(row_width=3)._get_row_content(values)
+            '+-----+-----+-----+\n| col |value|col3 |\n+-----+-----+-----+\n| val |field|val3 |\n+-----+-----+-----+\n',
+            TableSerializer(row_width=5).entries_to_string(entries)
         )
 
-    def test_get_header(self):
-        cols = ['col', 'value', 'col3']
+    def test_entries_to_chunks_accepts_iterator(self):
+        entries = iter([
+            Entry(data=dict(col='val1')),
+            Entry(data=dict(col='val2')),
+        ])
 
-        self.assertEqual(
-            '+-----+-----+-----+\n| col |value|col3 |\n+-----+-----+-----+\n',
-            TableSerializer(row_width=5)._get_header(cols)
+        self.assertListEqual(
+            [
+                '+-----+\n| col |\n+-----+\n',
+                '|val1 |\n+-----+\n',
+                '|val2 |\n+-----+\n',
+            ],
+            list(TableSerializer(row_width=5).entries_to_chunks(entries))
         )
 
-    def test_get_row(self):
-        cols = ['col', 'value', 'col3']
+    def test_entries_to_string_converts_values_to_strings(self):
+        entries = [
+            Entry(data=dict(col=None, num=12)),
+        ]
 
         self.assertEqual(
-            '| col |value|col3 |\n+-----+-----+-----+\n',
-            TableSerializer(row_width=5)._get_row(cols)
+            '+-----+-----+\n| col | num |\n+-----+-----+\n|     | 12  |\n+-----+-----+\n',
+            TableSerializer(row_width=5).entries_to_string(entries)
         )
 
-    def test_entries_to_string(self):
+    def test_auto_width_fits_columns_to_sample(self):
         entries = [
-            Entry(data=dict(col='val', value='field', col3='val3')),
+            Entry(data=dict(name='Dmitry', address=None)),
+            Entry(data=dict(name='Alex', address='St. Petersburg')),
+            Entry(data=dict(name='Alexander', address='London')),
         ]
 
         self.assertEqual(
-            '+-----+-----+-----+\n| col |value|col3 |\n+-----+-----+-----+\n| val |field|val3 |\n+-----+-----+-----+\n',
-            TableSerializer(row_width=5).entries_to_string(entries)
+            '+--------+----------------+\n'
+            '|  name  |    address     |\n'
+            '+--------+----------------+\n'
+            '| Dmitry |                |\n'
+            '+--------+----------------+\n'
+            '|  Alex  | St. Petersburg |\n'
+            '+--------+----------------+\n'
+            '|Alexande|     London     |\n'
+            '+--------+----------------+\n',
+            TableSerializer(auto_width=True, sample_size=2).entries_to_string(entries)
         )
+
+    def test_auto_width_is_limited_by_max_width(self):
+        entries = [Entry(data=dict(col='a long value'))]
+
+        self.assertEqual(
+            '+------+\n| col  |\n+------+\n|a long|\n+------+\n',
+            TableSerializer(auto_width=True, max_width=6).entries_to_string(entries)
+        )
+
+    def test_constructor_raises_value_error_if_sample_size_is_not_positive(self):
+        with self.assertRaises(ValueError):
+            TableSerializer(auto_width=True, sample_size=0)
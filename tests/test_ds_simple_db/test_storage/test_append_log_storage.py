@@ -0,0 +1,243 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase, mock
+
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.filters.glob_filter import GlobFilter
+from ds_simple_db.storage.append_log_storage import AppendLogStorage
+from ds_simple_db.storage.memory_dict_storage import MemoryDictStorage
+
+
+class TestAppendLogStorage(TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), 'db.csv')
+
+        storage = MemoryDictStorage(columns=['name', 'address'])
+        storage.insert(name='Dmitry', address='Moscow')
+        storage.save_to_file(self.path)
+
+    def open_storage(self, **kwargs):
+        return AppendLogStorage(self.path, columns=['name', 'address'], **kwargs)
+
+    def read_base_file(self):
+        storage = MemoryDictStorage(columns=['name', 'address'])
+        storage.load_from_file(self.path)
+
+        return storage.all_entries()
+
+    def test_insert_appends_to_log_without_rewriting_base_file(self):
+        storage = self.open_storage()
+        entry = storage.insert(name='Andrew')
+        storage.close()
+
+        self.assertEqual(Entry(data=dict(name='Andrew', address=None)), entry)
+        self.assertListEqual([Entry(data=dict(name='Dmitry', address='Moscow'))], self.read_base_file())
+        self.assertListEqual([dict(name='Andrew')], list(self.open_storage().log_rows()))
+
+    def test_entries_include_base_file_and_log(self):
+        storage = self.open_storage()
+        storage.insert(name='Andrew', address='London')
+        storage.insert_many([dict(name='Alex')])
+        storage.close()
+
+        storage = self.open_storage()
+
+        self.assertListEqual(
+            [
+                Entry(data=dict(name='Dmitry', address='Moscow')),
+                Entry(data=dict(name='Andrew', address='London')),
+                Entry(data=dict(name='Alex', address=None)),
+            ],
+            storage.all_entries()
+        )
+        self.assertListEqual(
+            [Entry(data=dict(name='Andrew', address='London')), Entry(data=dict(name='Alex', address=None))],
+            storage.filter(GlobFilter('name=A*'))
+        )
+
+    def test_insert_after_loading_updates_loaded_entries(self):
+        storage = self.open_storage()
+        storage.all_entries()
+        storage.insert(name='Andrew')
+
+        self.assertEqual(2, len(storage.all_entries()))
+        storage.close()
+
+    def test_insert_raises_value_error_and_keeps_log_unchanged_if_column_does_not_exist(self):
+        storage = self.open_storage()
+
+        with self.assertRaises(ValueError):
+            storage.insert(phone_number='+7')
+
+        with self.assertRaises(ValueError):
+            storage.insert_many([dict(name='Andrew'), dict()])
+
+        storage.close()
+
+        self.assertListEqual([], list(self.open_storage().log_rows()))
+
+    def test_compaction_rewrites_base_file_and_starts_new_log(self):
+        storage = self.open_storage(compact_threshold=2)
+        storage.insert(name='Andrew')
+
+        self.assertEqual(1, len(self.read_base_file()))
+
+        storage.insert(name='Alex')
+        storage.insert(name='Anna')
+        storage.close()
+
+        self.assertEqual(3, len(self.read_base_file()))
+        self.assertListEqual([dict(name='Anna')], list(self.open_storage().log_rows()))
+        self.assertEqual(4, len(self.open_storage().all_entries()))
+
+    def test_log_compacted_before_crash_is_discarded(self):
+        storage = self.open_storage()
+        storage.insert(name='Andrew')
+
+        # Simulate a crash after the base file has been rewritten, but before the log has been restarted
+        with mock.patch.object(AppendLogStorage, '_start_log', side_effect=RuntimeError('Crash')):
+            with self.assertRaises(RuntimeError):
+                storage.compact()
+
+        storage = self.open_storage()
+
+        self.assertEqual(2, len(storage.all_entries()))
+
+        storage.insert(name='Alex')
+        storage.close()
+
+        self.assertListEqual([dict(name='Alex')], list(self.open_storage().log_rows()))
+
+    def test_log_is_kept_if_compaction_crashes_before_rewriting_base_file(self):
+        storage = self.open_storage()
+        storage.insert(name='Andrew')
+
+        with mock.patch.object(MemoryDictStorage, 'save_to_file', side_effect=RuntimeError('Crash')):
+            with self.assertRaises(RuntimeError):
+                storage.compact()
+
+        storage = self.open_storage()
+        storage.insert(name='Alex')
+        storage.close()
+
+        self.assertListEqual([dict(name='Andrew'), dict(name='Alex')], list(self.open_storage().log_rows()))
+        self.assertEqual(3, len(self.open_storage().all_entries()))
+
+    def test_log_is_kept_if_base_file_is_copied_or_touched(self):
+        storage = self.open_storage()
+        storage.insert(name='Andrew')
+        storage.close()
+
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+        self.assertListEqual([dict(name='Andrew')], list(self.open_storage().log_rows()))
+
+        copied_path = os.path.join(tempfile.mkdtemp(), 'db.csv')
+        shutil.copy(self.path, copied_path)
+        shutil.copy(self.path + AppendLogStorage.LOG_SUFFIX, copied_path + AppendLogStorage.LOG_SUFFIX)
+        self.path = copied_path
+
+        storage = self.open_storage()
+        storage.insert(name='Alex')
+        storage.close()
+
+        # The header of the log refers to the copied base file now, so that it is not hashed again
+        with mock.patch.object(AppendLogStorage, '_base_hash', side_effect=AssertionError('Hashed again')):
+            self.assertListEqual([dict(name='Andrew'), dict(name='Alex')], list(self.open_storage().log_rows()))
+
+    def test_log_of_replaced_base_file_raises_value_error_and_is_kept(self):
+        storage = self.open_storage()
+        storage.insert(name='Andrew')
+        storage.close()
+
+        with open(self.path + AppendLogStorage.LOG_SUFFIX, 'rb') as fp:
+            log = fp.read()
+
+        other_storage = MemoryDictStorage(columns=['name', 'address'])
+        other_storage.insert(name='Anna', address='Paris')
+        other_storage.save_to_file(self.path)
+
+        storage = self.open_storage()
+
+        with self.assertRaises(ValueError):
+            storage.all_entries()
+
+        with self.assertRaises(ValueError):
+            storage.insert(name='Alex')
+
+        storage.close()
+
+        with open(self.path + AppendLogStorage.LOG_SUFFIX, 'rb') as fp:
+            self.assertEqual(log, fp.read())
+
+    def test_storages_of_same_file_see_changes_of_each_other(self):
+        storage = self.open_storage()
+        other_storage = self.open_storage()
+
+        self.assertEqual(1, len(storage.all_entries()))
+
+        other_storage.insert(name='Andrew')
+        self.assertEqual(2, len(storage.all_entries()))
+
+        other_storage.compact()
+        storage.insert(name='Alex')
+        other_storage.insert(name='Anna')
+
+        self.assertListEqual(['Dmitry', 'Andrew', 'Alex', 'Anna'], [entry['name'] for entry in storage.all_entries()])
+
+        storage.close()
+        other_storage.close()
+
+        self.assertListEqual([dict(name='Alex'), dict(name='Anna')], list(self.open_storage().log_rows()))
+
+    def test_partially_written_row_is_discarded(self):
+        storage = self.open_storage()
+        storage.insert(name='Andrew')
+        storage.close()
+
+        with open(self.path + AppendLogStorage.LOG_SUFFIX, 'a') as fp:
+            fp.write('{"name": "Al')
+
+        storage = self.open_storage()
+        storage.insert(name='Alex')
+        storage.close()
+
+        self.assertListEqual([dict(name='Andrew'), dict(name='Alex')], list(self.open_storage().log_rows()))
+
+    def test_storage_without_base_file_is_created_by_compaction(self):
+        os.remove(self.path)
+
+        storage = self.open_storage()
+        self.assertFalse(storage.exists())
+
+        storage.insert(name='Andrew', address='London')
+        self.assertTrue(storage.exists())
+
+        storage.compact()
+        storage.close()
+
+        self.assertListEqual([Entry(data=dict(name='Andrew', address='London'))], self.read_base_file())
+
+    def test_constructor_raises_value_error_if_parameters_are_not_positive(self):
+        with self.assertRaises(ValueError):
+            self.open_storage(sync_every=0)
+
+        with self.assertRaises(ValueError):
+            self.open_storage(compact_threshold=0)
+
+    def test_reloaded_storage_keeps_indexes_and_result_cache(self):
+        storage = self.open_storage()
+        storage.create_index('name')
+        storage.enable_result_cache()
+
+        other_storage = self.open_storage()
+        other_storage.insert(name='Andrew')
+        other_storage.close()
+
+        self.assertListEqual([Entry(data=dict(name='Andrew', address=None))], storage.filter(GlobFilter('name=Andrew')))
+        self.assertIn('index', storage.explain(GlobFilter('name=Andrew')))
+        self.assertIsNotNone(storage._storage._result_cache)
+
+        storage.close()
@@ -0,0 +1,187 @@
+import asyncio
+import os
+import tempfile
+import threading
+from unittest import TestCase
+
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.filters.glob_filter import GlobFilter
+from ds_simple_db.storage.async_storage import AsyncStorage
+from ds_simple_db.storage.memory_dict_storage import MemoryDictStorage
+
+
+class TestAsyncStorage(TestCase):
+    def create_storage(self, **kwargs):
+        storage = MemoryDictStorage(columns=['name', 'address'], thread_safe=True)
+        storage.insert(name='Dmitry', address='Moscow')
+        storage.insert(name='Andrew', address='London')
+        storage.insert(name='Alex', address='Vancouver')
+
+        return AsyncStorage(storage, **kwargs)
+
+    def test_constructor_raises_type_error_if_storage_is_not_storage(self):
+        with self.assertRaises(TypeError):
+            AsyncStorage(dict())
+
+    def test_insert_and_filter(self):
+        async def run():
+            storage = self.create_storage()
+            entry = await storage.insert(name='Anna', address='Paris')
+            entries = await storage.filter(GlobFilter('name=A*'))
+
+            return entry, entries
+
+        entry, entries = asyncio.run(run())
+
+        self.assertEqual(Entry(data=dict(name='Anna', address='Paris')), entry)
+        self.assertListEqual(['Andrew', 'Alex', 'Anna'], [entry['name'] for entry in entries])
+
+    def test_storage_created_outside_of_event_loop_is_used_in_several_loops(self):
+        storage = self.create_storage(max_concurrency=1)
+
+        for _ in range(2):
+            entries = asyncio.run(storage.filter(GlobFilter('name=A*')))
+
+            self.assertListEqual(['Andrew', 'Alex'], [entry['name'] for entry in entries])
+
+    def test_aiter_filter_yields_entries_in_batches(self):
+        async def run():
+            storage = self.create_storage()
+            storage.BATCH_SIZE = 1
+
+            return [entry async for entry in storage.aiter_filter(GlobFilter('name=A*'), offset=1)]
+
+        self.assertListEqual(
+            [Entry(data=dict(name='Alex', address='Vancouver'))],
+            asyncio.run(run())
+        )
+
+    def test_aiter_entries_stops_iterator_if_consumer_stops(self):
+        async def run():
+            storage = self.create_storage()
+            storage.BATCH_SIZE = 1
+            names = []
+
+            async for entry in storage.aiter_entries():
+                names.append(entry['name'])
+                break
+
+            return names
+
+        self.assertListEqual(['Dmitry'], asyncio.run(run()))
+
+    def test_aiter_entries_closes_iterator_in_executor(self):
+        closed_in_threads = []
+
+        class ClosingStorage(MemoryDictStorage):
+            def iter_entries(self, limit=None, offset=0):
+                try:
+                    yield from super().iter_entries(limit, offset)
+                finally:
+                    closed_in_threads.append(threading.get_ident())
+
+        async def run():
+            storage = AsyncStorage(ClosingStorage(columns=['name']))
+            await storage.insert_many([dict(name='Dmitry'), dict(name='Andrew')])
+            storage.BATCH_SIZE = 1
+
+            entries = storage.aiter_entries()
+            self.assertEqual('Dmitry', (await entries.__anext__())['name'])
+            await entries.aclose()
+
+        asyncio.run(run())
+
+        self.assertEqual(1, len(closed_in_threads))
+        self.assertNotEqual(threading.get_ident(), closed_in_threads[0])
+
+    def test_cancelled_consumer_leaves_running_iterator(self):
+        started = threading.Event()
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        class BlockingStorage(MemoryDictStorage):
+            def iter_entries(self, limit=None, offset=0):
+                started.set()
+                release.wait(10)
+
+                yield from super().iter_entries(limit, offset)
+
+        async def run():
+            storage = AsyncStorage(BlockingStorage(columns=['name']))
+
+            async def consume():
+                return [entry async for entry in storage.aiter_entries()]
+
+            task = asyncio.ensure_future(consume())
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 10)
+            task.cancel()
+
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+            release.set()
+
+        asyncio.run(run())
+
+    def test_errors_of_closing_iterator_are_raised(self):
+        class BrokenStorage(MemoryDictStorage):
+            def iter_entries(self, limit=None, offset=0):
+                try:
+                    yield from super().iter_entries(limit, offset)
+                finally:
+                    raise ValueError('Broken cleanup')
+
+        async def run():
+            storage = AsyncStorage(BrokenStorage(columns=['name']))
+            await storage.insert_many([dict(name='Dmitry'), dict(name='Andrew')])
+            storage.BATCH_SIZE = 1
+
+            entries = storage.aiter_entries()
+            await entries.__anext__()
+
+            with self.assertRaises(ValueError):
+                await entries.aclose()
+
+        asyncio.run(run())
+
+    def test_save_and_load_round_trip(self):
+        path = os.path.join(tempfile.mkdtemp(), 'db.json')
+
+        async def run():
+            await self.create_storage().save(path)
+
+            loaded_storage = AsyncStorage(MemoryDictStorage(columns=['name', 'address']))
+            await loaded_storage.load(path)
+
+            return await loaded_storage.all_entries()
+
+        self.assertEqual(3, len(asyncio.run(run())))
+
+    def test_concurrency_is_bounded(self):
+        num_running = 0
+        max_running = 0
+        lock = threading.Lock()
+
+        class SlowStorage(MemoryDictStorage):
+            def all_entries(self):
+                nonlocal num_running, max_running
+
+                with lock:
+                    num_running += 1
+                    max_running = max(max_running, num_running)
+
+                threading.Event().wait(0.01)
+
+                with lock:
+                    num_running -= 1
+
+                return super().all_entries()
+
+        async def run():
+            storage = AsyncStorage(SlowStorage(columns=['name']), max_concurrency=2)
+
+            await asyncio.gather(*[storage.all_entries() for _ in range(6)])
+
+        asyncio.run(run())
+
+        self.assertEqual(2, max_running)
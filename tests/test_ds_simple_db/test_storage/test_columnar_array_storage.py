@@ -0,0 +1,260 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.filters.glob_filter import GlobFilter
+from ds_simple_db.serializers.csv_serializer import CSVSerializer
+from ds_simple_db.storage.columnar_array_storage import ColumnarArrayStorage
+
+
+class TestColumnarArrayStorage(TestCase):
+
+    #
+    # __init__()
+    #
+
+    def test_default_constructor_creates_empty_storage(self):
+        storage = ColumnarArrayStorage()
+
+        self.assertListEqual([], storage.columns())
+        self.assertListEqual([], storage.all_entries())
+
+    def test_constructor_sets_given_initial_data(self):
+        storage = ColumnarArrayStorage(
+            initial_data=dict(
+                col1=[1, 2, 3],
+                col2=['str1', 'str2', 'str3']
+            ),
+            column_types=dict(col1='int')
+        )
+
+        self.assertListEqual(
+            [
+                Entry(data=dict(col1=1, col2='str1')),
+                Entry(data=dict(col1=2, col2='str2')),
+                Entry(data=dict(col1=3, col2='str3')),
+            ],
+            storage.all_entries()
+        )
+
+    def test_constructor_raises_value_error_if_lengths_of_lists_are_not_equal(self):
+        with self.assertRaises(ValueError):
+            ColumnarArrayStorage(
+                initial_data=dict(
+                    col1=['1', '2', '3'],
+                    col2=['str1', 'str2']
+                )
+            )
+
+    def test_constructor_raises_value_error_if_two_arguments_are_provided(self):
+        with self.assertRaises(ValueError):
+            ColumnarArrayStorage(
+                initial_data=dict(),
+                columns=list()
+            )
+
+    def test_constructor_raises_type_error_if_argument_is_not_dict(self):
+        with self.assertRaises(TypeError):
+            ColumnarArrayStorage(
+                initial_data='not_a_dict'
+            )
+
+    def test_constructor_raises_value_error_if_column_kind_is_unknown(self):
+        with self.assertRaises(ValueError):
+            ColumnarArrayStorage(
+                columns=['col1'],
+                column_types=dict(col1='complex')
+            )
+
+    def test_constructor_raises_value_error_if_typed_column_does_not_exist(self):
+        with self.assertRaises(ValueError):
+            ColumnarArrayStorage(
+                columns=['col1'],
+                column_types=dict(col2='int')
+            )
+
+    #
+    # columns()
+    #
+
+    def test_columns_method_is_correct(self):
+        self.assertListEqual(['col1', 'col2'], ColumnarArrayStorage(columns=['col1', 'col2']).columns())
+        self.assertListEqual(
+            ['col1', 'col2'],
+            ColumnarArrayStorage(initial_data=dict(col1=[], col2=[])).columns()
+        )
+
+    def test_column_types_default_to_str(self):
+        storage = ColumnarArrayStorage(
+            columns=['name', 'city', 'age', 'height'],
+            column_types=dict(city='category', age='int', height='float')
+        )
+
+        self.assertDictEqual(
+            dict(name='str', city='category', age='int', height='float'),
+            storage.column_types()
+        )
+
+    #
+    # insert()
+    #
+
+    def test_insert_returns_correct_entry(self):
+        storage = ColumnarArrayStorage(columns=['name', 'address'])
+        entry = storage.insert(name='Dmitry', address='Moscow')
+
+        self.assertEqual(Entry(data=dict(name='Dmitry', address='Moscow')), entry)
+
+    def test_insert_inserts_none_for_not_provided_columns(self):
+        storage = ColumnarArrayStorage(
+            columns=['name', 'city', 'age', 'height'],
+            column_types=dict(city='category', age='int', height='float')
+        )
+        storage.insert(name='Dmitry')
+
+        self.assertListEqual(
+            [Entry(data=dict(name='Dmitry', city=None, age=None, height=None))],
+            storage.all_entries()
+        )
+
+    def test_insert_keeps_values_of_all_kinds(self):
+        storage = ColumnarArrayStorage(
+            columns=['name', 'city', 'age', 'height'],
+            column_types=dict(city='category', age='int', height='float')
+        )
+        storage.insert(name='Дмитрий', city='Moscow', age=30, height=1.8)
+        storage.insert(name='Andrew', city='London', age=25, height=2)
+        storage.insert(name='Alex', city='Moscow', age=None, height=None)
+
+        self.assertListEqual(
+            [
+                Entry(data=dict(name='Дмитрий', city='Moscow', age=30, height=1.8)),
+                Entry(data=dict(name='Andrew', city='London', age=25, height=2.0)),
+                Entry(data=dict(name='Alex', city='Moscow', age=None, height=None)),
+            ],
+            storage.all_entries()
+        )
+
+    def test_insert_raises_value_error_if_no_data_provided(self):
+        storage = ColumnarArrayStorage(columns=['name', 'address'])
+
+        with self.assertRaises(ValueError):
+            storage.insert()
+
+    def test_insert_raises_value_error_if_column_does_not_exist_in_storage(self):
+        storage = ColumnarArrayStorage(columns=['name'])
+
+        with self.assertRaises(ValueError):
+            storage.insert(address='Moscow')
+
+    def test_insert_raises_type_error_and_keeps_storage_unchanged_if_value_type_is_wrong(self):
+        storage = ColumnarArrayStorage(columns=['name', 'age'], column_types=dict(age='int'))
+
+        with self.assertRaises(TypeError):
+            storage.insert(name='Dmitry', age='thirty')
+
+        with self.assertRaises(TypeError):
+            storage.insert(name=1, age=30)
+
+        self.assertListEqual([], storage.all_entries())
+
+    def test_insert_raises_value_error_and_keeps_columns_aligned_if_value_does_not_fit(self):
+        storage = ColumnarArrayStorage(columns=['name', 'age', 'height'], column_types=dict(age='int', height='float'))
+        storage.insert(name='Dmitry', age=30)
+
+        with self.assertRaises(ValueError):
+            storage.insert(name='Andrew', age=2 ** 70)
+
+        with self.assertRaises(ValueError):
+            storage.insert(name='Andrew', height=10 ** 400)
+
+        with self.assertRaises(ValueError):
+            storage.insert(name='\ud800', age=25)
+
+        storage.insert(name='Alex', age=25)
+
+        self.assertListEqual(
+            [
+                Entry(data=dict(name='Dmitry', age=30, height=None)),
+                Entry(data=dict(name='Alex', age=25, height=None)),
+            ],
+            storage.all_entries()
+        )
+
+    #
+    # filter()
+    #
+
+    def test_empty_filter_returns_no_entries(self):
+        storage = ColumnarArrayStorage(initial_data=dict(col1=['1', '2']))
+
+        self.assertListEqual([], storage.filter())
+
+    def test_filter_returns_matching_entries(self):
+        storage = ColumnarArrayStorage(
+            initial_data=dict(
+                name=['Dmitry', 'Andrew', 'Alex'],
+                address=['Moscow', 'London', 'Vancouver']
+            ),
+            column_types=dict(address='category')
+        )
+
+        self.assertListEqual(
+            [
+                Entry(data=dict(name='Andrew', address='London')),
+                Entry(data=dict(name='Alex', address='Vancouver')),
+            ],
+            storage.filter(GlobFilter('name=A*'))
+        )
+
+    #
+    # insert_many() / insert_columns()
+    #
+
+    def test_insert_many_keeps_values_of_all_kinds(self):
+        storage = ColumnarArrayStorage(
+            columns=['name', 'city', 'age', 'height'],
+            column_types=dict(city='category', age='int', height='float')
+        )
+        storage.insert_many([
+            dict(name='Dmitry', city='Moscow', age=30, height=1.8),
+            dict(name='Andrew', age=25),
+        ])
+
+        self.assertListEqual(
+            [
+                Entry(data=dict(name='Dmitry', city='Moscow', age=30, height=1.8)),
+                Entry(data=dict(name='Andrew', city=None, age=25, height=None)),
+            ],
+            storage.all_entries()
+        )
+
+    def test_insert_columns_raises_type_error_and_keeps_storage_unchanged_if_value_type_is_wrong(self):
+        storage = ColumnarArrayStorage(columns=['name', 'age'], column_types=dict(age='int'))
+
+        with self.assertRaises(TypeError):
+            storage.insert_columns(dict(name=['Dmitry', 'Andrew'], age=[30, 'thirty']))
+
+        self.assertListEqual([], storage.all_entries())
+
+    #
+    # load_from_file()
+    #
+
+    def test_load_from_file_with_type_inference_fills_typed_columns(self):
+        path = os.path.join(tempfile.mkdtemp(), 'db.csv')
+
+        with open(path, 'w') as fp:
+            fp.write('#name,age,height\nDmitry,30,1.8\nAndrew,,1.75\n')
+
+        storage = ColumnarArrayStorage(columns=['name', 'age', 'height'], column_types=dict(age='int', height='float'))
+        storage.load_from_file(path, CSVSerializer(infer_types=True))
+
+        self.assertListEqual(
+            [
+                Entry(data=dict(name='Dmitry', age=30, height=1.8)),
+                Entry(data=dict(name='Andrew', age=None, height=1.75)),
+            ],
+            storage.all_entries()
+        )
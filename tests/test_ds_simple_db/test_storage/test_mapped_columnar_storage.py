@@ -0,0 +1,100 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.filters.glob_filter import GlobFilter
+from ds_simple_db.storage.mapped_columnar_storage import MappedColumnarStorage
+from ds_simple_db.storage.memory_dict_storage import MemoryDictStorage
+
+
+class TestMappedColumnarStorage(TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), 'db.sdb')
+
+        storage = MemoryDictStorage(columns=['name', 'address'])
+        storage.insert(name='Dmitry', address='Moscow')
+        storage.insert(name='Andrew', address='London')
+        storage.insert(name='Alex', address=None)
+        storage.save_to_file(self.path)
+
+    def test_load_maps_file_columns(self):
+        storage = MappedColumnarStorage()
+        storage.load_from_file(self.path)
+
+        self.assertListEqual(['name', 'address'], storage.columns())
+        self.assertListEqual(
+            [
+                Entry(data=dict(name='Dmitry', address='Moscow')),
+                Entry(data=dict(name='Andrew', address='London')),
+                Entry(data=dict(name='Alex', address=None)),
+            ],
+            storage.all_entries()
+        )
+        storage.close()
+
+    def test_load_fills_columns_missing_in_file_with_none(self):
+        storage = MappedColumnarStorage(columns=['name', 'address', 'phone_number'])
+        storage.load_from_file(self.path)
+
+        self.assertEqual(
+            Entry(data=dict(name='Alex', address=None, phone_number=None)),
+            list(storage.iter_entries(offset=2))[0]
+        )
+        storage.close()
+
+    def test_load_raises_value_error_if_file_column_does_not_exist_in_storage(self):
+        storage = MappedColumnarStorage(columns=['name'])
+
+        with self.assertRaises(ValueError):
+            storage.load_from_file(self.path)
+
+    def test_filter_and_index_use_mapped_and_inserted_rows(self):
+        storage = MappedColumnarStorage(columns=['name', 'address'])
+        storage.create_index('name', kind='sorted')
+        storage.load_from_file(self.path)
+        storage.insert(name='Anna', address='Paris')
+
+        expected = [
+            Entry(data=dict(name='Andrew', address='London')),
+            Entry(data=dict(name='Alex', address=None)),
+            Entry(data=dict(name='Anna', address='Paris')),
+        ]
+
+        self.assertListEqual(expected, storage.filter(GlobFilter('name=A*')))
+        self.assertListEqual(expected[2:], storage.filter(GlobFilter('address=Pa*')))
+        self.assertEqual('sorted index prefix scan on `name`', storage.explain(GlobFilter('name=A*')))
+        storage.close()
+
+    def test_inserted_rows_are_saved_back(self):
+        storage = MappedColumnarStorage(columns=['name', 'address'])
+        storage.load_from_file(self.path)
+        storage.insert(name='Anna', address='Paris')
+        storage.save_to_file(self.path)
+        storage.close()
+
+        loaded_storage = MappedColumnarStorage(columns=['name', 'address'])
+        loaded_storage.load_from_file(self.path)
+
+        self.assertEqual(4, len(loaded_storage.all_entries()))
+        self.assertEqual(Entry(data=dict(name='Anna', address='Paris')), loaded_storage.all_entries()[-1])
+        loaded_storage.close()
+
+    def test_insert_raises_type_error_if_value_can_not_be_saved(self):
+        storage = MappedColumnarStorage(columns=['name', 'address'])
+        storage.load_from_file(self.path)
+
+        with self.assertRaises(TypeError):
+            storage.insert(name=1)
+
+        self.assertEqual(3, len(storage.all_entries()))
+        storage.close()
+
+    def test_load_copies_rows_of_other_formats(self):
+        csv_path = self.path.replace('.sdb', '.csv')
+        MemoryDictStorage(initial_data=dict(name=['Dmitry'], address=['Moscow'])).save_to_file(csv_path)
+
+        storage = MappedColumnarStorage(columns=['name', 'address'])
+        storage.load_from_file(csv_path)
+
+        self.assertListEqual([Entry(data=dict(name='Dmitry', address='Moscow'))], storage.all_entries())
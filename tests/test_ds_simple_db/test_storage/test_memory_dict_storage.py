@@ -1,6 +1,16 @@
-from unittest import TestCase
+import os
+import sys
+import tempfile
+import threading
+from unittest import TestCase, mock
 
 from ds_simple_db.core.entry import Entry
+from ds_simple_db.core.filter import Filter
+from ds_simple_db.filters.and_filter import AndFilter
+from ds_simple_db.filters.comparison_filter import ComparisonFilter
+from ds_simple_db.filters.glob_filter import GlobFilter
+from ds_simple_db.filters.range_filter import RangeFilter
+from ds_simple_db.filters.regex_filter import RegexFilter
 from ds_simple_db.storage.memory_dict_storage import MemoryDictStorage
 
 
@@ -205,3 +215,591 @@ class TestMemoryDictStorage(TestCase):
             [],
             storage.filter()
         )
+
+    def test_filter_returns_matching_entries(self):
+        storage = MemoryDictStorage(
+            initial_data=dict(
+                name=['Dmitry', 'Andrew', 'Alex'],
+                address=['Moscow', 'London', 'Vancouver']
+            )
+        )
+
+        self.assertListEqual(
+            [
+                Entry(data=dict(name='Andrew', address='London')),
+                Entry(data=dict(name='Alex', address='Vancouver')),
+            ],
+            storage.filter(GlobFilter('name=A*'))
+        )
+
+    def test_filter_falls_back_to_satisfies_if_mask_not_supported(self):
+        class LongNameFilter(Filter):
+            def satisfies(self, entry):
+                return len(entry.name) > 4
+
+        storage = MemoryDictStorage(
+            initial_data=dict(
+                name=['Dmitry', 'Alex']
+            )
+        )
+
+        self.assertListEqual(
+            [Entry(data=dict(name='Dmitry'))],
+            storage.filter(LongNameFilter())
+        )
+
+    def test_filter_raises_type_error_if_not_a_filter(self):
+        storage = MemoryDictStorage(columns=['name'])
+
+        with self.assertRaises(TypeError):
+            storage.filter('name=*')
+
+    #
+    # iter_entries()
+    #
+
+    def test_iter_entries_yields_entries_lazily(self):
+        storage = MemoryDictStorage(
+            initial_data=dict(
+                col1=[1, 2, 3]
+            )
+        )
+
+        entries = storage.iter_entries()
+
+        self.assertEqual(Entry(data=dict(col1=1)), next(entries))
+        self.assertListEqual([Entry(data=dict(col1=2)), Entry(data=dict(col1=3))], list(entries))
+
+    def test_iter_entries_applies_limit_and_offset(self):
+        storage = MemoryDictStorage(
+            initial_data=dict(
+                col1=[1, 2, 3, 4]
+            )
+        )
+
+        self.assertListEqual(
+            [Entry(data=dict(col1=2)), Entry(data=dict(col1=3))],
+            list(storage.iter_entries(limit=2, offset=1))
+        )
+        self.assertListEqual([], list(storage.iter_entries(offset=10)))
+        self.assertListEqual([], list(storage.iter_entries(limit=0)))
+
+    def test_iter_entries_raises_value_error_if_limit_or_offset_is_negative(self):
+        storage = MemoryDictStorage(columns=['col1'])
+
+        with self.assertRaises(ValueError):
+            storage.iter_entries(offset=-1)
+
+        with self.assertRaises(ValueError):
+            storage.iter_entries(limit=-1)
+
+    #
+    # iter_filter()
+    #
+
+    def test_iter_filter_applies_limit_and_offset_to_matching_entries(self):
+        storage = MemoryDictStorage(
+            initial_data=dict(
+                name=['Andrew', 'Dmitry', 'Alex', 'Anna']
+            )
+        )
+
+        self.assertListEqual(
+            [Entry(data=dict(name='Alex')), Entry(data=dict(name='Anna'))],
+            list(storage.iter_filter(GlobFilter('name=A*'), limit=2, offset=1))
+        )
+
+    def test_iter_filter_scans_in_chunks(self):
+        storage = MemoryDictStorage(
+            initial_data=dict(
+                num=[str(x) for x in range(10)]
+            )
+        )
+        storage.SCAN_CHUNK_SIZE = 3
+
+        self.assertListEqual(
+            [Entry(data=dict(num='1')), Entry(data=dict(num='8'))],
+            list(storage.iter_filter(GlobFilter('num=[18]')))
+        )
+
+    def test_iter_filter_empty_filter_yields_no_entries(self):
+        storage = MemoryDictStorage(
+            initial_data=dict(
+                col1=[1, 2]
+            )
+        )
+
+        self.assertListEqual([], list(storage.iter_filter()))
+
+    #
+    # _entry_by_index()
+    #
+
+    def test_inserted_entry_is_not_affected_by_further_inserts(self):
+        storage = MemoryDictStorage(columns=['name'])
+        entry = storage.insert(name='Dmitry')
+        storage.insert(name='Andrew')
+
+        self.assertEqual(Entry(data=dict(name='Dmitry')), entry)
+
+    #
+    # create_index()
+    #
+
+    def test_create_index_raises_value_error_if_column_does_not_exist(self):
+        storage = MemoryDictStorage(columns=['name'])
+
+        with self.assertRaises(ValueError):
+            storage.create_index('address')
+
+    def test_create_index_raises_value_error_if_kind_is_unknown(self):
+        storage = MemoryDictStorage(columns=['name'])
+
+        with self.assertRaises(ValueError):
+            storage.create_index('name', kind='bitmap')
+
+    def test_filter_with_index_returns_same_entries_as_scan(self):
+        storage = MemoryDictStorage(
+            initial_data=dict(
+                name=['Andrew', 'Dmitry', 'Alex', 'Anna'],
+                address=['London', 'Moscow', 'Vancouver', 'Moscow']
+            )
+        )
+        filters = [GlobFilter('name=A*'), GlobFilter('address=Moscow'), GlobFilter('name=Zoe')]
+        scanned_entries = [storage.filter(glob_filter) for glob_filter in filters]
+
+        storage.create_index('name', kind='sorted')
+        storage.create_index('address', kind='hash')
+
+        self.assertListEqual(scanned_entries, [storage.filter(glob_filter) for glob_filter in filters])
+
+    def test_index_is_updated_on_insert(self):
+        storage = MemoryDictStorage(columns=['name', 'address'])
+        storage.create_index('address')
+        storage.insert(name='Dmitry', address='Moscow')
+        storage.insert(name='Andrew')
+        storage.insert(name='Anna', address='Moscow')
+
+        self.assertListEqual(
+            [
+                Entry(data=dict(name='Dmitry', address='Moscow')),
+                Entry(data=dict(name='Anna', address='Moscow')),
+            ],
+            storage.filter(GlobFilter('address=Moscow'))
+        )
+        self.assertListEqual(
+            [Entry(data=dict(name='Andrew', address=None))],
+            storage.filter(GlobFilter('address=None'))
+        )
+
+    def test_iter_filter_with_index_applies_limit_and_offset(self):
+        storage = MemoryDictStorage(
+            initial_data=dict(
+                name=['Andrew', 'Dmitry', 'Alex', 'Anna']
+            )
+        )
+        storage.create_index('name', kind='sorted')
+
+        self.assertListEqual(
+            [Entry(data=dict(name='Alex'))],
+            list(storage.iter_filter(GlobFilter('name=A*'), limit=1, offset=1))
+        )
+
+    def test_filter_checks_index_candidates(self):
+        storage = MemoryDictStorage(
+            initial_data=dict(
+                name=['Andrew', 'Dmitry', 'Alex', 'Anna', 5],
+                address=['London', 'Moscow', 'Vancouver', 'Moscow', 'Moscow']
+            )
+        )
+        filters = [
+            ComparisonFilter('name', '>=', 'Alex'),
+            RangeFilter('name', '5', 'B'),
+            AndFilter(GlobFilter('address=Moscow'), ComparisonFilter('name', '<', 'B')),
+        ]
+        scanned_entries = [storage.filter(filter_obj) for filter_obj in filters]
+
+        storage.create_index('name', kind='sorted')
+        storage.create_index('address', kind='hash')
+
+        self.assertListEqual(scanned_entries, [storage.filter(filter_obj) for filter_obj in filters])
+        self.assertListEqual([Entry(data=dict(name='Anna', address='Moscow'))], scanned_entries[2])
+
+    #
+    # enable_result_cache()
+    #
+
+    def test_result_cache_refreshes_results_on_insert(self):
+        storage = MemoryDictStorage(initial_data=dict(name=['Andrew', 'Dmitry', 'Alex']))
+        cache = storage.enable_result_cache()
+
+        self.assertListEqual(['Andrew', 'Alex'], [entry.name for entry in storage.filter(GlobFilter('name=A*'))])
+        self.assertListEqual(['Alex'], [entry.name for entry in storage.iter_filter(GlobFilter('name=A*'), offset=1)])
+
+        storage.insert(name='Anna')
+
+        self.assertListEqual(
+            ['Andrew', 'Alex', 'Anna'],
+            [entry.name for entry in storage.filter(AndFilter(GlobFilter('name=A*')))]
+        )
+        self.assertListEqual(
+            ['Andrew', 'Alex', 'Anna'],
+            [entry.name for entry in storage.filter(GlobFilter('name=A*'))]
+        )
+        self.assertEqual(
+            dict(hits=1, refreshes=1, misses=2),
+            {key: cache.stats()[key] for key in ('hits', 'refreshes', 'misses')}
+        )
+
+    def test_result_cache_skips_filters_without_cache_key(self):
+        class LongNameFilter(Filter):
+            def satisfies(self, entry):
+                return len(entry.name) > 4
+
+        storage = MemoryDictStorage(initial_data=dict(name=['Dmitry', 'Alex']))
+        cache = storage.enable_result_cache()
+
+        self.assertListEqual([Entry(data=dict(name='Dmitry'))], storage.filter(LongNameFilter()))
+        self.assertListEqual([Entry(data=dict(name='Dmitry'))], storage.filter(AndFilter(LongNameFilter())))
+        self.assertEqual(0, cache.stats()['misses'])
+
+    #
+    # explain()
+    #
+
+    def test_explain_reports_evaluation_path(self):
+        storage = MemoryDictStorage(columns=['name', 'address'])
+
+        self.assertEqual('full scan', storage.explain(GlobFilter('name=Dmitry')))
+
+        storage.create_index('name', kind='sorted')
+        storage.create_index('address', kind='hash')
+
+        self.assertEqual('sorted index lookup on `name`', storage.explain(GlobFilter('name=Dmitry')))
+        self.assertEqual('sorted index prefix scan on `name`', storage.explain(GlobFilter('name=Dm*')))
+        self.assertEqual('hash index lookup on `address`', storage.explain(GlobFilter('address=Moscow')))
+        self.assertEqual('full scan', storage.explain(GlobFilter('address=Mos*')))
+        self.assertEqual(
+            'hash index lookup on `address`, then check `name ~ \'^D\'`',
+            storage.explain(AndFilter(RegexFilter('name', '^D'), GlobFilter('address=Moscow')))
+        )
+
+    #
+    # load_from_file() / save_to_file()
+    #
+
+    def test_save_and_load_round_trip(self):
+        folder = tempfile.mkdtemp()
+        storage = MemoryDictStorage(columns=['name', 'address'])
+        storage.insert(name='Dmitry', address='Moscow')
+        storage.insert(name='Andrew', address='London')
+
+        for extension in ['csv', 'json', 'sdb']:
+            path = os.path.join(folder, f'db.{extension}')
+            storage.save_to_file(path)
+
+            loaded_storage = MemoryDictStorage(columns=['name', 'address'])
+            loaded_storage.load_from_file(path)
+
+            self.assertListEqual(storage.all_entries(), loaded_storage.all_entries())
+
+    def test_save_and_load_round_trip_keeps_line_breaks_and_quotes(self):
+        path = os.path.join(tempfile.mkdtemp(), 'db.csv')
+        storage = MemoryDictStorage(columns=['name', 'address'])
+        storage.insert(name='line1\rline2', address='line1\nline2')
+        storage.insert(name='line1\r\nline2', address='"Quoted", with a comma')
+        storage.save_to_file(path)
+
+        for workers in [None, 2]:
+            with self.subTest(workers=workers):
+                loaded_storage = MemoryDictStorage(columns=['name', 'address'])
+                loaded_storage.load_from_files([path, path], workers=workers)
+
+                self.assertListEqual(storage.all_entries() * 2, loaded_storage.all_entries())
+
+    def test_save_keeps_existing_file_if_serialization_fails(self):
+        path = os.path.join(tempfile.mkdtemp(), 'db.csv')
+        storage = MemoryDictStorage(columns=['name'])
+        storage.insert(name='Dmitry')
+        storage.save_to_file(path)
+
+        storage.insert(name=1)
+
+        with self.assertRaises(TypeError):
+            storage.save_to_file(path)
+
+        loaded_storage = MemoryDictStorage(columns=['name'])
+        loaded_storage.load_from_file(path)
+
+        self.assertListEqual([Entry(data=dict(name='Dmitry'))], loaded_storage.all_entries())
+
+    def test_load_raises_value_error_if_file_does_not_exist(self):
+        storage = MemoryDictStorage(columns=['name'])
+
+        with self.assertRaises(ValueError):
+            storage.load_from_file(os.path.join(tempfile.mkdtemp(), 'db.csv'))
+
+    #
+    # load_from_files()
+    #
+
+    def test_load_from_files_appends_files_in_order(self):
+        folder = tempfile.mkdtemp()
+        paths = []
+
+        for number, extension in enumerate(['csv', 'json', 'sdb', 'csv']):
+            storage = MemoryDictStorage(columns=['name', 'address'])
+            storage.insert_many([dict(name=f'name{number}', address='Moscow'), dict(name=f'other{number}')])
+
+            paths.append(os.path.join(folder, f'db{number}.{extension}'))
+            storage.save_to_file(paths[-1])
+
+        for workers in [None, 2]:
+            with self.subTest(workers=workers):
+                storage = MemoryDictStorage(columns=['name', 'address'])
+                reports = storage.load_from_files(paths, workers=workers)
+
+                self.assertListEqual(
+                    ['name0', 'other0', 'name1', 'other1', 'name2', 'other2', 'name3', 'other3'],
+                    [entry['name'] for entry in storage.all_entries()]
+                )
+                self.assertListEqual(paths, [report['path'] for report in reports])
+                self.assertListEqual([2, 2, 2, 2], [report['rows'] for report in reports])
+                self.assertTrue(all(report['parse_seconds'] >= 0 for report in reports))
+                self.assertTrue(all(report['insert_seconds'] >= 0 for report in reports))
+
+    def test_load_from_files_raises_value_error_if_file_does_not_exist(self):
+        path = os.path.join(tempfile.mkdtemp(), 'db.csv')
+        storage = MemoryDictStorage(columns=['name'])
+        storage.insert(name='Dmitry')
+        storage.save_to_file(path)
+
+        with self.assertRaises(ValueError):
+            storage.load_from_files([path, path + '.missing'], workers=2)
+
+        self.assertEqual(1, len(storage.all_entries()))
+
+    #
+    # insert_many()
+    #
+
+    def test_insert_many_inserts_rows_in_batches(self):
+        storage = MemoryDictStorage(columns=['name', 'address'])
+        storage.create_index('address')
+
+        num_inserted = storage.insert_many(
+            iter([
+                dict(name='Dmitry', address='Moscow'),
+                dict(address='London', name='Andrew'),
+                dict(name='Alex'),
+            ]),
+            batch_size=2
+        )
+
+        self.assertEqual(3, num_inserted)
+        self.assertDictEqual(
+            dict(
+                name=['Dmitry', 'Andrew', 'Alex'],
+                address=['Moscow', 'London', None]
+            ),
+            storage._data
+        )
+        self.assertListEqual(
+            [Entry(data=dict(name='Andrew', address='London'))],
+            storage.filter(GlobFilter('address=London'))
+        )
+
+    def test_insert_many_rejects_whole_batch_with_invalid_row(self):
+        storage = MemoryDictStorage(columns=['name'])
+
+        with self.assertRaises(ValueError):
+            storage.insert_many([dict(name='Dmitry'), dict(name='Andrew'), dict(address='Moscow')], batch_size=2)
+
+        self.assertDictEqual(dict(name=['Dmitry', 'Andrew']), storage._data)
+
+    def test_insert_many_raises_value_error_if_row_is_empty(self):
+        storage = MemoryDictStorage(columns=['name'])
+
+        with self.assertRaises(ValueError):
+            storage.insert_many([dict(name='Dmitry'), dict()])
+
+        self.assertDictEqual(dict(name=[]), storage._data)
+
+    def test_insert_many_raises_type_error_if_row_is_not_dict(self):
+        storage = MemoryDictStorage(columns=['name'])
+
+        with self.assertRaises(TypeError):
+            storage.insert_many([['Dmitry']])
+
+    #
+    # insert_columns()
+    #
+
+    def test_insert_columns_extends_columns(self):
+        storage = MemoryDictStorage(columns=['name', 'address'])
+        storage.insert(name='Dmitry', address='Moscow')
+
+        self.assertEqual(2, storage.insert_columns(dict(name=['Andrew', 'Alex'])))
+        self.assertDictEqual(
+            dict(
+                name=['Dmitry', 'Andrew', 'Alex'],
+                address=['Moscow', None, None]
+            ),
+            storage._data
+        )
+
+    def test_insert_columns_raises_value_error_if_lengths_do_not_match(self):
+        storage = MemoryDictStorage(columns=['name', 'address'])
+
+        with self.assertRaises(ValueError):
+            storage.insert_columns(dict(name=['Andrew', 'Alex'], address=['London']))
+
+        self.assertDictEqual(dict(name=[], address=[]), storage._data)
+
+    def test_insert_columns_raises_value_error_if_column_does_not_exist(self):
+        storage = MemoryDictStorage(columns=['name'])
+
+        with self.assertRaises(ValueError):
+            storage.insert_columns(dict(address=['London']))
+
+    #
+    # thread_safe=True
+    #
+
+    def test_concurrent_readers_never_see_torn_rows(self):
+        storage = MemoryDictStorage(columns=['name', 'address', 'phone_number'], thread_safe=True)
+        storage.create_index('name', kind='sorted')
+
+        num_writers = 2
+        num_batches = 250
+        errors = []
+        writers_done = threading.Event()
+
+        def write(writer):
+            for batch in range(num_batches):
+                rows = [dict(name=f'{writer}-{batch}-{i}', address=f'{writer}-{batch}-{i}') for i in range(10)]
+
+                if batch % 2 == 0:
+                    storage.insert_many(rows, batch_size=3)
+                else:
+                    for row in rows:
+                        # The returned entry must be the inserted one, not the last one inserted by another thread
+                        if storage.insert(**row)['name'] != row['name']:
+                            errors.append(row)
+
+        def check(entries):
+            for entry in entries:
+                if entry['name'] != entry['address'] or entry['phone_number'] is not None:
+                    errors.append(entry.as_dict())
+
+        def read_new_entries():
+            num_seen = 0
+
+            while not writers_done.is_set():
+                try:
+                    # Reading only new rows keeps the reader at the end of columns, where writers append
+                    new_entries = list(storage.iter_entries(offset=num_seen))
+                    check(new_entries)
+                    num_seen += len(new_entries)
+                except Exception as e:
+                    errors.append(repr(e))
+
+        def filter_entries():
+            while not writers_done.is_set():
+                try:
+                    check(storage.filter(GlobFilter('address=0-*')))
+                    check(storage.filter(GlobFilter('name=1-*')))
+                except Exception as e:
+                    errors.append(repr(e))
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        try:
+            writers = [threading.Thread(target=write, args=(writer,)) for writer in range(num_writers)]
+            readers = [threading.Thread(target=target) for target in [read_new_entries, read_new_entries, filter_entries]]
+
+            for thread in writers + readers:
+                thread.start()
+
+            for thread in writers:
+                thread.join()
+
+            writers_done.set()
+
+            for thread in readers:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        self.assertListEqual([], errors)
+        self.assertEqual(num_writers * num_batches * 10, len(storage.all_entries()))
+        self.assertEqual(num_batches * 10, len(storage.filter(GlobFilter('name=1-*'))))
+
+        for column in storage.columns():
+            self.assertEqual(len(storage.all_entries()), len(storage._data[column]))
+
+    #
+    # filter(workers=...)
+    #
+
+    def test_parallel_filter_returns_matching_entries_in_order(self):
+        num_rows = MemoryDictStorage.SCAN_CHUNK_SIZE * 3
+        storage = MemoryDictStorage(
+            initial_data=dict(
+                name=[f'name{i}' for i in range(num_rows)],
+                age=list(range(num_rows))
+            )
+        )
+        self.addCleanup(storage.close)
+
+        for filter_obj in [GlobFilter('name=*7*'), GlobFilter('age=1?'), GlobFilter('name=missing')]:
+            self.assertListEqual(storage.filter(filter_obj), storage.filter(filter_obj, workers=2))
+
+        storage.insert(name='name77777777')
+
+        self.assertListEqual(
+            storage.filter(GlobFilter('name=*7*')),
+            storage.filter(GlobFilter('name=*7*'), workers=2)
+        )
+        self.assertListEqual(
+            storage.filter(GlobFilter('name=*7*'))[10:15],
+            list(storage.iter_filter(GlobFilter('name=*7*'), limit=5, offset=10, workers=2))
+        )
+
+    def test_parallel_filter_falls_back_if_values_can_not_be_shared(self):
+        num_rows = MemoryDictStorage.SCAN_CHUNK_SIZE * 2
+        storage = MemoryDictStorage(initial_data=dict(col=[True] * num_rows))
+        self.addCleanup(storage.close)
+
+        self.assertEqual(num_rows, len(storage.filter(GlobFilter('col=True'), workers=2)))
+
+        with self.assertRaises(ValueError):
+            storage.filter(GlobFilter('missing=*'), workers=2)
+
+    def test_parallel_filter_falls_back_without_shared_memory(self):
+        num_rows = MemoryDictStorage.SCAN_CHUNK_SIZE * 2
+        storage = MemoryDictStorage(initial_data=dict(col=[f'{i}' for i in range(num_rows)]))
+
+        # Importing a module mapped to None raises ImportError, as on Python 3.7
+        with mock.patch.dict(sys.modules, {'ds_simple_db.core.parallel_scan': None}):
+            self.assertEqual(num_rows, len(storage.filter(GlobFilter('col=*'), workers=2)))
+
+        self.assertIsNone(storage._scanner)
+
+    def test_parallel_filter_matches_serial_filter_on_mixed_values(self):
+        num_rows = MemoryDictStorage.SCAN_CHUNK_SIZE * 2
+        columns = dict(
+            int_and_float=[11 if i == 7 else 0.5 for i in range(num_rows)],
+            large_int=[2 ** 70 if i == 7 else i for i in range(num_rows)],
+            surrogate=['\ud800' if i == 7 else f'{i}' for i in range(num_rows)]
+        )
+
+        for column, values in columns.items():
+            with self.subTest(column=column):
+                storage = MemoryDictStorage(initial_data={column: values})
+                self.addCleanup(storage.close)
+                filter_obj = GlobFilter(f'{column}={values[7]}')
+
+                self.assertEqual(1, len(storage.filter(filter_obj)))
+                self.assertListEqual(storage.filter(filter_obj), storage.filter(filter_obj, workers=2))
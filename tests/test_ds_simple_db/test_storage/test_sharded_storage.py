@@ -0,0 +1,201 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from ds_simple_db.core.entry import Entry
+from ds_simple_db.filters.comparison_filter import ComparisonFilter
+from ds_simple_db.filters.glob_filter import GlobFilter
+from ds_simple_db.filters.range_filter import RangeFilter
+from ds_simple_db.storage import StorageFactory
+from ds_simple_db.storage.columnar_array_storage import ColumnarArrayStorage
+from ds_simple_db.storage.sharded_storage import ShardedStorage
+
+
+class TestShardedStorage(TestCase):
+    def setUp(self):
+        self.storage = ShardedStorage(columns=['age', 'name'], partitioning='range', boundaries=[30, 60])
+        self.storage.insert_many([
+            dict(age=25, name='Dmitry'),
+            dict(age=70, name='Andrew'),
+            dict(age=45, name='Alex'),
+            dict(age=20, name='Anna'),
+            dict(name='Nobody'),
+        ])
+
+    def tearDown(self):
+        self.storage.close()
+
+    #
+    # __init__()
+    #
+
+    def test_factory_creates_storage(self):
+        storage = StorageFactory.create('sharded_storage', columns=['name'], num_shards=2)
+
+        self.assertIsInstance(storage, ShardedStorage)
+        self.assertEqual(2, len(storage.shards))
+        self.assertEqual('name', storage.shard_key)
+
+    def test_constructor_creates_shards_of_given_type(self):
+        storage = ShardedStorage(
+            columns=['age'], num_shards=3, storage_type='columnar_array_storage', column_types=dict(age='int')
+        )
+        storage.insert(age=1)
+
+        self.assertTrue(all(isinstance(shard, ColumnarArrayStorage) for shard in storage.shards))
+
+        with self.assertRaises(TypeError):
+            storage.insert(age='one')
+
+    def test_constructor_raises_value_error_for_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ShardedStorage(columns=['name'])
+
+        with self.assertRaises(ValueError):
+            ShardedStorage(columns=['name'], num_shards=2, shard_key='age')
+
+        with self.assertRaises(ValueError):
+            ShardedStorage(columns=['name'], num_shards=2, partitioning='list')
+
+        with self.assertRaises(ValueError):
+            ShardedStorage(columns=['age'], partitioning='range', boundaries=[30, 10])
+
+        with self.assertRaises(ValueError):
+            ShardedStorage(columns=['age'], partitioning='range', boundaries=[10, 30], num_shards=2)
+
+        with self.assertRaises(ValueError):
+            ShardedStorage(columns=['age'], num_shards=2, boundaries=[10])
+
+    #
+    # insert(), insert_many(), insert_columns()
+    #
+
+    def test_range_partitioning_assigns_rows_to_shards_by_key(self):
+        self.assertListEqual([3, 1, 1], self.storage.shard_sizes())
+        self.assertListEqual(
+            [Entry(data=dict(age=45, name='Alex'))],
+            self.storage.shards[1].all_entries()
+        )
+
+    def test_hash_partitioning_spreads_rows_between_shards(self):
+        storage = ShardedStorage(columns=['id', 'name'], num_shards=4)
+        storage.insert_columns(dict(id=list(range(1000)), name=['name'] * 1000))
+
+        self.assertEqual(1000, sum(storage.shard_sizes()))
+        self.assertTrue(all(size == 250 for size in storage.shard_sizes()))
+
+    def test_insert_returns_inserted_entry(self):
+        self.assertEqual(Entry(data=dict(age=35, name='Anna')), self.storage.insert(age=35, name='Anna'))
+
+    def test_insert_raises_value_error_for_unknown_column(self):
+        with self.assertRaises(ValueError):
+            self.storage.insert(age=35, city='London')
+
+        with self.assertRaises(ValueError):
+            self.storage.insert_columns(dict(age=[1, 2], name=['a']))
+
+        self.assertEqual(5, sum(self.storage.shard_sizes()))
+
+    def test_insert_raises_type_error_for_keys_incomparable_with_boundaries(self):
+        with self.assertRaises(TypeError):
+            self.storage.insert(age='35')
+
+    #
+    # iter_entries(), all_entries()
+    #
+
+    def test_entries_are_returned_shard_by_shard(self):
+        self.assertListEqual(
+            ['Dmitry', 'Anna', 'Nobody', 'Alex', 'Andrew'],
+            [entry['name'] for entry in self.storage.all_entries()]
+        )
+
+    def test_iter_entries_applies_limit_and_offset_across_shards(self):
+        self.assertListEqual(
+            ['Nobody', 'Alex', 'Andrew'],
+            [entry['name'] for entry in self.storage.iter_entries(offset=2)]
+        )
+        self.assertListEqual(
+            ['Anna', 'Nobody', 'Alex'],
+            [entry['name'] for entry in self.storage.iter_entries(limit=3, offset=1)]
+        )
+        self.assertListEqual([], list(self.storage.iter_entries(limit=0)))
+
+        with self.assertRaises(ValueError):
+            self.storage.iter_entries(offset=-1)
+
+    #
+    # filter(), iter_filter(), explain()
+    #
+
+    def test_filter_merges_results_of_shards(self):
+        self.assertListEqual(
+            ['Anna', 'Alex', 'Andrew'],
+            [entry['name'] for entry in self.storage.filter(GlobFilter('name=A*'))]
+        )
+        self.assertListEqual(
+            ['Alex', 'Andrew'],
+            [entry['name'] for entry in self.storage.iter_filter(GlobFilter('name=A*'), limit=2, offset=1)]
+        )
+        self.assertListEqual([], self.storage.filter(None))
+
+    def test_filter_skips_shards_ruled_out_by_summaries(self):
+        filter_obj = RangeFilter('age', 40, 50)
+
+        self.assertListEqual([Entry(data=dict(age=45, name='Alex'))], self.storage.filter(filter_obj))
+        self.assertEqual('skip shards 0, 2 by column summaries; shard 1: full scan', self.storage.explain(filter_obj))
+
+    def test_filter_looks_up_hash_partitioned_key_in_a_single_shard(self):
+        storage = ShardedStorage(columns=['id'], num_shards=4)
+        storage.insert_columns(dict(id=[str(i) for i in range(100)]))
+
+        self.assertListEqual([Entry(data=dict(id='42'))], storage.filter(ComparisonFilter('id', '==', '42')))
+        self.assertEqual(1, storage.explain(ComparisonFilter('id', '==', '42')).count('full scan'))
+
+    def test_filter_uses_bloom_columns(self):
+        storage = ShardedStorage(columns=['id', 'city'], num_shards=2, bloom_columns=['city'])
+        storage.insert_columns(dict(id=[0, 1, 2, 3], city=['Moscow', 'Berlin', 'Moscow', 'Zurich']))
+
+        self.assertListEqual(
+            [Entry(data=dict(id=1, city='Berlin'))],
+            storage.filter(ComparisonFilter('city', '==', 'Berlin'))
+        )
+        self.assertEqual(1, storage.explain(ComparisonFilter('city', '==', 'Berlin')).count('full scan'))
+
+    def test_filter_uses_indexes_of_shards(self):
+        self.storage.create_index('name')
+
+        self.assertEqual(
+            'skip shards 0, 2 by column summaries; shard 1: hash index lookup on `name`',
+            self.storage.explain(GlobFilter('name=Alex'))
+        )
+        self.assertListEqual([Entry(data=dict(age=45, name='Alex'))], self.storage.filter(GlobFilter('name=Alex')))
+
+    def test_filter_sees_rows_inserted_after_result_is_cached(self):
+        caches = self.storage.enable_result_cache()
+        filter_obj = GlobFilter('name=A*')
+
+        self.assertEqual(3, len(self.storage.filter(filter_obj)))
+
+        self.storage.insert(age=35, name='Anton')
+
+        self.assertEqual(4, len(self.storage.filter(filter_obj)))
+        self.assertEqual(3, len(caches))
+
+    def test_filter_raises_type_error_for_invalid_filter(self):
+        with self.assertRaises(TypeError):
+            self.storage.filter('name=Alex')
+
+    #
+    # load_from_file(), save_to_file()
+    #
+
+    def test_save_and_load_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'db.json')
+            self.storage.save_to_file(path)
+
+            storage = ShardedStorage(columns=['age', 'name'], partitioning='range', boundaries=[30, 60])
+            storage.load_from_file(path)
+
+        self.assertListEqual(self.storage.all_entries(), storage.all_entries())
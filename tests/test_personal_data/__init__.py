@@ -0,0 +1,17 @@
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+
+from ds_simple_db.core.plugins import CACHE_DIR_ENV_VAR
+
+APPS_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'apps')
+"""The folder of the app, which is not an installed package"""
+
+sys.path.insert(0, APPS_FOLDER)
+
+# The same as in the tests of the library, the registry of plugins is kept in a temporary folder
+_cache_folder = tempfile.mkdtemp()
+os.environ[CACHE_DIR_ENV_VAR] = _cache_folder
+atexit.register(shutil.rmtree, _cache_folder, ignore_errors=True)
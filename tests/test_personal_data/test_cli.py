@@ -0,0 +1,107 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import TestCase
+
+from . import APPS_FOLDER
+
+
+class TestCliImports(TestCase):
+    """
+    A command run by the CLI must only import the modules it uses. Commands run in a fresh interpreter
+    twice, the first run caches the registry of plugins and creates the log of the database
+    """
+
+    CLI_PATH = os.path.join(APPS_FOLDER, 'personal_data.py')
+
+    IMPORT_BUDGET_US = 150000
+    """The maximum time of imports done by the CLI to insert a row (about 30 ms on a developer machine)"""
+
+    PACKAGES = ('personal_data', 'ds_command', 'ds_simple_db')
+
+    # Runs the CLI the same way as `python personal_data.py` does and prints the imported modules to stderr,
+    # since the command prints to stdout
+    SCRIPT = '''
+import json
+import os
+import runpy
+import sys
+
+sys.argv = sys.argv[1:]
+sys.path[0] = os.path.dirname(sys.argv[0])
+
+try:
+    runpy.run_path(sys.argv[0], run_name='__main__')
+finally:
+    print(json.dumps(sorted(sys.modules)), file=sys.stderr)
+'''
+
+    UNUSED_MODULES = [
+        'concurrent.futures.process',
+        'importlib.metadata',
+        'multiprocessing',
+        'socket',
+        'tempfile',
+        'webbrowser',
+        'personal_data.commands.display',
+        'personal_data.commands.serve',
+        'personal_data.display.html_display',
+        'personal_data.server',
+        'ds_simple_db.core.parallel_scan',
+        'ds_simple_db.serializers.binary_columnar_serializer',
+        'ds_simple_db.serializers.json_serializer',
+        'ds_simple_db.storage.mapped_columnar_storage',
+        'ds_simple_db.storage.sharded_storage',
+    ]
+
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+
+        self.insert_args = ['insert', '--path', os.path.join(folder.name, 'db.csv'), '--values', 'Dmitry,Moscow,+7']
+
+    def run_twice(self, args):
+        for _ in range(2):
+            result = subprocess.run([sys.executable] + args, capture_output=True, text=True, check=True)
+
+        self.assertIn('Dmitry', result.stdout)
+
+        return result.stderr
+
+    def test_insert_does_not_import_unused_modules(self):
+        modules = set(json.loads(self.run_twice(['-c', self.SCRIPT, self.CLI_PATH] + self.insert_args)))
+
+        self.assertIn('personal_data.commands.insert', modules)
+        self.assertIn('ds_simple_db.storage.append_log_storage', modules)
+
+        for module in self.UNUSED_MODULES:
+            self.assertNotIn(module, modules)
+
+    def test_insert_imports_fit_in_budget(self):
+        """
+        Lines of `-X importtime` are printed when imports finish, so modules imported by a module precede it
+        and are indented. Top-level imports done since the first module of the app are summed up.
+        Modules loaded by `importlib.import_module()` (commands, storages and serializers registered
+        by import paths) are not reported themselves, the modules they import are reported as top-level ones
+        """
+        output = self.run_twice(['-X', 'importtime', self.CLI_PATH] + self.insert_args)
+
+        total_us = 0
+        started = False
+
+        for line in output.splitlines():
+            if not line.startswith('import time:') or 'imported package' in line:
+                continue
+
+            _, cumulative_us, name = line[len('import time:'):].split('|')
+
+            if name.strip().split('.')[0] in self.PACKAGES:
+                started = True
+
+            if started and not name.startswith('  '):
+                total_us += int(cumulative_us)
+
+        self.assertTrue(started)
+        self.assertLess(total_us, self.IMPORT_BUDGET_US)
@@ -0,0 +1,181 @@
+import io
+import os
+import shutil
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from unittest import TestCase
+
+from ds_simple_db.storage.append_log_storage import AppendLogStorage
+from personal_data.commands import PersonalDataCommand
+from personal_data.server import send_command
+
+from . import APPS_FOLDER
+
+
+class TestCommandServer(TestCase):
+    """
+    A server is started in a separate process in its own working directory,
+    commands are sent from a client working in another directory
+    """
+
+    def setUp(self):
+        self.server_folder = self._temporary_folder()
+        self.client_folder = self._temporary_folder()
+        self.socket_path = os.path.join(self.server_folder, 'server.sock')
+        self.db_path = os.path.join(self.client_folder, 'db', 'demo.csv')
+
+        os.makedirs(os.path.dirname(self.db_path))
+
+        with open(self.db_path, 'w') as fp:
+            fp.write('#name,address,phone_number\nDmitry,Moscow,+7\n')
+
+    def _temporary_folder(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+
+        return folder.name
+
+    def run_app(self, *args):
+        return subprocess.run([sys.executable, os.path.join(APPS_FOLDER, 'personal_data.py')] + list(args),
+                              cwd=self.server_folder, capture_output=True, text=True, check=True).stdout
+
+    def start_server(self):
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(APPS_FOLDER, 'personal_data.py'), 'serve', '--socket', self.socket_path],
+            cwd=self.server_folder, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        )
+        self.addCleanup(self._stop_server, server)
+
+        deadline = time.monotonic() + 10
+
+        while not self._is_listening():
+            if server.poll() is not None:
+                self.fail(f'The server has exited: {server.stdout.read()}')
+
+            if time.monotonic() > deadline:
+                self.fail('The server has not started')
+
+            time.sleep(0.01)
+
+        return server
+
+    @staticmethod
+    def _stop_server(server):
+        server.terminate()
+        server.communicate(timeout=10)
+
+    def _is_listening(self):
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.connect(self.socket_path)
+        except OSError:
+            return False
+
+        return True
+
+    def send(self, command, *command_args):
+        output = io.StringIO()
+        cwd = os.getcwd()
+
+        os.chdir(self.client_folder)
+
+        try:
+            with redirect_stdout(output):
+                send_command(self.socket_path, command, list(command_args))
+        finally:
+            os.chdir(cwd)
+
+        return output.getvalue()
+
+    def send_raw(self, data):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(self.socket_path)
+            client.sendall(data)
+            client.shutdown(socket.SHUT_WR)
+
+            with client.makefile('r', encoding='utf-8') as reader:
+                return reader.read()
+
+    def read_db(self):
+        storage = AppendLogStorage(self.db_path, columns=PersonalDataCommand.DB_COLUMNS)
+
+        try:
+            return [entry['name'] for entry in storage.all_entries()]
+        finally:
+            storage.close()
+
+    def test_insert_and_display_resolve_paths_against_client_directory(self):
+        self.start_server()
+
+        self.assertIn('Anna', self.send('insert', '--path', 'db/demo.csv', '--values', 'Anna,Paris,+33'))
+
+        output = self.send('display', '--path', 'db/demo.csv')
+
+        self.assertIn('Dmitry', output)
+        self.assertIn('Anna', output)
+        self.assertListEqual(['Dmitry', 'Anna'], self.read_db())
+        self.assertFalse(os.path.exists(os.path.join(self.server_folder, 'db')))
+
+    def test_unknown_command_is_reported(self):
+        self.start_server()
+
+        self.assertIn('Command `serve` can not be run by the server', self.send('serve', '--socket', 'other.sock'))
+
+    def test_invalid_request_is_reported(self):
+        self.start_server()
+
+        self.assertEqual('Invalid request\n', self.send_raw(b'{broken\n'))
+        self.assertEqual('Invalid request\n', self.send_raw(b'["display"]\n'))
+
+    def test_client_disconnecting_mid_request_does_not_stop_server(self):
+        self.start_server()
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(self.socket_path)
+            client.sendall(b'{"command": "disp')
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(self.socket_path)
+            client.sendall(b'{"command": "display", "args": ["--path", "' + self.db_path.encode() + b'"]}\n')
+
+        self.assertIn('Dmitry', self.send('display', '--path', 'db/demo.csv'))
+
+    def test_stale_socket_is_replaced_and_socket_is_private(self):
+        stale_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale_socket.bind(self.socket_path)
+        stale_socket.close()
+
+        self.start_server()
+
+        self.assertEqual(0o600, stat.S_IMODE(os.stat(self.socket_path).st_mode))
+        self.assertIn('Dmitry', self.send('display', '--path', 'db/demo.csv'))
+
+        self.assertIn('already running', self.run_app('serve', '--socket', self.socket_path))
+
+    def test_html_display_prints_path_instead_of_opening_browser(self):
+        self.start_server()
+
+        output = self.send('display', '--path', 'db/demo.csv', '--format', 'html')
+        path = output.split('The table is written to ')[-1].strip()
+        self.addCleanup(shutil.rmtree, os.path.dirname(path), ignore_errors=True)
+
+        with open(path, encoding='utf-8') as fp:
+            self.assertIn('Dmitry', fp.read())
+
+    def test_changes_made_without_server_are_seen(self):
+        self.start_server()
+
+        self.assertNotIn('Anna', self.send('display', '--path', 'db/demo.csv'))
+
+        self.run_app('insert', '--path', self.db_path, '--values', 'Anna,Paris,+33')
+        self.assertIn('Anna', self.send('filter', '--path', 'db/demo.csv', '--glob', 'name=Anna'))
+
+        self.run_app('compact', '--path', self.db_path)
+        self.send('insert', '--path', 'db/demo.csv', '--values', 'Alex,London,+44')
+
+        self.assertListEqual(['Dmitry', 'Anna', 'Alex'], self.read_db())